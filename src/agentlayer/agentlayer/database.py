@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 
 __all__ = [
     "create_engine_for_path",
+    "create_read_engine_for_path",
     "get_session",
 ]
 
@@ -62,6 +63,67 @@ def create_engine_for_path(database_path: Path, *, echo: bool = False) -> Engine
     return engine
 
 
+def create_read_engine_for_path(
+    database_path: Path,
+    *,
+    pool_size: int = 4,
+    mmap_bytes: int = 256 * 1024 * 1024,
+    cache_bytes: int = 64 * 1024 * 1024,
+    on_connect: Callable[[Any, Any], None] | None = None,
+    echo: bool = False,
+) -> Engine:
+    """Create a read-only engine with a pre-warmed connection pool.
+
+    Connections open the file with a ``mode=ro`` URI and set
+    ``query_only``, so they never take the write lock and cannot block (or
+    be blocked by) a writer; in WAL mode they read the last committed
+    snapshot. Each connection gets a larger page cache and memory-mapped
+    I/O, which pays off because pooled connections live for the process.
+    ``pool_size`` connections are opened up front so the first queries do
+    not pay for connecting and warming the schema cache.
+
+    The database must already exist (read-only opens do not create it).
+
+    Args:
+        database_path: Path to the SQLite database file.
+        pool_size: Connections kept open (and opened up front). Up to the
+            same number again are opened on demand under load.
+        mmap_bytes: ``PRAGMA mmap_size`` per connection (0 disables mmap).
+        cache_bytes: Page cache per connection (``PRAGMA cache_size``).
+        on_connect: Extra ``connect`` listener (e.g. to ATTACH databases),
+            registered before the pool is warmed.
+        echo: If True, log all SQL statements (default: False).
+
+    Returns:
+        A read-only SQLAlchemy Engine instance.
+    """
+
+    def set_read_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA query_only=1")
+        cursor.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        cursor.execute(f"PRAGMA cache_size={-(int(cache_bytes) // 1024)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    engine = create_engine(
+        f"sqlite:///file:{database_path.expanduser().resolve()}?mode=ro&uri=true",
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=pool_size,
+        connect_args={"timeout": 30, "check_same_thread": False},
+    )
+    event.listen(engine, "connect", set_read_pragmas)
+    if on_connect is not None:
+        event.listen(engine, "connect", on_connect)
+
+    warm = [engine.connect() for _ in range(pool_size)]
+    for conn in warm:
+        conn.close()
+
+    return engine
+
+
 @contextmanager
 def get_session(session_factory: Callable[[], Session]) -> Generator[Session, None, None]:
     """Generic session context manager that uses a provided factory.
@@ -14,6 +14,7 @@ from agentlayer.logging import get_logger
 from agentlayer.settings import get_settings
 from llama_index.core.embeddings import BaseEmbedding
 
+from agentlayer.embedding.cache import EmbeddingCache, EmbeddingCacheStats, get_embedding_cache
 from agentlayer.embedding.identity import (
     EMBEDDING_BACKEND_METADATA_KEY,
     EMBEDDING_MODEL_METADATA_KEY,
@@ -32,6 +33,8 @@ def build_embed_model(backend: str, model_name: str, batch_size: int) -> "BaseEm
 
     Single source of truth for backend dispatch and constructor arguments.
     Used by get_embed_model (from settings) and by cached callers (e.g. vector store).
+    MLX models are shared through the model registry, which applies idle
+    unloading and the memory budget to them alongside the LLM.
 
     Args:
         backend: Embedding backend name (e.g. ``mlx`` or ``huggingface``).
@@ -42,10 +45,15 @@ def build_embed_model(backend: str, model_name: str, batch_size: int) -> "BaseEm
         Configured BaseEmbedding instance.
     """
     if backend == "mlx":
+        from agentlayer.llm.registry import get_model_registry
+
         logger.debug(f"Loading MLX embedding model: {model_name}")
-        embed_model = MLXEmbedding(
-            model_name=model_name,
-            embed_batch_size=batch_size,
+        embed_model = get_model_registry().register(
+            f"embedding:{model_name}:{batch_size}",
+            MLXEmbedding(
+                model_name=model_name,
+                embed_batch_size=batch_size,
+            ),
         )
         logger.info(f"MLX embedding model loaded: {model_name}")
         return embed_model
@@ -71,7 +79,8 @@ def get_embed_model(resilient: bool = False) -> "BaseEmbedding":
 
     Returns:
         BaseEmbedding instance configured from settings. When resilient=True,
-        returns a ResilientEmbedding wrapper around the base model.
+        returns a ResilientEmbedding wrapper around the base model, backed by
+        the persistent embedding cache when ``embedding.cache_enabled``.
     """
     settings = get_settings()
     embed_settings = settings.embedding
@@ -86,9 +95,20 @@ def get_embed_model(resilient: bool = False) -> "BaseEmbedding":
         logger.debug(
             f"Wrapping embedding model in ResilientEmbedding with batch_size={batch_size}"
         )
+        cache = None
+        if embed_settings.cache_enabled:
+            cache_path = embed_settings.cache_path or (
+                settings.cache_path / "embedding_cache.db"
+            )
+            cache = get_embedding_cache(cache_path, embed_settings.cache_max_entries)
         embed_model = ResilientEmbedding(
             embed_model=embed_model,
             batch_size=batch_size,
+            cache=cache,
+            cache_profile=EmbeddingIdentity(
+                backend=embed_settings.backend,
+                model_name=embed_settings.model_name,
+            ).profile,
         )
         logger.info("ResilientEmbedding wrapper enabled")
 
@@ -99,10 +119,52 @@ __all__ = [
     "EMBEDDING_BACKEND_METADATA_KEY",
     "EMBEDDING_MODEL_METADATA_KEY",
     "EMBEDDING_PROFILE_METADATA_KEY",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     "EmbeddingIdentity",
     "MLXEmbedding",
     "ResilientEmbedding",
     "build_embed_model",
     "get_embed_model",
+    "get_embedding_cache",
+    "get_query_embeddings",
     "resolve_embedding_identity",
 ]
+
+
+def get_query_embeddings(
+    embed_model: "BaseEmbedding",
+    queries: list[str],
+) -> list[list[float]]:
+    """Embed several queries with as few model calls as the backend allows.
+
+    MLX embeds queries exactly like documents, so the whole list goes through
+    one batched text-embedding call. HuggingFace models batch through their
+    query prompt. Any other model gets one ``get_query_embedding`` call per
+    query.
+
+    Args:
+        embed_model: Embedding model (optionally wrapped in ResilientEmbedding).
+        queries: Query strings to embed.
+
+    Returns:
+        One embedding per query, in input order.
+    """
+    if len(queries) <= 1:
+        return [embed_model.get_query_embedding(query) for query in queries]
+
+    inner = embed_model
+    if isinstance(embed_model, ResilientEmbedding):
+        inner = embed_model._embed_model
+
+    if isinstance(inner, MLXEmbedding):
+        return embed_model.get_text_embedding_batch(list(queries))
+
+    try:
+        from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+    except ImportError:  # pragma: no cover - optional integration
+        HuggingFaceEmbedding = None  # type: ignore[assignment,misc]
+    if HuggingFaceEmbedding is not None and isinstance(inner, HuggingFaceEmbedding):
+        return inner._embed(list(queries), prompt_name="query")
+
+    return [embed_model.get_query_embedding(query) for query in queries]
@@ -0,0 +1,262 @@
+"""agentlayer.embedding.cache - Persistent content-addressed embedding cache.
+
+Stores text embeddings in a SQLite sidecar keyed by the embedding profile
+(``EmbeddingIdentity.profile``) and the SHA-256 of the exact text sent to the
+model. Identical text is therefore embedded once per model, regardless of
+which document or path it came from.
+
+Vectors are stored as float32 blobs. The cache is bounded by entry count and
+evicts least-recently-used rows once it grows past ``max_entries``.
+
+Example usage:
+    from agentlayer.embedding.cache import get_embedding_cache
+
+    cache = get_embedding_cache(path, max_entries=200_000)
+    vectors = cache.get_many("mlx:model", texts)   # None for misses
+    cache.set_many("mlx:model", texts, embeddings)
+    print(cache.stats.hits, cache.stats.misses)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Sequence
+
+from agentlayer.logging import get_logger
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "get_embedding_cache",
+]
+
+logger = get_logger(__name__)
+
+# Keep well under SQLite's default host-parameter limit.
+_BATCH_SIZE = 500
+
+# On overflow, evict down to this fraction of max_entries so eviction runs
+# once per batch of inserts rather than on every insert.
+_EVICT_TO_FRACTION = 0.9
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    """Counters for an EmbeddingCache since it was opened.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that had to be embedded by the model.
+        evictions: Entries removed to stay within ``max_entries``.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache with LRU eviction.
+
+    Safe to share across threads; all access is serialized on one connection.
+
+    Args:
+        path: SQLite file for the cache (created if missing).
+        max_entries: Maximum number of cached vectors across all profiles.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 200_000) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file for the cache.
+            max_entries: Maximum number of cached vectors.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                id INTEGER PRIMARY KEY,
+                profile TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used_at REAL NOT NULL,
+                UNIQUE (profile, text_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used "
+            "ON embedding_cache (last_used_at)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        self.stats = EmbeddingCacheStats()
+
+    @property
+    def path(self) -> Path:
+        """Path of the cache database."""
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_many(self, profile: str, texts: Sequence[str]) -> list[list[float] | None]:
+        """Look up cached embeddings for ``texts``.
+
+        Args:
+            profile: Embedding profile the vectors must belong to.
+            texts: Texts exactly as they would be sent to the model.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        hashes = [_text_hash(text) for text in texts]
+        found: dict[str, tuple[int, list[float]]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for i in range(0, len(unique), _BATCH_SIZE):
+                batch = unique[i : i + _BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = self._conn.execute(
+                    f"SELECT id, text_hash, vector FROM embedding_cache "
+                    f"WHERE profile = ? AND text_hash IN ({placeholders})",
+                    [profile, *batch],
+                ).fetchall()
+                for row_id, text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[text_hash] = (row_id, vector.tolist())
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used_at = ? WHERE id = ?",
+                    [(now, row_id) for row_id, _ in found.values()],
+                )
+                self._conn.commit()
+
+            results = [found[h][1] if h in found else None for h in hashes]
+            hits = sum(1 for result in results if result is not None)
+            self.stats.hits += hits
+            self.stats.misses += len(results) - hits
+        return results
+
+    def set_many(
+        self,
+        profile: str,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        """Store embeddings for ``texts``, evicting old entries if needed.
+
+        Args:
+            profile: Embedding profile that produced the vectors.
+            texts: Texts exactly as sent to the model.
+            embeddings: Vectors aligned with ``texts``.
+        """
+        if not texts:
+            return
+        now = time.time()
+        rows = [
+            (profile, _text_hash(text), array("f", embedding).tobytes(), now)
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO embedding_cache (profile, text_hash, vector, last_used_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (profile, text_hash) DO UPDATE SET "
+                "vector = excluded.vector, last_used_at = excluded.last_used_at",
+                rows,
+            )
+            self._conn.commit()
+            if self._conn.total_changes - before:
+                self._count = self._conn.execute(
+                    "SELECT COUNT(*) FROM embedding_cache"
+                ).fetchone()[0]
+            if self._count > self._max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries down to the eviction target.
+
+        Caller must hold ``self._lock``.
+        """
+        target = int(self._max_entries * _EVICT_TO_FRACTION)
+        excess = self._count - target
+        if excess <= 0:
+            return
+        cursor = self._conn.execute(
+            "DELETE FROM embedding_cache WHERE id IN ("
+            "SELECT id FROM embedding_cache ORDER BY last_used_at LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        self._count -= cursor.rowcount
+        self.stats.evictions += cursor.rowcount
+        logger.debug(f"Evicted {cursor.rowcount} embedding cache entries")
+
+    def clear(self, profile: str | None = None) -> int:
+        """Remove cached entries.
+
+        Args:
+            profile: Only remove entries of this profile; all when None.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if profile is None:
+                cursor = self._conn.execute("DELETE FROM embedding_cache")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM embedding_cache WHERE profile = ?", (profile,)
+                )
+            self._conn.commit()
+            self._count -= cursor.rowcount
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=4)
+def get_embedding_cache(path: Path, max_entries: int) -> EmbeddingCache:
+    """Return a process-wide EmbeddingCache for ``path``.
+
+    Args:
+        path: SQLite file for the cache.
+        max_entries: Maximum number of cached vectors.
+
+    Returns:
+        Shared EmbeddingCache instance.
+    """
+    return EmbeddingCache(path, max_entries=max_entries)
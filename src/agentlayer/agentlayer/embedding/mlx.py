@@ -14,6 +14,8 @@ Example usage:
     embeddings = embed_model.get_text_embedding_batch(["Hello", "World"])
 """
 
+import threading
+import time
 from typing import Any
 
 from agentlayer.logging import get_logger
@@ -53,6 +55,8 @@ class MLXEmbedding(BaseEmbedding):
     # Private attributes for lazy-loaded model and tokenizer
     _model: Any = PrivateAttr(default=None)
     _tokenizer: Any = PrivateAttr(default=None)
+    _load_lock: Any = PrivateAttr(default_factory=threading.Lock)
+    _last_used_at: float = PrivateAttr(default=0.0)
 
     def __init__(
         self,
@@ -81,18 +85,53 @@ class MLXEmbedding(BaseEmbedding):
         """Return the class name for serialization."""
         return "MLXEmbedding"
 
-    def _load_model(self) -> None:
+    def _load_model(self) -> tuple[Any, Any]:
         """Load the model and tokenizer if not already loaded.
 
         Performs lazy initialization of the MLX model and tokenizer.
         Called automatically before first embedding generation.
+
+        Returns:
+            (model, tokenizer) references that stay valid for the caller
+            even if the model is unloaded concurrently.
         """
-        if self._model is None or self._tokenizer is None:
-            from mlx_embeddings.utils import load
+        with self._load_lock:
+            if self._model is None or self._tokenizer is None:
+                from mlx_embeddings.utils import load
+
+                logger.info(f"Loading MLX embedding model: {self.model_name}")
+                self._model, self._tokenizer = load(self.model_name)
+                logger.info(f"MLX embedding model loaded: {self.model_name}")
+            self._last_used_at = time.monotonic()
+            return self._model, self._tokenizer
+
+    def load(self) -> None:
+        """Load the model now instead of on first embedding (warm-up)."""
+        self._load_model()
+
+    def unload(self) -> None:
+        """Release the model and tokenizer; they reload on next use."""
+        with self._load_lock:
+            self._model = None
+            self._tokenizer = None
+        logger.debug(f"MLX embedding model unloaded: {self.model_name}")
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model is currently loaded."""
+        return self._model is not None
 
-            logger.info(f"Loading MLX embedding model: {self.model_name}")
-            self._model, self._tokenizer = load(self.model_name)
-            logger.info(f"MLX embedding model loaded: {self.model_name}")
+    @property
+    def last_used_at(self) -> float:
+        """``time.monotonic()`` of the last embedding call (0.0 if never)."""
+        return self._last_used_at
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the loaded weights in bytes (0 when unloaded)."""
+        from agentlayer.llm.registry import parameter_nbytes
+
+        return parameter_nbytes(self._model)
 
     def _get_text_embedding(self, text: str) -> list[float]:
         """Generate embedding for a single text.
@@ -103,17 +142,17 @@ class MLXEmbedding(BaseEmbedding):
         Returns:
             List of floats representing the text embedding.
         """
-        self._load_model()
+        model, tokenizer = self._load_model()
 
         # Tokenize and generate embedding
-        inputs = self._tokenizer.batch_encode_plus(
+        inputs = tokenizer.batch_encode_plus(
             [text],
             return_tensors="mlx",
             padding=True,
             truncation=True,
             max_length=512,
         )
-        outputs = self._model(
+        outputs = model(
             inputs["input_ids"],
             attention_mask=inputs["attention_mask"],
         )
@@ -136,19 +175,19 @@ class MLXEmbedding(BaseEmbedding):
         if not texts:
             return []
 
-        self._load_model()
+        model, tokenizer = self._load_model()
 
         #logger.info(f"Generating embeddings for {len(texts)} texts")
 
         # Batch tokenize and generate embeddings
-        inputs = self._tokenizer.batch_encode_plus(
+        inputs = tokenizer.batch_encode_plus(
             texts,
             return_tensors="mlx",
             padding=True,
             truncation=True,
             max_length=512,
         )
-        outputs = self._model(
+        outputs = model(
             inputs["input_ids"],
             attention_mask=inputs["attention_mask"],
         )
@@ -4,6 +4,9 @@ Provides a wrapper around BaseEmbedding that falls back to single-item
 embedding when batch embedding fails. This is useful for handling edge
 cases where certain texts cause batch processing to fail.
 
+When given an EmbeddingCache, text embeddings are looked up by
+(profile, text hash) first and only cache misses reach the wrapped model.
+
 Example usage:
     from agentlayer.embedding.resilient import ResilientEmbedding
     from agentlayer.embedding.mlx import MLXEmbedding
@@ -19,6 +22,8 @@ from agentlayer.logging import get_logger
 from llama_index.core.bridge.pydantic import PrivateAttr
 from llama_index.core.embeddings import BaseEmbedding
 
+from agentlayer.embedding.cache import EmbeddingCache
+
 __all__ = ["ResilientEmbedding"]
 
 logger = get_logger(__name__)
@@ -49,11 +54,15 @@ class ResilientEmbedding(BaseEmbedding):
     # Private attributes
     _embed_model: BaseEmbedding = PrivateAttr()
     _batch_size: int = PrivateAttr()
+    _cache: EmbeddingCache | None = PrivateAttr(default=None)
+    _cache_profile: str = PrivateAttr(default="")
 
     def __init__(
         self,
         embed_model: BaseEmbedding,
         batch_size: int = 32,
+        cache: EmbeddingCache | None = None,
+        cache_profile: str | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the resilient embedding wrapper.
@@ -61,6 +70,10 @@ class ResilientEmbedding(BaseEmbedding):
         Args:
             embed_model: The underlying BaseEmbedding to wrap.
             batch_size: Batch size for embedding operations. Defaults to 32.
+            cache: Optional persistent cache consulted for text embeddings.
+            cache_profile: Embedding profile used to key cache entries
+                (``EmbeddingIdentity.profile``). Defaults to the wrapped
+                model's name.
             **kwargs: Additional arguments passed to BaseEmbedding.
         """
         # Get model_name from the wrapped model if available
@@ -72,6 +85,8 @@ class ResilientEmbedding(BaseEmbedding):
         )
         self._embed_model = embed_model
         self._batch_size = batch_size
+        self._cache = cache
+        self._cache_profile = cache_profile or str(wrapped_model_name)
         logger.debug(
             f"Initialized ResilientEmbedding wrapping {wrapped_model_name} "
             f"with batch_size={batch_size}"
@@ -82,10 +97,15 @@ class ResilientEmbedding(BaseEmbedding):
         """Return the class name for serialization."""
         return "ResilientEmbedding"
 
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """The embedding cache in use, if any."""
+        return self._cache
+
     def _get_text_embedding(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
-        Delegates to the underlying embed model.
+        Delegates to the underlying embed model on a cache miss.
 
         Args:
             text: The text to embed.
@@ -93,7 +113,9 @@ class ResilientEmbedding(BaseEmbedding):
         Returns:
             List of floats representing the text embedding.
         """
-        return self._embed_model._get_text_embedding(text)
+        if self._cache is None:
+            return self._embed_model._get_text_embedding(text)
+        return self._get_text_embeddings([text])[0]
 
     def _get_query_embedding(self, query: str) -> list[float]:
         """Generate embedding for a query.
@@ -108,11 +130,39 @@ class ResilientEmbedding(BaseEmbedding):
         """
         return self._embed_model._get_query_embedding(query)
 
+    def _split_cached(
+        self, texts: list[str]
+    ) -> tuple[list[list[float] | None], list[int]]:
+        """Look texts up in the cache.
+
+        Returns:
+            Tuple of (per-text cached vector or None, indices of misses).
+        """
+        assert self._cache is not None
+        cached = self._cache.get_many(self._cache_profile, texts)
+        misses = [i for i, vector in enumerate(cached) if vector is None]
+        return cached, misses
+
+    def _merge_cached(
+        self,
+        texts: list[str],
+        cached: list[list[float] | None],
+        misses: list[int],
+        embedded: list[list[float]],
+    ) -> list[list[float]]:
+        """Store newly embedded misses and merge them into the cached results."""
+        assert self._cache is not None
+        self._cache.set_many(self._cache_profile, [texts[i] for i in misses], embedded)
+        for i, vector in zip(misses, embedded):
+            cached[i] = vector
+        return cached  # type: ignore[return-value]
+
     def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts with fallback.
+        """Generate embeddings for multiple texts with cache and fallback.
 
-        Attempts batch embedding first. If batch processing fails,
-        falls back to embedding texts one at a time.
+        Serves cached vectors first, then embeds the misses: attempts batch
+        embedding, and if batch processing fails, falls back to embedding
+        texts one at a time.
 
         Args:
             texts: List of texts to embed.
@@ -122,7 +172,17 @@ class ResilientEmbedding(BaseEmbedding):
         """
         if not texts:
             return []
+        if self._cache is None:
+            return self._embed_batch(texts)
+
+        cached, misses = self._split_cached(texts)
+        if not misses:
+            return cached  # type: ignore[return-value]
+        embedded = self._embed_batch([texts[i] for i in misses])
+        return self._merge_cached(texts, cached, misses, embedded)
 
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with the wrapped model, falling back to one at a time."""
         try:
             return self._embed_model._get_text_embeddings(texts)
         except Exception as e:
@@ -191,8 +251,7 @@ class ResilientEmbedding(BaseEmbedding):
     async def _aget_text_embedding(self, text: str) -> list[float]:
         """Async wrapper for single text embedding generation.
 
-        Delegates to the underlying model's async method if available,
-        otherwise falls back to sync.
+        Delegates to the underlying model's async method on a cache miss.
 
         Args:
             text: The text to embed.
@@ -200,13 +259,16 @@ class ResilientEmbedding(BaseEmbedding):
         Returns:
             List of floats representing the text embedding.
         """
-        return await self._embed_model._aget_text_embedding(text)
+        if self._cache is None:
+            return await self._embed_model._aget_text_embedding(text)
+        return (await self._aget_text_embeddings([text]))[0]
 
     async def _aget_text_embeddings(self, texts: list[str]) -> list[list[float]]:
-        """Async wrapper for batch text embedding with fallback.
+        """Async wrapper for batch text embedding with cache and fallback.
 
-        Attempts batch embedding first. If batch processing fails,
-        falls back to embedding texts one at a time.
+        Serves cached vectors first, then embeds the misses: attempts batch
+        embedding, and if batch processing fails, falls back to embedding
+        texts one at a time.
 
         Args:
             texts: List of texts to embed.
@@ -216,7 +278,17 @@ class ResilientEmbedding(BaseEmbedding):
         """
         if not texts:
             return []
+        if self._cache is None:
+            return await self._aembed_batch(texts)
+
+        cached, misses = self._split_cached(texts)
+        if not misses:
+            return cached  # type: ignore[return-value]
+        embedded = await self._aembed_batch([texts[i] for i in misses])
+        return self._merge_cached(texts, cached, misses, embedded)
 
+    async def _aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Async batch embed with the wrapped model, with per-text fallback."""
         try:
             return await self._embed_model._aget_text_embeddings(texts)
         except Exception as e:
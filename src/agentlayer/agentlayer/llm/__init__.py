@@ -18,6 +18,12 @@ from agentlayer.llm.prompts import (
     format_rerank_prompt,
 )
 from agentlayer.llm.provider import LLMProviderError, MLXProvider
+from agentlayer.llm.registry import (
+    ModelRegistry,
+    ModelStats,
+    get_model_registry,
+    warm_up_models,
+)
 from agentlayer.llm.reranker import (
     CachedReranker,
     RerankConfig,
@@ -31,6 +37,11 @@ __all__ = [
     # Provider
     "LLMProviderError",
     "MLXProvider",
+    # Registry
+    "ModelRegistry",
+    "ModelStats",
+    "get_model_registry",
+    "warm_up_models",
     # Reranker
     "CachedReranker",
     "RerankConfig",
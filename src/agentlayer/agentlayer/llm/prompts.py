@@ -6,12 +6,18 @@ Prompts are designed to work with small local models (MLX).
 
 from __future__ import annotations
 
+import re
+
 __all__ = [
     "QUERY_EXPANSION_PROMPT",
     "QUERY_EXPANSION_SYSTEM",
+    "RERANK_LISTWISE_PROMPT",
+    "RERANK_LISTWISE_SYSTEM",
     "RERANK_PROMPT",
     "RERANK_SYSTEM",
+    "format_listwise_rerank_prompt",
     "format_rerank_prompt",
+    "parse_listwise_scores",
 ]
 
 
@@ -30,6 +36,27 @@ Document:
 Is this document relevant to the query? Answer Yes or No:"""
 
 
+# System prompt for listwise reranking (several documents per call)
+RERANK_LISTWISE_SYSTEM = """You are a relevance judge. You will be given a search query and numbered documents.
+Rate how relevant each document is to the query on a scale from 0 (irrelevant) to 10 (directly answers the query).
+Respond with one line per document in the form [number] score, for example:
+[1] 8
+[2] 0
+Do not explain your reasoning."""
+
+
+# Template for listwise rerank user message
+RERANK_LISTWISE_PROMPT = """Query: {query}
+
+{documents}
+
+Rate each of the {count} documents above:"""
+
+
+# Matches "[3] 7", "3: 7", "3 - 7.5" etc. at the start of a response line
+_LISTWISE_LINE_RE = re.compile(r"^\s*\[?(\d+)\]?\s*[:=\-]?\s*(\d+(?:\.\d+)?)")
+
+
 # System prompt for query expansion
 QUERY_EXPANSION_SYSTEM = """You are a search query expansion assistant. Your task is to generate alternative query formulations to improve search recall.
 
@@ -81,3 +108,54 @@ def format_rerank_prompt(
         query=query,
         document=document_text,
     )
+
+
+def format_listwise_rerank_prompt(
+    query: str,
+    documents: list[str],
+    max_doc_chars: int = 800,
+) -> str:
+    """Format the listwise rerank prompt with a query and several documents.
+
+    Args:
+        query: The search query.
+        documents: Document texts to evaluate, numbered from 1 in order.
+        max_doc_chars: Maximum characters per document. Kept lower than
+            the pointwise limit so a batch fits the model context.
+
+    Returns:
+        Formatted prompt string ready for LLM.
+    """
+    sections = []
+    for i, text in enumerate(documents, start=1):
+        if len(text) > max_doc_chars:
+            text = text[:max_doc_chars] + "..."
+        sections.append(f"Document [{i}]:\n{text}")
+
+    return RERANK_LISTWISE_PROMPT.format(
+        query=query,
+        documents="\n\n".join(sections),
+        count=len(documents),
+    )
+
+
+def parse_listwise_scores(response: str, count: int) -> list[float | None]:
+    """Parse a listwise rerank response into normalized scores.
+
+    Args:
+        response: Raw LLM output, one "[number] score" line per document.
+        count: Number of documents in the prompt.
+
+    Returns:
+        One entry per document: the score scaled to [0, 1], or None when
+        the response did not rate that document.
+    """
+    scores: list[float | None] = [None] * count
+    for line in response.splitlines():
+        match = _LISTWISE_LINE_RE.match(line)
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        if 0 <= index < count and scores[index] is None:
+            scores[index] = min(max(float(match.group(2)) / 10.0, 0.0), 1.0)
+    return scores
@@ -13,6 +13,8 @@ Example:
 from __future__ import annotations
 
 import sys
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from agentlayer.logging import get_logger
@@ -40,7 +42,9 @@ class MLXProvider:
     """MLX local LLM provider for Apple Silicon.
 
     Uses mlx-lm for text generation (reranking, query expansion).
-    Models are lazy-loaded on first use.
+    Models are lazy-loaded on first use. Prefer the shared instance from
+    ``agentlayer.llm.registry.get_model_registry().get_llm()`` over
+    constructing providers directly, so the model is loaded once per process.
 
     Attributes:
         model_name: HuggingFace model name/path.
@@ -66,32 +70,48 @@ class MLXProvider:
         self._model: Any = None
         self._tokenizer: Any = None
         self._loaded = False
+        self._load_lock = threading.Lock()
+        self._last_used_at = 0.0
 
-    def _ensure_loaded(self) -> None:
-        """Load the model if not already loaded."""
-        if self._loaded:
-            return
+    def _ensure_loaded(self) -> tuple[Any, Any]:
+        """Load the model if not already loaded.
 
-        import time
+        Returns:
+            (model, tokenizer) references that stay valid for the caller
+            even if the model is unloaded concurrently.
+        """
+        with self._load_lock:
+            if self._loaded:
+                return self._model, self._tokenizer
 
-        logger.info(f"Loading MLX model: {self.model_name}")
-        start = time.perf_counter()
+            logger.info(f"Loading MLX model: {self.model_name}")
+            start = time.perf_counter()
 
-        try:
-            from mlx_lm import load
+            try:
+                from mlx_lm import load
 
-            self._model, self._tokenizer = load(self.model_name)
-            self._loaded = True
+                self._model, self._tokenizer = load(self.model_name)
+                self._loaded = True
 
-            elapsed = time.perf_counter() - start
-            logger.info(f"Model loaded in {elapsed:.2f}s")
+                elapsed = time.perf_counter() - start
+                logger.info(f"Model loaded in {elapsed:.2f}s")
 
-        except ImportError as e:
-            raise LLMProviderError(
-                "mlx-lm not installed. Install with: pip install mlx-lm"
-            ) from e
-        except Exception as e:
-            raise LLMProviderError(f"Failed to load model: {e}") from e
+            except ImportError as e:
+                raise LLMProviderError(
+                    "mlx-lm not installed. Install with: pip install mlx-lm"
+                ) from e
+            except Exception as e:
+                raise LLMProviderError(f"Failed to load model: {e}") from e
+
+            return self._model, self._tokenizer
+
+    def load(self) -> None:
+        """Load the model now instead of on first generate() (warm-up).
+
+        Raises:
+            LLMProviderError: If the model cannot be loaded.
+        """
+        self._ensure_loaded()
 
     async def generate(
         self,
@@ -115,9 +135,8 @@ class MLXProvider:
         Raises:
             LLMProviderError: If generation fails.
         """
-        import time
-
-        self._ensure_loaded()
+        model, tokenizer = self._ensure_loaded()
+        self._last_used_at = time.monotonic()
 
         start = time.perf_counter()
         prompt_preview = prompt[:80] + "..." if len(prompt) > 80 else prompt
@@ -134,8 +153,8 @@ class MLXProvider:
             messages.append({"role": "user", "content": prompt})
 
             # Apply chat template if available
-            if hasattr(self._tokenizer, "apply_chat_template"):
-                formatted_prompt = self._tokenizer.apply_chat_template(
+            if hasattr(tokenizer, "apply_chat_template"):
+                formatted_prompt = tokenizer.apply_chat_template(
                     messages,
                     tokenize=False,
                     add_generation_prompt=True,
@@ -150,8 +169,8 @@ class MLXProvider:
             sampler = make_sampler(temp=temperature)
 
             response = generate(
-                self._model,
-                self._tokenizer,
+                model,
+                tokenizer,
                 prompt=formatted_prompt,
                 max_tokens=max_tokens,
                 sampler=sampler,
@@ -166,12 +185,19 @@ class MLXProvider:
 
         except Exception as e:
             raise LLMProviderError(f"Generation failed: {e}") from e
+        finally:
+            self._last_used_at = time.monotonic()
 
     def unload(self) -> None:
-        """Unload model to free memory."""
-        self._model = None
-        self._tokenizer = None
-        self._loaded = False
+        """Unload model to free memory.
+
+        In-flight generate() calls keep their own references and finish
+        normally; the memory is released once they return.
+        """
+        with self._load_lock:
+            self._model = None
+            self._tokenizer = None
+            self._loaded = False
         logger.debug("Model unloaded")
 
     @property
@@ -179,6 +205,18 @@ class MLXProvider:
         """Whether the model is currently loaded."""
         return self._loaded
 
+    @property
+    def last_used_at(self) -> float:
+        """``time.monotonic()`` of the last generate() call (0.0 if never)."""
+        return self._last_used_at
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the loaded weights in bytes (0 when unloaded)."""
+        from agentlayer.llm.registry import parameter_nbytes
+
+        return parameter_nbytes(self._model)
+
     @staticmethod
     def is_available() -> bool:
         """Check if MLX is available on this system.
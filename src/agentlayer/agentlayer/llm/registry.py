@@ -0,0 +1,414 @@
+"""agentlayer.llm.registry - Shared registry for locally loaded models.
+
+Keeps one instance per local model (MLX LLMs and MLX embedding models) for
+the whole process, so components such as query expansion and reranking reuse
+an already-loaded model instead of paying a fresh ``mlx_lm.load`` each time.
+
+The registry also bounds what stays resident:
+
+- Idle unload: models not used for ``idle_unload_seconds`` are unloaded by a
+  background reaper thread and reload lazily on next use.
+- Memory budget: before a model is handed out, least-recently-used loaded
+  models are unloaded until the estimated total fits ``memory_budget_mb``.
+
+Unloading never breaks an in-flight call: providers capture their model
+references for the duration of a call, so memory is released once the call
+returns.
+
+Example usage:
+    from agentlayer.llm.registry import get_model_registry, warm_up_models
+
+    registry = get_model_registry()
+    provider = registry.get_llm()          # shared MLXProvider
+    response = await provider.generate("Is this relevant? Yes or No:")
+
+    warm_up_models()                       # load LLM + embedding at server start
+    print(registry.stats())
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+from agentlayer.logging import get_logger
+
+from agentlayer.settings import get_settings
+
+if TYPE_CHECKING:
+    from agentlayer.llm.provider import MLXProvider
+
+__all__ = [
+    "ManagedModel",
+    "ModelRegistry",
+    "ModelStats",
+    "get_model_registry",
+    "parameter_nbytes",
+    "warm_up_models",
+]
+
+logger = get_logger(__name__)
+
+# Upper bound on how long the reaper sleeps between idle checks.
+_MAX_REAP_INTERVAL_S = 30.0
+
+
+class ManagedModel(Protocol):
+    """A lazily loaded model the registry can load, unload, and measure."""
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model weights are resident."""
+        ...
+
+    @property
+    def last_used_at(self) -> float:
+        """``time.monotonic()`` of the last call that used the model."""
+        ...
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated resident size in bytes (0 when unloaded or unknown)."""
+        ...
+
+    def load(self) -> None:
+        """Load the model weights if not already loaded."""
+        ...
+
+    def unload(self) -> None:
+        """Release the model weights."""
+        ...
+
+
+def parameter_nbytes(model: Any) -> int:
+    """Estimate the size of an MLX model from its parameter arrays.
+
+    Args:
+        model: An ``mlx.nn.Module`` (or None).
+
+    Returns:
+        Total ``nbytes`` across parameters, or 0 if it cannot be determined.
+    """
+    if model is None:
+        return 0
+    try:
+        from mlx.utils import tree_flatten
+
+        return int(sum(array.nbytes for _, array in tree_flatten(model.parameters())))
+    except Exception:
+        return 0
+
+
+@dataclass(frozen=True, slots=True)
+class ModelStats:
+    """Snapshot of one registered model.
+
+    Attributes:
+        key: Registry key (e.g. ``llm:<model_name>``).
+        loaded: Whether the model is currently resident.
+        memory_bytes: Estimated resident size (last known size if unloaded).
+        idle_seconds: Seconds since the model was last used.
+    """
+
+    key: str
+    loaded: bool
+    memory_bytes: int
+    idle_seconds: float
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Registry bookkeeping for one model."""
+
+    model: ManagedModel
+    touched_at: float
+    known_bytes: int = 0
+
+
+class ModelRegistry:
+    """Thread-safe, process-wide owner of local models.
+
+    Args:
+        idle_unload_seconds: Unload models idle for this long; 0 disables.
+        memory_budget_mb: Maximum estimated size of loaded models; 0 means
+            unlimited.
+        clock: Monotonic clock, injectable for tests.
+        llm_factory: Builds an LLM provider for a model name. Defaults to
+            MLXProvider.
+    """
+
+    def __init__(
+        self,
+        idle_unload_seconds: float = 0.0,
+        memory_budget_mb: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        llm_factory: Callable[[str], ManagedModel] | None = None,
+    ) -> None:
+        """Create an empty registry.
+
+        Args:
+            idle_unload_seconds: Idle timeout before unloading; 0 disables.
+            memory_budget_mb: Budget for loaded models in MiB; 0 is unlimited.
+            clock: Monotonic clock.
+            llm_factory: Factory for LLM providers.
+        """
+        self._idle_unload_seconds = idle_unload_seconds
+        self._memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self._clock = clock
+        self._llm_factory = llm_factory
+        self._lock = threading.RLock()
+        self._entries: dict[str, _Entry] = {}
+        self._stop = threading.Event()
+        self._reaper: threading.Thread | None = None
+
+    def get_llm(self, model_name: str | None = None) -> "MLXProvider":
+        """Return the shared LLM provider for ``model_name``.
+
+        Creates the provider on first request. Makes room under the memory
+        budget before returning, so the caller can load it.
+
+        Args:
+            model_name: Model to use. Defaults to ``settings.llm.model_name``.
+
+        Returns:
+            Shared provider instance.
+
+        Raises:
+            LLMProviderError: If the provider cannot be created on this system.
+        """
+        name = model_name or get_settings().llm.model_name
+        key = f"llm:{name}"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                factory = self._llm_factory or _default_llm_factory
+                entry = self._add(key, factory(name))
+            entry.touched_at = self._clock()
+            self._enforce_budget(keep=key)
+            return entry.model  # type: ignore[return-value]
+
+    def register(self, key: str, model: ManagedModel) -> ManagedModel:
+        """Register an externally built model (e.g. an embedding model).
+
+        Args:
+            key: Unique registry key.
+            model: Model to manage.
+
+        Returns:
+            The model already registered under ``key``, or ``model``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._add(key, model)
+            return entry.model
+
+    def get(self, key: str) -> ManagedModel | None:
+        """Return the model registered under ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.touched_at = self._clock()
+            self._enforce_budget(keep=key)
+            return entry.model
+
+    def warm_up(self, keys: list[str] | None = None) -> list[str]:
+        """Load models ahead of the first request.
+
+        Args:
+            keys: Keys to load. Defaults to every registered model.
+
+        Returns:
+            Keys that were loaded successfully.
+        """
+        with self._lock:
+            targets = list(self._entries) if keys is None else keys
+        loaded: list[str] = []
+        for key in targets:
+            model = self.get(key)
+            if model is None:
+                continue
+            started = time.perf_counter()
+            try:
+                model.load()
+            except Exception as e:
+                logger.warning(f"Warm-up failed for {key}: {e}")
+                continue
+            with self._lock:
+                entry = self._entries[key]
+                entry.known_bytes = model.memory_bytes or entry.known_bytes
+                self._enforce_budget(keep=key)
+            loaded.append(key)
+            logger.info(f"Warmed up {key} in {time.perf_counter() - started:.2f}s")
+        return loaded
+
+    def unload_idle(self) -> list[str]:
+        """Unload models that have been idle longer than the idle timeout.
+
+        Returns:
+            Keys that were unloaded.
+        """
+        if self._idle_unload_seconds <= 0:
+            return []
+        now = self._clock()
+        unloaded: list[str] = []
+        with self._lock:
+            for key, entry in self._entries.items():
+                if not entry.model.is_loaded:
+                    continue
+                if now - self._last_used(entry) >= self._idle_unload_seconds:
+                    self._unload(key, entry, reason="idle")
+                    unloaded.append(key)
+        return unloaded
+
+    def unload_all(self) -> None:
+        """Unload every registered model."""
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry.model.is_loaded:
+                    self._unload(key, entry, reason="unload_all")
+
+    def loaded_bytes(self) -> int:
+        """Estimated total size of currently loaded models."""
+        with self._lock:
+            return sum(
+                self._size(entry) for entry in self._entries.values() if entry.model.is_loaded
+            )
+
+    def stats(self) -> list[ModelStats]:
+        """Return a snapshot of every registered model."""
+        now = self._clock()
+        with self._lock:
+            return [
+                ModelStats(
+                    key=key,
+                    loaded=entry.model.is_loaded,
+                    memory_bytes=self._size(entry),
+                    idle_seconds=max(0.0, now - self._last_used(entry)),
+                )
+                for key, entry in self._entries.items()
+            ]
+
+    def close(self) -> None:
+        """Stop the idle reaper and unload every model."""
+        self._stop.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=1.0)
+            self._reaper = None
+        self.unload_all()
+
+    def _add(self, key: str, model: ManagedModel) -> _Entry:
+        """Add an entry and start the reaper if idle unloading is on.
+
+        Caller must hold ``self._lock``.
+        """
+        entry = _Entry(model=model, touched_at=self._clock())
+        self._entries[key] = entry
+        logger.debug(f"Registered model {key}")
+        if self._idle_unload_seconds > 0 and self._reaper is None:
+            self._reaper = threading.Thread(
+                target=self._reap_loop, name="model-registry-reaper", daemon=True
+            )
+            self._reaper.start()
+        return entry
+
+    def _reap_loop(self) -> None:
+        """Background loop that unloads idle models."""
+        interval = min(self._idle_unload_seconds / 2, _MAX_REAP_INTERVAL_S)
+        while not self._stop.wait(interval):
+            try:
+                self.unload_idle()
+            except Exception as e:
+                logger.warning(f"Idle model unload failed: {e}")
+
+    def _last_used(self, entry: _Entry) -> float:
+        """Most recent of registry access and the model's own last use."""
+        return max(entry.touched_at, entry.model.last_used_at)
+
+    def _size(self, entry: _Entry) -> int:
+        """Current size estimate, refreshing the last known size when loaded.
+
+        Caller must hold ``self._lock``.
+        """
+        if entry.model.is_loaded:
+            entry.known_bytes = entry.model.memory_bytes or entry.known_bytes
+        return entry.known_bytes
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Unload LRU models until ``keep`` fits within the memory budget.
+
+        ``keep`` counts at its last known size even if it is not loaded yet,
+        so a model about to be loaded makes room for itself.
+
+        Caller must hold ``self._lock``.
+        """
+        if self._memory_budget_bytes <= 0:
+            return
+        loaded = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if key != keep and entry.model.is_loaded
+        ]
+        total = self._size(self._entries[keep]) + sum(self._size(e) for _, e in loaded)
+        for key, entry in sorted(loaded, key=lambda item: self._last_used(item[1])):
+            if total <= self._memory_budget_bytes:
+                break
+            total -= self._size(entry)
+            self._unload(key, entry, reason="memory budget")
+
+    def _unload(self, key: str, entry: _Entry, reason: str) -> None:
+        """Unload one model. Caller must hold ``self._lock``."""
+        self._size(entry)
+        entry.model.unload()
+        logger.info(f"Unloaded {key} ({reason}, ~{entry.known_bytes / 1024 / 1024:.0f} MiB)")
+
+
+def _default_llm_factory(model_name: str) -> ManagedModel:
+    """Build an MLXProvider for ``model_name``."""
+    from agentlayer.llm.provider import MLXProvider
+
+    return MLXProvider(model_name)
+
+
+@lru_cache(maxsize=1)
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide ModelRegistry configured from settings.
+
+    Returns:
+        Shared ModelRegistry instance.
+    """
+    llm_settings = get_settings().llm
+    return ModelRegistry(
+        idle_unload_seconds=llm_settings.idle_unload_seconds,
+        memory_budget_mb=llm_settings.memory_budget_mb,
+    )
+
+
+def warm_up_models() -> list[str]:
+    """Load the configured LLM and embedding model into the shared registry.
+
+    Intended for long-running entry points (MCP server, CLI) so the first
+    request does not pay model load latency. Models that are unavailable
+    on this system (e.g. MLX off Apple Silicon) are skipped.
+
+    Returns:
+        Keys of the models that were loaded.
+    """
+    from agentlayer.embedding import build_embed_model
+    from agentlayer.llm.provider import MLXProvider
+
+    settings = get_settings()
+    registry = get_model_registry()
+    if MLXProvider.is_available():
+        registry.get_llm()
+    if settings.embedding.backend == "mlx":
+        build_embed_model(
+            backend=settings.embedding.backend,
+            model_name=settings.embedding.model_name,
+            batch_size=settings.embedding.batch_size,
+        )
+    return registry.warm_up()
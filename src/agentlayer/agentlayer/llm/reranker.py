@@ -449,7 +449,10 @@ class CachedReranker:
         """Rerank nodes with cache integration.
 
         Checks the cache for previously computed scores, reranks only
-        uncached nodes, stores new scores, and merges results.
+        uncached nodes, stores new scores, and merges results. Nodes the
+        underlying reranker returns unchanged (not scored) are ranked after
+        all scored and cached nodes and returned as the same objects, so
+        callers can tell them apart by identity.
 
         Args:
             query: The search query string.
@@ -457,7 +460,8 @@ class CachedReranker:
             top_n: Number of top results to return. If None, returns all.
 
         Returns:
-            List of NodeWithScore objects sorted by score, limited to top_n.
+            List of NodeWithScore objects sorted by rerank score, followed
+            by unscored nodes, limited to top_n.
         """
         from llama_index.core.schema import NodeWithScore as NWS
 
@@ -470,10 +474,10 @@ class CachedReranker:
         uncached_nodes: list[NWS] = []
         cached_scores: dict[str, float] = {}
 
-        for node in nodes:
-            node_hash = self._get_node_hash(node)
-            cached_score = self.cache.get_rerank(query, node_hash, self.model_name)
+        node_hashes = [self._get_node_hash(node) for node in nodes]
+        lookups = self.cache.get_rerank_many(query, node_hashes, self.model_name)
 
+        for node, node_hash, cached_score in zip(nodes, node_hashes, lookups):
             if cached_score is not None:
                 cached_scores[node_hash] = cached_score
                 cached_nodes.append(node)
@@ -487,22 +491,31 @@ class CachedReranker:
             f"for query '{query[:50]}...'"
         )
 
-        # Rerank uncached nodes
+        # Rerank uncached nodes. Nodes handed back unchanged were not scored
+        # (e.g. latency budget exhausted) and still carry their retrieval
+        # score, which is on a different scale from rerank scores.
         reranked_uncached: list[NWS] = []
+        unscored_nodes: list[NWS] = []
         if uncached_nodes:
-            reranked_uncached = self.reranker.rerank(
+            input_ids = {id(node) for node in uncached_nodes}
+            for node in self.reranker.rerank(
                 nodes=uncached_nodes,
                 query=query,
                 top_n=None,  # Get all scores, we'll limit later
-            )
+            ):
+                if id(node) in input_ids:
+                    unscored_nodes.append(node)
+                else:
+                    reranked_uncached.append(node)
 
-            # Cache the new scores
-            for node in reranked_uncached:
-                node_hash = self._get_node_hash(node)
-                score = node.score or 0.0
-                self.cache.set_rerank(query, node_hash, self.model_name, score)
+            # Cache the new scores; retrieval scores are never cached.
+            new_scores = {
+                self._get_node_hash(node): node.score or 0.0
+                for node in reranked_uncached
+            }
+            self.cache.set_rerank_many(query, new_scores, self.model_name)
 
-            logger.debug(f"Cached {len(reranked_uncached)} new rerank scores")
+            logger.debug(f"Cached {len(new_scores)} new rerank scores")
 
         # Update cached nodes with their cached scores
         updated_cached: list[NWS] = []
@@ -513,9 +526,11 @@ class CachedReranker:
             updated_node = node.model_copy(update={"score": cached_score})
             updated_cached.append(updated_node)
 
-        # Merge and sort all results
+        # Merge and sort scored results; unscored nodes follow in the
+        # order the reranker returned them.
         all_results = reranked_uncached + updated_cached
         all_results.sort(key=lambda n: n.score or 0.0, reverse=True)
+        all_results.extend(unscored_nodes)
 
         # Limit to top_n
         if top_n is not None:
@@ -523,7 +538,8 @@ class CachedReranker:
 
         logger.debug(
             f"Rerank complete: {len(all_results)} results "
-            f"(from {cache_hits} cached + {len(reranked_uncached)} reranked)"
+            f"(from {cache_hits} cached + {len(reranked_uncached)} reranked, "
+            f"{len(unscored_nodes)} unscored)"
         )
 
         return all_results
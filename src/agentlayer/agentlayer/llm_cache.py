@@ -5,13 +5,36 @@ to reduce redundant API calls and improve response times.
 
 The cache uses a SQLite table with TTL-based expiration. Cache keys are
 SHA-256 hashes of the cache type and input parameters.
+
+Bulk lookups and writes (``get_many``/``set_many``) cost one ``IN`` query and
+one ``INSERT ... ON CONFLICT DO UPDATE`` regardless of how many keys they
+cover; the single-key helpers are thin wrappers around them.
+
+Lookups go through two tiers. A bounded in-process LRU (``LLMMemoryCache``),
+shared by every LLMCache in the process, answers repeated lookups without
+touching SQLite; only its misses reach the table. Writes go to both tiers.
+Expired rows are removed in bulk by ``purge_expired`` (indexed on
+``created_at``), which the catalog runs when it opens the database.
+
+Example usage:
+    cache = LLMCache(session)
+    scores = cache.get_many("rerank", [(query, h, model) for h in doc_hashes])
+    cache.set_many("rerank", [((query, h, model), 0.8) for h in new_hashes])
+    print(cache.stats.memory_hits, cache.stats.disk_hits, cache.stats.misses)
 """
 
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Sequence
 
-from sqlalchemy import DateTime, String, Text, select
+from sqlalchemy import DateTime, Index, String, Text, delete, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 from agentlayer.logging import get_logger
@@ -22,8 +45,20 @@ __all__ = [
     "LLMCache",
     "LLMCacheBase",
     "LLMCacheEntry",
+    "LLMCacheStats",
+    "LLMMemoryCache",
+    "create_llm_cache_tables",
+    "get_llm_cache_stats",
+    "get_llm_memory_cache",
+    "purge_expired",
 ]
 
+# Keys per IN (...) query, well under SQLite's host-parameter limit.
+_BATCH_SIZE = 500
+
+# Default capacity of the in-process LRU tier.
+DEFAULT_MEMORY_ENTRIES = 10_000
+
 
 class LLMCacheBase(DeclarativeBase):
     """Declarative base for LLM cache tables."""
@@ -45,6 +80,7 @@ class LLMCacheEntry(LLMCacheBase):
     """
 
     __tablename__ = "llm_cache_v2"
+    __table_args__ = (Index("ix_llm_cache_v2_created_at", "created_at"),)
 
     cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
     cache_type: Mapped[str] = mapped_column(Text, nullable=False)
@@ -58,6 +94,190 @@ class LLMCacheEntry(LLMCacheBase):
         )
 
 
+@dataclass(slots=True)
+class LLMCacheStats:
+    """Counters for the two-tier LLM cache since the process started.
+
+    Attributes:
+        memory_hits: Lookups answered by the in-process LRU.
+        disk_hits: Lookups answered by the SQLite table.
+        misses: Lookups found in neither tier (or expired).
+        evictions: Entries dropped from the LRU to stay within capacity.
+        expired_purged: Expired rows deleted from the SQLite table.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired_purged: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier."""
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+
+# Counters shared by every cache tier in the process (see get_llm_cache_stats).
+_PROCESS_STATS = LLMCacheStats()
+
+
+def get_llm_cache_stats() -> LLMCacheStats:
+    """Return the process-wide LLM cache counters."""
+    return _PROCESS_STATS
+
+
+class LLMMemoryCache:
+    """Thread-safe, bounded LRU of serialized cache entries.
+
+    Entries are keyed by (scope, cache_key), where the scope identifies the
+    database, so caches over different databases never see each other's
+    results. Values are the stored JSON strings, so callers always get a
+    fresh decoded copy.
+
+    Args:
+        max_entries: Capacity; 0 disables the memory tier.
+        stats: Counters to update. Defaults to the process-wide stats.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        stats: LLMCacheStats | None = None,
+    ) -> None:
+        """Create an empty LRU.
+
+        Args:
+            max_entries: Capacity; 0 disables the memory tier.
+            stats: Counters to update. Defaults to the process-wide stats.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = stats if stats is not None else _PROCESS_STATS
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, scope: str, cache_key: str, cutoff: datetime) -> str | None:
+        """Return the JSON for ``cache_key`` if cached and created after ``cutoff``.
+
+        Args:
+            scope: Database scope of the entry.
+            cache_key: SHA-256 cache key.
+            cutoff: Entries created before this are expired and dropped.
+
+        Returns:
+            Stored JSON string, or None on a miss.
+        """
+        key = (scope, cache_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < cutoff:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, scope: str, cache_key: str, result_json: str, created_at: datetime) -> None:
+        """Insert or refresh an entry, evicting least-recently-used ones.
+
+        Args:
+            scope: Database scope of the entry.
+            cache_key: SHA-256 cache key.
+            result_json: Stored JSON string.
+            created_at: Creation time used for TTL checks.
+        """
+        if self._max_entries <= 0:
+            return
+        key = (scope, cache_key)
+        with self._lock:
+            self._entries[key] = (result_json, created_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def discard(self, scope: str, cache_keys: Sequence[str]) -> None:
+        """Drop entries (e.g. after their rows were deleted)."""
+        with self._lock:
+            for cache_key in cache_keys:
+                self._entries.pop((scope, cache_key), None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=4)
+def get_llm_memory_cache(max_entries: int = DEFAULT_MEMORY_ENTRIES) -> LLMMemoryCache:
+    """Return the process-wide memory tier with the given capacity.
+
+    Args:
+        max_entries: LRU capacity; 0 disables the memory tier.
+
+    Returns:
+        Shared LLMMemoryCache instance.
+    """
+    return LLMMemoryCache(max_entries=max_entries)
+
+
+def create_llm_cache_tables(engine: Engine) -> None:
+    """Create the LLM cache table and its ``created_at`` index.
+
+    ``create_all`` skips indexes on tables that already exist, so the index
+    is also created explicitly for databases from before it was added.
+
+    Args:
+        engine: Engine of the database that holds the cache.
+    """
+    LLMCacheBase.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_llm_cache_v2_created_at "
+                "ON llm_cache_v2 (created_at)"
+            )
+        )
+
+
+def purge_expired(
+    bind: Engine | Connection | Session,
+    ttl_hours: int,
+    stats: LLMCacheStats | None = None,
+) -> int:
+    """Delete every cache row older than ``ttl_hours`` in one statement.
+
+    Uses the ``created_at`` index, so the cost is proportional to the number
+    of expired rows rather than the table size.
+
+    Args:
+        bind: Engine (committed here), connection, or session to run on.
+        ttl_hours: Entry time-to-live in hours.
+        stats: Counters to add the purged row count to. Defaults to the
+            process-wide stats.
+
+    Returns:
+        Number of rows deleted.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=ttl_hours)
+    stmt = delete(LLMCacheEntry).where(LLMCacheEntry.created_at < cutoff)
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            purged = conn.execute(stmt).rowcount
+    else:
+        purged = bind.execute(stmt).rowcount
+    (stats if stats is not None else _PROCESS_STATS).expired_purged += purged
+    if purged:
+        logger.info(f"Purged {purged} expired LLM cache entries")
+    return purged
+
+
 class LLMCache:
     """LLM result cache with TTL-based expiration.
 
@@ -81,15 +301,37 @@ class LLMCache:
 
     DEFAULT_TTL_HOURS: int = 168  # 1 week
 
-    def __init__(self, session: Session, ttl_hours: int | None = None) -> None:
+    def __init__(
+        self,
+        session: Session,
+        ttl_hours: int | None = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
         """Initialize the LLM cache.
 
         Args:
             session: SQLAlchemy session for database operations.
             ttl_hours: Cache TTL in hours. Defaults to DEFAULT_TTL_HOURS (168).
+            memory_entries: Capacity of the shared in-process LRU tier;
+                0 disables it. Defaults to DEFAULT_MEMORY_ENTRIES.
         """
         self._session = session
         self._ttl_hours = ttl_hours if ttl_hours is not None else self.DEFAULT_TTL_HOURS
+        self._memory = get_llm_memory_cache(memory_entries)
+        self._scope = str(session.get_bind().url)
+
+    @property
+    def stats(self) -> LLMCacheStats:
+        """Process-wide hit/miss/eviction counters for the cache tiers."""
+        return self._memory.stats
+
+    def purge_expired(self) -> int:
+        """Delete all expired rows in one indexed statement.
+
+        Returns:
+            Number of rows deleted.
+        """
+        return purge_expired(self._session, self._ttl_hours, stats=self.stats)
 
     def _make_key(self, cache_type: str, *parts: str) -> str:
         """Generate a SHA-256 cache key from type and parts.
@@ -107,71 +349,109 @@ class LLMCache:
         key_string = ":".join([cache_type] + list(parts))
         return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
 
-    def _is_expired(self, entry: LLMCacheEntry) -> bool:
-        """Check if a cache entry has expired.
-
-        Args:
-            entry: The cache entry to check.
+    def get_many(self, cache_type: str, keys: Sequence[Sequence[str]]) -> list[Any | None]:
+        """Retrieve several cached results, memory tier first.
 
-        Returns:
-            True if the entry is older than the TTL, False otherwise.
-        """
-        expiry_time = entry.created_at + timedelta(hours=self._ttl_hours)
-        return datetime.utcnow() > expiry_time
-
-    def _get_entry(self, cache_key: str) -> LLMCacheEntry | None:
-        """Retrieve a cache entry by key, returning None if expired.
+        Keys missing from the in-process LRU are fetched with one query per
+        500 keys. Expired entries are treated as misses and deleted in a
+        single statement.
 
         Args:
-            cache_key: The SHA-256 hash key.
+            cache_type: The type of cached item (e.g., "expansion", "rerank").
+            keys: Key parts per lookup, as passed to ``_make_key``.
 
         Returns:
-            The cache entry if found and not expired, None otherwise.
+            One decoded JSON value per key, or None if not found/expired.
         """
-        stmt = select(LLMCacheEntry).where(LLMCacheEntry.cache_key == cache_key)
-        entry = self._session.execute(stmt).scalar_one_or_none()
+        if not keys:
+            return []
+        cache_keys = [self._make_key(cache_type, *parts) for parts in keys]
+        cutoff = datetime.utcnow() - timedelta(hours=self._ttl_hours)
+
+        found: dict[str, str] = {}
+        pending: list[str] = []
+        for key in dict.fromkeys(cache_keys):
+            result_json = self._memory.get(self._scope, key, cutoff)
+            if result_json is None:
+                pending.append(key)
+            else:
+                found[key] = result_json
+        memory_hits = len(found)
+
+        rows: dict[str, tuple[str, datetime]] = {}
+        for i in range(0, len(pending), _BATCH_SIZE):
+            stmt = select(
+                LLMCacheEntry.cache_key,
+                LLMCacheEntry.result_json,
+                LLMCacheEntry.created_at,
+            ).where(LLMCacheEntry.cache_key.in_(pending[i : i + _BATCH_SIZE]))
+            for cache_key, result_json, created_at in self._session.execute(stmt):
+                rows[cache_key] = (result_json, created_at)
+
+        expired = [key for key, (_, created_at) in rows.items() if created_at < cutoff]
+        if expired:
+            logger.debug("Deleting expired cache entries", count=len(expired))
+            self._session.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.cache_key.in_(expired))
+            )
+            for key in expired:
+                del rows[key]
 
-        if entry is None:
-            return None
+        for key, (result_json, created_at) in rows.items():
+            self._memory.put(self._scope, key, result_json, created_at)
+            found[key] = result_json
 
-        if self._is_expired(entry):
-            logger.debug("Cache entry expired", cache_key=cache_key[:16])
-            self._session.delete(entry)
-            return None
+        stats = self.stats
+        stats.memory_hits += memory_hits
+        stats.disk_hits += len(rows)
+        stats.misses += len(pending) - len(rows)
 
-        return entry
+        return [
+            json.loads(found[key]) if key in found else None for key in cache_keys
+        ]
 
-    def _set_entry(
-        self, cache_key: str, cache_type: str, result_json: str
-    ) -> LLMCacheEntry:
-        """Create or update a cache entry.
+    def set_many(
+        self, cache_type: str, entries: Sequence[tuple[Sequence[str], Any]]
+    ) -> None:
+        """Create or update several cache entries in one upsert.
+
+        Updating an entry refreshes its ``created_at`` (and hence its TTL).
+        Entries are written through to the in-process LRU.
 
         Args:
-            cache_key: The SHA-256 hash key.
             cache_type: The type of cached item.
-            result_json: JSON-serialized result data.
-
-        Returns:
-            The created or updated cache entry.
+            entries: (key parts, JSON-serializable result) pairs.
         """
-        stmt = select(LLMCacheEntry).where(LLMCacheEntry.cache_key == cache_key)
-        entry = self._session.execute(stmt).scalar_one_or_none()
-
-        if entry is not None:
-            entry.result_json = result_json
-            entry.created_at = datetime.utcnow()
-            logger.debug("Updated cache entry", cache_key=cache_key[:16])
-        else:
-            entry = LLMCacheEntry(
-                cache_key=cache_key,
-                cache_type=cache_type,
-                result_json=result_json,
-                created_at=datetime.utcnow(),
-            )
-            self._session.add(entry)
-            logger.debug("Created cache entry", cache_key=cache_key[:16])
-
-        return entry
+        if not entries:
+            return
+        now = datetime.utcnow()
+        values = {
+            self._make_key(cache_type, *parts): json.dumps(result)
+            for parts, result in entries
+        }
+        stmt = sqlite_insert(LLMCacheEntry)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.cache_key],
+            set_={
+                "result_json": stmt.excluded.result_json,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        self._session.execute(
+            stmt,
+            [
+                {
+                    "cache_key": cache_key,
+                    "cache_type": cache_type,
+                    "result_json": result_json,
+                    "created_at": now,
+                }
+                for cache_key, result_json in values.items()
+            ],
+        )
+        for cache_key, result_json in values.items():
+            self._memory.put(self._scope, cache_key, result_json, now)
+        logger.debug("Upserted cache entries", cache_type=cache_type, count=len(values))
 
     def get_expansion(self, query: str, model: str) -> dict | None:
         """Retrieve a cached query expansion result.
@@ -183,15 +463,14 @@ class LLMCache:
         Returns:
             The cached expansion result dict, or None if not found/expired.
         """
-        cache_key = self._make_key("expansion", query, model)
-        entry = self._get_entry(cache_key)
+        result = self.get_many("expansion", [(query, model)])[0]
 
-        if entry is None:
+        if result is None:
             logger.debug("Expansion cache miss", query=query[:50], model=model)
             return None
 
         logger.debug("Expansion cache hit", query=query[:50], model=model)
-        return json.loads(entry.result_json)
+        return result
 
     def set_expansion(self, query: str, model: str, result: dict) -> None:
         """Cache a query expansion result.
@@ -201,9 +480,7 @@ class LLMCache:
             model: The LLM model identifier.
             result: The expansion result to cache.
         """
-        cache_key = self._make_key("expansion", query, model)
-        result_json = json.dumps(result)
-        self._set_entry(cache_key, "expansion", result_json)
+        self.set_many("expansion", [((query, model), result)])
         logger.debug("Cached expansion result", query=query[:50], model=model)
 
     def get_rerank(self, query: str, doc_hash: str, model: str) -> float | None:
@@ -217,15 +494,14 @@ class LLMCache:
         Returns:
             The cached rerank score, or None if not found/expired.
         """
-        cache_key = self._make_key("rerank", query, doc_hash, model)
-        entry = self._get_entry(cache_key)
+        score = self.get_rerank_many(query, [doc_hash], model)[0]
 
-        if entry is None:
+        if score is None:
             logger.debug("Rerank cache miss", doc_hash=doc_hash[:16])
             return None
 
         logger.debug("Rerank cache hit", doc_hash=doc_hash[:16])
-        return float(entry.result_json)
+        return score
 
     def set_rerank(self, query: str, doc_hash: str, model: str, score: float) -> None:
         """Cache a rerank score.
@@ -236,6 +512,34 @@ class LLMCache:
             model: The reranker model identifier.
             score: The rerank score to cache.
         """
-        cache_key = self._make_key("rerank", query, doc_hash, model)
-        self._set_entry(cache_key, "rerank", str(score))
+        self.set_rerank_many(query, {doc_hash: score}, model)
         logger.debug("Cached rerank score", doc_hash=doc_hash[:16], score=score)
+
+    def get_rerank_many(
+        self, query: str, doc_hashes: Sequence[str], model: str
+    ) -> list[float | None]:
+        """Retrieve cached rerank scores for several documents at once.
+
+        Args:
+            query: The search query.
+            doc_hashes: Hashes identifying the documents/chunks.
+            model: The reranker model identifier.
+
+        Returns:
+            One score per hash, or None if not found/expired.
+        """
+        results = self.get_many("rerank", [(query, h, model) for h in doc_hashes])
+        return [None if result is None else float(result) for result in results]
+
+    def set_rerank_many(self, query: str, scores: dict[str, float], model: str) -> None:
+        """Cache rerank scores for several documents in one upsert.
+
+        Args:
+            query: The search query.
+            scores: Rerank score per document hash.
+            model: The reranker model identifier.
+        """
+        self.set_many(
+            "rerank",
+            [((query, doc_hash, model), score) for doc_hash, score in scores.items()],
+        )
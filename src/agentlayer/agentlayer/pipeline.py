@@ -6,7 +6,7 @@ and settings access used by both DatasetIngestPipeline and DatasetIndexPipeline.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,8 @@ __all__ = [
     "BasePipeline",
 ]
 
+T = TypeVar("T")
+
 
 class BasePipeline(BaseModel):
     """Shared base for ingest and index pipelines.
@@ -35,6 +37,14 @@ class BasePipeline(BaseModel):
         default=1,
         description="Reserved; pipelines run with 1 worker because persistence writes to SQLite.",
     )
+    writer: Optional[Any] = Field(
+        default=None,
+        description=(
+            "Optional single-writer executor (``run(fn)``) for database writes, "
+            "e.g. catalog.store.writer.SQLiteWriter. When unset, writes use the "
+            "ambient session."
+        ),
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -42,6 +52,12 @@ class BasePipeline(BaseModel):
         """Generate a cache key for a dataset."""
         return f"{dataset_name}"
 
+    def _write(self, fn: Callable[[], T]) -> T:
+        """Run a database step on ``writer`` if set, else inline."""
+        if self.writer is None:
+            return fn()
+        return self.writer.run(fn)
+
     def _get_embed_model(self) -> "BaseEmbedding":
         """Get embedding model, using resilient wrapper if enabled."""
         if self.embed_model is not None:
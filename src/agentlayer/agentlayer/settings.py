@@ -126,6 +126,36 @@ class PerformanceSettings(BaseSettings):
         ge=1,
         description="Default concurrency level for parallel operations",
     )
+    read_buffer_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024 * 1024,
+        description="Bytes of source files read ahead of the ingest pipeline",
+    )
+    max_parallel_datasets: int = Field(
+        default=2,
+        ge=1,
+        description="Datasets synced concurrently by DatasetSync.arun",
+    )
+    writer_commit_every: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum write jobs per commit on the SQLite writer thread",
+    )
+    read_pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="Pre-warmed read-only connections kept for search",
+    )
+    read_mmap_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="mmap_size of read-only search connections",
+    )
+    read_cache_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024 * 1024,
+        description="Page cache size of each read-only search connection",
+    )
     embedding_batch_size: int = Field(
         default=32,
         ge=1,
@@ -163,6 +193,19 @@ class DatabasesSettings(BaseSettings):
         default=None,
         description="Path to the content SQLite database (default: config_root / 'content.db')",
     )
+    content_compression: Literal["none", "zstd"] = Field(
+        default="none",
+        description=(
+            "Compression for document bodies in the content database "
+            "('zstd' requires the zstandard package)"
+        ),
+    )
+    content_compression_level: int = Field(
+        default=3,
+        ge=1,
+        le=22,
+        description="zstd level used when content_compression is 'zstd'",
+    )
 
 
 class EmbeddingSettings(BaseSettings):
@@ -195,6 +238,19 @@ class EmbeddingSettings(BaseSettings):
         ge=1,
         description="Embedding vector dimension (384 for MiniLM-L6-v2)",
     )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Reuse text embeddings from a persistent cache keyed by profile and text hash",
+    )
+    cache_path: Path | None = Field(
+        default=None,
+        description="Embedding cache SQLite file (default: cache_path / 'embedding_cache.db')",
+    )
+    cache_max_entries: int = Field(
+        default=200_000,
+        ge=1,
+        description="Maximum cached embeddings before least-recently-used entries are evicted",
+    )
 
 
 class LLMSettings(BaseSettings):
@@ -217,6 +273,20 @@ class LLMSettings(BaseSettings):
         default="mlx-community/Llama-3.2-1B-Instruct-4bit",
         description="Name or path of the generative LLM (must be autoregressive, not BERT)",
     )
+    idle_unload_seconds: float = Field(
+        default=900.0,
+        ge=0.0,
+        description="Unload local models (LLM and embedding) idle this long; 0 disables",
+    )
+    memory_budget_mb: int = Field(
+        default=0,
+        ge=0,
+        description="Budget for loaded local models in MiB; LRU models are unloaded to fit (0 = unlimited)",
+    )
+    warm_up: bool = Field(
+        default=False,
+        description="Load the LLM and embedding models when the MCP server or CLI starts",
+    )
 
 
 class SubstrateSettings(BaseSettings):
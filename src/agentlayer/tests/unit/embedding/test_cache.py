@@ -0,0 +1,56 @@
+"""Tests for the persistent embedding cache."""
+
+import pytest
+
+from agentlayer.embedding.cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=10)
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Stored vectors are returned for the same profile and text."""
+        assert cache.get_many("mlx:m", ["a"]) == [None]
+
+        cache.set_many("mlx:m", ["a"], [[0.5, 0.25]])
+
+        assert cache.get_many("mlx:m", ["a", "b"]) == [[0.5, 0.25], None]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    def test_profiles_are_isolated(self, cache):
+        """The same text under another profile is a miss."""
+        cache.set_many("mlx:m", ["a"], [[1.0]])
+
+        assert cache.get_many("huggingface:m", ["a"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries survive reopening the cache file."""
+        path = tmp_path / "embeddings.db"
+        first = EmbeddingCache(path)
+        first.set_many("mlx:m", ["a"], [[1.0, 2.0]])
+        first.close()
+
+        second = EmbeddingCache(path)
+        assert second.get_many("mlx:m", ["a"]) == [[1.0, 2.0]]
+        assert len(second) == 1
+        second.close()
+
+    def test_evicts_least_recently_used(self, cache):
+        """Overflowing max_entries evicts the oldest entries first."""
+        cache.set_many("mlx:m", ["keep"], [[1.0]])
+        cache.set_many("mlx:m", [f"t{i}" for i in range(9)], [[0.0]] * 9)
+        cache.get_many("mlx:m", ["keep"])
+
+        cache.set_many("mlx:m", ["new1", "new2"], [[0.0], [0.0]])
+
+        assert len(cache) == 9
+        assert cache.stats.evictions == 3
+        assert cache.get_many("mlx:m", ["keep"]) == [[1.0]]
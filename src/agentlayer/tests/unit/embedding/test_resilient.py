@@ -235,6 +235,16 @@ class TestResilientEmbeddingAsync:
 class TestGetEmbedModelResilient:
     """Tests for get_embed_model with resilient parameter."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_registry(self):
+        """Give each test its own model registry so mocks are not shared."""
+        from agentlayer.llm.registry import ModelRegistry
+
+        with patch(
+            "agentlayer.llm.registry.get_model_registry", return_value=ModelRegistry()
+        ):
+            yield
+
     def test_get_embed_model_not_resilient(self):
         """Test get_embed_model returns unwrapped model when resilient=False."""
         from agentlayer.embedding.resilient import ResilientEmbedding
@@ -269,6 +279,7 @@ class TestGetEmbedModelResilient:
             mock_settings.return_value.embedding.backend = "mlx"
             mock_settings.return_value.embedding.model_name = "test-model"
             mock_settings.return_value.embedding.batch_size = 16
+            mock_settings.return_value.embedding.cache_enabled = False
 
             # Import after patching
             from agentlayer.embedding import get_embed_model
@@ -300,3 +311,73 @@ class TestGetEmbedModelResilient:
 
         assert model is mock_model
         assert not isinstance(model, ResilientEmbedding)
+
+
+class CountingEmbedding(MockEmbedding):
+    """Mock embedding that records which texts reach the model."""
+
+    seen: list[str] = []
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.seen.extend(texts)
+        return [[float(len(text))] for text in texts]
+
+
+class TestResilientEmbeddingCache:
+    """Tests for ResilientEmbedding backed by an EmbeddingCache."""
+
+    def test_only_misses_reach_model(self, tmp_path):
+        """Cached texts are served without calling the wrapped model."""
+        from agentlayer.embedding.cache import EmbeddingCache
+        from agentlayer.embedding.resilient import ResilientEmbedding
+
+        base_model = CountingEmbedding()
+        base_model.seen = []
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+        resilient = ResilientEmbedding(
+            embed_model=base_model, cache=cache, cache_profile="mlx:mock"
+        )
+
+        first = resilient.get_text_embedding_batch(["a", "bb"])
+        second = resilient.get_text_embedding_batch(["bb", "ccc"])
+
+        assert first == [[1.0], [2.0]]
+        assert second == [[2.0], [3.0]]
+        assert base_model.seen == ["a", "bb", "ccc"]
+        assert cache.stats.hits == 1
+        cache.close()
+
+
+class TestGetQueryEmbeddings:
+    """Tests for multi-query embedding helper."""
+
+    def test_generic_model_uses_query_embedding_per_query(self):
+        """Models without a batched query path embed each query as a query."""
+        from agentlayer.embedding import get_query_embeddings
+
+        model = MockEmbedding(embedding_dim=2)
+
+        assert get_query_embeddings(model, ["a", "b"]) == [[0.2, 0.2], [0.2, 0.2]]
+        assert get_query_embeddings(model, []) == []
+
+    def test_huggingface_batches_with_query_prompt(self, monkeypatch):
+        """HuggingFace models embed all queries in one call with the query prompt."""
+        from types import ModuleType
+
+        from agentlayer.embedding import get_query_embeddings
+
+        calls: list[tuple[list[str], str]] = []
+
+        class FakeHF(MockEmbedding):
+            def _embed(self, sentences, prompt_name=None):
+                calls.append((list(sentences), prompt_name))
+                return [[1.0] for _ in sentences]
+
+        module = ModuleType("llama_index.embeddings.huggingface")
+        module.HuggingFaceEmbedding = FakeHF
+        monkeypatch.setitem(sys.modules, "llama_index.embeddings.huggingface", module)
+
+        result = get_query_embeddings(FakeHF(embedding_dim=1), ["a", "b", "c"])
+
+        assert result == [[1.0], [1.0], [1.0]]
+        assert calls == [(["a", "b", "c"], "query")]
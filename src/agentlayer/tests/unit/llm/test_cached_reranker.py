@@ -55,6 +55,27 @@ def make_mock_node(
     return mock_nws
 
 
+def make_mock_cache(lookup=None) -> MagicMock:
+    """Create a mock LLMCache whose bulk rerank lookup is driven by ``lookup``.
+
+    Args:
+        lookup: Score returned for every hash, or a callable
+            ``(query, doc_hash, model) -> score | None``.
+
+    Returns:
+        Mock LLMCache.
+    """
+    cache = MagicMock()
+
+    def get_rerank_many(query: str, doc_hashes: list[str], model: str) -> list:
+        if callable(lookup):
+            return [lookup(query, doc_hash, model) for doc_hash in doc_hashes]
+        return [lookup for _ in doc_hashes]
+
+    cache.get_rerank_many.side_effect = get_rerank_many
+    return cache
+
+
 class TestCachedRerankerInit:
     """Tests for CachedReranker initialization."""
 
@@ -147,8 +168,7 @@ class TestCachedRerankerCacheLookup:
     def test_cache_hit_uses_cached_score(self) -> None:
         """Uses cached score when cache hit occurs."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = 0.85  # Cache hit
+        mock_cache = make_mock_cache(0.85)  # Cache hit
 
         cached = CachedReranker(mock_reranker, mock_cache, model_name="test-model")
 
@@ -160,7 +180,7 @@ class TestCachedRerankerCacheLookup:
         mock_reranker.rerank.assert_not_called()
 
         # Should have looked up in cache
-        mock_cache.get_rerank.assert_called_once_with("test query", "hash1", "test-model")
+        mock_cache.get_rerank_many.assert_called_once_with("test query", ["hash1"], "test-model")
 
         # Result should have cached score
         assert len(result) == 1
@@ -169,8 +189,7 @@ class TestCachedRerankerCacheLookup:
     def test_cache_miss_calls_reranker(self) -> None:
         """Calls underlying reranker when cache miss occurs."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None  # Cache miss
+        mock_cache = make_mock_cache(None)  # Cache miss
 
         reranked_node = make_mock_node(node_id="node-1", content_hash="hash1", score=0.9)
         mock_reranker.rerank.return_value = [reranked_node]
@@ -190,8 +209,7 @@ class TestCachedRerankerCacheLookup:
     def test_cache_miss_stores_new_score(self) -> None:
         """Stores new score in cache after reranking."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None  # Cache miss
+        mock_cache = make_mock_cache(None)  # Cache miss
 
         reranked_node = make_mock_node(node_id="node-1", content_hash="hash1", score=0.9)
         mock_reranker.rerank.return_value = [reranked_node]
@@ -203,8 +221,55 @@ class TestCachedRerankerCacheLookup:
         cached.rerank("test query", [node], top_n=10)
 
         # Should store new score in cache
-        mock_cache.set_rerank.assert_called_once_with(
-            "test query", "hash1", "test-model", 0.9
+        mock_cache.set_rerank_many.assert_called_once_with(
+            "test query", {"hash1": 0.9}, "test-model"
+        )
+
+    def test_unscored_nodes_are_not_cached(self) -> None:
+        """Nodes returned unchanged by the reranker are not cached."""
+        mock_reranker = MagicMock()
+        mock_cache = make_mock_cache(None)  # Cache miss
+
+        scored = make_mock_node(node_id="node-1", content_hash="hash1", score=0.9)
+        unscored = make_mock_node(node_id="node-2", content_hash="hash2", score=0.03)
+        # node-2 was left unscored (e.g. budget exhausted) and handed back as-is
+        mock_reranker.rerank.return_value = [scored, unscored]
+
+        cached = CachedReranker(mock_reranker, mock_cache, model_name="test-model")
+
+        node = make_mock_node(node_id="node-1", content_hash="hash1", score=0.5)
+        results = cached.rerank("test query", [node, unscored], top_n=10)
+
+        mock_cache.set_rerank_many.assert_called_once_with(
+            "test query", {"hash1": 0.9}, "test-model"
+        )
+        assert unscored in results
+
+
+    def test_budget_exhausted_nodes_ranked_after_scored(self) -> None:
+        """Nodes left unscored mid-batch follow scored and cached nodes."""
+        mock_reranker = MagicMock()
+
+        def lookup(query: str, doc_hash: str, model: str) -> float | None:
+            return 0.2 if doc_hash == "hash1" else None
+
+        mock_cache = make_mock_cache(lookup)
+
+        node1 = make_mock_node(node_id="node-1", content_hash="hash1")
+        node2 = make_mock_node(node_id="node-2", content_hash="hash2")
+        # Budget ran out after node-2: node-3 keeps a high retrieval score
+        node3 = make_mock_node(node_id="node-3", content_hash="hash3", score=12.0)
+        scored2 = make_mock_node(node_id="node-2", content_hash="hash2", score=0.7)
+        mock_reranker.rerank.return_value = [scored2, node3]
+
+        cached = CachedReranker(mock_reranker, mock_cache, model_name="test-model")
+
+        results = cached.rerank("test query", [node1, node2, node3], top_n=10)
+
+        assert [r.node.node_id for r in results] == ["node-2", "node-1", "node-3"]
+        assert results[2] is node3
+        mock_cache.set_rerank_many.assert_called_once_with(
+            "test query", {"hash2": 0.7}, "test-model"
         )
 
 
@@ -214,7 +279,6 @@ class TestCachedRerankerPartialCacheHits:
     def test_partial_cache_hit_reranks_only_uncached(self) -> None:
         """Only reranks uncached nodes when partial cache hit."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
 
         # node-1 is cached, node-2 is not
         def get_rerank_side_effect(query: str, doc_hash: str, model: str) -> float | None:
@@ -222,7 +286,7 @@ class TestCachedRerankerPartialCacheHits:
                 return 0.8  # Cached
             return None  # Not cached
 
-        mock_cache.get_rerank.side_effect = get_rerank_side_effect
+        mock_cache = make_mock_cache(get_rerank_side_effect)
 
         # Reranker returns score for node-2
         reranked_node2 = make_mock_node(node_id="node-2", content_hash="hash2", score=0.7)
@@ -243,14 +307,13 @@ class TestCachedRerankerPartialCacheHits:
     def test_partial_cache_hit_merges_results(self) -> None:
         """Merges cached and reranked results correctly."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
 
         def get_rerank_side_effect(query: str, doc_hash: str, model: str) -> float | None:
             if doc_hash == "hash1":
                 return 0.6  # Cached score
             return None
 
-        mock_cache.get_rerank.side_effect = get_rerank_side_effect
+        mock_cache = make_mock_cache(get_rerank_side_effect)
 
         # Reranker returns higher score for node-2
         reranked_node2 = make_mock_node(node_id="node-2", content_hash="hash2", score=0.9)
@@ -276,8 +339,7 @@ class TestCachedRerankerScoreOrdering:
     def test_results_sorted_by_score_descending(self) -> None:
         """Results are sorted by score in descending order."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None  # All cache misses
+        mock_cache = make_mock_cache(None)  # All cache misses
 
         # Reranker returns nodes in non-sorted order
         nodes_reranked = [
@@ -305,8 +367,7 @@ class TestCachedRerankerScoreOrdering:
     def test_respects_top_n_limit(self) -> None:
         """Limits results to top_n after sorting."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None
+        mock_cache = make_mock_cache(None)
 
         nodes_reranked = [
             make_mock_node(node_id=f"node-{i}", content_hash=f"hash{i}", score=0.1 * i)
@@ -333,8 +394,7 @@ class TestCachedRerankerScoreOrdering:
     def test_top_n_none_returns_all(self) -> None:
         """Returns all results when top_n is None."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None
+        mock_cache = make_mock_cache(None)
 
         nodes_reranked = [
             make_mock_node(node_id=f"node-{i}", content_hash=f"hash{i}", score=0.1 * i)
@@ -369,13 +429,12 @@ class TestCachedRerankerEdgeCases:
 
         assert result == []
         mock_reranker.rerank.assert_not_called()
-        mock_cache.get_rerank.assert_not_called()
+        mock_cache.get_rerank_many.assert_not_called()
 
     def test_all_cache_hits_skips_reranker(self) -> None:
         """Skips reranker entirely when all nodes are cached."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = 0.75  # All cached
+        mock_cache = make_mock_cache(0.75)  # All cached
 
         cached = CachedReranker(mock_reranker, mock_cache)
 
@@ -397,8 +456,7 @@ class TestCachedRerankerEdgeCases:
     def test_handles_zero_score(self) -> None:
         """Handles nodes with zero score correctly."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None
+        mock_cache = make_mock_cache(None)
 
         reranked_node = make_mock_node(node_id="node-1", content_hash="hash1", score=0.0)
         mock_reranker.rerank.return_value = [reranked_node]
@@ -413,13 +471,14 @@ class TestCachedRerankerEdgeCases:
         assert result[0].score == 0.0
 
         # Should still cache zero score
-        mock_cache.set_rerank.assert_called_once_with("test query", "hash1", "default", 0.0)
+        mock_cache.set_rerank_many.assert_called_once_with(
+            "test query", {"hash1": 0.0}, "default"
+        )
 
     def test_handles_none_score_as_zero(self) -> None:
         """Handles None score as 0.0."""
         mock_reranker = MagicMock()
-        mock_cache = MagicMock()
-        mock_cache.get_rerank.return_value = None
+        mock_cache = make_mock_cache(None)
 
         reranked_node = make_mock_node(node_id="node-1", content_hash="hash1")
         reranked_node.score = None  # Explicitly None
@@ -432,4 +491,6 @@ class TestCachedRerankerEdgeCases:
         result = cached.rerank("test query", [node], top_n=10)
 
         # Should cache 0.0 for None score
-        mock_cache.set_rerank.assert_called_once_with("test query", "hash1", "default", 0.0)
+        mock_cache.set_rerank_many.assert_called_once_with(
+            "test query", {"hash1": 0.0}, "default"
+        )
@@ -2,7 +2,13 @@
 
 import pytest
 
-from agentlayer.llm.prompts import RERANK_PROMPT, RERANK_SYSTEM, format_rerank_prompt
+from agentlayer.llm.prompts import (
+    RERANK_PROMPT,
+    RERANK_SYSTEM,
+    format_listwise_rerank_prompt,
+    format_rerank_prompt,
+    parse_listwise_scores,
+)
 
 
 class TestPromptConstants:
@@ -116,3 +122,38 @@ class TestFormatRerankPrompt:
 
         assert "unicode" in result
         assert "Hello" in result
+
+
+class TestListwisePrompt:
+    """Tests for listwise rerank prompt formatting and parsing."""
+
+    def test_numbers_documents_in_order(self) -> None:
+        """Each document is numbered from 1 in input order."""
+        result = format_listwise_rerank_prompt("test query", ["first", "second"])
+
+        assert "test query" in result
+        assert result.index("Document [1]:\nfirst") < result.index("Document [2]:\nsecond")
+        assert "2 documents" in result
+
+    def test_truncates_each_document(self) -> None:
+        """Documents longer than max_doc_chars are truncated individually."""
+        result = format_listwise_rerank_prompt("q", ["x" * 500], max_doc_chars=50)
+
+        assert "x" * 50 + "..." in result
+        assert "x" * 51 not in result
+
+    def test_parses_scores_and_normalizes(self) -> None:
+        """Scores are scaled to [0, 1] and matched by document number."""
+        scores = parse_listwise_scores("[2] 5\n[1] 10\n3: 0", 3)
+
+        assert scores == [1.0, 0.5, 0.0]
+
+    def test_missing_and_out_of_range_entries(self) -> None:
+        """Unrated documents are None; unknown numbers and noise are ignored."""
+        scores = parse_listwise_scores("Sure!\n[1] 7\n[9] 3\n[1] 2", 2)
+
+        assert scores == [0.7, None]
+
+    def test_clamps_scores(self) -> None:
+        """Scores above 10 are clamped to 1.0."""
+        assert parse_listwise_scores("[1] 42", 1) == [1.0]
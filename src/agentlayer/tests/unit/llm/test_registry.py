@@ -0,0 +1,211 @@
+"""Tests for agentlayer.llm.registry."""
+
+import threading
+
+import pytest
+
+from agentlayer.llm.registry import ModelRegistry
+
+MIB = 1024 * 1024
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeModel:
+    """ManagedModel stand-in with a fixed loaded size."""
+
+    def __init__(self, clock: FakeClock, size_mb: int = 100) -> None:
+        self._clock = clock
+        self._size = size_mb * MIB
+        self.is_loaded = False
+        self.last_used_at = 0.0
+        self.loads = 0
+        self.unloads = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._size if self.is_loaded else 0
+
+    def load(self) -> None:
+        if not self.is_loaded:
+            self.loads += 1
+        self.is_loaded = True
+        self.last_used_at = self._clock()
+
+    def unload(self) -> None:
+        self.unloads += 1
+        self.is_loaded = False
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _registry(clock: FakeClock, **kwargs) -> tuple[ModelRegistry, list[str]]:
+    created: list[str] = []
+
+    def factory(name: str) -> FakeModel:
+        created.append(name)
+        return FakeModel(clock)
+
+    return ModelRegistry(clock=clock, llm_factory=factory, **kwargs), created
+
+
+class TestSharing:
+    """Tests for shared model instances."""
+
+    def test_get_llm_returns_one_instance_per_model(self, clock: FakeClock) -> None:
+        """Repeated requests reuse the provider instead of rebuilding it."""
+        registry, created = _registry(clock)
+
+        first = registry.get_llm("model-a")
+        second = registry.get_llm("model-a")
+        other = registry.get_llm("model-b")
+
+        assert first is second
+        assert other is not first
+        assert created == ["model-a", "model-b"]
+
+    def test_concurrent_get_llm_creates_once(self, clock: FakeClock) -> None:
+        """Concurrent first requests still build a single provider."""
+        registry, created = _registry(clock)
+        results: list[object] = []
+
+        def worker() -> None:
+            results.append(registry.get_llm("model-a"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert created == ["model-a"]
+        assert all(result is results[0] for result in results)
+
+    def test_register_keeps_first_model(self, clock: FakeClock) -> None:
+        """Registering an existing key returns the already registered model."""
+        registry, _ = _registry(clock)
+        first, second = FakeModel(clock), FakeModel(clock)
+
+        assert registry.register("embedding:x", first) is first
+        assert registry.register("embedding:x", second) is first
+        assert registry.get("embedding:x") is first
+
+
+class TestIdleUnload:
+    """Tests for idle-timeout unloading."""
+
+    def test_unloads_only_idle_models(self, clock: FakeClock) -> None:
+        """Models idle past the timeout are unloaded; recently used ones stay."""
+        registry, _ = _registry(clock, idle_unload_seconds=60)
+        idle = registry.register("embedding:idle", FakeModel(clock))
+        busy = registry.register("embedding:busy", FakeModel(clock))
+        idle.load()
+        busy.load()
+
+        clock.now += 45
+        busy.load()  # model reports its own use
+        clock.now += 30
+
+        assert registry.unload_idle() == ["embedding:idle"]
+        assert not idle.is_loaded
+        assert busy.is_loaded
+
+    def test_disabled_timeout_never_unloads(self, clock: FakeClock) -> None:
+        """idle_unload_seconds=0 keeps models loaded."""
+        registry, _ = _registry(clock, idle_unload_seconds=0)
+        model = registry.register("embedding:x", FakeModel(clock))
+        model.load()
+        clock.now += 10_000
+
+        assert registry.unload_idle() == []
+        assert model.is_loaded
+
+
+class TestMemoryBudget:
+    """Tests for the loaded-model memory budget."""
+
+    def test_unloads_least_recently_used_to_fit(self, clock: FakeClock) -> None:
+        """Requesting a model unloads LRU models until the budget fits."""
+        registry, _ = _registry(clock, memory_budget_mb=250)
+        embedding = registry.register("embedding:x", FakeModel(clock))
+        registry.warm_up(["embedding:x"])
+        clock.now += 1
+        llm_a = registry.get_llm("model-a")
+        llm_a.load()
+        clock.now += 1
+        llm_b = registry.get_llm("model-b")
+        llm_b.load()
+        clock.now += 1
+
+        # All three (300 MiB) exceed the budget: the next access evicts the LRU.
+        registry.get_llm("model-b")
+
+        assert not embedding.is_loaded
+        assert llm_a.is_loaded and llm_b.is_loaded
+        assert registry.loaded_bytes() == 200 * MIB
+
+    def test_reloaded_model_makes_room_for_its_known_size(self, clock: FakeClock) -> None:
+        """An unloaded model counts at its last known size when requested again."""
+        registry, _ = _registry(clock, memory_budget_mb=150)
+        registry.warm_up()  # no models yet
+        llm_a = registry.get_llm("model-a")
+        llm_a.load()
+        registry.warm_up(["llm:model-a"])
+        registry.unload_all()
+        clock.now += 1
+        llm_b = registry.get_llm("model-b")
+        llm_b.load()
+        clock.now += 1
+
+        assert registry.get_llm("model-a") is llm_a
+        assert not llm_b.is_loaded
+
+
+class TestWarmUp:
+    """Tests for warm-up and stats."""
+
+    def test_warm_up_loads_registered_models(self, clock: FakeClock) -> None:
+        """warm_up() loads every registered model and reports their keys."""
+        registry, _ = _registry(clock)
+        llm = registry.get_llm("model-a")
+        embedding = registry.register("embedding:x", FakeModel(clock))
+
+        loaded = registry.warm_up()
+
+        assert loaded == ["llm:model-a", "embedding:x"]
+        assert llm.is_loaded and embedding.is_loaded
+        assert {s.key: s.memory_bytes for s in registry.stats()} == {
+            "llm:model-a": 100 * MIB,
+            "embedding:x": 100 * MIB,
+        }
+
+    def test_warm_up_skips_failures(self, clock: FakeClock) -> None:
+        """A model that fails to load does not stop the others."""
+        registry, _ = _registry(clock)
+        broken = FakeModel(clock)
+        broken.load = lambda: (_ for _ in ()).throw(RuntimeError("no weights"))
+        registry.register("embedding:broken", broken)
+        registry.register("embedding:ok", FakeModel(clock))
+
+        assert registry.warm_up() == ["embedding:ok"]
+
+    def test_close_unloads_everything(self, clock: FakeClock) -> None:
+        """close() stops the reaper and unloads all models."""
+        registry, _ = _registry(clock, idle_unload_seconds=60)
+        model = registry.register("embedding:x", FakeModel(clock))
+        model.load()
+
+        registry.close()
+
+        assert not model.is_loaded
@@ -8,7 +8,15 @@ from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 from agentlayer.database import create_engine_for_path
-from agentlayer.llm_cache import LLMCache, LLMCacheBase, LLMCacheEntry
+from agentlayer.llm_cache import (
+    LLMCache,
+    LLMCacheBase,
+    LLMCacheEntry,
+    LLMCacheStats,
+    LLMMemoryCache,
+    create_llm_cache_tables,
+    purge_expired,
+)
 
 
 class TestLLMCacheEntry:
@@ -402,3 +410,198 @@ class TestLLMCacheIntegration:
 
         result = cache.get_expansion("query", "model")
         assert result == complex_data
+
+
+class TestLLMCacheBulk:
+    """Tests for get_many/set_many bulk operations."""
+
+    @pytest.fixture
+    def db_session(self, tmp_path: Path):
+        """Create a test database session."""
+        db_path = tmp_path / "test.db"
+        engine = create_engine_for_path(db_path)
+        LLMCacheBase.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        session = factory()
+        yield session
+        session.close()
+
+    def test_get_many_mixes_hits_and_misses(self, db_session) -> None:
+        """get_many returns values in input order with None for misses."""
+        cache = LLMCache(db_session, ttl_hours=24)
+        cache.set_many("rerank", [(("q", "h1", "m"), 0.9), (("q", "h3", "m"), 0.1)])
+
+        result = cache.get_many("rerank", [("q", "h1", "m"), ("q", "h2", "m"), ("q", "h3", "m")])
+
+        assert result == [0.9, None, 0.1]
+
+    def test_set_many_upserts_existing(self, db_session) -> None:
+        """set_many overwrites existing keys instead of failing on conflict."""
+        cache = LLMCache(db_session, ttl_hours=24)
+        cache.set_rerank("q", "h1", "m", 0.2)
+
+        cache.set_rerank_many("q", {"h1": 0.7, "h2": 0.4}, "m")
+
+        assert cache.get_rerank_many("q", ["h1", "h2"], "m") == [0.7, 0.4]
+        count = db_session.execute(text("SELECT COUNT(*) FROM llm_cache_v2")).scalar()
+        assert count == 2
+
+    def test_get_many_deletes_expired(self, db_session) -> None:
+        """Expired entries are misses and are removed."""
+        cache = LLMCache(db_session, ttl_hours=1)
+        cache.set_rerank_many("q", {"fresh": 0.5}, "m")
+        db_session.add(
+            LLMCacheEntry(
+                cache_key=cache._make_key("rerank", "q", "stale", "m"),
+                cache_type="rerank",
+                result_json="0.9",
+                created_at=datetime.utcnow() - timedelta(hours=2),
+            )
+        )
+        db_session.flush()
+
+        assert cache.get_rerank_many("q", ["fresh", "stale"], "m") == [0.5, None]
+        count = db_session.execute(text("SELECT COUNT(*) FROM llm_cache_v2")).scalar()
+        assert count == 1
+
+    def test_bulk_is_one_statement_each(self, db_session) -> None:
+        """A 40-key lookup and write cost one SELECT and one INSERT."""
+        from sqlalchemy import event
+
+        cache = LLMCache(db_session, ttl_hours=24)
+        hashes = [f"h{i}" for i in range(40)]
+        statements: list[str] = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, params, context, executemany) -> None:
+            statements.append(statement.split()[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            cache.get_rerank_many("q", hashes, "m")
+            cache.set_rerank_many("q", {h: 0.5 for h in hashes}, "m")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert statements.count("SELECT") == 1
+        assert statements.count("INSERT") == 1
+
+    def test_empty_inputs(self, db_session) -> None:
+        """Empty bulk calls are no-ops."""
+        cache = LLMCache(db_session, ttl_hours=24)
+
+        assert cache.get_many("rerank", []) == []
+        cache.set_many("rerank", [])
+
+
+class TestLLMCacheMemoryTier:
+    """Tests for the in-process LRU tier and expired-row purging."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path):
+        """Create a database with the LLM cache table."""
+        engine = create_engine_for_path(tmp_path / "test.db")
+        create_llm_cache_tables(engine)
+        return engine
+
+    def _count_selects(self, engine, fn) -> int:
+        from sqlalchemy import event
+
+        selects: list[str] = []
+
+        def record(conn, cursor, statement, params, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return len(selects)
+
+    def test_repeat_lookup_skips_disk(self, engine) -> None:
+        """A second lookup from a new LLMCache instance is served from memory."""
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        with factory() as session:
+            LLMCache(session).set_expansion("query", "model", {"lex": ["a"]})
+            session.commit()
+
+        with factory() as session:
+            cache = LLMCache(session)
+            before = cache.stats.memory_hits
+            selects = self._count_selects(
+                engine, lambda: cache.get_expansion("query", "model")
+            )
+
+        assert selects == 0
+        assert cache.stats.memory_hits == before + 1
+
+    def test_memory_tier_is_scoped_per_database(self, engine, tmp_path: Path) -> None:
+        """Entries cached for one database are not visible to another."""
+        other = create_engine_for_path(tmp_path / "other.db")
+        create_llm_cache_tables(other)
+        with sessionmaker(bind=engine)() as session:
+            LLMCache(session).set_rerank("q", "h", "m", 0.5)
+        with sessionmaker(bind=other)() as session:
+            assert LLMCache(session).get_rerank("q", "h", "m") is None
+
+    def test_lru_evicts_oldest(self) -> None:
+        """The LRU drops least-recently-used entries past capacity."""
+        memory = LLMMemoryCache(max_entries=2, stats=LLMCacheStats())
+        now = datetime.utcnow()
+        cutoff = now - timedelta(hours=1)
+        memory.put("db", "a", "1", now)
+        memory.put("db", "b", "2", now)
+        assert memory.get("db", "a", cutoff) == "1"  # a is now most recent
+        memory.put("db", "c", "3", now)
+
+        assert memory.get("db", "b", cutoff) is None
+        assert memory.get("db", "a", cutoff) == "1"
+        assert memory.stats.evictions == 1
+
+    def test_memory_entries_respect_ttl(self) -> None:
+        """Entries older than the cutoff are misses and are dropped."""
+        memory = LLMMemoryCache(max_entries=10, stats=LLMCacheStats())
+        memory.put("db", "a", "1", datetime.utcnow() - timedelta(hours=2))
+
+        assert memory.get("db", "a", datetime.utcnow() - timedelta(hours=1)) is None
+        assert len(memory) == 0
+
+    def test_purge_expired_deletes_in_bulk(self, engine) -> None:
+        """purge_expired removes only rows older than the TTL."""
+        stats = LLMCacheStats()
+        old = datetime.utcnow() - timedelta(hours=5)
+        with sessionmaker(bind=engine)() as session:
+            for i in range(3):
+                session.add(
+                    LLMCacheEntry(
+                        cache_key=f"{i:064d}", cache_type="rerank",
+                        result_json="0.1", created_at=old,
+                    )
+                )
+            LLMCache(session).set_rerank("q", "fresh", "m", 0.9)
+            session.commit()
+
+        assert purge_expired(engine, ttl_hours=1, stats=stats) == 3
+        assert stats.expired_purged == 3
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM llm_cache_v2")).scalar() == 1
+
+    def test_created_at_index_added_to_existing_table(self, tmp_path: Path) -> None:
+        """create_llm_cache_tables adds the index to tables created without it."""
+        engine = create_engine_for_path(tmp_path / "legacy.db")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE llm_cache_v2 (cache_key VARCHAR(64) PRIMARY KEY, "
+                    "cache_type TEXT NOT NULL, result_json TEXT NOT NULL, "
+                    "created_at DATETIME NOT NULL)"
+                )
+            )
+
+        create_llm_cache_tables(engine)
+
+        with engine.connect() as conn:
+            indexes = conn.execute(text("PRAGMA index_list('llm_cache_v2')")).fetchall()
+        assert "ix_llm_cache_v2_created_at" in {row[1] for row in indexes}
@@ -8,6 +8,11 @@ Commands:
         methods: Run all documented search methods for a query
     eval: Evaluation commands for RAG search quality
         golden: Run golden query evaluation
+    index: FTS index maintenance
+        check: Run FTS5 integrity-check
+        optimize: Merge FTS segments
+        stats: Show FTS segment counts and sizes
+    sync: Ingest and index datasets from job configs
 
 Example usage:
     # Run search method comparison
@@ -15,23 +20,34 @@ Example usage:
 
     # Run golden query evaluation
     uv run python -m catalog eval golden
+
+    # Check FTS index integrity
+    uv run python -m catalog index check
+
+    # Sync all jobs, two datasets at a time
+    uv run python -m catalog sync --max-parallel-datasets 2
 """
 
 import typer
 
 from catalog.cli.eval import eval_app
 from catalog.cli.search import search_app
+from catalog.cli.sync import sync_command
+from index.cli.maintenance import index_app
 
-__all__ = ["app", "eval_app", "search_app"]
+__all__ = ["app", "eval_app", "index_app", "search_app", "sync_command"]
 
 app = typer.Typer(
     name="catalog",
     help="Catalog CLI for managing document search and evaluation.",
 )
 
+
 # Register sub-apps
 app.add_typer(eval_app, name="eval")
 app.add_typer(search_app, name="search")
+app.add_typer(index_app, name="index")
+app.command(name="sync")(sync_command)
 
 
 def main() -> None:
@@ -31,6 +31,8 @@ import typer
 
 from agentlayer.logging import get_logger
 
+from catalog.cli.warmup import warm_up_if_enabled
+
 __all__ = ["search_app"]
 
 logger = get_logger(__name__)
@@ -41,6 +43,12 @@ search_app = typer.Typer(
 )
 
 
+@search_app.callback()
+def _startup() -> None:
+    """Warm up the models search uses, if llm.warm_up is set."""
+    warm_up_if_enabled()
+
+
 @search_app.command()
 def methods(
     query: Annotated[
@@ -133,7 +141,7 @@ def methods(
 
     with get_session() as session:
         with use_session(session):
-            service = SearchService(session)
+            service = SearchService(session, read_only=True)
             for method_name, criteria in plan:
                 try:
                     search_results = service.search(criteria)
@@ -141,6 +149,8 @@ def methods(
                         "mode": criteria.mode,
                         "rerank": criteria.rerank,
                         "timing_ms": search_results.timing_ms,
+                        "leg_timings_ms": search_results.leg_timings_ms,
+                        "degraded_legs": search_results.degraded_legs,
                         "total_candidates": search_results.total_candidates,
                         "results": [r.model_dump() for r in search_results.results],
                     }
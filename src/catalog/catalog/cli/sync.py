@@ -0,0 +1,86 @@
+"""catalog.cli.sync - Dataset sync CLI command.
+
+Runs ingest -> index for every job config in a directory.
+
+Example usage:
+    # Sync every job in the configured job directory
+    uv run python -m catalog sync
+
+    # Sync a specific directory, three datasets at a time
+    uv run python -m catalog sync ./jobs --max-parallel-datasets 3
+
+    # Continue ingests that were interrupted, from their last committed batch
+    uv run python -m catalog sync --resume
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from agentlayer.logging import get_logger
+
+from catalog.cli.warmup import warm_up_if_enabled
+
+__all__ = ["sync_command"]
+
+logger = get_logger(__name__)
+
+
+def sync_command(
+    job_dir: Annotated[
+        Path | None,
+        typer.Argument(help="Directory of job YAML files. Defaults to job_config_path."),
+    ] = None,
+    max_parallel_datasets: Annotated[
+        int | None,
+        typer.Option(
+            "--max-parallel-datasets",
+            "-p",
+            min=1,
+            help="Datasets synced at once (default: performance.max_parallel_datasets).",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue interrupted ingests from their checkpoints instead of starting over.",
+        ),
+    ] = False,
+) -> None:
+    """Ingest and index datasets from job configs.
+
+    Exits with code 1 if any job fails.
+    """
+    from catalog.sync import DatasetSync
+
+    warm_up_if_enabled()
+    runner = DatasetSync(
+        base_dir=job_dir,
+        max_parallel_datasets=max_parallel_datasets,
+        resume=resume,
+    )
+    runner.load_jobs()
+    jobs = len(runner.configs)
+    results = asyncio.run(runner.arun())
+
+    for result in results:
+        typer.echo(
+            f"{result.ingest.dataset_name}: "
+            f"created={result.ingest.documents_created} "
+            f"updated={result.ingest.documents_updated} "
+            f"deactivated={result.ingest.documents_deactivated} "
+            f"chunks={result.index.chunks_created}"
+        )
+    for name, stage in runner.metrics.items():
+        snapshot = stage.snapshot()
+        typer.echo(
+            f"stage {name}: peak_queued={snapshot['peak_queued']} "
+            f"completed={snapshot['completed']}"
+        )
+
+    if len(results) < jobs:
+        typer.echo(f"Error: {jobs - len(results)} of {jobs} jobs failed", err=True)
+        raise typer.Exit(1)
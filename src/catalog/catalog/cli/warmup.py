@@ -0,0 +1,24 @@
+"""catalog.cli.warmup - Optional model warm-up for model-using commands.
+
+Only commands that run the LLM or embedding model (search, sync) warm
+them up; maintenance and reporting commands start without loading models.
+
+Example usage:
+    from catalog.cli.warmup import warm_up_if_enabled
+
+    def sync_command() -> None:
+        warm_up_if_enabled()
+        ...
+"""
+
+__all__ = ["warm_up_if_enabled"]
+
+
+def warm_up_if_enabled() -> None:
+    """Load the configured LLM and embedding model now, if llm.warm_up is set."""
+    from catalog.core.settings import get_settings
+
+    if get_settings().llm.warm_up:
+        from agentlayer.llm.registry import warm_up_models
+
+        warm_up_models()
@@ -114,7 +114,9 @@ class ZvecSettings(BaseSettings):
     """Zvec vector store configuration.
 
     Zvec is the primary vector backend, using LlamaIndex SimpleVectorStore
-    with a local JSON index file.
+    with a local JSON index file. Queries read a memory-mapped binary copy
+    of that file kept alongside it (``<index>.zvec/``). Setting
+    ``index_type="ivf"`` adds an approximate IVF index to large segments.
     """
 
     model_config = SettingsConfigDict(
@@ -130,6 +132,30 @@ class ZvecSettings(BaseSettings):
         default="catalog_vectors",
         description="Zvec collection name for vector storage",
     )
+    index_type: Literal["exact", "ivf"] = Field(
+        default="exact",
+        description="Zvec search strategy: 'exact' brute force or 'ivf' approximate nearest neighbour",
+    )
+    ivf_nlist: int = Field(
+        default=0,
+        ge=0,
+        description="IVF cluster count (0 = sqrt of segment size)",
+    )
+    ivf_nprobe: int = Field(
+        default=8,
+        ge=1,
+        description="IVF clusters scanned per query (higher = better recall, slower)",
+    )
+    ivf_min_vectors: int = Field(
+        default=4096,
+        ge=1,
+        description="Segments smaller than this use exact search even when index_type is 'ivf'",
+    )
+    ivf_retrain_growth: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Retrain IVF centroids once a segment grows past this multiple of its trained size",
+    )
 
 
 class VectorDBSettings(BaseSettings):
@@ -292,6 +318,15 @@ class RAGSettings(BaseSettings):
         default=True,
         description="Enable per-document deduplication in hybrid retrieval",
     )
+    hybrid_vector_timeout_ms: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Timeout for each vector leg of hybrid retrieval in milliseconds; "
+            "a leg that misses it is dropped and FTS results are still "
+            "returned (0 disables)"
+        ),
+    )
 
     # Reranking
     rerank_top_n: int = Field(
@@ -312,6 +347,34 @@ class RAGSettings(BaseSettings):
         default=True,
         description="Enable caching of rerank scores",
     )
+    rerank_strategy: Literal["listwise", "pointwise"] = Field(
+        default="listwise",
+        description=(
+            "MLX rerank prompting: 'listwise' scores a batch of candidates per "
+            "LLM call, 'pointwise' asks Yes/No once per candidate"
+        ),
+    )
+    rerank_batch_size: int = Field(
+        default=5,
+        ge=1,
+        description="Candidates per listwise rerank prompt",
+    )
+    rerank_max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Maximum concurrent rerank LLM calls (keep at 1 for a single "
+            "local MLX model)"
+        ),
+    )
+    rerank_budget_ms: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Per-query rerank latency budget in milliseconds; candidates not "
+            "scored in time keep their retrieval score (0 disables)"
+        ),
+    )
 
     # Caching
     cache_ttl_hours: int = Field(
@@ -319,6 +382,31 @@ class RAGSettings(BaseSettings):
         ge=1,
         description="Cache TTL in hours (default 1 week)",
     )
+    cache_memory_entries: int = Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Capacity of the in-process LRU in front of the LLM cache table, "
+            "shared by all searches in the process (0 disables)"
+        ),
+    )
+    result_cache_entries: int = Field(
+        default=1_000,
+        ge=0,
+        description=(
+            "Search results kept per SearchService, keyed on the normalized "
+            "query, the other criteria and the index generation (0 disables)"
+        ),
+    )
+    result_cache_similarity: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Query-embedding cosine similarity at which a cached result is "
+            "reused for a different query, e.g. 0.95 (0 disables)"
+        ),
+    )
 
     # Retrieval
     vector_top_k: int = Field(
@@ -337,6 +425,38 @@ class RAGSettings(BaseSettings):
         description="Number of results after RRF fusion",
     )
 
+    # FTS maintenance
+    fts_bulk_min_documents: int = Field(
+        default=200,
+        ge=0,
+        description=(
+            "Documents in one index run from which FTS5 merge settings are tuned "
+            "for bulk loading (0 disables)"
+        ),
+    )
+    fts_bulk_automerge: int = Field(
+        default=8,
+        ge=0,
+        le=16,
+        description="FTS5 automerge during bulk index runs (segments merged per level)",
+    )
+    fts_bulk_crisismerge: int = Field(
+        default=64,
+        ge=2,
+        description=(
+            "FTS5 crisismerge during bulk index runs (segments per level before "
+            "a forced merge)"
+        ),
+    )
+    fts_optimize_segment_threshold: int = Field(
+        default=32,
+        ge=0,
+        description=(
+            "Run FTS5 optimize after an index run when a table has more segments "
+            "than this (0 disables)"
+        ),
+    )
+
     # Snippets
     snippet_max_lines: int = Field(
         default=10,
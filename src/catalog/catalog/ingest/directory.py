@@ -7,6 +7,7 @@ and produces LlamaIndex Documents for the ingestion pipeline.
 from __future__ import annotations
 
 import mimetypes
+from collections.abc import Iterator
 from functools import cached_property
 from pathlib import Path
 
@@ -23,6 +24,7 @@ from catalog.ingest.sources import (
     create_source,
     register_ingest_config_factory, DatasetSourceConfig,
 )
+from catalog.ingest.streaming import ReadOptions, batched, read_ahead
 
 if TYPE_CHECKING:
     from catalog.ingest.job import SourceConfig
@@ -108,6 +110,7 @@ class DirectorySource(BaseSource):
     """
 
     type_name = "directory"
+    supports_manifest = True
 
     def __init__(
         self,
@@ -140,42 +143,36 @@ class DirectorySource(BaseSource):
     @cached_property
     def documents(self) -> list[Document]:
         """Load all matching files as LlamaIndex Documents."""
-        all_docs: list[Document] = []
-        seen_paths: set[Path] = set()
+        return [doc for batch in self.iter_documents() for doc in batch]
 
-        for pattern in self._includes:
-            for file_path in sorted(self.path.glob(pattern)):
-                if not file_path.is_file():
-                    continue
-                if file_path in seen_paths:
-                    continue
-                rel = file_path.relative_to(self.path)
-                if self._is_excluded(str(rel)):
-                    continue
-                seen_paths.add(file_path)
+    def iter_documents(self, options: ReadOptions | None = None) -> Iterator[list[Document]]:
+        """Read matching files on a thread pool and yield them in batches.
 
-                try:
-                    text = file_path.read_text(encoding=self._encoding)
-                except (UnicodeDecodeError, PermissionError, OSError) as exc:
-                    logger.warning(f"Skipping unreadable file {file_path}: {exc}")
-                    continue
+        Files are yielded in the same order as ``documents``; unreadable
+        files are skipped with a warning.
 
-                mime_type, _ = mimetypes.guess_type(str(file_path))
-                doc = Document(
-                    text=text,
-                    metadata={
-                        "relative_path": str(rel),
-                        "file_path": str(file_path),
-                        "file_name": file_path.name,
-                        "_format": _extension_to_format(file_path.suffix.lower()),
-                        "_media_type": mime_type,
-                    },
-                )
-                doc.id_ = str(rel)
-                all_docs.append(doc)
-
-        logger.info(f"DirectorySource loaded {len(all_docs)} documents from {self.path}")
-        return all_docs
+        Args:
+            options: Batch size and read limits. Defaults to
+                ``ReadOptions.from_settings()``.
+
+        Yields:
+            Lists of at most ``options.batch_size`` documents.
+        """
+        options = options or ReadOptions.from_settings()
+        paths = self._iter_paths()
+        if self.manifest is not None:
+            paths = self.manifest.select(paths)
+        loaded = read_ahead(
+            paths,
+            self._load_file,
+            max_workers=options.max_workers,
+            max_in_flight_bytes=options.max_in_flight_bytes,
+        )
+        count = 0
+        for batch in batched((doc for doc in loaded if doc is not None), options.batch_size):
+            count += len(batch)
+            yield batch
+        logger.info(f"DirectorySource loaded {count} documents from {self.path}")
 
     def transforms(self, dataset_id: int):
         """Return source-specific transforms.
@@ -200,6 +197,51 @@ class DirectorySource(BaseSource):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _iter_paths(self) -> Iterator[Path]:
+        """Yield matching files in pattern order, without duplicates."""
+        seen_paths: set[Path] = set()
+        for pattern in self._includes:
+            for file_path in sorted(self.path.glob(pattern)):
+                if not file_path.is_file():
+                    continue
+                if file_path in seen_paths:
+                    continue
+                if self._is_excluded(str(file_path.relative_to(self.path))):
+                    continue
+                seen_paths.add(file_path)
+                yield file_path
+
+    def _load_file(self, file_path: Path) -> Document | None:
+        """Read one file into a Document.
+
+        Returns None if the file cannot be read, or if the manifest shows
+        its content is unchanged.
+        """
+        try:
+            data = file_path.read_bytes()
+            if self.manifest is not None and self.manifest.content_unchanged(file_path, data):
+                return None
+            # Universal newlines, as read_text would
+            text = data.decode(self._encoding).replace("\r\n", "\n").replace("\r", "\n")
+        except (UnicodeDecodeError, PermissionError, OSError) as exc:
+            logger.warning(f"Skipping unreadable file {file_path}: {exc}")
+            return None
+
+        rel = file_path.relative_to(self.path)
+        mime_type, _ = mimetypes.guess_type(str(file_path))
+        doc = Document(
+            text=text,
+            metadata={
+                "relative_path": str(rel),
+                "file_path": str(file_path),
+                "file_name": file_path.name,
+                "_format": _extension_to_format(file_path.suffix.lower()),
+                "_media_type": mime_type,
+            },
+        )
+        doc.id_ = str(rel)
+        return doc
+
     def _is_excluded(self, rel_path: str) -> bool:
         """Check if a relative path matches any exclusion pattern."""
         if not self._excludes:
@@ -197,20 +197,20 @@ class DatasetJob(BaseModel):
         """Create an LLM provider from this job's config.
 
         When the ``llm`` section is omitted from the YAML config,
-        falls back to the application-level settings via
-        :class:`agentlayer.llm.provider.MLXProvider` default constructor.
+        falls back to the application-level settings. Providers come from
+        the shared model registry, so the model is loaded once per process.
 
         Returns:
             An MLXProvider instance.
         """
-        from agentlayer.llm.provider import MLXProvider
+        from agentlayer.llm.registry import get_model_registry
 
         if self.llm is None:
             logger.debug("No job-level LLM config; using application settings")
-            return MLXProvider()
+            return get_model_registry().get_llm()
 
         logger.debug(f"Loading MLX LLM model from job config: {self.llm.model_name}")
-        return MLXProvider(model_name=self.llm.model_name)
+        return get_model_registry().get_llm(self.llm.model_name)
 
     def create_embed_model(self) -> BaseEmbedding:
         """Create an embedding model from this job's config.
@@ -0,0 +1,205 @@
+"""catalog.ingest.manifest - Stat-based change detection for file sources.
+
+A dataset's manifest records, per file, the ``os.stat`` fields and content
+hash seen when it was last ingested (``SourceFile`` rows). Before reading,
+a source passes its file listing through ``SourceManifest.select``: files
+whose size, mtime and inode all match are not read at all. Files that are
+read are hashed first, and skipped if only their stat changed (e.g. touched).
+
+Every listed file is recorded, read or not, so the ingest pipeline knows
+the full set of files present. That makes deletion sync correct without
+reading unchanged files, including in incremental mode.
+
+Example usage:
+    from catalog.ingest.manifest import SourceManifest
+
+    manifest = SourceManifest(root, previous=SourceFileRepository().map_by_dataset(ds_id))
+    for path in manifest.select(all_files):
+        if manifest.content_unchanged(path):
+            continue
+        load(path)
+    print(manifest.unchanged, manifest.deleted)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from agentlayer.logging import get_logger
+
+__all__ = [
+    "FileState",
+    "SourceManifest",
+]
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FileState:
+    """A file's stat fields and, once read, its content hash.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number.
+        content_hash: SHA-256 of the file bytes, or None if not read.
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+    content_hash: str | None = None
+
+    @classmethod
+    def of(cls, path: str | os.PathLike[str]) -> FileState:
+        """Stat a file.
+
+        Raises:
+            OSError: If the file cannot be stat'ed.
+        """
+        st = os.stat(path)
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+
+    @classmethod
+    def from_entry(cls, entry: Any) -> FileState:
+        """Build from a ``SourceFile`` row (or anything with the same fields)."""
+        return cls(
+            size=entry.size,
+            mtime_ns=entry.mtime_ns,
+            inode=entry.inode,
+            content_hash=entry.content_hash,
+        )
+
+    def same_file(self, other: FileState) -> bool:
+        """Whether two states have the same size, mtime and inode."""
+        return (self.size, self.mtime_ns, self.inode) == (
+            other.size,
+            other.mtime_ns,
+            other.inode,
+        )
+
+    def as_values(self) -> dict[str, Any]:
+        """Column values for ``SourceFileRepository.sync``."""
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "inode": self.inode,
+            "content_hash": self.content_hash,
+        }
+
+
+class SourceManifest:
+    """Previous and current file states for one ingest run of a dataset.
+
+    Attributes:
+        root: Dataset root; manifest paths are relative to it.
+        previous: States recorded by the last run, keyed by relative path.
+        current: States of every file listed this run.
+        unchanged: Relative paths that were not read, or read and found
+            identical, and so produce no documents this run.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        previous: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Initialize the manifest.
+
+        Args:
+            root: Dataset root directory.
+            previous: Last run's entries (``FileState`` or ``SourceFile``
+                rows), keyed by relative path.
+        """
+        self.root = root
+        self.previous: dict[str, FileState] = {
+            path: entry if isinstance(entry, FileState) else FileState.from_entry(entry)
+            for path, entry in (previous or {}).items()
+        }
+        self.current: dict[str, FileState] = {}
+        self.unchanged: set[str] = set()
+        self._content_checked: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def relative(self, path: str | os.PathLike[str]) -> str:
+        """A file's manifest key: its path relative to the root."""
+        return str(Path(path).relative_to(self.root))
+
+    def select(self, files: Iterable[Path]) -> list[Path]:
+        """Stat the listed files and return those that need reading.
+
+        Args:
+            files: Every file currently in the source.
+
+        Returns:
+            Files that are new or whose stat changed, in input order. A file
+            with no previous entry is always read, whatever its mtime: it
+            may be a renamed or never-ingested file, and only reading it
+            puts it in the manifest.
+        """
+        to_read: list[Path] = []
+        for path in files:
+            rel = self.relative(path)
+            try:
+                state = FileState.of(path)
+            except OSError as exc:
+                logger.warning(f"Skipping file that cannot be stat'ed {path}: {exc}")
+                continue
+            prev = self.previous.get(rel)
+            if prev is not None and prev.same_file(state):
+                self.current[rel] = prev
+                self.unchanged.add(rel)
+            else:
+                self.current[rel] = state
+                to_read.append(path)
+        logger.debug(
+            f"Manifest: {len(to_read)} of {len(self.current)} files changed under {self.root}"
+        )
+        return to_read
+
+    def content_unchanged(self, path: Path, data: bytes | None = None) -> bool:
+        """Hash a selected file; True if its bytes match the previous run.
+
+        Safe to call from reader threads, and more than once per file.
+
+        Args:
+            path: A file returned by ``select``.
+            data: The file's bytes, if the caller has already read them.
+        """
+        rel = self.relative(path)
+        with self._lock:
+            if rel in self._content_checked:
+                return self._content_checked[rel]
+        if data is None:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                # Let the reader report it
+                return False
+        digest = hashlib.sha256(data).hexdigest()
+        prev = self.previous.get(rel)
+        same = prev is not None and prev.content_hash == digest
+        with self._lock:
+            self.current[rel] = replace(self.current[rel], content_hash=digest)
+            self._content_checked[rel] = same
+            if same:
+                self.unchanged.add(rel)
+        return same
+
+    @property
+    def deleted(self) -> set[str]:
+        """Paths in the previous manifest that are no longer present."""
+        return set(self.previous) - set(self.current)
+
+    def entries(self, paths: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Column values to store for ``paths`` (those listed this run)."""
+        return {
+            path: self.current[path].as_values() for path in paths if path in self.current
+        }
@@ -9,16 +9,35 @@ DocstoreStrategy.DUPLICATES_ONLY (no vector store). The docstore uses
 SHA256(text + metadata) to detect changes and is persisted between runs
 so only new/changed documents are reprocessed.
 
-Deletion: documents not in the current batch are marked inactive in SQLite
+File sources also keep a per-file manifest (``SourceFile`` rows, see
+catalog.ingest.manifest): files whose stat matches the last run are not
+read at all, and the manifest's full file listing drives deletion sync.
+
+Deletion: documents not in the source are marked inactive in SQLite
 via deactivate_missing(). Vector and FTS cleanup for inactive documents
 is handled by the Index pipeline's reconciliation pass (ADR-0004).
 
-Pipeline flow:
+Documents are streamed from ``BaseSource.iter_documents`` and run through
+the pipeline one micro-batch at a time, so memory is bounded by the batch
+size rather than the size of the source. Each batch is committed together
+with an ``IngestCheckpoint`` (last path and running stats), its manifest
+entries and its extracted link targets. A crash loses at most one batch;
+with ``resume`` set, the next run continues after the last committed batch.
+
+Pipeline flow (per batch):
 1. LlamaIndex docstore filters unchanged documents (upstream)
 2. OntologyMapper
 3. PersistenceTransform (upsert to documents table, DB-only)
 4. Source-specific post-persist transforms
-5. Post-pipeline deletion sync (deactivate removed docs in SQLite)
+5. Stage link targets, update manifest and checkpoint, commit
+
+After all batches:
+6. Link resolution (targets may be in any batch)
+7. Deletion sync (deactivate removed docs in SQLite), drop the checkpoint
+
+Database steps go through ``BasePipeline._write``: inline on the ambient
+session by default, or on a shared ``SQLiteWriter`` thread when ``writer``
+is set, in which case reading the source overlaps with other writes.
 """
 
 from __future__ import annotations
@@ -30,7 +49,7 @@ from typing import Optional, Sequence
 from agentlayer.logging import get_logger
 from llama_index.core.ingestion import DocstoreStrategy, IngestionPipeline
 from llama_index.core.storage.docstore import SimpleDocumentStore
-from llama_index.core.schema import BaseNode, TransformComponent
+from llama_index.core.schema import BaseNode, Document, TransformComponent
 
 from agentlayer.pipeline import BasePipeline
 from catalog.ingest.cache import (
@@ -38,17 +57,27 @@ from catalog.ingest.cache import (
     load_pipeline,
     persist_pipeline,
 )
+from catalog.ingest.manifest import SourceManifest
 from catalog.ingest.schemas import IngestResult
 from catalog.ingest.sources import BaseSource, create_source, DatasetSourceConfig
+from catalog.ingest.streaming import ReadOptions
 from catalog.ingest.tracing import TracingDocstore
 from catalog.store.database import get_session
 from catalog.store.dataset import DatasetService
-from catalog.store.repositories import DatasetRepository, DocumentRepository
-from agentlayer.session import use_session
+from catalog.store.models import Dataset
+from catalog.store.repositories import (
+    DatasetRepository,
+    DocumentIndexStateRepository,
+    DocumentRepository,
+    IndexGenerationRepository,
+    IngestCheckpointRepository,
+    SourceFileRepository,
+)
+from agentlayer.session import current_session, use_session
 from index.store.vector import VectorStoreManager
 from catalog.transform.links import LinkResolutionTransform
 from catalog.transform.ontology import OntologyMapper
-from catalog.transform.llama import PersistenceTransform
+from catalog.transform.llama import PersistenceStats, PersistenceTransform
 
 __all__ = [
     "DatasetIngestPipeline",
@@ -66,6 +95,9 @@ class DatasetIngestPipeline(BasePipeline):
 
     Attributes:
         ingest_config: Configuration for ingestion. Required for ingest().
+        vector_manager: Vector store manager used to clear a forced dataset's
+            vectors. Pipelines syncing concurrently must share one; a new
+            manager is created if unset.
 
     The goals of an IngestionPipeline are:
     1. Populate the Index to facilitate search;
@@ -80,6 +112,7 @@ class DatasetIngestPipeline(BasePipeline):
     """
 
     ingest_config: Optional[DatasetSourceConfig] = None
+    vector_manager: Optional[VectorStoreManager] = None
 
     @cached_property
     def _settings(self):
@@ -162,9 +195,24 @@ class DatasetIngestPipeline(BasePipeline):
 
         return pipeline
 
+    @staticmethod
+    def _pop_transform(
+        pipeline: IngestionPipeline, transform_type: type[TransformComponent]
+    ) -> TransformComponent | None:
+        """Remove and return the pipeline's transform of a type, if present."""
+        for transform in pipeline.transformations:
+            if isinstance(transform, transform_type):
+                pipeline.transformations = [
+                    t for t in pipeline.transformations if t is not transform
+                ]
+                return transform
+        return None
+
     def ingest(self) -> IngestResult:
         """Ingest documents using the pipeline.
 
+        Documents are read from ``source.iter_documents`` and run through
+        the pipeline one batch at a time (``performance.batch_size``).
         Persists documents to the database. Returns after persistence --
         indexing is handled separately by the caller (DatasetSync).
 
@@ -189,132 +237,317 @@ class DatasetIngestPipeline(BasePipeline):
             started_at=started_at,
         )
 
+        if self.writer is not None:
+            # Each database step runs on the shared writer thread
+            return self._ingest(result)
         with get_session() as session:
             with use_session(session):
-                # Get or create dataset — use config fields (not self.source)
-                # so source creation is deferred until after incremental
-                # resolution below.
-                dataset = DatasetService.create_or_update(
-                    session,
-                    self.ingest_config.dataset_name,
-                    source_type=self.ingest_config.type_name,
-                    source_path=str(self.ingest_config.source_path),
-                    catalog_name=self.ingest_config.catalog_name,
-                )
-                self.dataset_id = dataset.id
-                self.dataset_name = dataset.name
-
-                # Resolve incremental flag to if_modified_since before
-                # accessing self.source (which triggers file filtering).
-                is_incremental = self.ingest_config.if_modified_since is not None
-                if self.ingest_config.incremental and not is_incremental:
-                    if dataset.last_ingested_at is not None:
-                        self.ingest_config.if_modified_since = dataset.last_ingested_at
-                        is_incremental = True
-                        logger.info(
-                            f"Incremental mode: filtering files modified since "
-                            f"{dataset.last_ingested_at}"
-                        )
-                    else:
-                        logger.info(
-                            "Incremental mode: new dataset, running full ingestion"
-                        )
-
-                # Handle forced ingestion: clear vectors and pipeline cache
-                if self.ingest_config.force:
-                    vector_manager = VectorStoreManager()
-                    deleted: int = vector_manager.delete_by_dataset(dataset.name)
-                    if deleted > 0:
-                        logger.info(
-                            f"Force mode: cleared {deleted} vectors for "
-                            f"dataset '{dataset.name}'"
-                        )
-                    clear_cache(self._cache_key(dataset.name))
-
-                # Build and run pipeline (no vector store; Index handles vectors)
-                pipeline: IngestionPipeline = self.build_pipeline()
-
-                source_docs = self.source.documents
+                return self._ingest(result)
+
+    def _prepare_dataset(self) -> Dataset:
+        """Get or create the dataset and apply incremental/force settings."""
+        session = current_session()
+        # Get or create dataset — use config fields (not self.source)
+        # so source creation is deferred until after incremental
+        # resolution below.
+        dataset = DatasetService.create_or_update(
+            session,
+            self.ingest_config.dataset_name,
+            source_type=self.ingest_config.type_name,
+            source_path=str(self.ingest_config.source_path),
+            catalog_name=self.ingest_config.catalog_name,
+        )
+        self.dataset_id = dataset.id
+        self.dataset_name = dataset.name
+
+        # Resolve incremental flag to if_modified_since before
+        # accessing self.source (which triggers file filtering).
+        if self.ingest_config.incremental and self.ingest_config.if_modified_since is None:
+            if dataset.last_ingested_at is not None:
+                self.ingest_config.if_modified_since = dataset.last_ingested_at
                 logger.info(
-                    f"Running {len(source_docs)} documents through pipeline"
+                    f"Incremental mode: filtering files modified since "
+                    f"{dataset.last_ingested_at}"
                 )
-                # SQLite does not support concurrent writers from multiple
-                # processes; persistence transforms write to SQLite, so use 1.
-                nodes: Sequence[BaseNode] = pipeline.run(
-                    documents=source_docs, num_workers=1
+            else:
+                logger.info(
+                    "Incremental mode: new dataset, running full ingestion"
                 )
 
-                # Collect statistics from transforms
-                persist_transform = None
-                for t in pipeline.transformations:
-                    if isinstance(t, PersistenceTransform):
-                        persist_transform = t
-
-                # Deletion sync: mark documents not in the current batch
-                # as inactive in SQLite. Index pipeline reconciliation
-                # removes FTS and vector entries for inactive docs (ADR-0004).
-                #
-                # Skip in incremental mode: only a subset of files were
-                # loaded, so missing docs are simply not-yet-modified,
-                # not deleted.
-                deactivated = 0
-                if not is_incremental:
-                    batch_paths = {
-                        doc.metadata.get("relative_path", doc.id_)
-                        for doc in source_docs
-                    }
-                    doc_repo = DocumentRepository()
-                    deactivated = doc_repo.deactivate_missing(
-                        dataset.id, batch_paths
-                    )
-                    if deactivated > 0:
-                        logger.info(
-                            f"Deletion sync: deactivated {deactivated} documents "
-                            f"not in current batch"
-                        )
-
-                # Stamp last_ingested_at on the dataset
-                ds_repo = DatasetRepository(session)
-                dataset_orm = ds_repo.get_by_id(dataset.id)
-                dataset_orm.last_ingested_at = datetime.now(tz=timezone.utc)
-
-                session.flush()
-
-                if persist_transform:
-                    result.documents_created = persist_transform.stats.created
-                    result.documents_updated = persist_transform.stats.updated
-                    result.documents_failed = persist_transform.stats.failed
-                    result.errors = list(persist_transform.stats.errors)
-
-                result.documents_read = len(source_docs)
-                result.dataset_id = dataset.id
-                result.dataset_name = dataset.name
-                result.documents_deactivated = deactivated
-
-                # Derive skipped count: docs in batch that weren't
-                # created or updated were filtered by LlamaIndex's
-                # docstore as unchanged.
-                total_processed = (
-                    (persist_transform.stats.created + persist_transform.stats.updated)
-                    if persist_transform else 0
+        # Handle forced ingestion: clear vectors and pipeline cache
+        if self.ingest_config.force:
+            vector_manager = self.vector_manager or VectorStoreManager()
+            deleted: int = vector_manager.delete_by_dataset(dataset.name)
+            if deleted > 0:
+                logger.info(
+                    f"Force mode: cleared {deleted} vectors for "
+                    f"dataset '{dataset.name}'"
                 )
-                result.documents_skipped = len(source_docs) - total_processed
+            clear_cache(self._cache_key(dataset.name))
+            # Vectors are gone, so the next index run must be a full one.
+            DocumentIndexStateRepository(session).clear_by_parent(dataset.id)
+        return dataset
 
-                # Persist pipeline cache state
-                persist_pipeline(dataset.name, pipeline)
+    def _load_checkpoint(
+        self, dataset_id: int, uses_manifest: bool
+    ) -> tuple[bool, dict[str, int]]:
+        """Look for an interrupted run of this dataset.
 
-                result.completed_at = datetime.now(tz=timezone.utc)
+        Args:
+            dataset_id: Dataset being ingested.
+            uses_manifest: Whether the source skips files recorded in the
+                manifest. Only then does a resumed run skip the files the
+                interrupted run committed.
 
+        Returns:
+            Tuple of (start over, resumed stats). An interrupted run is
+            continued from its checkpoint when ``resume`` is set and the
+            source uses the manifest; otherwise the checkpoint is discarded
+            and every file is read again.
+        """
+        checkpoints = IngestCheckpointRepository()
+        checkpoint = checkpoints.get(dataset_id)
+        if checkpoint is None:
+            return False, {}
+        if self.ingest_config.resume and not self.ingest_config.force:
+            if uses_manifest:
                 logger.info(
-                    f"Ingestion complete: "
-                    f"created={result.documents_created}, "
-                    f"updated={result.documents_updated}, "
-                    f"skipped={result.documents_skipped}, "
-                    f"deactivated={result.documents_deactivated}, "
-                    f"failed={result.documents_failed}"
+                    f"Resuming interrupted ingest after '{checkpoint.last_path}' "
+                    f"({checkpoint.stats.get('documents_read', 0)} documents already read)"
+                )
+                return False, dict(checkpoint.stats)
+            # Every file is read again, so the checkpoint's counts would be
+            # counted twice
+            logger.warning(
+                f"Cannot resume after '{checkpoint.last_path}': source has no "
+                f"file manifest; starting over"
+            )
+        else:
+            logger.warning(
+                "Previous ingest was interrupted; starting over "
+                "(set resume to continue from its checkpoint instead)"
+            )
+        checkpoints.clear(dataset_id)
+        return True, {}
+
+    def _ingest(self, result: IngestResult) -> IngestResult:
+        """Run ingestion, with database steps going through ``_write``.
+
+        Reading the source happens on the calling thread, so with a
+        shared writer it overlaps with other datasets' writes.
+        """
+        dataset = self._write(self._prepare_dataset)
+        is_incremental = self.ingest_config.if_modified_since is not None
+
+        # Build and run pipeline (no vector store; Index handles vectors)
+        pipeline: IngestionPipeline = self.build_pipeline()
+
+        # Links may point at documents persisted by a later batch, so
+        # targets are staged per batch and resolved once, after every batch.
+        link_transform = self._pop_transform(pipeline, LinkResolutionTransform)
+        persist_transform = next(
+            (
+                t for t in pipeline.transformations
+                if isinstance(t, PersistenceTransform)
+            ),
+            None,
+        )
+        persist_stats = PersistenceStats()
+
+        # A checkpoint only exists if the last run was interrupted
+        uses_manifest = self.source.supports_manifest
+        start_over, resumed = self._write(
+            lambda: self._load_checkpoint(dataset.id, uses_manifest)
+        )
+        persist_stats.created = resumed.get("created", 0)
+        persist_stats.updated = resumed.get("updated", 0)
+        persist_stats.skipped = resumed.get("skipped", 0)
+        persist_stats.failed = resumed.get("failed", 0)
+        progress = {
+            "documents_read": resumed.get("documents_read", 0),
+            "files_committed": resumed.get("files_committed", 0),
+        }
+        resumed_files = progress["files_committed"]
+
+        # Stat-based change detection: unchanged files are not read.
+        # Files committed by an interrupted run are in the manifest too, so
+        # resuming reads only what that run did not get to.
+        manifest: SourceManifest | None = None
+        if uses_manifest:
+            previous = (
+                {} if self.ingest_config.force or start_over
+                else self._write(
+                    lambda: SourceFileRepository().map_by_dataset(dataset.id)
+                )
+            )
+            manifest = SourceManifest(self.source.path, previous)
+            self.source.manifest = manifest
+
+        def run_batch(batch: list[Document]) -> None:
+            if persist_transform:
+                persist_transform.stats.reset()
+            # SQLite does not support concurrent writers from multiple
+            # processes; persistence transforms write to SQLite, so use 1.
+            nodes = pipeline.run(documents=batch, num_workers=1)
+            if persist_transform:
+                _add_stats(persist_stats, persist_transform.stats)
+                failed_paths = persist_transform.stats.failed_paths
+                if failed_paths:
+                    # The docstore recorded each document's hash and the
+                    # cache the transforms' output, failures included;
+                    # forget both so the next run retries the failed files
+                    for doc in batch:
+                        if doc.metadata.get("relative_path", doc.id_) in failed_paths:
+                            pipeline.docstore.delete_document(doc.id_, raise_error=False)
+                    pipeline.cache.clear()
+
+            # Record the batch's progress in the same transaction, so a
+            # resumed run starts exactly after the last committed batch
+            paths = [doc.metadata.get("relative_path", doc.id_) for doc in batch]
+            checkpoints = IngestCheckpointRepository()
+            if link_transform is not None:
+                checkpoints.add_pending_links(dataset.id, link_transform.extract(nodes))
+            if manifest is not None:
+                # Files that failed to persist stay out of the manifest, so
+                # the next run reads them again
+                progress["files_committed"] += SourceFileRepository().upsert(
+                    dataset.id,
+                    manifest.entries(
+                        p for p in paths if p not in persist_stats.failed_paths
+                    ),
                 )
+            progress["documents_read"] += len(batch)
+            checkpoints.save(
+                dataset.id,
+                paths[-1] if paths else None,
+                {
+                    **progress,
+                    "created": persist_stats.created,
+                    "updated": persist_stats.updated,
+                    "skipped": persist_stats.skipped,
+                    "failed": persist_stats.failed,
+                },
+            )
+            if self.writer is None:
+                current_session().commit()
+
+        # Stream the source in micro-batches: only one batch of documents
+        # is held in memory, and each batch is committed as it completes.
+        options = ReadOptions.from_settings()
+        source_paths: set[str] = set()
+        for batch in self.source.iter_documents(options):
+            source_paths.update(
+                doc.metadata.get("relative_path", doc.id_) for doc in batch
+            )
+            self._write(lambda batch=batch: run_batch(batch))
+        documents_read = progress["documents_read"]
 
-                return result
+        logger.info(
+            f"Ran {documents_read} documents through pipeline "
+            f"in batches of {options.batch_size}"
+        )
+        if link_transform is not None:
+            self._write(
+                lambda: link_transform.resolve(
+                    IngestCheckpointRepository().pending_links(dataset.id)
+                )
+            )
+
+        def finalize() -> None:
+            # Deletion sync: mark documents not in the current batch
+            # as inactive in SQLite. Index pipeline reconciliation
+            # removes FTS and vector entries for inactive docs (ADR-0004).
+            #
+            # Skip in incremental mode: only a subset of files were
+            # loaded, so missing docs are simply not-yet-modified,
+            # not deleted.
+            #
+            # With a manifest every file present was listed, read or
+            # not, so deletion sync is correct in incremental mode too.
+            deactivated = 0
+            if manifest is not None:
+                present = source_paths | manifest.unchanged
+                deactivated = DocumentRepository().deactivate_missing(
+                    dataset.id, present
+                )
+                SourceFileRepository().sync(
+                    dataset.id, manifest.entries(present - persist_stats.failed_paths)
+                )
+                # Files committed before an interruption count as read, not unchanged
+                result.files_unchanged = len(manifest.unchanged) - resumed_files
+                if deactivated > 0:
+                    logger.info(
+                        f"Deletion sync: deactivated {deactivated} documents "
+                        f"no longer in the source"
+                    )
+            elif not is_incremental:
+                doc_repo = DocumentRepository()
+                deactivated = doc_repo.deactivate_missing(
+                    dataset.id, source_paths
+                )
+                if deactivated > 0:
+                    logger.info(
+                        f"Deletion sync: deactivated {deactivated} documents "
+                        f"not in current batch"
+                    )
+            result.documents_deactivated = deactivated
+
+            # Updated documents leave their previous body behind in
+            # the content database once nothing else references it
+            if persist_stats.updated:
+                purged = DocumentRepository().purge_unreferenced_content()
+                if purged:
+                    logger.debug(f"Purged {purged} unreferenced document bodies")
+
+            # The run is complete: drop its checkpoint and staged links
+            IngestCheckpointRepository().clear(dataset.id)
+
+            # Invalidate cached search results over the dataset's documents
+            if persist_stats.created or persist_stats.updated or deactivated:
+                IndexGenerationRepository().bump(dataset.id)
+
+            # Stamp last_ingested_at on the dataset
+            dataset_orm = DatasetRepository().get_by_id(dataset.id)
+            dataset_orm.last_ingested_at = datetime.now(tz=timezone.utc)
+
+            current_session().flush()
+
+        self._write(finalize)
+
+        result.documents_created = persist_stats.created
+        result.documents_updated = persist_stats.updated
+        result.documents_failed = persist_stats.failed
+        result.errors = list(persist_stats.errors)
+
+        result.documents_read = documents_read
+        result.dataset_id = dataset.id
+        result.dataset_name = dataset.name
+
+        # Derive skipped count: docs in batch that weren't
+        # created or updated were filtered by LlamaIndex's
+        # docstore as unchanged; files the manifest showed
+        # unchanged are skipped too.
+        total_processed = persist_stats.created + persist_stats.updated
+        result.documents_skipped = (
+            documents_read - total_processed + result.files_unchanged
+        )
+
+        # Persist pipeline cache state
+        persist_pipeline(dataset.name, pipeline)
+
+        result.completed_at = datetime.now(tz=timezone.utc)
+
+        logger.info(
+            f"Ingestion complete: "
+            f"created={result.documents_created}, "
+            f"updated={result.documents_updated}, "
+            f"skipped={result.documents_skipped}, "
+            f"unchanged_files={result.files_unchanged}, "
+            f"deactivated={result.documents_deactivated}, "
+            f"failed={result.documents_failed}"
+        )
+
+        return result
 
     def ingest_dataset(self, config: DatasetSourceConfig) -> IngestResult:
         """Ingest documents using the provided config.
@@ -334,6 +567,17 @@ class DatasetIngestPipeline(BasePipeline):
         )
         return pipeline.ingest()
 
+
+def _add_stats(total: PersistenceStats, batch: PersistenceStats) -> None:
+    """Add one batch's persistence statistics to the run totals."""
+    total.created += batch.created
+    total.updated += batch.updated
+    total.skipped += batch.skipped
+    total.failed += batch.failed
+    total.errors.extend(batch.errors)
+    total.failed_paths.update(batch.failed_paths)
+
+
 if __name__ == "__main__":
     import sys
     from agentlayer.logging import get_logger, configure_logging
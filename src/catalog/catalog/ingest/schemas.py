@@ -31,9 +31,12 @@ class IngestResult(BaseModel):
         documents_read: Total number of documents read.
         documents_created: Number of new documents created.
         documents_updated: Number of documents updated.
-        documents_skipped: Number of unchanged documents skipped (filtered by docstore).
+        documents_skipped: Number of unchanged documents skipped (filtered by the
+            file manifest or the docstore).
         documents_deactivated: Number of documents deactivated (removed from source).
         documents_failed: Number of documents that failed to process.
+        files_unchanged: Number of files the manifest showed unchanged, which
+            were not run through the pipeline (most were not read at all).
         started_at: When the ingestion started.
         completed_at: When the ingestion completed.
         errors: List of error messages if any.
@@ -47,6 +50,7 @@ class IngestResult(BaseModel):
     documents_skipped: int = 0
     documents_deactivated: int = 0
     documents_failed: int = 0
+    files_unchanged: int = 0
     started_at: datetime
     completed_at: datetime | None = None
     errors: list[str] = Field(default_factory=list)
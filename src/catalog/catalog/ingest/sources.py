@@ -7,12 +7,17 @@ source types and config factories.
 from datetime import datetime
 from functools import singledispatch
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from pydantic import BaseModel
 
+from catalog.ingest.streaming import ReadOptions, batched
+
 if TYPE_CHECKING:
+    from llama_index.core import Document
+
     from catalog.ingest.job import SourceConfig
+    from catalog.ingest.manifest import SourceManifest
 
 __all__ = [
     "BaseSource",
@@ -24,7 +29,16 @@ __all__ = [
 
 
 class BaseSource:
-    """Base class for document sources."""
+    """Base class for document sources.
+
+    Attributes:
+        supports_manifest: Whether ``iter_documents`` honours ``manifest``.
+        manifest: Set by the ingest pipeline on sources that support it;
+            files the manifest reports unchanged are not read.
+    """
+
+    supports_manifest: bool = False
+    manifest: "SourceManifest | None" = None
 
     @property
     def link_resolver(self):
@@ -39,6 +53,24 @@ class BaseSource:
     def documents(self):
         pass
 
+    def iter_documents(self, options: ReadOptions | None = None) -> Iterator[list["Document"]]:
+        """Yield the source's documents in batches as they are read.
+
+        This is what ``DatasetIngestPipeline.ingest`` consumes. Streaming
+        sources override it to read on a thread pool within
+        ``options.max_in_flight_bytes``, so only the current batch is held
+        in memory; the default batches the fully loaded ``documents``.
+
+        Args:
+            options: Batch size and read limits. Defaults to
+                ``ReadOptions.from_settings()``.
+
+        Yields:
+            Lists of at most ``options.batch_size`` documents.
+        """
+        options = options or ReadOptions.from_settings()
+        yield from batched(self.documents or [], options.batch_size)
+
     def transforms(self, *args, **kwargs):
         return []
 
@@ -117,12 +149,17 @@ class DatasetSourceConfig(BaseModel):
         dataset_name: Name for the dataset (will be normalized).
         catalog_name: Optional catalog name. If set, creates/links catalog to dataset.
         force: If True, reprocess all documents even if unchanged.
+        resume: If True and the last ingest of the dataset was interrupted,
+            continue from its checkpoint instead of starting over. Sources
+            without a file manifest cannot skip committed files and always
+            start over.
     """
     type_name: str
     source_path: Path
     dataset_name: str
     catalog_name: str | None = None
     force: bool = False
+    resume: bool = False
     incremental: bool = False
     if_modified_since: datetime | None = None
 
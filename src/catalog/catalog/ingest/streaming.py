@@ -0,0 +1,139 @@
+"""catalog.ingest.streaming - Bounded, parallel reads for streaming sources.
+
+Sources read files on a thread pool and hand documents to the ingest
+pipeline in batches. At most ``max_in_flight_bytes`` of source files are
+read ahead of the consumer, so an ingest run holds one batch plus the
+read-ahead budget in memory rather than the whole source.
+
+Example usage:
+    from catalog.ingest.streaming import batched, read_ahead
+
+    docs = read_ahead(paths, load_file, max_workers=4, max_in_flight_bytes=64 << 20)
+    for batch in batched(docs, 100):
+        pipeline.run(documents=batch)
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from agentlayer.logging import get_logger
+
+__all__ = [
+    "ReadOptions",
+    "batched",
+    "file_size",
+    "read_ahead",
+]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Reads queued per worker; bounds the queue when files are tiny.
+_QUEUE_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class ReadOptions:
+    """How a streaming source reads its files.
+
+    Attributes:
+        batch_size: Documents per batch handed to the ingest pipeline.
+        max_workers: Threads reading and parsing files.
+        max_in_flight_bytes: Bytes of source files read ahead of the consumer.
+    """
+
+    batch_size: int = 100
+    max_workers: int = 4
+    max_in_flight_bytes: int = 64 * 1024 * 1024
+
+    @classmethod
+    def from_settings(cls) -> ReadOptions:
+        """Build options from the performance settings."""
+        from catalog.core.settings import get_settings
+
+        performance = get_settings().performance
+        return cls(
+            batch_size=performance.batch_size,
+            max_workers=performance.concurrency,
+            max_in_flight_bytes=performance.read_buffer_bytes,
+        )
+
+
+def file_size(path: str | os.PathLike[str]) -> int:
+    """Size of a file in bytes, or 0 if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def read_ahead(
+    items: Iterable[T],
+    read: Callable[[T], R],
+    *,
+    size_of: Callable[[T], int] = file_size,
+    max_workers: int = 4,
+    max_in_flight_bytes: int = 64 * 1024 * 1024,
+) -> Iterator[R]:
+    """Apply ``read`` to each item on a thread pool, yielding results in order.
+
+    New reads are only submitted while the summed ``size_of`` of reads not
+    yet handed to the consumer fits in ``max_in_flight_bytes``. A single
+    item larger than the budget is still read, on its own.
+
+    Args:
+        items: Items to read, typically file paths.
+        read: Function doing the I/O and parsing for one item.
+        size_of: Estimated memory cost of an item; defaults to its file size.
+        max_workers: Thread pool size.
+        max_in_flight_bytes: Read-ahead budget.
+
+    Yields:
+        ``read(item)`` for each item, in input order.
+    """
+    max_queued = max(1, max_workers) * _QUEUE_PER_WORKER
+    pending: deque[tuple[Future[R], int]] = deque()
+    in_flight = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="source-read") as pool:
+        try:
+            for item in items:
+                size = size_of(item)
+                while pending and (
+                    in_flight + size > max_in_flight_bytes or len(pending) >= max_queued
+                ):
+                    future, done = pending.popleft()
+                    in_flight -= done
+                    yield future.result()
+                pending.append((pool.submit(read, item), size))
+                in_flight += size
+            while pending:
+                future, done = pending.popleft()
+                in_flight -= done
+                yield future.result()
+        finally:
+            # Consumer stopped early (or a read raised): drop queued reads
+            for future, _ in pending:
+                future.cancel()
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Group items into lists of at most ``size``."""
+    if size < 1:
+        raise ValueError(f"Batch size must be at least 1, got {size}")
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -7,6 +7,7 @@ where the ``./`` prefix distinguishes internal links from external URLs.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
@@ -22,6 +23,7 @@ from catalog.integrations.obsidian.reader import (
     ObsidianVaultReader,
 )
 from catalog.ingest.sources import BaseSource
+from catalog.ingest.streaming import ReadOptions
 from catalog.ontology import OntologyMappingSpec
 
 __all__ = [
@@ -64,6 +66,7 @@ class HeptabaseVaultSource(BaseSource):
     """Populates a Dataset from a Heptabase export directory."""
 
     type_name = "heptabase"
+    supports_manifest = True
 
     def __init__(
         self,
@@ -83,6 +86,9 @@ class HeptabaseVaultSource(BaseSource):
         self.ontology_spec = ontology_spec
         self.reader = HeptabaseVaultReader(input_dir=self.path)
 
+        # Full listing for manifest-based change detection
+        self._all_files = list(self.reader.input_files)
+
         if if_modified_since is not None:
             ts = if_modified_since.timestamp()
             self.reader.input_files = sorted(
@@ -126,3 +132,11 @@ class HeptabaseVaultSource(BaseSource):
         logger.info(f"Loading documents from Heptabase export at: {self.path}")
         docs = self.reader.load_data()
         return docs
+
+    def iter_documents(self, options: ReadOptions | None = None) -> Iterator[list[Document]]:
+        """Stream documents from the Heptabase export in batches (see ``stream_data``)."""
+        logger.info(f"Streaming documents from Heptabase export at: {self.path}")
+        if self.manifest is not None:
+            # The manifest decides what to read, from the full listing
+            self.reader.input_files = list(self._all_files)
+        yield from self.reader.stream_data(options, self.manifest)
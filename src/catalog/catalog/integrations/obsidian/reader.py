@@ -22,6 +22,7 @@ cache between runs.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Tuple, Union
 
@@ -32,6 +33,9 @@ from llama_index.core import Document
 from llama_index.core.readers import SimpleDirectoryReader
 from llama_index.readers.file import MarkdownReader
 
+from catalog.ingest.manifest import SourceManifest
+from catalog.ingest.streaming import ReadOptions, batched, read_ahead
+
 logger = get_logger(__name__)
 
 
@@ -600,6 +604,73 @@ class ObsidianVaultReader(SimpleDirectoryReader):
         """
         return extract_wikilinks(text)
 
+    def _safe_input_files(self) -> list[Path]:
+        """Restrict ``input_files`` to files passing the safety checks."""
+        # Dont do this for explicit `input_files`, assume the caller knows best
+        self.input_files = [p for p in self.input_files if self._is_safe_file(p)]
+        return self.input_files
+
+    def _load_file(self, input_file: Path) -> List[Document]:
+        """Load one vault file: file I/O, frontmatter parsing and file metadata.
+
+        Equivalent to what ``SimpleDirectoryReader.load_data`` does per file;
+        safe to call from worker threads.
+        """
+        docs = SimpleDirectoryReader.load_file(
+            input_file=input_file,
+            file_metadata=self.file_metadata,
+            file_extractor=self.file_extractor,
+            filename_as_id=self.filename_as_id,
+            encoding=self.encoding,
+            errors=self.errors,
+            raise_on_error=self.raise_on_error,
+            fs=self.fs,
+        )
+        return self._exclude_metadata(docs)
+
+    def _scan_links(self, input_file: Path) -> List[Tuple[str, List[str]]]:
+        """Load one file and keep only its note names and raw link targets."""
+        return [
+            (doc.metadata.get("note_name", ""), self._extract_links(doc.text))
+            for doc in self._load_file(input_file)
+        ]
+
+    def _final_wikilinks(self, doc: Document, valid_notes: set[str]) -> List[str]:
+        """Extract a document's links, dropping dead ones if configured."""
+        raw_wikilinks = self._extract_links(doc.text)
+        if not self._remove_dead_wikilinks:
+            return raw_wikilinks
+        valid_wikilinks = []
+        for link in raw_wikilinks:
+            if link in valid_notes:
+                valid_wikilinks.append(link)
+            else:
+                current_file = doc.metadata.get("file_name", "unknown")
+                logger.debug(f"Dead wikilink found in '{current_file}': [[{link}]]")
+        return valid_wikilinks
+
+    def _enrich(
+        self,
+        doc: Document,
+        wikilinks: List[str],
+        backlinks_map: Dict[str, set[str]],
+    ) -> Document:
+        """Attach wikilinks, tasks and backlinks to a loaded document."""
+        if self._should_extract_links:
+            doc.metadata["wikilinks"] = wikilinks
+
+        if self._should_extract_tasks:
+            tasks, cleaned_text = extract_tasks(doc.text, self._should_remove_tasks)
+            doc.metadata["tasks"] = tasks
+            if self._should_remove_tasks:
+                doc = Document(text=cleaned_text, metadata=doc.metadata)
+
+        if self._should_extract_links:
+            note_name = doc.metadata.get("note_name", "")
+            doc.metadata["backlinks"] = sorted(backlinks_map.get(note_name, set()))
+
+        return doc
+
     def load_data(
         self,
         show_progress: bool = False,
@@ -615,6 +686,9 @@ class ObsidianVaultReader(SimpleDirectoryReader):
         3. Extracts wikilinks and builds backlinks graph
         4. Optionally extracts tasks
 
+        Holds the whole vault in memory; ``stream_data`` yields the same
+        documents in batches.
+
         Args:
             show_progress: If True, show a progress bar.
             num_workers: Number of workers for parallel loading.
@@ -623,15 +697,7 @@ class ObsidianVaultReader(SimpleDirectoryReader):
         Returns:
             List of Document objects with Obsidian metadata.
         """
-        # Filter input files through safety checks before loading
-        # Dont do this for explicit `input_files`, assume the caller knows best
-        safe_files = []
-        for file_path in self.input_files:
-            if self._is_safe_file(file_path):
-                safe_files.append(file_path)
-
-        # Update input_files to only include safe files
-        self.input_files = safe_files
+        self._safe_input_files()
 
         # Load documents using parent class
         docs = super().load_data(
@@ -647,49 +713,98 @@ class ObsidianVaultReader(SimpleDirectoryReader):
             if doc.metadata.get("note_name")
         }
 
-        # Build backlinks map: {target_note: [source_note1, source_note2, ...]}
+        # First pass: links, and the backlinks map
+        # {target_note: {source_note1, source_note2, ...}}
+        links: List[List[str]] = [[] for _ in docs]
         backlinks_map: Dict[str, set[str]] = {}
+        if self._should_extract_links:
+            for i, doc in enumerate(docs):
+                links[i] = self._final_wikilinks(doc, valid_notes)
+                note_name = doc.metadata.get("note_name", "")
+                for link in links[i]:
+                    backlinks_map.setdefault(link, set()).add(note_name)
 
-        # First pass
-        for i, doc in enumerate(docs):
-            note_name = doc.metadata.get("note_name", "")
+        # Second pass: attach links, tasks and backlinks
+        return [
+            self._enrich(doc, doc_links, backlinks_map)
+            for doc, doc_links in zip(docs, links)
+        ]
+
+    def stream_data(
+        self,
+        options: ReadOptions | None = None,
+        manifest: SourceManifest | None = None,
+    ) -> Iterator[List[Document]]:
+        """
+        Yield the documents ``load_data`` returns, in batches, as they are read.
 
-            # Optionally extract wikilinks and build backlinks map
-            if self._should_extract_links:
-                raw_wikilinks = self._extract_links(doc.text)
+        Files are read and their frontmatter parsed on a thread pool, with
+        at most ``options.max_in_flight_bytes`` of files read ahead of the
+        consumer. Backlinks need the whole vault's link graph, so when
+        wikilinks are extracted a first bounded pass collects note names and
+        link targets (no bodies) before documents are yielded.
+
+        With a ``manifest``, only files it reports changed are read. Their
+        backlinks reflect links from the files read in this run, as with
+        ``if_modified_since`` filtering; ``DocumentLink`` rows remain the
+        complete link graph.
+
+        Args:
+            options: Batch size and read limits. Defaults to
+                ``ReadOptions.from_settings()``.
+            manifest: Previous run's file states; unchanged files are skipped.
+
+        Yields:
+            Lists of at most ``options.batch_size`` documents.
+        """
+        options = options or ReadOptions.from_settings()
+        files = self._safe_input_files()
+        if manifest is not None:
+            files = self.input_files = manifest.select(files)
+
+        def read(func: Any) -> Iterator[Any]:
+            if manifest is not None:
+                func = _unless_unchanged(manifest, func)
+            return read_ahead(
+                files,
+                func,
+                max_workers=options.max_workers,
+                max_in_flight_bytes=options.max_in_flight_bytes,
+            )
 
-                final_wikilinks = raw_wikilinks
+        valid_notes: set[str] = set()
+        backlinks_map: Dict[str, set[str]] = {}
+        if self._should_extract_links:
+            notes = [note for file_notes in read(self._scan_links) for note in file_notes]
+            valid_notes = {name for name, _ in notes if name}
+            if manifest is not None:
+                # Skipped notes are still valid link targets
+                valid_notes.update(Path(path).stem for path in manifest.unchanged)
+            for note_name, raw_links in notes:
                 if self._remove_dead_wikilinks:
-                    # Filter dead links
-                    valid_wikilinks = []
-                    for link in raw_wikilinks:
-                        if link in valid_notes:
-                            valid_wikilinks.append(link)
-                        else:
-                            current_file = doc.metadata.get("file_name", "unknown")
-                            logger.debug(
-                                f"Dead wikilink found in '{current_file}': [[{link}]]"
-                            )
-                    final_wikilinks = valid_wikilinks
-
-                doc.metadata["wikilinks"] = final_wikilinks
-
-                for link in final_wikilinks:
+                    raw_links = [link for link in raw_links if link in valid_notes]
+                for link in raw_links:
                     backlinks_map.setdefault(link, set()).add(note_name)
+            del notes
+
+        docs = (
+            self._enrich(
+                doc,
+                self._final_wikilinks(doc, valid_notes) if self._should_extract_links else [],
+                backlinks_map,
+            )
+            for file_docs in read(self._load_file)
+            for doc in file_docs
+        )
+        yield from batched(docs, options.batch_size)
 
-            # Optionally extract tasks
-            if self._should_extract_tasks:
-                tasks, cleaned_text = extract_tasks(doc.text, self._should_remove_tasks)
-                doc.metadata["tasks"] = tasks
-                if self._should_remove_tasks:
-                    docs[i] = Document(text=cleaned_text, metadata=doc.metadata)
 
-        # Second pass: assign backlinks
-        if self._should_extract_links:
-            for doc in docs:
-                note_name = doc.metadata.get("note_name", "")
-                doc.metadata["backlinks"] = sorted(
-                    backlinks_map.get(note_name, set())
-                )
+def _unless_unchanged(manifest: SourceManifest, load: Any) -> Any:
+    """Wrap a per-file loader to return nothing for files with unchanged content."""
+
+    def wrapped(input_file: Path) -> List[Any]:
+        if manifest.content_unchanged(Path(input_file)):
+            return []
+        return load(input_file)
 
-        return docs
+    return wrapped
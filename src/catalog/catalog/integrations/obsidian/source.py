@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
@@ -10,6 +11,7 @@ from llama_index.core.node_parser import MarkdownNodeParser
 from pydantic import model_validator
 
 from catalog.ingest.sources import BaseSource, DatasetSourceConfig
+from catalog.ingest.streaming import ReadOptions
 from catalog.ontology import OntologyMappingSpec
 from catalog.integrations.obsidian.links import ObsidianWikilinkResolver
 from catalog.integrations.obsidian.reader import ObsidianVaultReader, logger, ObsidianMarkdownNormalize
@@ -18,6 +20,7 @@ from catalog.integrations.obsidian.reader import ObsidianVaultReader, logger, Ob
 class ObsidianVaultSource(BaseSource):
     """Populates a Dataset from an Obsidian vault."""
     type_name = "obsidian"
+    supports_manifest = True
 
     def __init__(
             self, path: str | Path,
@@ -40,6 +43,9 @@ class ObsidianVaultSource(BaseSource):
         self.ontology_spec = ontology_spec
         self.reader = ObsidianVaultReader(input_dir=self.path)
 
+        # Full listing for manifest-based change detection
+        self._all_files = list(self.reader.input_files)
+
         if if_modified_since is not None:
             ts = if_modified_since.timestamp()
             self.reader.input_files = sorted(
@@ -84,6 +90,14 @@ class ObsidianVaultSource(BaseSource):
         docs = self.reader.load_data()
         return docs
 
+    def iter_documents(self, options: ReadOptions | None = None) -> Iterator[list[Document]]:
+        """Stream documents from the Obsidian vault in batches (see ``stream_data``)."""
+        logger.info(f"Streaming documents from Obsidian vault at: {self.path}")
+        if self.manifest is not None:
+            # The manifest decides what to read, from the full listing
+            self.reader.input_files = list(self._all_files)
+        yield from self.reader.stream_data(options, self.manifest)
+
 
 class SourceObsidianConfig(DatasetSourceConfig):
     """Configuration for Obsidian vault ingestion.
@@ -5,28 +5,43 @@ multi-database support via ATTACH.
 
 The catalog database stores metadata, FTS indexes, and resource hierarchy.
 The content database stores document bodies (ATTACHed to catalog connections).
+Creating the catalog tables on an engine without a content database (e.g. a
+throwaway engine from ``create_engine_for_path``) attaches a sibling
+``<name>.content.db`` so ``Document.body`` always has somewhere to live.
+
+Search reads go through a separate read-only engine (``get_read_session``):
+``mode=ro`` connections with ``query_only`` and a larger page cache and mmap,
+kept in a pre-warmed pool, so queries never queue behind ingest writers.
 
 Example usage:
-    from catalog.store.database import get_engine, get_session
+    from catalog.store.database import get_engine, get_read_session, get_session
 
     engine = get_engine()  # Returns catalog engine (with content ATTACHed)
     with get_session() as session:
         # perform database operations
         pass
+
+    with get_read_session() as session:
+        # queries only; sees the last committed state
+        pass
 """
 
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import Engine, event
+from pathlib import Path
+
+from agentlayer.logging import get_logger
+from sqlalchemy import Connection, Engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 
-from agentlayer.database import create_engine_for_path  # noqa: F401
+from agentlayer.database import create_engine_for_path, create_read_engine_for_path
 
 from catalog.store.models.catalog import CatalogBase
-from catalog.store.models.content import ContentBase
+from catalog.store.models.content import ContentBase, hash_body, store_bodies
 
 if TYPE_CHECKING:
     from catalog.core.settings import Settings
@@ -41,11 +56,20 @@ __all__ = [
     "DatabaseRegistry",
     "create_engine_for_path",
     "get_engine",
+    "get_read_engine",
+    "get_read_session",
+    "get_read_session_factory",
     "get_registry",
     "get_session",
     "get_session_factory",
+    "migrate_document_bodies",
 ]
 
+logger = get_logger(__name__)
+
+# Schema name of the content database on catalog connections.
+CONTENT_SCHEMA = "content"
+
 
 DatabaseName = Literal["catalog", "content"]
 
@@ -55,8 +79,9 @@ class DatabaseRegistry:
 
     Manages the catalog and content databases with proper initialization order:
     1. Create all engines
-    2. Create all tables (metadata.create_all)
-    3. Register ATTACH event listeners
+    2. Create the content tables and register the ATTACH event listener
+    3. Create the catalog tables and move legacy document bodies to content
+    4. Create the FTS virtual tables
 
     The content database is ATTACHed to catalog connections, allowing
     cross-database queries via the 'content.' schema prefix.
@@ -75,6 +100,8 @@ class DatabaseRegistry:
             settings: Application settings containing database paths.
         """
         self._settings = settings
+        self._read_engine: Engine | None = None
+        self._read_lock = threading.Lock()
 
         # 1. Create all engines
         self._engines: dict[DatabaseName, Engine] = {
@@ -82,14 +109,32 @@ class DatabaseRegistry:
             "content": create_engine_for_path(settings.databases.content_path),
         }
 
-        # 2. Create all tables (ORM)
+        # 2. Create content tables, then register the ATTACH listener on the
+        # catalog engine so every connection from the pool (including the
+        # one creating the catalog tables) has content attached
+        ContentBase.metadata.create_all(
+            self._engines["content"].execution_options(
+                schema_translate_map={CONTENT_SCHEMA: None}
+            )
+        )
+        event.listen(
+            self._engines["catalog"],
+            "connect",
+            self._attach_content_database,
+        )
+
+        # 2a. Create catalog tables (ORM) and move bodies out of the legacy
+        # documents.body column
         CatalogBase.metadata.create_all(self._engines["catalog"])
-        ContentBase.metadata.create_all(self._engines["content"])
+        migrate_document_bodies(self._engines["catalog"])
 
         # 2b. Create LLM cache tables (separate DeclarativeBase in agentlayer)
-        from agentlayer.llm_cache import LLMCacheBase
+        # and purge expired rows once per process, instead of one at a time
+        # on read
+        from agentlayer.llm_cache import create_llm_cache_tables, purge_expired
 
-        LLMCacheBase.metadata.create_all(self._engines["catalog"])
+        create_llm_cache_tables(self._engines["catalog"])
+        purge_expired(self._engines["catalog"], settings.rag.cache_ttl_hours)
 
         # 3. Create FTS virtual tables (not managed by SQLAlchemy metadata)
         # Deferred import to avoid circular dependency:
@@ -100,14 +145,6 @@ class DatabaseRegistry:
         create_fts_table(self._engines["catalog"])
         create_chunks_fts_table(self._engines["catalog"])
 
-        # 4. Register ATTACH listener on catalog engine
-        # This ensures every connection from the pool has content attached
-        event.listen(
-            self._engines["catalog"],
-            "connect",
-            self._attach_content_database,
-        )
-
     def _attach_content_database(
         self, dbapi_connection: Any, connection_record: Any
     ) -> None:
@@ -117,9 +154,44 @@ class DatabaseRegistry:
         """
         content_path = self._settings.databases.content_path.expanduser()
         cursor = dbapi_connection.cursor()
-        cursor.execute(f"ATTACH DATABASE '{content_path}' AS content")
+        cursor.execute(f"ATTACH DATABASE ? AS {CONTENT_SCHEMA}", (str(content_path),))
         cursor.close()
 
+    def _attach_content_database_read_only(
+        self, dbapi_connection: Any, connection_record: Any
+    ) -> None:
+        """Attach the content database read-only to a search connection."""
+        content_path = self._settings.databases.content_path.expanduser().resolve()
+        cursor = dbapi_connection.cursor()
+        cursor.execute(
+            f"ATTACH DATABASE ? AS {CONTENT_SCHEMA}", (f"file:{content_path}?mode=ro",)
+        )
+        cursor.close()
+
+    def get_read_engine(self) -> Engine:
+        """Get the read-only catalog engine used by search.
+
+        Created (and its pool warmed) on first use, so processes that only
+        ingest never open it. The content database is ATTACHed read-only.
+
+        Returns:
+            The read-only Engine for the catalog database.
+        """
+        with self._read_lock:
+            if self._read_engine is None:
+                performance = self._settings.performance
+                self._read_engine = create_read_engine_for_path(
+                    self._settings.databases.catalog_path,
+                    pool_size=performance.read_pool_size,
+                    mmap_bytes=performance.read_mmap_bytes,
+                    cache_bytes=performance.read_cache_bytes,
+                    on_connect=self._attach_content_database_read_only,
+                )
+                logger.debug(
+                    f"Read-only engine ready with {performance.read_pool_size} connections"
+                )
+            return self._read_engine
+
     def get_engine(self, db: DatabaseName = "catalog") -> Engine:
         """Get the engine for the specified database.
 
@@ -148,6 +220,96 @@ class DatabaseRegistry:
         return sessionmaker(bind=self._engines[db], expire_on_commit=False)
 
 
+def _sibling_content_path(catalog_path: str) -> str:
+    """Content database path next to a catalog file ('' for in-memory)."""
+    if not catalog_path:
+        return ""
+    path = Path(catalog_path)
+    return str(path.with_name(f"{path.stem}.content.db"))
+
+
+def _attach_sibling_content_database(dbapi_connection: Any, connection_record: Any) -> None:
+    """Attach ``<name>.content.db`` to a catalog connection lacking content."""
+    cursor = dbapi_connection.cursor()
+    try:
+        databases = {row[1]: row[2] for row in cursor.execute("PRAGMA database_list")}
+        if CONTENT_SCHEMA not in databases:
+            cursor.execute(
+                f"ATTACH DATABASE ? AS {CONTENT_SCHEMA}",
+                (_sibling_content_path(databases.get("main", "")),),
+            )
+    finally:
+        cursor.close()
+
+
+@event.listens_for(CatalogBase.metadata, "before_create")
+def _ensure_content_database(target: Any, connection: Connection, **kw: Any) -> None:
+    """Make the content database available wherever catalog tables are created.
+
+    Engines from the registry attach the configured content database on
+    connect. Any other engine gets a sibling content file, attached to this
+    connection and (via a connect listener) to every later one. The content
+    tables are then created in the attached schema.
+    """
+    engine = connection.engine
+    databases = {
+        row[1] for row in connection.exec_driver_sql("PRAGMA database_list")
+    }
+    if CONTENT_SCHEMA not in databases:
+        _attach_sibling_content_database(connection.connection.dbapi_connection, None)
+        if not event.contains(engine, "connect", _attach_sibling_content_database):
+            event.listen(engine, "connect", _attach_sibling_content_database)
+    ContentBase.metadata.create_all(connection)
+
+
+def migrate_document_bodies(engine: Engine, batch_size: int = 500) -> int:
+    """Move bodies from the legacy ``documents.body`` column to the content table.
+
+    Each body is stored once in ``content.document_content`` (compressed per
+    the ``databases.content_compression`` setting), its hash is written to
+    ``documents.body_hash``, and the ``body`` column is dropped. Safe to
+    re-run: rows that already have a ``body_hash`` are skipped, and a
+    database without the column is left untouched.
+
+    Args:
+        engine: Catalog engine with the content database attached.
+        batch_size: Documents moved per round trip.
+
+    Returns:
+        Number of documents whose body was moved.
+    """
+    with engine.connect() as conn:
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA main.table_info(documents)")}
+        if "body" not in columns:
+            return 0
+        if "body_hash" not in columns:
+            conn.exec_driver_sql("ALTER TABLE documents ADD COLUMN body_hash VARCHAR(64)")
+
+        moved = 0
+        while True:
+            rows = conn.execute(
+                text("SELECT id, body FROM documents WHERE body_hash IS NULL LIMIT :limit"),
+                {"limit": batch_size},
+            ).all()
+            if not rows:
+                break
+            hashed = [(doc_id, hash_body(body or ""), body or "") for doc_id, body in rows]
+            store_bodies(conn, {body_hash: body for _, body_hash, body in hashed})
+            conn.execute(
+                text("UPDATE documents SET body_hash = :body_hash WHERE id = :id"),
+                [{"id": doc_id, "body_hash": body_hash} for doc_id, body_hash, _ in hashed],
+            )
+            moved += len(rows)
+
+        conn.exec_driver_sql("ALTER TABLE documents DROP COLUMN body")
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_documents_body_hash ON documents (body_hash)"
+        )
+        conn.commit()
+    logger.info(f"Moved {moved} document bodies to the content database")
+    return moved
+
+
 @lru_cache(maxsize=1)
 def get_registry() -> DatabaseRegistry:
     """Get the singleton DatabaseRegistry instance.
@@ -213,3 +375,43 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+def get_read_engine() -> Engine:
+    """Get the read-only catalog engine (with content ATTACHed read-only).
+
+    Returns:
+        The singleton read-only Engine used by search.
+    """
+    return get_registry().get_read_engine()
+
+
+def get_read_session_factory() -> "sessionmaker[Session]":
+    """Get a session factory for read-only search sessions.
+
+    Returns:
+        A sessionmaker bound to the read-only catalog engine.
+    """
+    return sessionmaker(bind=get_read_engine(), autoflush=False, expire_on_commit=False)
+
+
+@contextmanager
+def get_read_session() -> Generator[Session, None, None]:
+    """Context manager for read-only database sessions.
+
+    Yields a session on a pooled read-only connection. Nothing is
+    committed; the connection's read transaction is ended on exit so the
+    next user sees fresh data. Writing raises ``OperationalError``.
+
+    Yields:
+        A SQLAlchemy Session instance.
+
+    Example:
+        with get_read_session() as session:
+            results = FTSChunkManager(session).search_with_scores("python")
+    """
+    session = get_read_session_factory()()
+    try:
+        yield session
+    finally:
+        session.close()
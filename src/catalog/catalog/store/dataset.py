@@ -551,12 +551,15 @@ class DatasetService:
         dataset_id: int,
         *,
         active_only: bool = False,
+        include_body: bool = True,
     ) -> list[DocumentInfo]:
         """List documents in a dataset.
 
         Args:
             dataset_id: The parent dataset's ID.
             active_only: If True, only return active documents.
+            include_body: If False, bodies are not loaded and ``body`` is
+                None on every result.
 
         Returns:
             List of document info objects.
@@ -564,7 +567,24 @@ class DatasetService:
         with self._get_session() as session:
             repo = DocumentRepository(session)
             docs = repo.list_by_parent(dataset_id, active_only=active_only)
-            return [DocumentInfo.from_orm_model(doc) for doc in docs]
+            if include_body:
+                repo.load_bodies(docs)
+            return [
+                DocumentInfo.from_orm_model(doc, include_body=include_body) for doc in docs
+            ]
+
+    def get_document_bodies(self, dataset_id: int, paths: set[str]) -> dict[str, str]:
+        """Get the bodies of documents in a dataset by path.
+
+        Args:
+            dataset_id: The parent dataset's ID.
+            paths: Document paths; unknown paths are ignored.
+
+        Returns:
+            Mapping of path -> body.
+        """
+        with self._get_session() as session:
+            return DocumentRepository(session).get_bodies_by_paths(dataset_id, paths)
 
     def list_document_paths(
         self,
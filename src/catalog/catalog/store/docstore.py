@@ -192,6 +192,7 @@ class SQLiteDocumentStore(BaseDocumentStore):
         try:
             repo = DocumentRepository(session)
             sql_docs = repo.list_by_parent(self._parent_id, active_only=True)
+            repo.load_bodies(sql_docs)
             return {doc.path: self._sql_doc_to_node(doc) for doc in sql_docs}
         finally:
             session.close()
@@ -16,13 +16,18 @@ from catalog.store.models.catalog import (
     CollectionMember,
     Dataset,
     Document,
+    DocumentIndexState,
     DocumentKind,
     DocumentLink,
     DocumentLinkKind,
+    IndexGeneration,
+    IngestCheckpoint,
+    PendingDocumentLink,
     Repository,
     RepositoryLink,
     Resource,
     ResourceKind,
+    SourceFile,
 )
 from catalog.store.models.content import ContentBase
 
@@ -45,11 +50,16 @@ __all__ = [
     "CollectionMember",
     "Dataset",
     "Document",
+    "DocumentIndexState",
     "DocumentKind",
     "DocumentLink",
     "DocumentLinkKind",
+    "IndexGeneration",
+    "IngestCheckpoint",
+    "PendingDocumentLink",
     "Repository",
     "RepositoryLink",
     "Resource",
     "ResourceKind",
+    "SourceFile",
 ]
@@ -12,8 +12,30 @@ import json
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, JSON, String, Text, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    JSON,
+    String,
+    Text,
+    event,
+    func,
+)
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    object_session,
+    relationship,
+)
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from catalog.store.models.content import hash_body, load_bodies, store_bodies
 
 __all__ = [
     "CatalogBase",
@@ -27,13 +49,18 @@ __all__ = [
     "CollectionMember",
     "Dataset",
     "Document",
+    "DocumentIndexState",
     "DocumentKind",
     "DocumentLink",
     "DocumentLinkKind",
+    "IndexGeneration",
+    "IngestCheckpoint",
+    "PendingDocumentLink",
     "Repository",
     "RepositoryLink",
     "Resource",
     "ResourceKind",
+    "SourceFile",
 ]
 
 
@@ -226,7 +253,9 @@ class Document(Resource):
         content_hash: SHA256 hash of the document content.
         etag: Source-provided etag for change detection.
         last_modified: Source-provided modification time.
-        body: Full normalized text content for FTS and chunking.
+        body_hash: Key of the body in ``content.document_content``.
+        body: Full normalized text content for FTS and chunking. Stored in
+            the content database and loaded on first access.
         parent_resource: Relationship to owning Resource.
     """
 
@@ -244,7 +273,7 @@ class Document(Resource):
     content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     etag: Mapped[str | None] = mapped_column(String(255), nullable=True)
     last_modified: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    body: Mapped[str] = mapped_column(Text, nullable=False)
+    body_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     parent_resource: Mapped["Resource"] = relationship(
         "Resource",
@@ -267,6 +296,7 @@ class Document(Resource):
         Index("ix_documents_parent_path", "parent_id", "path", unique=True),
         Index("ix_documents_parent_active", "parent_id", "active"),
         Index("ix_documents_content_hash", "content_hash"),
+        Index("ix_documents_body_hash", "body_hash"),
     )
 
     __mapper_args__ = {
@@ -274,10 +304,225 @@ class Document(Resource):
         "inherit_condition": id == Resource.id,
     }
 
+    # (body_hash, body) of the last body set or loaded; not a mapped column.
+    _body_cache = None
+    # True while a body set on this instance is not yet in the content table.
+    _body_unsaved = False
+
+    @property
+    def body(self) -> str:
+        """Full body text, loaded from the content database on first access."""
+        body_hash = self.body_hash
+        cached = self._body_cache
+        if cached is not None and cached[0] == body_hash:
+            return cached[1]
+        if body_hash is None:
+            return ""
+        session = object_session(self)
+        if session is None:
+            raise DetachedInstanceError(
+                f"Document {self.id} is not bound to a session; its body cannot be loaded"
+            )
+        body = load_bodies(session.connection(), [body_hash]).get(body_hash, "")
+        self._body_cache = (body_hash, body)
+        return body
+
+    @body.setter
+    def body(self, value: str) -> None:
+        body_hash = hash_body(value)
+        self.body_hash = body_hash
+        self._body_cache = (body_hash, value)
+        self._body_unsaved = True
+
     def __repr__(self) -> str:
         return f"<Document(id={self.id}, path='{self.path}', active={self.active})>"
 
 
+@event.listens_for(Session, "before_flush")
+def _store_document_bodies(session: Session, flush_context: Any, instances: Any) -> None:
+    """Write bodies set on new or changed Documents to the content table."""
+    pending = [
+        doc
+        for doc in (*session.new, *session.dirty)
+        if isinstance(doc, Document) and doc._body_unsaved
+    ]
+    if not pending:
+        return
+    store_bodies(
+        session.connection(),
+        {doc._body_cache[0]: doc._body_cache[1] for doc in pending if doc._body_cache},
+    )
+    for doc in pending:
+        doc._body_unsaved = False
+
+
+# ---------------------------------------------------------------------------
+# DocumentIndexState
+# ---------------------------------------------------------------------------
+
+
+class DocumentIndexState(CatalogBase):
+    """Marker recording which version of a document was last indexed.
+
+    Written by the index pipeline after a successful run. A document whose
+    ``content_hash`` or the pipeline's ``index_signature`` no longer matches
+    its marker is re-indexed; all others are skipped.
+
+    Attributes:
+        document_id: FK to ``documents.id``.
+        indexed_hash: ``Document.content_hash`` at the last successful index.
+        index_signature: Fingerprint of the chunking/embedding configuration
+            used for that index run.
+        indexed_at: When the document was last indexed.
+    """
+
+    __tablename__ = "document_index_state"
+
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True
+    )
+    indexed_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    index_signature: Mapped[str] = mapped_column(String(64), nullable=False)
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DocumentIndexState(document_id={self.document_id}, "
+            f"indexed_hash='{self.indexed_hash}')>"
+        )
+
+
+class SourceFile(CatalogBase):
+    """Manifest entry for a file read into a dataset on a previous ingest.
+
+    Ingest compares a file's ``os.stat`` against its entry and skips reading
+    files whose size, mtime and inode are unchanged; ``content_hash`` lets
+    files that were touched but not edited skip the pipeline too.
+
+    Attributes:
+        dataset_id: FK to ``datasets.id``.
+        path: Path of the file relative to the dataset root (the document path).
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number.
+        content_hash: SHA-256 of the file bytes, if the file was read.
+    """
+
+    __tablename__ = "source_files"
+
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"), primary_key=True
+    )
+    path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    mtime_ns: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    inode: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<SourceFile(dataset_id={self.dataset_id}, path='{self.path}')>"
+
+
+class IndexGeneration(CatalogBase):
+    """Counter bumped whenever a dataset's search indexes change.
+
+    Query-result caches key entries on it, so bumping it invalidates every
+    cached result for the dataset, in every process sharing the database.
+    No row means the dataset's indexes have not changed since it was
+    created (generation 0).
+
+    Attributes:
+        dataset_id: FK to ``datasets.id``.
+        generation: Number of index writes so far.
+        updated_at: When the generation was last bumped.
+    """
+
+    __tablename__ = "index_generations"
+
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"), primary_key=True
+    )
+    generation: Mapped[int] = mapped_column(nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<IndexGeneration(dataset_id={self.dataset_id}, "
+            f"generation={self.generation})>"
+        )
+
+
+class IngestCheckpoint(CatalogBase):
+    """Progress of an ingest run that has not finished yet.
+
+    Written in the same transaction as each committed batch and deleted when
+    the run completes, so a row only exists for an interrupted run. Resuming
+    continues from it instead of starting over.
+
+    Attributes:
+        dataset_id: FK to ``datasets.id``.
+        last_path: Path of the last document committed.
+        stats: Running totals (``documents_read``, ``created``, ``updated``,
+            ``skipped``, ``failed``, ``files_committed``).
+        started_at: When the interrupted run started.
+        updated_at: When the last batch was committed.
+    """
+
+    __tablename__ = "ingest_checkpoints"
+
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    stats: Mapped[dict[str, int]] = mapped_column(JSON, nullable=False, default=dict)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<IngestCheckpoint(dataset_id={self.dataset_id}, "
+            f"last_path='{self.last_path}')>"
+        )
+
+
+class PendingDocumentLink(CatalogBase):
+    """A link target extracted during an ingest run, not yet resolved.
+
+    Links are resolved once every batch has been persisted (targets may be
+    in any batch). Staging them here rather than in memory keeps ingest
+    memory bounded and lets a resumed run resolve links extracted before
+    the interruption.
+
+    Attributes:
+        source_id: FK to ``documents.id`` of the linking document.
+        target_name: Link target name as extracted by the LinkResolver.
+        dataset_id: FK to ``datasets.id`` of the run.
+    """
+
+    __tablename__ = "pending_document_links"
+
+    source_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True
+    )
+    target_name: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PendingDocumentLink(source_id={self.source_id}, "
+            f"target_name='{self.target_name}')>"
+        )
+
 
 # ---------------------------------------------------------------------------
 # DocumentLink
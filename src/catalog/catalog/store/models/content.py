@@ -6,14 +6,57 @@ catalog database connection, allowing cross-database queries via schema prefix.
 
 Models defined here use ``__table_args__ = {"schema": "content"}`` to indicate
 they belong to the attached content database.
+
+Document bodies are content-addressed: ``document_content`` is keyed by the
+SHA-256 of the body text, so identical bodies are stored once, and each row
+is optionally zstd-compressed.
+
+Example usage:
+    from catalog.store.models.content import (
+        decode_body,
+        encode_body,
+        hash_body,
+        load_bodies,
+        store_bodies,
+    )
+
+    data, compression = encode_body("# Note", compression="zstd")
+    assert decode_body(data, compression) == "# Note"
+
+    # On a catalog connection (content database ATTACHed)
+    store_bodies(connection, {hash_body("# Note"): "# Note"})
+    print(load_bodies(connection, [hash_body("# Note")]))
 """
 
-from sqlalchemy.orm import DeclarativeBase
+import hashlib
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any
+
+from agentlayer.logging import get_logger
+from sqlalchemy import Connection, Integer, LargeBinary, String, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 __all__ = [
+    "COMPRESSION_ZSTD",
     "ContentBase",
+    "DocumentContent",
+    "decode_body",
+    "encode_body",
+    "hash_body",
+    "load_bodies",
+    "store_bodies",
 ]
 
+logger = get_logger(__name__)
+
+# Value of DocumentContent.compression for zstd-compressed rows.
+COMPRESSION_ZSTD = "zstd"
+
+# Hashes per IN (...) lookup, below SQLite's bound-parameter limit.
+_LOOKUP_BATCH = 500
+
 
 class ContentBase(DeclarativeBase):
     """SQLAlchemy declarative base for content database models.
@@ -26,13 +69,176 @@ class ContentBase(DeclarativeBase):
     pass
 
 
-# Future content models will be defined here, e.g.:
-#
-# class DocumentContent(ContentBase):
-#     __tablename__ = "document_content"
-#     __table_args__ = {"schema": "content"}
-#
-#     id: Mapped[int] = mapped_column(primary_key=True)
-#     document_id: Mapped[int] = mapped_column(nullable=False, index=True)
-#     body: Mapped[str] = mapped_column(Text, nullable=False)
-#     ...
+class DocumentContent(ContentBase):
+    """A document body, stored once per distinct text.
+
+    Documents reference their body by ``Document.body_hash``; rows are
+    never updated, and rows no longer referenced by any document are
+    removed by ``DocumentRepository.purge_unreferenced_content``.
+
+    Attributes:
+        content_hash: SHA-256 hex digest of the UTF-8 body text.
+        compression: Codec of ``data`` (``"zstd"``), or None if stored raw.
+        size: Length of the uncompressed UTF-8 body in bytes.
+        data: Body bytes, compressed according to ``compression``.
+    """
+
+    __tablename__ = "document_content"
+    __table_args__ = {"schema": "content"}
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    compression: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    @property
+    def text(self) -> str:
+        """The decoded body text."""
+        return decode_body(self.data, self.compression)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DocumentContent(content_hash='{self.content_hash[:12]}', "
+            f"size={self.size}, compression={self.compression})>"
+        )
+
+
+def hash_body(body: str) -> str:
+    """Compute the content address of a body (SHA-256 of its UTF-8 bytes)."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _zstd() -> Any | None:
+    """Import the optional zstandard module, or None if not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        logger.warning(
+            "Content compression 'zstd' requested but the zstandard package is not "
+            "installed; storing document bodies uncompressed"
+        )
+        return None
+    return zstandard
+
+
+def encode_body(
+    body: str,
+    compression: str | None = None,
+    level: int = 3,
+) -> tuple[bytes, str | None]:
+    """Encode a body for storage.
+
+    Args:
+        body: Body text.
+        compression: ``"zstd"`` to compress, None (or ``"none"``) to store
+            raw. Falls back to raw if zstandard is not installed.
+        level: zstd compression level.
+
+    Returns:
+        Tuple of (stored bytes, compression actually applied).
+    """
+    raw = body.encode("utf-8")
+    if compression == COMPRESSION_ZSTD:
+        zstd = _zstd()
+        if zstd is not None:
+            return zstd.ZstdCompressor(level=level).compress(raw), COMPRESSION_ZSTD
+    return raw, None
+
+
+def decode_body(data: bytes, compression: str | None) -> str:
+    """Decode stored body bytes.
+
+    Raises:
+        RuntimeError: If the row is zstd-compressed and zstandard is not
+            installed.
+        ValueError: If the compression codec is unknown.
+    """
+    if compression is None:
+        return data.decode("utf-8")
+    if compression == COMPRESSION_ZSTD:
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("Document body is zstd-compressed; install zstandard to read it")
+        return zstd.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown document body compression: {compression!r}")
+
+
+def _compression_settings() -> tuple[str | None, int]:
+    """Read the configured body compression codec and level."""
+    from catalog.core.settings import get_settings
+
+    databases = get_settings().databases
+    return databases.content_compression, databases.content_compression_level
+
+
+def _existing_hashes(connection: Connection, hashes: list[str]) -> set[str]:
+    """Return which of ``hashes`` are already stored."""
+    table = DocumentContent.__table__
+    found: set[str] = set()
+    for start in range(0, len(hashes), _LOOKUP_BATCH):
+        batch = hashes[start : start + _LOOKUP_BATCH]
+        found.update(
+            connection.execute(
+                select(table.c.content_hash).where(table.c.content_hash.in_(batch))
+            ).scalars()
+        )
+    return found
+
+
+def store_bodies(connection: Connection, bodies: Mapping[str, str]) -> None:
+    """Store bodies keyed by their hash; bodies already stored are skipped.
+
+    Only missing bodies are encoded, so re-storing unchanged documents costs
+    one indexed lookup per batch rather than a compression pass.
+
+    Args:
+        connection: Catalog connection with the content database attached.
+        bodies: Mapping of ``hash_body(body)`` -> body.
+    """
+    if not bodies:
+        return
+    existing = _existing_hashes(connection, list(bodies))
+    missing = {h: body for h, body in bodies.items() if h not in existing}
+    if not missing:
+        return
+    compression, level = _compression_settings()
+    rows = []
+    for content_hash, body in missing.items():
+        data, applied = encode_body(body, compression, level)
+        rows.append(
+            {
+                "content_hash": content_hash,
+                "compression": applied,
+                "size": len(body.encode("utf-8")),
+                "data": data,
+            }
+        )
+    connection.execute(
+        sqlite_insert(DocumentContent.__table__).on_conflict_do_nothing(), rows
+    )
+
+
+def load_bodies(connection: Connection, hashes: Iterable[str]) -> dict[str, str]:
+    """Load and decode bodies by hash.
+
+    Args:
+        connection: Catalog connection with the content database attached.
+        hashes: Body hashes to load; duplicates are fine.
+
+    Returns:
+        Mapping of hash -> body for the hashes that are stored.
+    """
+    table = DocumentContent.__table__
+    unique = list(dict.fromkeys(hashes))
+    bodies: dict[str, str] = {}
+    for start in range(0, len(unique), _LOOKUP_BATCH):
+        batch = unique[start : start + _LOOKUP_BATCH]
+        rows = connection.execute(
+            select(table.c.content_hash, table.c.compression, table.c.data).where(
+                table.c.content_hash.in_(batch)
+            )
+        )
+        for content_hash, compression, data in rows:
+            bodies[content_hash] = decode_body(data, compression)
+    return bodies
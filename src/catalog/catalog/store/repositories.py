@@ -4,10 +4,24 @@ Repositories abstract database access patterns for all Resource models.
 Supports both explicit session injection and ambient session via contextvars.
 """
 
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from catalog.store.models import (
@@ -21,13 +35,19 @@ from catalog.store.models import (
     CollectionMember,
     Dataset,
     Document,
+    DocumentIndexState,
     DocumentKind,
     DocumentLink,
     DocumentLinkKind,
+    IndexGeneration,
+    IngestCheckpoint,
+    PendingDocumentLink,
     Repository,
     RepositoryLink,
     Resource,
+    SourceFile,
 )
+from catalog.store.models.content import DocumentContent, hash_body, load_bodies, store_bodies
 from agentlayer.session import current_session
 
 __all__ = [
@@ -35,9 +55,13 @@ __all__ = [
     "CatalogRepository",
     "CollectionRepository",
     "DatasetRepository",
+    "DocumentIndexStateRepository",
     "DocumentLinkRepository",
     "DocumentRepository",
+    "IndexGenerationRepository",
+    "IngestCheckpointRepository",
     "RepoRepository",
+    "SourceFileRepository",
 ]
 
 
@@ -212,15 +236,7 @@ class DocumentRepository(_BaseRepository):
         """
         from catalog.store.dataset import make_document_uri
 
-        parent = self._session.get(Dataset, parent_id)
-        if parent is None:
-            parent = self._session.get(Resource, parent_id)
-            if parent is None:
-                raise ValueError(f"Parent resource {parent_id} not found")
-            name = getattr(parent, "uri", None) or str(parent_id)
-        else:
-            name = parent.name
-        uri = make_document_uri(name, path)
+        uri = make_document_uri(self._uri_name(parent_id), path)
 
         doc = Document(
             parent_id=parent_id,
@@ -241,6 +257,143 @@ class DocumentRepository(_BaseRepository):
         self._session.add(doc)
         return doc
 
+    def _uri_name(self, parent_id: int) -> str:
+        """Resolve the name used in URIs of a parent's documents.
+
+        Raises:
+            ValueError: If the parent resource does not exist.
+        """
+        parent = self._session.get(Dataset, parent_id)
+        if parent is not None:
+            return parent.name
+        resource = self._session.get(Resource, parent_id)
+        if resource is None:
+            raise ValueError(f"Parent resource {parent_id} not found")
+        return getattr(resource, "uri", None) or str(parent_id)
+
+    def create_many(self, parent_id: int, documents: list[dict[str, Any]]) -> list[int]:
+        """Create documents with one bulk INSERT per table.
+
+        Unlike `create`, no Document instances are added to the session;
+        the rows are written immediately.
+
+        Args:
+            parent_id: Parent resource ID (typically a Dataset).
+            documents: One dict per document with ``path``, ``content_hash``
+                and ``body``, plus any other Document column values
+                (title, etag, metadata_json, ...).
+
+        Returns:
+            IDs of the created documents, in input order.
+        """
+        if not documents:
+            return []
+
+        from catalog.store.dataset import make_document_uri
+
+        name = self._uri_name(parent_id)
+        rows = [
+            {**values, "parent_id": parent_id, "uri": make_document_uri(name, values["path"])}
+            for values in self._store_bodies(documents)
+        ]
+        result = self._session.execute(
+            insert(Document).returning(Document.id, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars())
+
+    def update_many(self, documents: list[dict[str, Any]]) -> None:
+        """Update documents with bulk UPDATEs by primary key.
+
+        Rows with the same set of keys share one executemany. Instances of
+        the updated documents already in the session are expired so they
+        reload the new values on next access.
+
+        Args:
+            documents: One dict per document with ``id`` and the column
+                values to set; a ``body`` is stored in the content table.
+        """
+        if not documents:
+            return
+        self._session.execute(update(Document), self._store_bodies(documents))
+        identity_map = self._session.identity_map
+        for values in documents:
+            key = Document.__mapper__.identity_key_from_primary_key([values["id"]])
+            doc = identity_map.get(key)
+            if doc is not None:
+                self._session.expire(doc)
+
+    def _store_bodies(self, documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Store the ``body`` values of bulk rows, replacing them with ``body_hash``."""
+        bodies: dict[str, str] = {}
+        rows: list[dict[str, Any]] = []
+        for values in documents:
+            if "body" not in values:
+                rows.append(values)
+                continue
+            row = dict(values)
+            body = row.pop("body")
+            row["body_hash"] = hash_body(body)
+            bodies[row["body_hash"]] = body
+            rows.append(row)
+        store_bodies(self._session.connection(), bodies)
+        return rows
+
+    def load_bodies(self, docs: list[Document]) -> None:
+        """Load the bodies of many documents in one query per 500 documents.
+
+        Accessing ``Document.body`` on each document afterwards does not
+        query the content database again.
+
+        Args:
+            docs: Documents whose bodies to load.
+        """
+        hashes = [doc.body_hash for doc in docs if doc.body_hash is not None]
+        bodies = load_bodies(self._session.connection(), hashes)
+        for doc in docs:
+            if doc.body_hash in bodies:
+                doc._body_cache = (doc.body_hash, bodies[doc.body_hash])
+
+    def get_bodies_by_paths(self, parent_id: int, paths: set[str]) -> dict[str, str]:
+        """Load the bodies of documents under a parent by path.
+
+        Reads only ``path`` and ``body_hash`` from the catalog, then the
+        bodies from the content database.
+
+        Args:
+            parent_id: The parent resource's ID.
+            paths: Document paths.
+
+        Returns:
+            Mapping of path -> body for the paths that exist.
+        """
+        hashes: dict[str, str] = {}
+        path_list = sorted(paths)
+        for start in range(0, len(path_list), 500):
+            stmt = select(Document.path, Document.body_hash).where(
+                Document.parent_id == parent_id,
+                Document.path.in_(path_list[start : start + 500]),
+                Document.body_hash.is_not(None),
+            )
+            hashes.update(self._session.execute(stmt).tuples())
+        bodies = load_bodies(self._session.connection(), hashes.values())
+        return {path: bodies.get(body_hash, "") for path, body_hash in hashes.items()}
+
+    def purge_unreferenced_content(self) -> int:
+        """Delete stored bodies that no document references any more.
+
+        Returns:
+            Number of bodies deleted.
+        """
+        self._session.flush()
+        referenced = select(Document.body_hash).where(Document.body_hash.is_not(None))
+        result = self._session.execute(
+            delete(DocumentContent)
+            .where(DocumentContent.content_hash.not_in(referenced))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
     def get_by_id(self, doc_id: int) -> Document | None:
         """Get a document by ID.
 
@@ -289,6 +442,34 @@ class DocumentRepository(_BaseRepository):
         stmt = stmt.order_by(Document.path)
         return list(self._session.execute(stmt).scalars().all())
 
+    def map_by_path(
+        self,
+        parent_id: int,
+        paths: Iterable[str] | None = None,
+    ) -> dict[str, Document]:
+        """Load documents under a parent, keyed by path.
+
+        Bodies live in the content database and are loaded on first access,
+        so prefetching a large dataset does not read every document's text.
+
+        Args:
+            parent_id: The parent resource's ID.
+            paths: If given, only load these paths (one query per 500);
+                otherwise load every document under the parent in one query.
+
+        Returns:
+            Mapping of path -> Document, including inactive documents.
+        """
+        stmt = select(Document).where(Document.parent_id == parent_id)
+        if paths is None:
+            return {doc.path: doc for doc in self._session.execute(stmt).scalars()}
+        docs: dict[str, Document] = {}
+        path_list = sorted(set(paths))
+        for start in range(0, len(path_list), 500):
+            batch_stmt = stmt.where(Document.path.in_(path_list[start : start + 500]))
+            docs.update((doc.path, doc) for doc in self._session.execute(batch_stmt).scalars())
+        return docs
+
     def list_paths_by_parent(
         self,
         parent_id: int,
@@ -505,6 +686,422 @@ class DocumentRepository(_BaseRepository):
         return count or 0
 
 
+class DocumentIndexStateRepository(_BaseRepository):
+    """Repository for per-document index markers (DocumentIndexState)."""
+
+    def list_pending(
+        self,
+        parent_id: int,
+        index_signature: str,
+    ) -> list[tuple[Document, DocumentIndexState | None]]:
+        """List active documents that need (re-)indexing.
+
+        A document is pending when it has no marker, its ``content_hash``
+        differs from the marker's ``indexed_hash``, or the marker was written
+        under a different ``index_signature``.
+
+        Args:
+            parent_id: The parent resource's ID.
+            index_signature: Signature of the current index configuration.
+
+        Returns:
+            List of ``(document, marker)`` pairs ordered by path; ``marker``
+            is None for documents that were never indexed.
+        """
+        stmt = (
+            select(Document, DocumentIndexState)
+            .outerjoin(
+                DocumentIndexState,
+                DocumentIndexState.document_id == Document.id,
+            )
+            .where(
+                Document.parent_id == parent_id,
+                Document.active == True,  # noqa: E712
+                (DocumentIndexState.document_id.is_(None))
+                | (DocumentIndexState.indexed_hash != Document.content_hash)
+                | (DocumentIndexState.index_signature != index_signature),
+            )
+            .order_by(Document.path)
+        )
+        return [(doc, state) for doc, state in self._session.execute(stmt).all()]
+
+    def mark_indexed(
+        self,
+        indexed_hashes: dict[int, str],
+        index_signature: str,
+    ) -> int:
+        """Record documents as indexed at the given content hashes.
+
+        Args:
+            indexed_hashes: Mapping of document ID to the indexed content hash.
+            index_signature: Signature of the index configuration used.
+
+        Returns:
+            Number of markers written.
+        """
+        if not indexed_hashes:
+            return 0
+        existing = {
+            state.document_id: state
+            for state in self._session.execute(
+                select(DocumentIndexState).where(
+                    DocumentIndexState.document_id.in_(indexed_hashes)
+                )
+            ).scalars()
+        }
+        now = datetime.now()
+        for document_id, content_hash in indexed_hashes.items():
+            state = existing.get(document_id)
+            if state is None:
+                self._session.add(
+                    DocumentIndexState(
+                        document_id=document_id,
+                        indexed_hash=content_hash,
+                        index_signature=index_signature,
+                        indexed_at=now,
+                    )
+                )
+            else:
+                state.indexed_hash = content_hash
+                state.index_signature = index_signature
+                state.indexed_at = now
+        return len(indexed_hashes)
+
+    def clear_inactive(self, parent_id: int) -> int:
+        """Drop markers for inactive or deleted documents of a parent.
+
+        Ensures a document that is reactivated later is indexed again, since
+        its index artifacts were removed when it went inactive.
+
+        Args:
+            parent_id: The parent resource's ID.
+
+        Returns:
+            Number of markers removed.
+        """
+        inactive_ids = select(Document.id).where(
+            Document.parent_id == parent_id,
+            Document.active == False,  # noqa: E712
+        )
+        result = self._session.execute(
+            delete(DocumentIndexState)
+            .where(
+                DocumentIndexState.document_id.in_(inactive_ids)
+                | DocumentIndexState.document_id.notin_(select(Document.id))
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+    def clear_by_parent(self, parent_id: int) -> int:
+        """Drop all markers for a parent so its next index run is a full one.
+
+        Args:
+            parent_id: The parent resource's ID.
+
+        Returns:
+            Number of markers removed.
+        """
+        doc_ids = select(Document.id).where(Document.parent_id == parent_id)
+        result = self._session.execute(
+            delete(DocumentIndexState)
+            .where(DocumentIndexState.document_id.in_(doc_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+
+class SourceFileRepository(_BaseRepository):
+    """Repository for the per-dataset source file manifest (SourceFile)."""
+
+    def map_by_dataset(self, dataset_id: int) -> dict[str, SourceFile]:
+        """Load a dataset's manifest, keyed by path.
+
+        Only entries whose document is still active are returned, so a file
+        whose document was deactivated is read again. Files that failed to
+        persist are never recorded (see ``DatasetIngestPipeline.ingest``).
+
+        Args:
+            dataset_id: The dataset's ID.
+
+        Returns:
+            Mapping of path -> SourceFile.
+        """
+        stmt = (
+            select(SourceFile)
+            .join(
+                Document,
+                (Document.parent_id == SourceFile.dataset_id)
+                & (Document.path == SourceFile.path),
+            )
+            .where(
+                SourceFile.dataset_id == dataset_id,
+                Document.active == True,  # noqa: E712
+            )
+        )
+        return {entry.path: entry for entry in self._session.execute(stmt).scalars()}
+
+    def sync(self, dataset_id: int, entries: dict[str, dict[str, Any]]) -> int:
+        """Make the dataset's manifest exactly ``entries``.
+
+        Unchanged rows are left alone, so a run that skipped most files
+        writes only the entries that changed.
+
+        Args:
+            dataset_id: The dataset's ID.
+            entries: Mapping of path -> column values (size, mtime_ns,
+                inode, content_hash).
+
+        Returns:
+            Number of rows inserted, updated or deleted.
+        """
+        columns = ("size", "mtime_ns", "inode", "content_hash")
+        table = SourceFile.__table__
+        existing = {
+            row.path: tuple(row[1:])
+            for row in self._session.execute(
+                select(table.c.path, *(table.c[name] for name in columns)).where(
+                    table.c.dataset_id == dataset_id
+                )
+            )
+        }
+
+        removed = sorted(set(existing) - set(entries))
+        for start in range(0, len(removed), 500):
+            self._session.execute(
+                delete(SourceFile).where(
+                    SourceFile.dataset_id == dataset_id,
+                    SourceFile.path.in_(removed[start : start + 500]),
+                )
+            )
+
+        changed = {
+            path: values
+            for path, values in entries.items()
+            if existing.get(path) != tuple(values.get(name) for name in columns)
+        }
+        return len(removed) + self.upsert(dataset_id, changed)
+
+    def upsert(self, dataset_id: int, entries: dict[str, dict[str, Any]]) -> int:
+        """Insert or update manifest entries, leaving other rows alone.
+
+        Args:
+            dataset_id: The dataset's ID.
+            entries: Mapping of path -> column values.
+
+        Returns:
+            Number of rows written.
+        """
+        if not entries:
+            return 0
+        stmt = sqlite_insert(SourceFile)
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[SourceFile.dataset_id, SourceFile.path],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in ("size", "mtime_ns", "inode", "content_hash")
+                },
+            ),
+            [{"dataset_id": dataset_id, "path": path, **values} for path, values in entries.items()],
+        )
+        return len(entries)
+
+
+class IndexGenerationRepository(_BaseRepository):
+    """Repository for per-dataset index generation counters."""
+
+    def bump(self, dataset_id: int) -> None:
+        """Record that the dataset's search indexes changed.
+
+        Args:
+            dataset_id: The dataset's ID.
+        """
+        stmt = sqlite_insert(IndexGeneration).values(dataset_id=dataset_id, generation=1)
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[IndexGeneration.dataset_id],
+                set_={
+                    "generation": IndexGeneration.generation + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def get(self, dataset_id: int) -> int:
+        """Get the dataset's current generation (0 if never bumped).
+
+        Args:
+            dataset_id: The dataset's ID.
+        """
+        generation = self._session.execute(
+            select(IndexGeneration.generation).where(IndexGeneration.dataset_id == dataset_id)
+        ).scalar()
+        return generation or 0
+
+    def token(self, dataset_name: str | None = None) -> str:
+        """Fingerprint of the index state a search over the dataset(s) sees.
+
+        Combines dataset IDs and creation times with their generations, so
+        it changes when a dataset is re-indexed, created, or deleted and
+        re-created (even under a reused ID).
+
+        Args:
+            dataset_name: Dataset to fingerprint, or None for all datasets.
+
+        Returns:
+            Opaque string, equal only for identical index states.
+        """
+        stmt = (
+            select(
+                Dataset.id, Dataset.created_at, func.coalesce(IndexGeneration.generation, 0)
+            )
+            .outerjoin(IndexGeneration, IndexGeneration.dataset_id == Dataset.id)
+            .order_by(Dataset.id)
+        )
+        if dataset_name is not None:
+            stmt = stmt.where(Dataset.name == dataset_name)
+        return ",".join(
+            f"{ds_id}@{created_at:%Y%m%d%H%M%S}:{gen}"
+            for ds_id, created_at, gen in self._session.execute(stmt)
+        )
+
+
+class IngestCheckpointRepository(_BaseRepository):
+    """Repository for interrupted-ingest checkpoints and their pending links."""
+
+    def get(self, dataset_id: int) -> IngestCheckpoint | None:
+        """Get the dataset's checkpoint, if a run was interrupted.
+
+        Args:
+            dataset_id: The dataset's ID.
+
+        Returns:
+            The IngestCheckpoint, or None.
+        """
+        return self._session.get(IngestCheckpoint, dataset_id)
+
+    def save(self, dataset_id: int, last_path: str | None, stats: dict[str, int]) -> None:
+        """Create or update the dataset's checkpoint.
+
+        Args:
+            dataset_id: The dataset's ID.
+            last_path: Path of the last committed document.
+            stats: Running totals for the run.
+        """
+        stmt = sqlite_insert(IngestCheckpoint).values(
+            dataset_id=dataset_id, last_path=last_path, stats=dict(stats)
+        )
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[IngestCheckpoint.dataset_id],
+                set_={
+                    "last_path": stmt.excluded.last_path,
+                    "stats": stmt.excluded.stats,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        self._forget(dataset_id)
+
+    def add_pending_links(self, dataset_id: int, links: dict[int, list[str]]) -> int:
+        """Stage extracted link targets for resolution at the end of the run.
+
+        A document seen again replaces its staged targets.
+
+        Args:
+            dataset_id: The dataset's ID.
+            links: Mapping of source document ID -> link target names. A
+                document with no targets is staged so its links get cleared.
+
+        Returns:
+            Number of targets staged.
+        """
+        if not links:
+            return 0
+        source_ids = list(links)
+        for start in range(0, len(source_ids), 500):
+            self._session.execute(
+                delete(PendingDocumentLink).where(
+                    PendingDocumentLink.source_id.in_(source_ids[start : start + 500])
+                )
+            )
+        # An empty name marks a document whose links were all removed
+        rows = [
+            {"source_id": source_id, "target_name": name, "dataset_id": dataset_id}
+            for source_id, names in links.items()
+            for name in (dict.fromkeys(names) or [""])
+        ]
+        self._session.execute(insert(PendingDocumentLink), rows)
+        return sum(1 for row in rows if row["target_name"])
+
+    def pending_links(self, dataset_id: int) -> dict[int, list[str]]:
+        """Load the dataset's staged link targets.
+
+        Returns:
+            Mapping of source document ID -> target names (possibly empty).
+        """
+        links: dict[int, list[str]] = {}
+        stmt = (
+            select(PendingDocumentLink.source_id, PendingDocumentLink.target_name)
+            .where(PendingDocumentLink.dataset_id == dataset_id)
+            .order_by(PendingDocumentLink.source_id)
+        )
+        for source_id, name in self._session.execute(stmt):
+            targets = links.setdefault(source_id, [])
+            if name:
+                targets.append(name)
+        return links
+
+    def clear(self, dataset_id: int) -> None:
+        """Delete the dataset's checkpoint and staged links.
+
+        Args:
+            dataset_id: The dataset's ID.
+        """
+        self._session.execute(
+            delete(PendingDocumentLink).where(PendingDocumentLink.dataset_id == dataset_id)
+        )
+        self._session.execute(
+            delete(IngestCheckpoint).where(IngestCheckpoint.dataset_id == dataset_id)
+        )
+        self._forget(dataset_id)
+
+    def _forget(self, dataset_id: int) -> None:
+        """Drop a loaded checkpoint written behind the ORM's back."""
+        checkpoint = self._session.identity_map.get(
+            self._session.identity_key(IngestCheckpoint, dataset_id)
+        )
+        if checkpoint is not None:
+            self._session.expunge(checkpoint)
+
+
+# Session-local staging tables for set-based link replacement. They live in
+# SQLite's temp schema, so they are private to the connection and never
+# touch the catalog file.
+_link_staging_metadata = MetaData()
+_link_sources = Table(
+    "link_sources",
+    _link_staging_metadata,
+    Column("source_id", Integer, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+_link_targets = Table(
+    "link_targets",
+    _link_staging_metadata,
+    Column("source_id", Integer, primary_key=True),
+    Column("target_name", String, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+_link_lookup = Table(
+    "link_lookup",
+    _link_staging_metadata,
+    Column("target_name", String, primary_key=True),
+    Column("doc_id", Integer, nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+
 class DocumentLinkRepository(_BaseRepository):
     """Repository for DocumentLink model operations."""
 
@@ -605,6 +1202,105 @@ class DocumentLinkRepository(_BaseRepository):
             self._session.delete(link)
         return len(links)
 
+    def replace_outgoing_bulk(
+        self,
+        links: dict[int, list[str]],
+        lookup: dict[str, int],
+        relation: DocumentLinkKind,
+    ) -> dict[str, int]:
+        """Replace the outgoing links of many documents in a few statements.
+
+        Link target names and the name -> document lookup are staged into
+        temp tables, then targets are resolved with one join. Existing
+        outgoing links of every source are removed with one DELETE and the
+        resolved links written with one ``INSERT ... SELECT``. Self-links
+        are not stored.
+
+        Args:
+            links: Mapping of source document ID -> link target names. A
+                source with no names has its outgoing links cleared.
+            lookup: Mapping of target name -> document ID.
+            relation: The link type of the new links.
+
+        Returns:
+            Counts of ``resolved``, ``unresolved`` and ``self_links``
+            (distinct target names per source).
+        """
+        counts = {"resolved": 0, "unresolved": 0, "self_links": 0}
+        if not links:
+            return counts
+
+        # Pending ORM deletes/inserts must land before the set-based statements
+        self._session.flush()
+        connection = self._session.connection()
+        tables = (_link_sources, _link_targets, _link_lookup)
+        for table in tables:
+            table.create(connection, checkfirst=True)
+            connection.execute(delete(table))
+
+        try:
+            connection.execute(
+                insert(_link_sources), [{"source_id": source_id} for source_id in links]
+            )
+            target_rows = [
+                {"source_id": source_id, "target_name": name}
+                for source_id, names in links.items()
+                for name in dict.fromkeys(names)
+            ]
+            if target_rows:
+                connection.execute(insert(_link_targets), target_rows)
+            if lookup:
+                connection.execute(
+                    insert(_link_lookup),
+                    [{"target_name": name, "doc_id": doc_id} for name, doc_id in lookup.items()],
+                )
+
+            staged = _link_targets.outerjoin(
+                _link_lookup, _link_lookup.c.target_name == _link_targets.c.target_name
+            )
+            resolved, unresolved, self_links = connection.execute(
+                select(
+                    func.count(_link_lookup.c.doc_id)
+                    - func.count().filter(_link_lookup.c.doc_id == _link_targets.c.source_id),
+                    func.count() - func.count(_link_lookup.c.doc_id),
+                    func.count().filter(_link_lookup.c.doc_id == _link_targets.c.source_id),
+                ).select_from(staged)
+            ).one()
+            counts.update(resolved=resolved, unresolved=unresolved, self_links=self_links)
+
+            connection.execute(
+                delete(DocumentLink).where(
+                    DocumentLink.source_id.in_(select(_link_sources.c.source_id))
+                )
+            )
+            connection.execute(
+                insert(DocumentLink).from_select(
+                    ["source_id", "target_id", "relation"],
+                    select(
+                        _link_targets.c.source_id,
+                        _link_lookup.c.doc_id,
+                        literal(relation, DocumentLink.relation.type),
+                    )
+                    .select_from(
+                        _link_targets.join(
+                            _link_lookup,
+                            _link_lookup.c.target_name == _link_targets.c.target_name,
+                        )
+                    )
+                    .where(_link_lookup.c.doc_id != _link_targets.c.source_id)
+                    .distinct(),
+                )
+            )
+        finally:
+            for table in tables:
+                connection.execute(delete(table))
+
+        # Links loaded before the rewrite no longer reflect the table
+        for obj in list(self._session.identity_map.values()):
+            if isinstance(obj, DocumentLink):
+                self._session.expire(obj)
+        return counts
+
     def delete_by_parent(self, parent_id: int) -> int:
         """Delete all links where source or target belongs to a parent resource.
 
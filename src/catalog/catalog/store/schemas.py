@@ -130,20 +130,22 @@ class DocumentInfo(BaseModel):
     content_hash: str
     etag: str | None
     last_modified: datetime | None
-    body: str
+    body: str | None = None
     metadata: dict[str, Any]
     created_at: datetime
     updated_at: datetime
     model_config = {"from_attributes": True}
 
     @classmethod
-    def from_orm_model(cls, doc: Any) -> "DocumentInfo":
+    def from_orm_model(cls, doc: Any, *, include_body: bool = True) -> "DocumentInfo":
         """Construct a DocumentInfo from a Document ORM instance.
 
         Handles metadata_json deserialization via the model's get_metadata().
 
         Args:
             doc: A Document ORM model instance.
+            include_body: If False, ``body`` is None and the body is not
+                loaded from the content database.
 
         Returns:
             Populated DocumentInfo.
@@ -162,7 +164,7 @@ class DocumentInfo(BaseModel):
             content_hash=doc.content_hash,
             etag=doc.etag,
             last_modified=doc.last_modified,
-            body=doc.body,
+            body=doc.body if include_body else None,
             metadata=doc.get_metadata(),
             created_at=doc.created_at,
             updated_at=doc.updated_at,
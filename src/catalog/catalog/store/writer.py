@@ -0,0 +1,311 @@
+"""catalog.store.writer - Single writer thread for the catalog database.
+
+SQLite allows one writer at a time. Pipelines running concurrently on
+their own sessions end up serializing on ``database is locked`` retries
+(bounded by the busy timeout). ``SQLiteWriter`` instead runs every write
+step on one dedicated thread with one session, in submission order, so
+writers never contend and the work around the writes (reading, embedding)
+is free to run in parallel.
+
+Each job runs in a SAVEPOINT, so a failing job rolls back only its own
+changes. The transaction is committed once the queue is drained or after
+``commit_every`` jobs, whichever comes first; a job's future resolves
+after the commit that made it durable. If the writer thread itself fails
+(e.g. the session cannot be created), every outstanding job's future gets
+the error and later submissions raise.
+
+Example usage:
+    from catalog.store.writer import SQLiteWriter
+
+    with SQLiteWriter() as writer:
+        doc_count = writer.run(lambda: DocumentRepository().count_by_parent(ds_id))
+        print(writer.metrics.peak_queued)
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from agentlayer.logging import get_logger
+from agentlayer.session import use_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session, sessionmaker
+
+__all__ = [
+    "SQLiteWriter",
+    "StageMetrics",
+]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Queue sentinel that stops the writer thread
+_STOP = object()
+
+
+@dataclass
+class StageMetrics:
+    """Queue depth of one pipeline stage.
+
+    Thread-safe; updated by the stage's producers and its worker(s).
+
+    Attributes:
+        name: Stage name.
+        queued: Items waiting for the stage.
+        active: Items being processed.
+        peak_queued: Highest ``queued`` seen.
+        completed: Items finished (successfully or not).
+    """
+
+    name: str
+    queued: int = 0
+    active: int = 0
+    peak_queued: int = 0
+    completed: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def enqueue(self) -> None:
+        """Record an item waiting for the stage."""
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+    def start(self) -> None:
+        """Record a waiting item being picked up."""
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+
+    def finish(self) -> None:
+        """Record an active item finishing."""
+        with self._lock:
+            self.active -= 1
+            self.completed += 1
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count an already-enqueued item as active for the block."""
+        self.start()
+        try:
+            yield
+        finally:
+            self.finish()
+
+    def snapshot(self) -> dict[str, int]:
+        """Current counters as a plain dict (for logging and CLI output)."""
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "active": self.active,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+            }
+
+
+class SQLiteWriter:
+    """Runs database write jobs on one dedicated thread with batched commits.
+
+    A job is a zero-argument callable; it runs with the writer's session
+    as the ambient session (``current_session()``), so repositories and
+    transforms work unchanged. Jobs must not hold on to ORM objects across
+    jobs from other threads except to read already-loaded attributes.
+
+    Attributes:
+        metrics: Queue depth of the writer (``write`` stage).
+        commits: Number of commits made.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session] | None = None,
+        *,
+        commit_every: int | None = None,
+    ) -> None:
+        """Initialize the writer (call ``start`` or use as a context manager).
+
+        Args:
+            session_factory: Factory for the writer's session. Defaults to
+                the catalog database's session factory.
+            commit_every: Commit after at most this many jobs even if more
+                are queued. Defaults to ``performance.writer_commit_every``.
+        """
+        if commit_every is None:
+            from catalog.core.settings import get_settings
+
+            commit_every = get_settings().performance.writer_commit_every
+        if commit_every < 1:
+            raise ValueError(f"commit_every must be >= 1, got {commit_every}")
+        self._session_factory = session_factory
+        self._commit_every = commit_every
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        # Guards _thread against submissions racing a dying writer thread
+        self._lock = threading.Lock()
+        self.metrics = StageMetrics("write")
+        self.commits = 0
+
+    def start(self) -> SQLiteWriter:
+        """Start the writer thread."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sqlite-writer", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Commit outstanding jobs and stop the writer thread."""
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+            with self._lock:
+                self._thread = None
+
+    def __enter__(self) -> SQLiteWriter:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def submit(self, fn: Callable[[], T]) -> Future[T]:
+        """Queue a write job.
+
+        Returns:
+            A future resolving to the job's return value once committed,
+            or to its exception.
+
+        Raises:
+            RuntimeError: If the writer is not running (never started,
+                closed, or its thread failed).
+        """
+        future: Future[T] = Future()
+        with self._lock:
+            if self._thread is None:
+                raise RuntimeError("SQLiteWriter is not running; call start() first")
+            self.metrics.enqueue()
+            self._queue.put((fn, future))
+        return future
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """Run a write job and wait for its commit.
+
+        Called from a job already on the writer thread, runs it inline
+        (in the current transaction) instead of deadlocking on the queue.
+        """
+        if threading.current_thread() is self._thread:
+            return fn()
+        return self.submit(fn).result()
+
+    def _run(self) -> None:
+        """Writer thread: serve jobs; on failure, fail every outstanding job."""
+        pending: list[tuple[Future[Any], Any]] = []
+        try:
+            self._serve(pending)
+        except BaseException as exc:
+            logger.error(f"Writer thread failed: {exc}")
+            self._fail_outstanding(exc, pending)
+
+    def _serve(self, pending: list[tuple[Future[Any], Any]]) -> None:
+        """Drain the queue, committing in batches."""
+        if self._session_factory is None:
+            from catalog.store.database import get_session_factory
+
+            self._session_factory = get_session_factory()
+        session = self._session_factory()
+        stopping = False
+        try:
+            with use_session(session):
+                while not stopping:
+                    item = self._queue.get()
+                    if item is _STOP:
+                        break
+                    while True:
+                        self._execute(session, item, pending)
+                        if len(pending) >= self._commit_every:
+                            self._commit(session, pending)
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is _STOP:
+                            stopping = True
+                            break
+                    self._commit(session, pending)
+        finally:
+            session.close()
+
+    def _fail_outstanding(
+        self, exc: BaseException, pending: list[tuple[Future[Any], Any]]
+    ) -> None:
+        """Stop accepting jobs and fail uncommitted and queued ones with ``exc``."""
+        with self._lock:
+            if self._thread is threading.current_thread():
+                self._thread = None
+        for future, _ in pending:
+            if not future.done():
+                future.set_exception(exc)
+        pending.clear()
+        # No submit() can enqueue past this point, so the drain is complete
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                continue
+            _, future = item
+            with self.metrics.track():
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+
+    def _execute(
+        self,
+        session: Session,
+        item: tuple[Callable[[], Any], Future[Any]],
+        pending: list[tuple[Future[Any], Any]],
+    ) -> None:
+        """Run one job in a savepoint."""
+        fn, future = item
+        self.metrics.start()
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                with session.begin_nested():
+                    result = fn()
+            except BaseException as exc:  # noqa: BLE001 - delivered to the submitter
+                logger.debug(f"Write job failed and was rolled back: {exc}")
+                future.set_exception(exc)
+            else:
+                pending.append((future, result))
+        finally:
+            self.metrics.finish()
+
+    def _commit(self, session: Session, pending: list[tuple[Future[Any], Any]]) -> None:
+        """Commit the open transaction and resolve the jobs it contains."""
+        if not pending:
+            # Only failed (already rolled back) jobs; just end the transaction
+            session.rollback()
+            return
+        try:
+            session.commit()
+        except Exception as exc:
+            logger.error(f"Writer commit failed, {len(pending)} jobs rolled back: {exc}")
+            session.rollback()
+            for future, _ in pending:
+                future.set_exception(exc)
+        else:
+            self.commits += 1
+            for future, result in pending:
+                future.set_result(result)
+        pending.clear()
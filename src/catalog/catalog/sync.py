@@ -15,6 +15,13 @@ Usage::
 Or for a single config::
 
     result = sync.sync(config)
+
+``arun`` syncs up to ``max_parallel_datasets`` datasets at once. Reading,
+parsing and embedding run on each dataset's own thread, while every SQLite
+write goes through one shared ``SQLiteWriter`` thread with batched commits,
+so datasets never contend for the database lock. They also share one
+``VectorStoreManager``, so no dataset's persist overwrites the vectors
+another one added. Per-stage queue depths are kept in ``DatasetSync.metrics``.
 """
 
 from __future__ import annotations
@@ -29,11 +36,13 @@ from pydantic import BaseModel, Field
 from catalog.core.settings import get_settings
 from index.pipelines import DatasetIndexPipeline
 from index.pipelines.schemas import IndexResult
+from index.store.vector import VectorStoreManager
 from catalog.ingest.job import DatasetJob
 from catalog.ingest.pipelines import DatasetIngestPipeline
 from catalog.ingest.schemas import IngestResult
 from catalog.ingest.sources import DatasetSourceConfig
 from catalog.store.database import get_session
+from catalog.store.writer import SQLiteWriter, StageMetrics
 from agentlayer.session import use_session
 
 __all__ = [
@@ -60,38 +69,75 @@ class DatasetSync:
     """Orchestrates ingest -> index for dataset jobs.
 
     Loads job configs from YAML, runs ingest for each, then runs index.
+
+    Attributes:
+        max_parallel_datasets: Datasets synced concurrently by ``arun``.
+        resume: Continue interrupted ingests of loaded jobs from their
+            checkpoints (see ``DatasetSourceConfig.resume``).
+        metrics: Queue depth per stage of the last ``arun``: ``datasets``
+            (jobs waiting for a parallel slot) and ``write`` (jobs waiting
+            for the SQLite writer thread).
     """
 
     def __init__(
         self,
         base_dir: Path | None = None,
         per_job_concurrency: int = 1,
+        max_parallel_datasets: int | None = None,
+        resume: bool = False,
     ) -> None:
+        settings = get_settings()
         self._pipelines: List[DatasetIngestPipeline] = []
         self._configs: List[DatasetSourceConfig] = []
-        self.base_dir = base_dir or get_settings().job_config_path
+        self.base_dir = base_dir or settings.job_config_path
         self.per_job_concurrency = per_job_concurrency
+        self.max_parallel_datasets = (
+            max_parallel_datasets or settings.performance.max_parallel_datasets
+        )
+        self.resume = resume
+        self.metrics: dict[str, StageMetrics] = {}
 
-    def sync(self, config: DatasetSourceConfig) -> SyncResult:
+    @property
+    def configs(self) -> list[DatasetSourceConfig]:
+        """Job configs loaded by ``load_jobs``."""
+        return list(self._configs)
+
+    def sync(
+        self,
+        config: DatasetSourceConfig,
+        writer: SQLiteWriter | None = None,
+        vector_manager: VectorStoreManager | None = None,
+    ) -> SyncResult:
         """Run ingest then index for a single dataset.
 
         Args:
             config: Source configuration for the dataset.
+            writer: Shared writer for database steps. If None, each stage
+                writes through its own session.
+            vector_manager: Shared vector store manager, used by the index
+                stage and to clear vectors of a forced dataset. If None,
+                each stage creates its own.
 
         Returns:
             SyncResult with both ingest and index results.
         """
-        ingest_pipeline = DatasetIngestPipeline(ingest_config=config)
+        ingest_pipeline = DatasetIngestPipeline(
+            ingest_config=config, writer=writer, vector_manager=vector_manager
+        )
         ingest_result = ingest_pipeline.ingest()
 
         index_pipeline = DatasetIndexPipeline(
             dataset_id=ingest_result.dataset_id,
             dataset_name=ingest_result.dataset_name,
+            writer=writer,
         )
 
-        with get_session() as session:
-            with use_session(session):
-                index_result = index_pipeline.index()
+        if writer is not None:
+            index_result = index_pipeline.index(vector_manager=vector_manager)
+        else:
+            with get_session() as session:
+                with use_session(session):
+                    index_result = index_pipeline.index(vector_manager=vector_manager)
 
         return SyncResult(ingest=ingest_result, index=index_result)
 
@@ -119,28 +165,56 @@ class DatasetSync:
             try:
                 job = DatasetJob.from_yaml(path)
                 config = job.to_ingest_config()
+                if self.resume:
+                    config.resume = True
                 self._configs.append(config)
                 logger.debug(f"Loaded job config: {path.name}")
             except Exception as e:
                 logger.error(f"Failed to load job config {path}: {e}")
 
-    async def arun(self) -> list[SyncResult]:
+    async def arun(self, max_parallel_datasets: int | None = None) -> list[SyncResult]:
         """Run all configured jobs, each as ingest -> index.
 
+        At most ``max_parallel_datasets`` jobs run at once; all of them
+        write through one ``SQLiteWriter`` and index into one
+        ``VectorStoreManager``.
+
+        Args:
+            max_parallel_datasets: Override for ``self.max_parallel_datasets``.
+
         Returns:
-            List of SyncResult for each job.
+            List of SyncResult for each job that succeeded.
         """
         if not self._configs:
             logger.warning("No configs to run. Did you call load_jobs()?")
             return []
 
-        logger.info(f"Starting execution of {len(self._configs)} jobs")
+        limit = max_parallel_datasets or self.max_parallel_datasets
+        logger.info(
+            f"Starting execution of {len(self._configs)} jobs "
+            f"({limit} datasets in parallel)"
+        )
 
-        tasks = []
-        for config in self._configs:
-            tasks.append(asyncio.to_thread(self.sync, config))
+        slots = asyncio.Semaphore(limit)
+        datasets = StageMetrics("datasets")
+        vector_manager = VectorStoreManager()
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        with SQLiteWriter() as writer:
+            self.metrics = {"datasets": datasets, "write": writer.metrics}
+
+            async def run_job(config: DatasetSourceConfig) -> SyncResult:
+                datasets.enqueue()
+                async with slots:
+                    with datasets.track():
+                        return await asyncio.to_thread(
+                            self.sync, config, writer, vector_manager
+                        )
+
+            results = await asyncio.gather(
+                *(run_job(config) for config in self._configs),
+                return_exceptions=True,
+            )
+            commits = writer.commits
 
         sync_results: list[SyncResult] = []
         for i, result in enumerate(results):
@@ -150,6 +224,13 @@ class DatasetSync:
                 logger.info(f"Job {i} completed successfully")
                 sync_results.append(result)
 
+        logger.info(
+            f"Sync complete: {commits} commits, "
+            + ", ".join(
+                f"{name} peak queue={stage.peak_queued}"
+                for name, stage in self.metrics.items()
+            )
+        )
         return sync_results
 
 
@@ -161,11 +242,14 @@ if __name__ == "__main__":
     configure_logging(level="DEBUG")
 
     if len(sys.argv) < 2:
-        print("Usage: python -m catalog.sync <job_config_dir>")
+        print("Usage: python -m catalog.sync <job_config_dir> [max_parallel_datasets]")
         sys.exit(1)
 
     target = Path(sys.argv[1])
 
-    sync = DatasetSync(base_dir=target)
+    sync = DatasetSync(
+        base_dir=target,
+        max_parallel_datasets=int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    )
     sync.load_jobs()
     asyncio.run(sync.arun())
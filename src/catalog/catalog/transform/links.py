@@ -5,7 +5,10 @@ extraction and lookup strategy to a LinkResolver implementation.
 Each integration (Obsidian, Heptabase, etc.) provides its own resolver.
 
 Runs **after** PersistenceTransform so that every document already has
-a ``doc_id`` in its node metadata.
+a ``doc_id`` in its node metadata. Links for a whole batch of nodes are
+resolved and replaced set-wise (see
+``DocumentLinkRepository.replace_outgoing_bulk``), so the number of
+statements does not grow with the number of links.
 """
 
 from __future__ import annotations
@@ -18,7 +21,6 @@ from llama_index.core.schema import BaseNode, TransformComponent
 
 from catalog.store.models import DocumentLinkKind
 from catalog.store.repositories import DocumentLinkRepository, DocumentRepository
-from agentlayer.session import current_session
 
 __all__ = [
     "LinkResolver",
@@ -159,26 +161,54 @@ class LinkResolutionTransform(TransformComponent):
         Returns:
             The same nodes unchanged (passthrough).
         """
-        self.stats.reset()
+        self.resolve(self.extract(nodes))
+        return nodes
 
-        session = current_session()
-        doc_repo = DocumentRepository()
-        link_repo = DocumentLinkRepository()
+    def extract(self, nodes: list[BaseNode]) -> dict[int, list[str]]:
+        """Extract link targets per document, without touching the database.
 
-        # Delegate lookup construction to the resolver.
-        name_to_id = self._resolver.build_lookup(self._dataset_id, doc_repo)
+        Args:
+            nodes: Nodes with ``doc_id`` in metadata; chunks of the same
+                document are merged.
 
+        Returns:
+            Mapping of document ID -> target names. Documents with no
+            links map to an empty list, so their old links get cleared.
+        """
+        links: dict[int, list[str]] = {}
         for node in nodes:
             if not node.metadata:
                 continue
-            targets = self._resolver.extract_links(node)
-            if not targets:
+            doc_id = node.metadata.get("doc_id")
+            if doc_id is None:
                 continue
-            self._process_node(
-                node, targets, name_to_id, link_repo, session
-            )
+            links.setdefault(doc_id, []).extend(self._resolver.extract_links(node))
+        return links
+
+    def resolve(self, links: dict[int, list[str]]) -> LinkResolutionStats:
+        """Resolve extracted targets and replace the documents' outgoing links.
+
+        Resolves and replaces links as one set instead of a delete + upsert
+        round trip per link.
+
+        Args:
+            links: Mapping of document ID -> target names (see ``extract``).
+
+        Returns:
+            This pass's statistics (also available as ``stats``).
+        """
+        self.stats.reset()
+
+        # Delegate lookup construction to the resolver.
+        name_to_id = self._resolver.build_lookup(self._dataset_id, DocumentRepository())
 
-        session.flush()
+        counts = DocumentLinkRepository().replace_outgoing_bulk(
+            links, name_to_id, self._resolver.link_kind
+        )
+        self.stats.resolved = counts["resolved"]
+        self.stats.unresolved = counts["unresolved"]
+        self.stats.self_links = counts["self_links"]
+        self.stats.documents_processed = sum(1 for targets in links.values() if targets)
 
         logger.info(
             f"LinkResolutionTransform complete: "
@@ -187,39 +217,4 @@ class LinkResolutionTransform(TransformComponent):
             f"self_links={self.stats.self_links}, "
             f"documents={self.stats.documents_processed}"
         )
-
-        return nodes
-
-    def _process_node(
-        self,
-        node: BaseNode,
-        targets: list[str],
-        name_to_id: dict[str, int],
-        link_repo: DocumentLinkRepository,
-        session,
-    ) -> None:
-        """Resolve links for a single node and create DocumentLink rows."""
-        doc_id = node.metadata.get("doc_id")
-        if doc_id is None:
-            return
-
-        self.stats.documents_processed += 1
-
-        # Clear existing outgoing links for idempotent re-ingestion.
-        # Flush after delete so new inserts don't conflict with pending deletes.
-        link_repo.delete_outgoing(doc_id)
-        session.flush()
-
-        for target_name in targets:
-            target_id = name_to_id.get(target_name)
-            if target_id is None:
-                logger.trace(f"Unresolved link: '{target_name}' from doc {doc_id}")
-                self.stats.unresolved += 1
-                continue
-
-            if target_id == doc_id:
-                self.stats.self_links += 1
-                continue
-
-            link_repo.upsert(doc_id, target_id, self._resolver.link_kind)
-            self.stats.resolved += 1
+        return self.stats
@@ -20,7 +20,9 @@ Example usage:
 
 import hashlib
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
 from agentlayer.logging import get_logger
@@ -133,6 +135,7 @@ class PersistenceStats:
         skipped: Number of unchanged documents skipped.
         failed: Number of documents that failed to process.
         errors: List of error messages for failed documents.
+        failed_paths: Paths of the documents that failed to process.
     """
 
     created: int = 0
@@ -140,6 +143,7 @@ class PersistenceStats:
     skipped: int = 0
     failed: int = 0
     errors: list[str] = field(default_factory=list)
+    failed_paths: set[str] = field(default_factory=set)
 
     @property
     def total_processed(self) -> int:
@@ -153,6 +157,17 @@ class PersistenceStats:
         self.skipped = 0
         self.failed = 0
         self.errors = []
+        self.failed_paths = set()
+
+
+# (Document column, node metadata key) for optional resource-level fields.
+_OPTIONAL_FIELDS: tuple[tuple[str, str], ...] = (
+    ("title", "title"),
+    ("description", "description"),
+    ("format", "_format"),
+    ("media_type", "_media_type"),
+    ("subject", "_subject"),
+)
 
 
 def _compute_content_hash(content: str, metadata_json: str | None = None) -> str:
@@ -167,10 +182,15 @@ class PersistenceTransform(TransformComponent):
     """LlamaIndex TransformComponent that persists nodes to the database.
 
     This transform handles database persistence within the pipeline:
-    1. Check if document exists (by path from node metadata)
-    2. Create new documents or update existing ones
+    1. Load the dataset's existing documents in one query (bodies stay unloaded)
+    2. Create new documents or update existing ones, in batches
     3. Track statistics
 
+    Each batch is written with one bulk INSERT and bulk UPDATEs by primary
+    key inside a savepoint. If a batch fails (e.g. URI collision), it is
+    rolled back and retried node by node, each in its own savepoint, so
+    only the offending nodes are dropped.
+
     Change detection is handled upstream by LlamaIndex's docstore mechanism
     (using SHA256 of text + metadata). Only new or changed documents reach
     this transform.
@@ -196,6 +216,7 @@ class PersistenceTransform(TransformComponent):
     _dataset_id: int = 0
     _dataset_name: str = ""
     _path_key: str = "relative_path"
+    _batch_size: int = 500
     _stats: PersistenceStats | None = None
 
     def __init__(
@@ -204,6 +225,7 @@ class PersistenceTransform(TransformComponent):
         dataset_name: str = "",
         *,
         path_key: str = "relative_path",
+        batch_size: int = 500,
         **kwargs: Any,
     ) -> None:
         """Initialize the persistence transform.
@@ -212,12 +234,15 @@ class PersistenceTransform(TransformComponent):
             dataset_id: ID of the dataset to persist documents to.
             dataset_name: Normalized name of the dataset (used for URI generation).
             path_key: Metadata key for the document path (default: "relative_path").
+            batch_size: Documents per bulk write. 0 persists every node in
+                its own savepoint.
             **kwargs: Additional arguments passed to TransformComponent.
         """
         super().__init__(**kwargs)
         self._dataset_id = dataset_id
         self._dataset_name = dataset_name
         self._path_key = path_key
+        self._batch_size = batch_size
         self._stats = PersistenceStats()
 
     @property
@@ -262,39 +287,23 @@ class PersistenceTransform(TransformComponent):
 
             doc_repo = DocumentRepository()
 
-            # Pre-fetch existing documents for efficiency
-            existing_paths = doc_repo.list_paths_by_parent(
-                self._dataset_id, active_only=False
+            # Only the rows this run touches, so streamed batches stay
+            # O(batch); bodies are loaded lazily
+            existing_docs = doc_repo.map_by_path(
+                self._dataset_id, {self._get_path(node) for node in nodes}
             )
-            existing_docs: dict[str, Document | None] = {
-                path: doc_repo.get_by_path(self._dataset_id, path)
-                for path in existing_paths
-            }
 
-            output_nodes: list[BaseNode] = []
-            for node in nodes:
-                try:
-                    # Use a savepoint so a single node failure (e.g. URI
-                    # collision) doesn't poison the entire session.
-                    nested = session.begin_nested()
-                    try:
-                        changed = self._process_node(
-                            session=session,
-                            doc_repo=doc_repo,
-                            node=node,
-                            existing_docs=existing_docs,
+            if self._batch_size > 0:
+                output_nodes: list[BaseNode] = []
+                created_ids: dict[str, int] = {}
+                for batch in self._batches(nodes):
+                    output_nodes.extend(
+                        self._persist_batch(
+                            session, doc_repo, batch, existing_docs, created_ids
                         )
-                        nested.commit()
-                        if changed:
-                            output_nodes.append(node)
-                    except Exception:
-                        nested.rollback()
-                        raise
-                except Exception as e:
-                    path = self._get_path(node)
-                    logger.error(f"Failed to persist {path}: {e}")
-                    self.stats.failed += 1
-                    self.stats.errors.append(f"{path}: {e}")
+                    )
+            else:
+                output_nodes = self._persist_each(session, doc_repo, nodes, existing_docs)
 
             session.flush()
 
@@ -307,6 +316,118 @@ class PersistenceTransform(TransformComponent):
 
             return output_nodes
 
+    def _batches(self, nodes: list[BaseNode]) -> Iterator[list[BaseNode]]:
+        """Split nodes into write batches.
+
+        A batch never holds the same path twice, so a repeated path is
+        written by a later batch as an update of the row the earlier one
+        created.
+        """
+        batch: list[BaseNode] = []
+        paths: set[str] = set()
+        for node in nodes:
+            path = self._get_path(node)
+            if len(batch) >= self._batch_size or path in paths:
+                yield batch
+                batch, paths = [], set()
+            batch.append(node)
+            paths.add(path)
+        if batch:
+            yield batch
+
+    def _persist_batch(
+        self,
+        session: Session,
+        doc_repo: DocumentRepository,
+        batch: list[BaseNode],
+        existing_docs: dict[str, Document],
+        created_ids: dict[str, int],
+    ) -> list[BaseNode]:
+        """Write a batch with bulk statements, falling back to per-node writes.
+
+        Args:
+            session: Session to write with.
+            doc_repo: Document repository.
+            batch: Nodes to persist; no path appears twice.
+            existing_docs: Documents by path, from before this run or
+                created by the per-node fallback.
+            created_ids: IDs of documents bulk-created by earlier batches,
+                by path. A path seen again is loaded into ``existing_docs``.
+
+        Returns:
+            The batch's nodes that were persisted.
+        """
+        creates: list[dict[str, Any]] = []
+        create_nodes: list[BaseNode] = []
+        updates: list[dict[str, Any]] = []
+        for node in batch:
+            path, values = self._document_values(node)
+            if path in created_ids:
+                existing_docs[path] = session.get(Document, created_ids.pop(path))
+            existing = existing_docs.get(path)
+            if existing is not None:
+                updates.append({"id": existing.id, "active": True, **values})
+                node.metadata["doc_id"] = existing.id
+            else:
+                creates.append({"path": path, **values})
+                create_nodes.append(node)
+
+        try:
+            with session.begin_nested():
+                doc_repo.update_many(updates)
+                new_ids = doc_repo.create_many(self._dataset_id, creates)
+        except Exception as e:
+            logger.warning(
+                f"Bulk write of {len(batch)} documents failed, retrying one by one: {e}"
+            )
+            return self._persist_each(session, doc_repo, batch, existing_docs)
+
+        for node, doc_id in zip(create_nodes, new_ids):
+            node.metadata["doc_id"] = doc_id
+            created_ids[self._get_path(node)] = doc_id
+        self.stats.created += len(creates)
+        self.stats.updated += len(updates)
+        return batch
+
+    def _persist_each(
+        self,
+        session: Session,
+        doc_repo: DocumentRepository,
+        nodes: list[BaseNode],
+        existing_docs: dict[str, Document],
+    ) -> list[BaseNode]:
+        """Persist nodes one at a time, each in its own savepoint.
+
+        Returns:
+            The nodes that were persisted; failures are recorded in stats.
+        """
+        output_nodes: list[BaseNode] = []
+        for node in nodes:
+            try:
+                # Use a savepoint so a single node failure (e.g. URI
+                # collision) doesn't poison the entire session.
+                nested = session.begin_nested()
+                try:
+                    changed = self._process_node(
+                        session=session,
+                        doc_repo=doc_repo,
+                        node=node,
+                        existing_docs=existing_docs,
+                    )
+                    nested.commit()
+                    if changed:
+                        output_nodes.append(node)
+                except Exception:
+                    nested.rollback()
+                    raise
+            except Exception as e:
+                path = self._get_path(node)
+                logger.error(f"Failed to persist {path}: {e}")
+                self.stats.failed += 1
+                self.stats.errors.append(f"{path}: {e}")
+                self.stats.failed_paths.add(path)
+        return output_nodes
+
     def _get_path(self, node: BaseNode) -> str:
         """Extract document path from node metadata."""
         if node.metadata and self._path_key in node.metadata:
@@ -335,66 +456,71 @@ class PersistenceTransform(TransformComponent):
         }
         return filtered if filtered else None
 
-    def _process_node(
-        self,
-        session: Session,
-        doc_repo: DocumentRepository,
-        node: BaseNode,
-        existing_docs: dict[str, Document | None],
-    ) -> bool:
-        """Process a single node for persistence.
+    def _document_values(self, node: BaseNode) -> tuple[str, dict[str, Any]]:
+        """Compute a node's path and the Document column values to write.
 
-        Every node that reaches this transform is new or changed (LlamaIndex
-        docstore filters unchanged documents upstream). This method always
-        creates or updates.
+        Optional resource fields (title, description, format, media_type,
+        subject) are only included when the node provides them, so updates
+        keep the stored values otherwise.
 
         Returns:
-            True (all nodes pass downstream).
+            Tuple of (path, column values).
         """
         path = self._get_path(node)
         body = node.get_content()
         metadata_payload = self._get_metadata(node)
         metadata_json = json.dumps(metadata_payload) if metadata_payload else None
-        content_hash = _compute_content_hash(body, metadata_json)
 
         # Extract source metadata for etag/last_modified
         etag = node.metadata.get("etag") if node.metadata else None
         last_modified_str = node.metadata.get("last_modified") if node.metadata else None
         last_modified = None
         if last_modified_str:
-            from datetime import datetime
             try:
                 last_modified = datetime.fromisoformat(last_modified_str)
             except (ValueError, TypeError):
                 pass
 
+        values: dict[str, Any] = {
+            "content_hash": _compute_content_hash(body, metadata_json),
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "metadata_json": metadata_payload,
+        }
+
         # Extract title, description, and resource-level fields from node metadata
-        title = node.metadata.get("title") if node.metadata else None
-        description = node.metadata.get("description") if node.metadata else None
-        format_ = node.metadata.get("_format") if node.metadata else None
-        media_type = node.metadata.get("_media_type") if node.metadata else None
-        subject = node.metadata.get("_subject") if node.metadata else None
+        if node.metadata:
+            for column, key in _OPTIONAL_FIELDS:
+                value = node.metadata.get(key)
+                if value is not None:
+                    values[column] = value
+        return path, values
+
+    def _process_node(
+        self,
+        session: Session,
+        doc_repo: DocumentRepository,
+        node: BaseNode,
+        existing_docs: dict[str, Document],
+    ) -> bool:
+        """Process a single node for persistence.
 
+        Every node that reaches this transform is new or changed (LlamaIndex
+        docstore filters unchanged documents upstream). This method always
+        creates or updates.
+
+        Returns:
+            True (all nodes pass downstream).
+        """
+        path, values = self._document_values(node)
         existing = existing_docs.get(path)
 
         if existing is not None:
             # Update existing document
-            existing.content_hash = content_hash
-            existing.body = body
-            existing.etag = etag
-            existing.last_modified = last_modified
+            for column, value in values.items():
+                setattr(existing, column, value)
             existing.active = True
-            existing.metadata_json = metadata_payload
-            if title is not None:
-                existing.title = title
-            if description is not None:
-                existing.description = description
-            if format_ is not None:
-                existing.format = format_
-            if media_type is not None:
-                existing.media_type = media_type
-            if subject is not None:
-                existing.subject = subject
             session.flush()
 
             node.metadata["doc_id"] = existing.id
@@ -403,20 +529,7 @@ class PersistenceTransform(TransformComponent):
             return True
         else:
             # New document - create
-            doc = doc_repo.create(
-                parent_id=self._dataset_id,
-                path=path,
-                content_hash=content_hash,
-                body=body,
-                title=title,
-                description=description,
-                format=format_,
-                media_type=media_type,
-                subject=subject,
-                etag=etag,
-                last_modified=last_modified,
-                metadata_json=metadata_payload,
-            )
+            doc = doc_repo.create(parent_id=self._dataset_id, path=path, **values)
             session.flush()
 
             node.metadata["doc_id"] = doc.id
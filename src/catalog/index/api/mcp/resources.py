@@ -164,7 +164,7 @@ def _read_dataset_listing(
     """
     import json
 
-    docs = dataset_service.list_documents(dataset.id, active_only=True)
+    docs = dataset_service.list_documents(dataset.id, active_only=True, include_body=False)
 
     listing = {
         "dataset": dataset.name,
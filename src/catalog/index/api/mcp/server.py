@@ -23,6 +23,7 @@ from agentlayer.logging import get_logger
 from index.api.mcp.resources import list_resources, read_resource
 from index.api.mcp.tools import create_mcp_tools
 from index.search.service import SearchService
+from catalog.core.settings import get_settings
 from catalog.store.database import get_session
 from agentlayer.session import use_session
 
@@ -63,7 +64,7 @@ class MCPServer:
         if self._service is None:
             self._session = get_session().__enter__()
             use_session(self._session).__enter__()
-            self._service = SearchService(self._session)
+            self._service = SearchService(self._session, read_only=True)
             self._tools = create_mcp_tools(self._service)
             self._tool_map = {t.metadata.name: t for t in self._tools}
             logger.debug(f"Initialized MCPServer with {len(self._tools)} tools")
@@ -79,6 +80,10 @@ class MCPServer:
 
         try:
             self._ensure_initialized()
+            if get_settings().llm.warm_up:
+                from agentlayer.llm.registry import warm_up_models
+
+                warm_up_models()
             self._run_loop()
         except KeyboardInterrupt:
             logger.info("MCP server interrupted")
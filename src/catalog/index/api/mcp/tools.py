@@ -19,6 +19,7 @@ Example usage:
 
 from typing import Any
 
+from agentlayer.llm_cache import get_llm_cache_stats
 from agentlayer.logging import get_logger
 from llama_index.core.tools import FunctionTool
 from pydantic import BaseModel, Field
@@ -380,20 +381,25 @@ def _make_catalog_multi_get(service: SearchService):
                     "documents": [],
                 }
 
-            # Get all documents in dataset
-            all_docs = dataset_service.list_documents(dataset.id, active_only=True)
-
-            # Filter by glob pattern
-            matching_docs = []
-            for doc in all_docs:
-                if fnmatch.fnmatch(doc.path, glob_pattern):
-                    matching_docs.append({
-                        "path": doc.path,
-                        "dataset_name": dataset_name,
-                        "body": doc.body,
-                        "title": doc.title,
-                        "metadata": doc.metadata,
-                    })
+            # List documents without bodies, then load bodies for matches only
+            all_docs = dataset_service.list_documents(
+                dataset.id, active_only=True, include_body=False
+            )
+            matches = [doc for doc in all_docs if fnmatch.fnmatch(doc.path, glob_pattern)]
+            bodies = dataset_service.get_document_bodies(
+                dataset.id, {doc.path for doc in matches}
+            )
+
+            matching_docs = [
+                {
+                    "path": doc.path,
+                    "dataset_name": dataset_name,
+                    "body": bodies.get(doc.path, ""),
+                    "title": doc.title,
+                    "metadata": doc.metadata,
+                }
+                for doc in matches
+            ]
 
             return {
                 "pattern": pattern,
@@ -426,7 +432,7 @@ def _make_catalog_status(service: SearchService):
         """Get catalog index health and status information.
 
         Returns information about database connectivity, vector store,
-        FTS tables, and any issues.
+        FTS tables, LLM cache hit/miss/eviction counters, and any issues.
 
         Returns:
             Dictionary with health status and component details.
@@ -437,6 +443,8 @@ def _make_catalog_status(service: SearchService):
             dataset_service = DatasetService(service.session)
             datasets = dataset_service.list_datasets()
 
+            cache_stats = get_llm_cache_stats()
+
             return {
                 "healthy": health.is_healthy,
                 "components": [
@@ -457,6 +465,14 @@ def _make_catalog_status(service: SearchService):
                     }
                     for ds in datasets
                 ],
+                "llm_cache": {
+                    "memory_hits": cache_stats.memory_hits,
+                    "disk_hits": cache_stats.disk_hits,
+                    "misses": cache_stats.misses,
+                    "evictions": cache_stats.evictions,
+                    "expired_purged": cache_stats.expired_purged,
+                    "hit_rate": cache_stats.hit_rate,
+                },
             }
 
         except Exception as e:
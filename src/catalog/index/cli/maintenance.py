@@ -0,0 +1,123 @@
+"""index.cli.maintenance - FTS index maintenance CLI commands.
+
+Provides CLI commands for inspecting and maintaining the FTS5 indexes.
+
+Commands:
+    check: Run FTS5 integrity-check on the index tables
+    optimize: Merge each FTS table into a single segment
+    stats: Show segment counts and sizes per FTS table
+
+Example usage:
+    # Verify the FTS indexes (exit code 1 on corruption)
+    uv run python -m catalog index check
+
+    # Merge segments after a large re-index
+    uv run python -m catalog index optimize --table chunks_fts
+"""
+
+from typing import Annotated
+
+import typer
+
+from agentlayer.logging import get_logger
+
+__all__ = ["index_app"]
+
+logger = get_logger(__name__)
+
+index_app = typer.Typer(
+    name="index",
+    help="FTS index maintenance commands.",
+)
+
+TableOption = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--table",
+        "-t",
+        help="FTS table to process (repeatable). Defaults to all index FTS tables.",
+    ),
+]
+
+
+def _tables(table: list[str] | None) -> tuple[str, ...]:
+    """Resolve --table options against the known FTS tables."""
+    from index.store.fts_maintenance import FTS_TABLES
+
+    if not table:
+        return FTS_TABLES
+    unknown = sorted(set(table) - set(FTS_TABLES))
+    if unknown:
+        typer.echo(
+            f"Error: Unknown FTS table(s): {', '.join(unknown)} "
+            f"(expected one of {', '.join(FTS_TABLES)})",
+            err=True,
+        )
+        raise typer.Exit(1)
+    return tuple(table)
+
+
+@index_app.command()
+def check(table: TableOption = None) -> None:
+    """Run FTS5 integrity-check on the index tables.
+
+    External-content tables are also checked against their content table.
+    Exits with code 1 if any table is inconsistent.
+    """
+    from agentlayer.session import use_session
+    from catalog.store.database import get_session
+    from index.store.fts_maintenance import FTSMaintenance
+
+    failed = False
+    with get_session() as session:
+        with use_session(session):
+            maintenance = FTSMaintenance()
+            for name in maintenance.existing_tables(_tables(table)):
+                error = maintenance.integrity_check(name)
+                if error is None:
+                    typer.echo(f"{name}: ok")
+                else:
+                    failed = True
+                    typer.echo(f"{name}: FAILED - {error}", err=True)
+    if failed:
+        typer.echo("Rebuild a failed chunks_fts with FTSChunkManager.rebuild().", err=True)
+        raise typer.Exit(1)
+
+
+@index_app.command()
+def optimize(table: TableOption = None) -> None:
+    """Merge each FTS table into a single segment."""
+    from agentlayer.session import use_session
+    from catalog.store.database import get_session
+    from index.store.fts_maintenance import FTSMaintenance
+
+    with get_session() as session:
+        with use_session(session):
+            maintenance = FTSMaintenance()
+            for name in maintenance.existing_tables(_tables(table)):
+                before = maintenance.segment_stats(name)
+                maintenance.optimize(name)
+                segments = before.segments if before is not None else 0
+                typer.echo(f"{name}: {segments} segments merged")
+
+
+@index_app.command()
+def stats(table: TableOption = None) -> None:
+    """Show segment counts and sizes per FTS table."""
+    from agentlayer.session import use_session
+    from catalog.store.database import get_session
+    from index.store.fts_maintenance import FTSMaintenance
+
+    with get_session() as session:
+        with use_session(session):
+            maintenance = FTSMaintenance()
+            typer.echo(f"{'Table':<16} {'Segments':>8} {'Pages':>8} {'Size (KiB)':>11}  Levels")
+            typer.echo("-" * 60)
+            for name in maintenance.existing_tables(_tables(table)):
+                segment_stats = maintenance.segment_stats(name)
+                if segment_stats is None:
+                    continue
+                typer.echo(
+                    f"{name:<16} {segment_stats.segments:>8} {segment_stats.pages:>8} "
+                    f"{segment_stats.size_bytes / 1024:>11.1f}  {segment_stats.levels}"
+                )
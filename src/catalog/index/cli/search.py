@@ -141,6 +141,8 @@ def methods(
                         "mode": criteria.mode,
                         "rerank": criteria.rerank,
                         "timing_ms": search_results.timing_ms,
+                        "leg_timings_ms": search_results.leg_timings_ms,
+                        "degraded_legs": search_results.degraded_legs,
                         "total_candidates": search_results.total_candidates,
                         "results": [r.model_dump() for r in search_results.results],
                     }
@@ -4,6 +4,9 @@ Provides tools for measuring and tracking search quality against
 golden (ground truth) query sets.
 """
 
+from index.eval.ann import evaluate_ann_recall
+from index.eval.fts_query import benchmark_fts_query_overhead
+from index.eval.fts_write import benchmark_chunk_writes
 from index.eval.golden import (
     EVAL_THRESHOLDS,
     EvalResult,
@@ -11,11 +14,18 @@ from index.eval.golden import (
     evaluate_golden_queries,
     load_golden_queries,
 )
+from index.eval.read_pool import benchmark_concurrent_search
+from index.eval.rerank import benchmark_rerank
 
 __all__ = [
     "EvalResult",
     "EVAL_THRESHOLDS",
     "GoldenQuery",
+    "benchmark_chunk_writes",
+    "benchmark_concurrent_search",
+    "benchmark_fts_query_overhead",
+    "benchmark_rerank",
+    "evaluate_ann_recall",
     "evaluate_golden_queries",
     "load_golden_queries",
 ]
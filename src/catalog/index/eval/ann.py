@@ -0,0 +1,124 @@
+"""ANN vs exact vector search comparison over golden queries.
+
+Measures how closely the approximate (IVF) Zvec search reproduces exact
+brute-force results and what it saves in latency. Each golden query is
+embedded once and run through both paths against the same index.
+
+Example usage:
+    from index.eval.ann import evaluate_ann_recall
+    from index.eval.golden import load_golden_queries
+    from index.store.vector import VectorStoreManager
+
+    queries = load_golden_queries("tests/rag_v2/fixtures/golden_queries.json")
+    report = evaluate_ann_recall(VectorStoreManager(), queries)
+    print(report["recall_at_10"], report["ann_latency_ms_p95"])
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from agentlayer.logging import get_logger
+
+from index.eval.golden import GoldenQuery
+
+if TYPE_CHECKING:
+    from index.store.vector import VectorStoreManager
+
+__all__ = [
+    "evaluate_ann_recall",
+]
+
+logger = get_logger(__name__)
+
+
+def _timed_query(
+    vector_manager: "VectorStoreManager",
+    query_embedding: list[float],
+    top_k: int,
+    dataset_name: str | None,
+    exact: bool,
+) -> tuple[list[str], float]:
+    """Run one Zvec query and return (node_ids, latency_ms)."""
+    started = time.perf_counter()
+    hits = vector_manager._query_zvec(
+        top_k=top_k,
+        dataset_name=dataset_name,
+        query_embedding=query_embedding,
+        exact=exact,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    return [hit.node_id for hit in hits], elapsed_ms
+
+
+def evaluate_ann_recall(
+    vector_manager: "VectorStoreManager",
+    golden_queries: list[GoldenQuery],
+    k_values: list[int] | None = None,
+    dataset_name: str | None = None,
+) -> dict[str, float]:
+    """Compare approximate and exact Zvec search on golden queries.
+
+    Recall@k is the fraction of the exact top-k node ids that the
+    approximate search also returns in its top-k, averaged over queries.
+
+    Args:
+        vector_manager: Manager configured for the Zvec backend.
+        golden_queries: Queries to run (only the query text is used).
+        k_values: k values for recall@k. Defaults to [1, 5, 10].
+        dataset_name: Optional dataset filter applied to both paths.
+
+    Returns:
+        Dict with ``queries``, ``recall_at_<k>`` per k, and p50/p95 latency
+        in milliseconds for both paths (``exact_latency_ms_p50`` etc.).
+
+    Raises:
+        ValueError: If the active vector backend is not Zvec.
+    """
+    if vector_manager.vector_backend != "zvec":
+        raise ValueError("ANN recall evaluation requires the zvec vector backend")
+
+    if k_values is None:
+        k_values = [1, 5, 10]
+    max_k = max(k_values)
+
+    embed_model = vector_manager.get_embed_model_for_identity(
+        vector_manager.get_configured_embedding_identity()
+    )
+
+    recalls: dict[int, list[float]] = {k: [] for k in k_values}
+    exact_latencies: list[float] = []
+    ann_latencies: list[float] = []
+    for gq in golden_queries:
+        query_embedding = embed_model.get_query_embedding(gq.query)
+        exact_ids, exact_ms = _timed_query(
+            vector_manager, query_embedding, max_k, dataset_name, exact=True
+        )
+        ann_ids, ann_ms = _timed_query(
+            vector_manager, query_embedding, max_k, dataset_name, exact=False
+        )
+        exact_latencies.append(exact_ms)
+        ann_latencies.append(ann_ms)
+
+        for k in k_values:
+            expected = set(exact_ids[:k])
+            if not expected:
+                continue
+            recalls[k].append(len(expected & set(ann_ids[:k])) / len(expected))
+
+    report: dict[str, float] = {"queries": float(len(golden_queries))}
+    for k in k_values:
+        report[f"recall_at_{k}"] = float(np.mean(recalls[k])) if recalls[k] else 0.0
+    for label, latencies in (("exact", exact_latencies), ("ann", ann_latencies)):
+        report[f"{label}_latency_ms_p50"] = (
+            float(np.percentile(latencies, 50)) if latencies else 0.0
+        )
+        report[f"{label}_latency_ms_p95"] = (
+            float(np.percentile(latencies, 95)) if latencies else 0.0
+        )
+
+    logger.debug(
+        f"ANN recall evaluation over {len(golden_queries)} queries: "
+        f"recall@{max_k}={report[f'recall_at_{max_k}']:.3f}"
+    )
+    return report
@@ -0,0 +1,148 @@
+"""Per-query overhead of chunks_fts searches: ad-hoc SQL vs prepared statements.
+
+Builds a throwaway SQLite database with the chunks FTS table, indexes a
+synthetic vault, and runs the same query mix two ways:
+
+- ad-hoc: the previous search path - SQL text rebuilt per call with the
+  BM25 weights interpolated, executed through ``Session.execute(text(...))``
+- prepared: ``FTSChunkManager.search_with_scores`` - fixed statement text
+  per filter mode, weights bound as parameters, run on the raw DBAPI cursor
+
+The query mix alternates the intent weight presets and the filtered and
+unfiltered modes, which is what multiplied the ad-hoc statement variants.
+
+Example usage:
+    from index.eval.fts_query import benchmark_fts_query_overhead
+
+    report = benchmark_fts_query_overhead(queries=2_000)
+    print(report["adhoc_us_per_query"], report["prepared_us_per_query"])
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from agentlayer.database import create_engine_for_path
+from agentlayer.logging import get_logger
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import Session
+
+from index.eval.fts_write import _note_chunks
+from index.store.fts_chunk import FTSChunkManager, create_chunks_fts_table
+
+__all__ = [
+    "benchmark_fts_query_overhead",
+]
+
+logger = get_logger(__name__)
+
+_TERMS = ("tokio executor", "segment merge", "backlink", "vector embedding", "journal review")
+# Default, informational and navigational heading weights.
+_PRESETS = ("0.0, 0.25, 1.0, 0.0", "0.0, 0.5, 1.0, 0.0", "0.0, 0.8, 1.0, 0.0")
+_DATASETS = ("bench", "other")
+
+
+def _adhoc_search(
+    session: Session,
+    query: str,
+    limit: int,
+    bm25_weights: str,
+    dataset_name: str | None,
+) -> list[tuple[str, float]]:
+    """Search the way the pre-prepared-statement path did."""
+    match = f"{{heading body}} : ({query})"
+    conditions = ["chunks_fts MATCH :query"]
+    params: dict[str, object] = {"limit": limit}
+    if dataset_name is not None:
+        match = f'dataset_name : "{dataset_name}" AND {match}'
+        conditions.append("dataset_name = :dataset_name")
+        params["dataset_name"] = dataset_name
+    params["query"] = match
+    rows = session.execute(
+        sql_text(f"""
+            SELECT node_id, body, source_doc_id,
+                bm25(chunks_fts, {bm25_weights}, 0.0) as rank
+            FROM chunks_fts
+            WHERE {" AND ".join(conditions)}
+            ORDER BY rank
+            LIMIT :limit
+        """),
+        params,
+    )
+    return [(row.node_id, -row.rank) for row in rows]
+
+
+def benchmark_fts_query_overhead(
+    queries: int = 2_000,
+    note_count: int = 25,
+    chunks_per_note: int = 4,
+    limit: int = 10,
+    workdir: Path | None = None,
+) -> dict[str, float]:
+    """Compare per-query time of the ad-hoc and prepared chunk search paths.
+
+    The corpus is kept small so the measurement is dominated by per-query
+    overhead (SQL building, compilation, ORM result handling) rather than
+    FTS5 matching.
+
+    Args:
+        queries: Queries run through each path.
+        note_count: Notes in the synthetic vault, split across two datasets.
+        chunks_per_note: Chunks per note.
+        limit: Result limit per query.
+        workdir: Directory for the throwaway database. Defaults to a
+            temporary directory.
+
+    Returns:
+        Dict with ``queries``, ``adhoc_us_per_query``,
+        ``prepared_us_per_query`` and ``speedup``.
+    """
+    workload = [
+        (
+            _TERMS[i % len(_TERMS)],
+            _PRESETS[i % len(_PRESETS)],
+            _DATASETS[0] if i % 2 else None,
+        )
+        for i in range(queries)
+    ]
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        engine = create_engine_for_path(Path(tmp) / "fts_query_bench.db")
+        create_chunks_fts_table(engine)
+        with Session(engine) as session:
+            fts = FTSChunkManager(session)
+            for note in range(note_count):
+                dataset = _DATASETS[note % len(_DATASETS)]
+                fts.replace_document(
+                    f"{dataset}:{note}.md", _note_chunks(note, chunks_per_note, 0)
+                )
+            session.commit()
+
+            # Warm both paths (statement caches, page cache).
+            for term, weights, dataset in workload[: len(_PRESETS) * 2]:
+                _adhoc_search(session, term, limit, weights, dataset)
+                fts.search_with_scores(term, limit, bm25_weights=weights, dataset_name=dataset)
+
+            started = time.perf_counter()
+            for term, weights, dataset in workload:
+                _adhoc_search(session, term, limit, weights, dataset)
+            adhoc_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for term, weights, dataset in workload:
+                fts.search_with_scores(term, limit, bm25_weights=weights, dataset_name=dataset)
+            prepared_seconds = time.perf_counter() - started
+        engine.dispose()
+
+    adhoc_us = adhoc_seconds * 1e6 / queries if queries else 0.0
+    prepared_us = prepared_seconds * 1e6 / queries if queries else 0.0
+    report = {
+        "queries": float(queries),
+        "adhoc_us_per_query": adhoc_us,
+        "prepared_us_per_query": prepared_us,
+        "speedup": adhoc_us / prepared_us if prepared_us else 0.0,
+    }
+    logger.debug(
+        f"FTS query overhead over {queries} queries: ad-hoc {adhoc_us:.0f}us, "
+        f"prepared {prepared_us:.0f}us ({report['speedup']:.1f}x)"
+    )
+    return report
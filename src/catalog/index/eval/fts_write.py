@@ -0,0 +1,118 @@
+"""Per-chunk vs bulk chunks_fts write throughput on a synthetic vault.
+
+Builds a throwaway SQLite database with the chunks FTS table, indexes a
+synthetic vault of markdown notes, and then re-indexes it two ways:
+
+- per-chunk: ``FTSChunkManager.upsert`` for every chunk (one statement
+  and FTS update per chunk)
+- bulk: ``FTSChunkManager.replace_document`` once per note (one delete by
+  source_doc_id plus one executemany insert)
+
+The per-chunk path is timed on a sample of notes and extrapolated to the
+full vault.
+
+Example usage:
+    from index.eval.fts_write import benchmark_chunk_writes
+
+    report = benchmark_chunk_writes(note_count=10_000)
+    print(report["bulk_seconds"], report["per_chunk_seconds"], report["speedup"])
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from agentlayer.database import create_engine_for_path
+from agentlayer.logging import get_logger
+from sqlalchemy.orm import Session
+
+from index.store.fts_chunk import FTSChunkManager, create_chunks_fts_table
+
+__all__ = [
+    "benchmark_chunk_writes",
+]
+
+logger = get_logger(__name__)
+
+_WORDS = (
+    "async runtime tokio executor future waker channel actor mailbox "
+    "index segment merge posting token stem query rank vector embedding "
+    "garden note link backlink tag heading outline journal review"
+).split()
+
+
+def _note_chunks(note: int, chunks_per_note: int, revision: int) -> list[tuple[str, str]]:
+    """Synthesize (node_id, text) chunks for one note."""
+    chunks = []
+    for seq in range(chunks_per_note):
+        words = " ".join(
+            _WORDS[(note * 7 + seq * 3 + i + revision) % len(_WORDS)] for i in range(60)
+        )
+        text = f"## Section {seq} of note {note}\n\n{words}"
+        chunks.append((f"{note:08x}{revision:04x}:{seq}", text))
+    return chunks
+
+
+def benchmark_chunk_writes(
+    note_count: int = 10_000,
+    chunks_per_note: int = 4,
+    per_chunk_sample: int = 200,
+    workdir: Path | None = None,
+) -> dict[str, float]:
+    """Compare per-chunk and bulk chunks_fts writes when re-indexing a vault.
+
+    Args:
+        note_count: Notes in the synthetic vault.
+        chunks_per_note: Chunks per note.
+        per_chunk_sample: Notes re-indexed through the per-chunk path; its
+            time is extrapolated to ``note_count``.
+        workdir: Directory for the throwaway database. Defaults to a
+            temporary directory.
+
+    Returns:
+        Dict with ``notes``, ``chunks``, ``bulk_seconds`` (full vault),
+        ``per_chunk_seconds`` (extrapolated), ``per_chunk_sampled_notes``,
+        notes/second for both paths, and ``speedup``.
+    """
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        engine = create_engine_for_path(Path(tmp) / "fts_write_bench.db")
+        create_chunks_fts_table(engine)
+        with Session(engine) as session:
+            fts = FTSChunkManager(session)
+            for note in range(note_count):
+                fts.replace_document(f"bench:{note}.md", _note_chunks(note, chunks_per_note, 0))
+            session.commit()
+
+            sample = min(per_chunk_sample, note_count)
+            started = time.perf_counter()
+            for note in range(sample):
+                for node_id, text in _note_chunks(note, chunks_per_note, 1):
+                    fts.upsert(node_id=node_id, text=text, source_doc_id=f"bench:{note}.md")
+            session.commit()
+            sample_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for note in range(note_count):
+                fts.replace_document(f"bench:{note}.md", _note_chunks(note, chunks_per_note, 2))
+            session.commit()
+            bulk_seconds = time.perf_counter() - started
+        engine.dispose()
+
+    per_chunk_seconds = sample_seconds * note_count / sample if sample else 0.0
+    report = {
+        "notes": float(note_count),
+        "chunks": float(note_count * chunks_per_note),
+        "bulk_seconds": bulk_seconds,
+        "per_chunk_seconds": per_chunk_seconds,
+        "per_chunk_sampled_notes": float(sample),
+        "bulk_notes_per_second": note_count / bulk_seconds if bulk_seconds else 0.0,
+        "per_chunk_notes_per_second": (
+            note_count / per_chunk_seconds if per_chunk_seconds else 0.0
+        ),
+        "speedup": per_chunk_seconds / bulk_seconds if bulk_seconds else 0.0,
+    }
+    logger.debug(
+        f"FTS write benchmark over {note_count} notes: bulk {bulk_seconds:.2f}s, "
+        f"per-chunk ~{per_chunk_seconds:.2f}s ({report['speedup']:.1f}x)"
+    )
+    return report
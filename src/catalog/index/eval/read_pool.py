@@ -0,0 +1,173 @@
+"""Concurrent search throughput while an ingest is writing, per connection path.
+
+Builds a throwaway SQLite database with the chunks FTS table and a
+synthetic vault, starts a writer thread that keeps re-indexing notes in
+small committed transactions (the shape of an ingest), and runs the same
+search workload from several reader threads two ways:
+
+- shared: a new ``Session`` on the read-write engine per search, the path
+  search used to take (WAL pragmas and a pre-ping on every checkout, the
+  default page cache, no mmap)
+- read_pool: a session from ``create_read_engine_for_path`` per search
+  (``mode=ro`` + ``query_only``, larger page cache and mmap, pre-warmed)
+
+Each search mirrors a hybrid request's database work: an FTS query plus a
+chunk-text lookup for the hits.
+
+Example usage:
+    from index.eval.read_pool import benchmark_concurrent_search
+
+    report = benchmark_concurrent_search(readers=8, seconds=5.0)
+    print(report["shared_qps"], report["read_pool_qps"], report["speedup"])
+"""
+
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from agentlayer.database import create_engine_for_path, create_read_engine_for_path
+from agentlayer.logging import get_logger
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from index.eval.fts_write import _note_chunks
+from index.store.fts_chunk import FTSChunkManager, create_chunks_fts_table
+
+__all__ = [
+    "benchmark_concurrent_search",
+]
+
+logger = get_logger(__name__)
+
+_TERMS = ("tokio executor", "segment merge", "backlink", "vector embedding", "journal review")
+
+
+def _ingest(
+    engine: Engine,
+    note_count: int,
+    chunks_per_note: int,
+    stop: threading.Event,
+    commits: list[int],
+) -> None:
+    """Re-index notes one committed transaction at a time until stopped.
+
+    Appends the number of commits made to ``commits``.
+    """
+    made = 0
+    with Session(engine) as session:
+        fts = FTSChunkManager(session)
+        while not stop.is_set():
+            note = made % note_count
+            fts.replace_document(f"bench:{note}.md", _note_chunks(note, chunks_per_note, made + 1))
+            session.commit()
+            made += 1
+    commits.append(made)
+
+
+def _run_readers(
+    session_factory: Callable[[], Session],
+    readers: int,
+    seconds: float,
+    limit: int,
+) -> list[float]:
+    """Search from ``readers`` threads for ``seconds``; returns per-query latencies."""
+    latencies: list[list[float]] = [[] for _ in range(readers)]
+    deadline = time.perf_counter() + seconds
+
+    def reader(slot: int) -> None:
+        i = slot
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            with session_factory() as session:
+                fts = FTSChunkManager(session)
+                hits = fts.search_with_scores(_TERMS[i % len(_TERMS)], limit)
+                fts.get_texts([hit.node_id for hit in hits])
+            latencies[slot].append(time.perf_counter() - started)
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [latency for per_reader in latencies for latency in per_reader]
+
+
+def _p95_ms(latencies: list[float]) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+
+
+def benchmark_concurrent_search(
+    readers: int = 8,
+    seconds: float = 5.0,
+    note_count: int = 500,
+    chunks_per_note: int = 4,
+    limit: int = 10,
+    workdir: Path | None = None,
+) -> dict[str, float]:
+    """Compare search throughput of the shared and read-only paths under ingest.
+
+    Args:
+        readers: Concurrent reader threads.
+        seconds: Time each path is measured for.
+        note_count: Notes in the synthetic vault.
+        chunks_per_note: Chunks per note.
+        limit: Result limit per search.
+        workdir: Directory for the throwaway database. Defaults to a
+            temporary directory.
+
+    Returns:
+        Dict with ``readers``, ``shared_qps``, ``read_pool_qps``,
+        ``shared_p95_ms``, ``read_pool_p95_ms``, ``speedup`` and the ingest
+        commits made during each measurement (``shared_ingest_commits``,
+        ``read_pool_ingest_commits``).
+    """
+    report: dict[str, float] = {"readers": float(readers)}
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        db_path = Path(tmp) / "read_pool_bench.db"
+        engine = create_engine_for_path(db_path)
+        create_chunks_fts_table(engine)
+        with Session(engine) as session:
+            fts = FTSChunkManager(session)
+            for note in range(note_count):
+                fts.replace_document(f"bench:{note}.md", _note_chunks(note, chunks_per_note, 0))
+            session.commit()
+        read_engine = create_read_engine_for_path(db_path, pool_size=readers)
+
+        paths: dict[str, Callable[[], Session]] = {
+            "shared": lambda: Session(engine),
+            "read_pool": lambda: Session(read_engine),
+        }
+        for name, session_factory in paths.items():
+            stop = threading.Event()
+            commits: list[int] = []
+            writer = threading.Thread(
+                target=_ingest, args=(engine, note_count, chunks_per_note, stop, commits)
+            )
+            writer.start()
+            try:
+                latencies = _run_readers(session_factory, readers, seconds, limit)
+            finally:
+                stop.set()
+                writer.join()
+            report[f"{name}_qps"] = len(latencies) / seconds if seconds else 0.0
+            report[f"{name}_p95_ms"] = _p95_ms(latencies)
+            report[f"{name}_ingest_commits"] = float(commits[0] if commits else 0)
+
+        read_engine.dispose()
+        engine.dispose()
+
+    shared = report["shared_qps"]
+    report["speedup"] = report["read_pool_qps"] / shared if shared else 0.0
+    logger.debug(
+        f"Concurrent search with {readers} readers under ingest: "
+        f"shared {shared:.0f} q/s (p95 {report['shared_p95_ms']:.1f}ms), "
+        f"read pool {report['read_pool_qps']:.0f} q/s "
+        f"(p95 {report['read_pool_p95_ms']:.1f}ms, {report['speedup']:.2f}x)"
+    )
+    return report
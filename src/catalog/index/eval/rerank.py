@@ -0,0 +1,132 @@
+"""Serial vs batched LLM rerank latency comparison.
+
+Runs the same candidates through the serial pointwise MLX path (one Yes/No
+prompt per candidate, one at a time) and the batched listwise path, and
+reports latency, LLM call counts, and how much the two top-n lists agree.
+
+Example usage:
+    from agentlayer.llm.provider import MLXProvider
+    from index.eval.rerank import benchmark_rerank
+
+    report = benchmark_rerank(nodes, "rust async runtimes", MLXProvider())
+    print(report["serial_latency_ms_p50"], report["batched_latency_ms_p50"])
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from agentlayer.logging import get_logger
+
+from index.search.rerank import Reranker
+
+if TYPE_CHECKING:
+    from llama_index.core.schema import NodeWithScore
+
+__all__ = [
+    "benchmark_rerank",
+]
+
+logger = get_logger(__name__)
+
+
+class _CountingProvider:
+    """Provider proxy that counts generate() calls."""
+
+    def __init__(self, provider: Any) -> None:
+        self._provider = provider
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs: Any) -> str:
+        with self._lock:
+            self.calls += 1
+        return await self._provider.generate(prompt, **kwargs)
+
+
+def _timed_rerank(
+    reranker: Reranker,
+    nodes: list["NodeWithScore"],
+    query: str,
+    top_n: int,
+    runs: int,
+) -> tuple[list[str], list[float]]:
+    """Rerank ``runs`` times and return (last top-n node ids, latencies_ms)."""
+    latencies: list[float] = []
+    ranked: list["NodeWithScore"] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        ranked = reranker.rerank(nodes=nodes, query=query, top_n=top_n)
+        latencies.append((time.perf_counter() - started) * 1000.0)
+    return [n.node.node_id for n in ranked], latencies
+
+
+def benchmark_rerank(
+    nodes: list["NodeWithScore"],
+    query: str,
+    provider: Any,
+    top_n: int = 10,
+    runs: int = 3,
+    batch_size: int | None = None,
+    max_concurrency: int | None = None,
+) -> dict[str, float]:
+    """Compare serial pointwise and batched listwise MLX reranking.
+
+    Neither path applies a latency budget, so both score every candidate.
+
+    Args:
+        nodes: Rerank candidates (typically the hybrid retrieval output).
+        query: Query to rerank for.
+        provider: LLM provider with an async ``generate()`` (e.g. MLXProvider).
+        top_n: Results kept after reranking.
+        runs: Repetitions per path; latency percentiles are over runs.
+        batch_size: Listwise batch size. Defaults to settings.
+        max_concurrency: Concurrent LLM calls on the batched path.
+            Defaults to settings.
+
+    Returns:
+        Dict with p50/p95 latency per path (``serial_latency_ms_p50`` etc.),
+        ``speedup`` (serial p50 / batched p50), LLM calls per rerank for
+        each path, and ``top_n_overlap`` between the two rankings.
+    """
+    serial_provider = _CountingProvider(provider)
+    batched_provider = _CountingProvider(provider)
+    serial = Reranker(
+        default_top_n=top_n,
+        strategy="pointwise",
+        max_concurrency=1,
+        budget_ms=0,
+        mlx_provider=serial_provider,
+    )
+    batched = Reranker(
+        default_top_n=top_n,
+        strategy="listwise",
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        budget_ms=0,
+        mlx_provider=batched_provider,
+    )
+
+    serial_ids, serial_latencies = _timed_rerank(serial, nodes, query, top_n, runs)
+    batched_ids, batched_latencies = _timed_rerank(batched, nodes, query, top_n, runs)
+
+    report: dict[str, float] = {"candidates": float(len(nodes))}
+    for label, latencies in (("serial", serial_latencies), ("batched", batched_latencies)):
+        report[f"{label}_latency_ms_p50"] = float(np.percentile(latencies, 50))
+        report[f"{label}_latency_ms_p95"] = float(np.percentile(latencies, 95))
+    report["serial_llm_calls"] = serial_provider.calls / runs
+    report["batched_llm_calls"] = batched_provider.calls / runs
+    batched_p50 = report["batched_latency_ms_p50"]
+    report["speedup"] = report["serial_latency_ms_p50"] / batched_p50 if batched_p50 else 0.0
+    expected = set(serial_ids)
+    report["top_n_overlap"] = (
+        len(expected & set(batched_ids)) / len(expected) if expected else 0.0
+    )
+
+    logger.debug(
+        f"Rerank benchmark over {len(nodes)} candidates: "
+        f"speedup={report['speedup']:.2f}x, "
+        f"calls {report['serial_llm_calls']:.0f} -> {report['batched_llm_calls']:.0f}"
+    )
+    return report
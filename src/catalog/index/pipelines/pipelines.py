@@ -5,6 +5,12 @@ FTS indexing, chunking, chunk FTS, embedding, and vector insertion.
 
 Can also accept nodes directly via index(nodes=...) for manual testing.
 
+Indexing is incremental by default: only documents whose ``content_hash``
+(or the index configuration signature) changed since their last successful
+index are loaded, tracked via ``DocumentIndexState`` markers. Within a
+changed document, ChunkPersistenceTransform keeps chunks whose IDs are
+unchanged, deletes stale ones, and only passes new chunks to the embedder.
+
 Pipeline flow:
 1. DocumentFTSTransform (document-level FTS indexing)
 2. ResilientSplitter (token-based with char fallback)
@@ -12,23 +18,45 @@ Pipeline flow:
 4. EmbeddingPrefixTransform (Nomic-style prefixes)
 5. Vector identity transforms from VectorStoreManager
 6. embed_model (generate embeddings)
+
+Runs over at least ``rag.fts_bulk_min_documents`` documents tune FTS5
+automerge/crisismerge for bulk loading; afterwards any FTS table with more
+than ``rag.fts_optimize_segment_threshold`` segments is optimized.
+
+Stages 1-3 write to SQLite and run through ``BasePipeline._write`` (on the
+shared writer thread when ``writer`` is set); embedding and vector
+insertion run separately on the calling thread.
+
+After the run, ``VectorStoreManager.persist_vector_store`` refreshes the
+binary Zvec index; with ``zvec.index_type="ivf"`` this incrementally
+assigns new chunks to the existing IVF clusters.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from functools import cached_property
-from typing import Sequence
+from typing import Collection, Sequence
 
 from agentlayer.logging import get_logger
 from llama_index.core.ingestion import IngestionPipeline
 from llama_index.core.schema import BaseNode, Document as LlamaDocument, TransformComponent
+from pydantic import Field
 
 from agentlayer.pipeline import BasePipeline
 from agentlayer.session import current_session
 from index.pipelines.schemas import IndexResult
-from catalog.store.repositories import DocumentRepository
+from catalog.store.models import Document
+from catalog.store.repositories import (
+    DocumentIndexStateRepository,
+    DocumentRepository,
+    IndexGenerationRepository,
+)
 from index.store.cleanup import IndexCleanup, ReconciliationStats
+from index.store.fts_maintenance import FTSMaintenance
 from index.store.vector import VectorStoreManager
 from index.transform.embedding import EmbeddingPrefixTransform
 from index.transform.llama import ChunkPersistenceTransform, DocumentFTSTransform
@@ -40,6 +68,10 @@ __all__ = [
 
 logger = get_logger(__name__)
 
+# Bump when the text handed to the embedding model changes shape, so existing
+# documents are re-embedded. 2: prefixed text only, without metadata header.
+_EMBED_INPUT_VERSION = 2
+
 
 class DatasetIndexPipeline(BasePipeline):
     """Index pipeline: FTS, chunking, embedding, and vector insertion.
@@ -52,6 +84,11 @@ class DatasetIndexPipeline(BasePipeline):
         index(nodes=None, vector_manager=None) -> IndexResult
     """
 
+    incremental: bool = Field(
+        default=True,
+        description="Only index documents changed since their last successful index.",
+    )
+
     @cached_property
     def _settings(self):
         """Get RAG settings from catalog configuration."""
@@ -67,27 +104,50 @@ class DatasetIndexPipeline(BasePipeline):
         """
         doc_repo = DocumentRepository()
         docs = doc_repo.list_by_parent(self.dataset_id, active_only=True)
-        nodes: list[BaseNode] = []
-        for doc in docs:
-            metadata = doc.metadata_json or {}
-            metadata["doc_id"] = doc.id
-            metadata["relative_path"] = doc.path
-            if doc.title:
-                metadata["title"] = doc.title
-            if doc.description:
-                metadata["description"] = doc.description
-            node = LlamaDocument(text=doc.body, metadata=metadata, id_=doc.path)
-            nodes.append(node)
-        return nodes
+        doc_repo.load_bodies(docs)
+        return [self._document_to_node(doc) for doc in docs]
+
+    @staticmethod
+    def _document_to_node(doc: Document) -> BaseNode:
+        """Convert a catalog Document into a LlamaIndex document node."""
+        metadata = doc.metadata_json or {}
+        metadata["doc_id"] = doc.id
+        metadata["relative_path"] = doc.path
+        if doc.title:
+            metadata["title"] = doc.title
+        if doc.description:
+            metadata["description"] = doc.description
+        return LlamaDocument(text=doc.body, metadata=metadata, id_=doc.path)
+
+    def _index_signature(self, vector_manager: VectorStoreManager) -> str:
+        """Fingerprint the configuration that determines chunks and vectors.
+
+        Documents indexed under a different signature are re-indexed in full,
+        so changing chunking, prefixes, or the embedding model takes effect
+        without a manual rebuild.
+        """
+        payload = {
+            "embed_input": _EMBED_INPUT_VERSION,
+            "chunk_size": self._settings.chunk_size,
+            "chunk_overlap": self._settings.chunk_overlap,
+            "chunk_chars_per_token": self._settings.chunk_chars_per_token,
+            "chunk_fallback_enabled": self._settings.chunk_fallback_enabled,
+            "embed_prefix_doc": self._settings.embed_prefix_doc,
+            "embedding_profile": vector_manager.get_configured_embedding_identity().profile,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
 
     def _get_transforms(
         self,
         vector_manager: VectorStoreManager,
+        reuse_paths: Collection[str] = (),
     ) -> list[TransformComponent]:
         """Build the transform chain for indexing.
 
         Args:
             vector_manager: Vector manager providing backend-aware ingest transforms.
+            reuse_paths: Document paths whose unchanged chunks can skip embedding.
         """
         embed_model = self._get_embed_model()
         identity_transforms = vector_manager.build_ingest_transforms(embed_model)
@@ -105,6 +165,8 @@ class DatasetIndexPipeline(BasePipeline):
             # Stage 3: Chunk FTS persistence + metadata assignment
             ChunkPersistenceTransform(
                 dataset_name=self.dataset_name,
+                vector_manager=vector_manager,
+                reuse_paths=reuse_paths,
             ),
             # Stage 4: Embedding prefix
             EmbeddingPrefixTransform(
@@ -118,20 +180,26 @@ class DatasetIndexPipeline(BasePipeline):
     def build_pipeline(
         self,
         vector_manager: VectorStoreManager,
+        reuse_paths: Collection[str] = (),
     ) -> IngestionPipeline:
         """Build the index pipeline.
 
         Unlike the ingest pipeline, the index pipeline does NOT use a docstore
-        or docstore_strategy -- change detection already happened in the ingest
-        stage. All nodes passed here are new or changed and should be processed.
+        or docstore_strategy -- document-level change detection uses the
+        ``DocumentIndexState`` markers, and chunk-level reuse happens in
+        ChunkPersistenceTransform.
 
         Args:
             vector_manager: Vector store manager for embeddings.
+            reuse_paths: Document paths whose unchanged chunks can skip embedding.
 
         Returns:
             Configured IngestionPipeline ready to run.
         """
-        transformations = self._get_transforms(vector_manager=vector_manager)
+        transformations = self._get_transforms(
+            vector_manager=vector_manager,
+            reuse_paths=reuse_paths,
+        )
         vector_store = vector_manager.get_vector_store()
 
         pipeline = IngestionPipeline(
@@ -151,6 +219,8 @@ class DatasetIndexPipeline(BasePipeline):
         Expects ambient session to be set (e.g. via use_session(session)).
         """
         session = current_session()
+        if self.dataset_id is not None:
+            DocumentIndexStateRepository(session).clear_inactive(self.dataset_id)
         cleanup = IndexCleanup(session)
         return cleanup.reconcile_inactive_documents(
             parent_id=self.dataset_id,
@@ -158,6 +228,81 @@ class DatasetIndexPipeline(BasePipeline):
             vector_manager=vector_manager,
         )
 
+    def _load_pending(
+        self,
+        nodes: Sequence[BaseNode] | None,
+        vector_manager: VectorStoreManager,
+        signature: str,
+    ) -> tuple[Sequence[BaseNode], dict[int, str], set[str], int, int]:
+        """Reconcile inactive documents and load the nodes to index.
+
+        Returns:
+            Tuple of (nodes, content_hash by loaded document ID, paths whose
+            chunks may be reused, unchanged document count, reconciled
+            inactive document count).
+        """
+        reconciled = self._reconcile_inactive_documents(vector_manager).documents_reconciled
+        if reconciled and self.dataset_id is not None:
+            # Commits with the reconciliation's deletes
+            IndexGenerationRepository().bump(self.dataset_id)
+        if nodes is not None:
+            return nodes, {}, set(), 0, reconciled
+
+        loaded_docs: list[Document] = []
+        reuse_paths: set[str] = set()
+        documents_skipped = 0
+        if self.incremental:
+            pending = DocumentIndexStateRepository().list_pending(self.dataset_id, signature)
+            loaded_docs = [doc for doc, _ in pending]
+            # Chunks can only be reused if they were embedded under the
+            # current configuration.
+            reuse_paths = {
+                doc.path
+                for doc, state in pending
+                if state is not None and state.index_signature == signature
+            }
+            documents_skipped = (
+                DocumentRepository().count_by_parent(self.dataset_id, active_only=True)
+                - len(loaded_docs)
+            )
+        else:
+            loaded_docs = DocumentRepository().list_by_parent(
+                self.dataset_id, active_only=True
+            )
+        nodes = [self._document_to_node(doc) for doc in loaded_docs]
+        return (
+            nodes,
+            {doc.id: doc.content_hash for doc in loaded_docs},
+            reuse_paths,
+            documents_skipped,
+            reconciled,
+        )
+
+    @staticmethod
+    def _split_pipeline(
+        pipeline: IngestionPipeline,
+    ) -> tuple[IngestionPipeline, IngestionPipeline]:
+        """Split a built pipeline after chunk persistence.
+
+        Returns:
+            The SQLite-writing stage (through ChunkPersistenceTransform) and
+            the embedding stage. Neither owns the vector store; embedded
+            nodes are added to it under the vector manager's lock.
+        """
+        transforms = list(pipeline.transformations)
+        split = next(
+            (
+                i + 1
+                for i, t in enumerate(transforms)
+                if isinstance(t, ChunkPersistenceTransform)
+            ),
+            0,
+        )
+        return (
+            IngestionPipeline(transformations=transforms[:split]),
+            IngestionPipeline(transformations=transforms[split:]),
+        )
+
     def index(
         self,
         nodes: Sequence[BaseNode] | None = None,
@@ -165,13 +310,20 @@ class DatasetIndexPipeline(BasePipeline):
     ) -> IndexResult:
         """Run the index pipeline on documents.
 
-        Loads active documents from the DB unless nodes are passed directly.
-        Reconciles index artifacts for inactive documents first, then indexes
-        active docs. Expects to run within a session context (e.g. use_session(session)).
+        Loads documents from the DB unless nodes are passed directly. In
+        incremental mode only documents changed since their last successful
+        index are loaded, and their markers are updated once the run and the
+        vector store persist succeed. Reconciles index artifacts for inactive
+        documents first. Expects to run within a session context
+        (e.g. use_session(session)), unless ``writer`` is set, in which case
+        database steps run on the writer and embedding runs on the caller's
+        thread.
 
         Args:
             nodes: Optional document nodes override. If None, loads from DB.
             vector_manager: Optional vector manager. Creates a new one if not provided.
+                Pipelines indexing concurrently into one store must share it,
+                since each persist writes the manager's whole store.
 
         Returns:
             IndexResult with statistics about the operation.
@@ -182,49 +334,101 @@ class DatasetIndexPipeline(BasePipeline):
             vector_manager = VectorStoreManager()
 
         vector_manager.load_or_create()
-        self._reconcile_inactive_documents(vector_manager)
-
-        if nodes is None:
-            nodes = self._load_nodes()
-
-        logger.info(f"Starting indexing: {len(nodes)} nodes for dataset '{self.dataset_name}'")
+        signature = self._index_signature(vector_manager)
+        nodes, indexed_hashes, reuse_paths, documents_skipped, reconciled = self._write(
+            lambda: self._load_pending(nodes, vector_manager, signature)
+        )
 
-        pipeline = self.build_pipeline(vector_manager=vector_manager)
+        logger.info(
+            f"Starting indexing: {len(nodes)} nodes for dataset '{self.dataset_name}' "
+            f"({documents_skipped} unchanged documents skipped)"
+        )
 
-        # SQLite does not support concurrent writers; persistence transforms
-        # write to SQLite, so use 1 worker.
-        result_nodes: Sequence[BaseNode] = pipeline.run(
-            nodes=list(nodes), num_workers=1
+        pipeline = self.build_pipeline(
+            vector_manager=vector_manager,
+            reuse_paths=reuse_paths,
         )
+        write_stage, embed_stage = self._split_pipeline(pipeline)
+
+        settings = self._settings
+
+        def write_chunks() -> tuple[Sequence[BaseNode], list[str]]:
+            fts_maintenance = FTSMaintenance()
+            bulk_merge = (
+                fts_maintenance.bulk_merge(
+                    settings.fts_bulk_automerge, settings.fts_bulk_crisismerge
+                )
+                if 0 < settings.fts_bulk_min_documents <= len(nodes)
+                else nullcontext()
+            )
+            # SQLite does not support concurrent writers; persistence
+            # transforms write to SQLite, so use 1 worker.
+            with bulk_merge:
+                chunks = write_stage.run(nodes=list(nodes), num_workers=1)
+            optimized = fts_maintenance.optimize_if_needed(
+                settings.fts_optimize_segment_threshold
+            )
+            # Chunks changed: invalidate cached search results in the same
+            # transaction as the chunk writes.
+            if nodes and self.dataset_id is not None:
+                IndexGenerationRepository().bump(self.dataset_id)
+            return chunks, optimized
+
+        # FTS, splitting and chunk persistence write to SQLite; embedding
+        # does not, so with a shared writer it runs on this thread, in
+        # parallel with other datasets' writes.
+        chunks, fts_optimized = self._write(write_chunks)
+        result_nodes: Sequence[BaseNode] = embed_stage.run(nodes=list(chunks), num_workers=1)
+        embedded = [node for node in result_nodes if node.embedding is not None]
+        if embedded and pipeline.vector_store is not None:
+            # The manager may be shared with other datasets' pipelines
+            with vector_manager.lock:
+                pipeline.vector_store.add(embedded)
 
         # Collect statistics from transforms
         chunk_persist_transform = None
         for t in pipeline.transformations:
             if isinstance(t, ChunkPersistenceTransform):
                 chunk_persist_transform = t
+        chunk_stats = chunk_persist_transform.stats if chunk_persist_transform else None
 
         result = IndexResult(
             dataset_id=self.dataset_id or 0,
             dataset_name=self.dataset_name or "",
             started_at=started_at,
-            chunks_created=chunk_persist_transform.stats.created if chunk_persist_transform else 0,
+            chunks_created=chunk_stats.created if chunk_stats else 0,
+            chunks_skipped=chunk_stats.skipped if chunk_stats else 0,
+            chunks_deleted=chunk_stats.deleted if chunk_stats else 0,
             vectors_inserted=len(result_nodes) if result_nodes else 0,
             fts_documents_indexed=len(nodes),
-            errors=(
-                list(chunk_persist_transform.stats.errors)
-                if chunk_persist_transform
-                else []
-            ),
+            documents_skipped=documents_skipped,
+            fts_tables_optimized=fts_optimized,
+            errors=list(chunk_stats.errors) if chunk_stats else [],
             completed_at=datetime.now(tz=timezone.utc),
         )
 
         # Persist vector store state
         vector_manager.persist_vector_store()
 
+        # Markers are only advanced after a clean run so failed documents are
+        # retried on the next sync.
+        if indexed_hashes and result.success:
+            self._write(
+                lambda: DocumentIndexStateRepository().mark_indexed(indexed_hashes, signature)
+            )
+
+        # Results cached while vectors were being inserted are stale once
+        # the store is persisted; the store is not transactional with SQLite.
+        if result_nodes and self.dataset_id is not None:
+            self._write(lambda: IndexGenerationRepository().bump(self.dataset_id))
+
         logger.info(
             f"Indexing complete: "
             f"fts_docs={result.fts_documents_indexed}, "
+            f"skipped_docs={result.documents_skipped}, "
             f"chunks={result.chunks_created}, "
+            f"reused_chunks={result.chunks_skipped}, "
+            f"deleted_chunks={result.chunks_deleted}, "
             f"vectors={result.vectors_inserted}"
         )
 
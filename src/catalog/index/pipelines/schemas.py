@@ -12,8 +12,13 @@ class IndexResult(BaseModel):
         dataset_id: ID of the dataset.
         dataset_name: Normalized name of the dataset.
         chunks_created: Number of chunks indexed in FTS.
+        chunks_skipped: Number of unchanged chunks reused without re-embedding.
+        chunks_deleted: Number of stale chunks removed from changed documents.
         vectors_inserted: Number of vectors inserted into vector store.
         fts_documents_indexed: Number of documents indexed in document-level FTS.
+        documents_skipped: Number of unchanged documents skipped entirely.
+        fts_tables_optimized: FTS tables optimized after the run because
+            their segment count crossed the threshold.
         started_at: When the indexing started.
         completed_at: When the indexing completed.
         errors: List of error messages if any.
@@ -22,8 +27,12 @@ class IndexResult(BaseModel):
     dataset_id: int
     dataset_name: str
     chunks_created: int = 0
+    chunks_skipped: int = 0
+    chunks_deleted: int = 0
     vectors_inserted: int = 0
     fts_documents_indexed: int = 0
+    documents_skipped: int = 0
+    fts_tables_optimized: list[str] = Field(default_factory=list)
     started_at: datetime
     completed_at: datetime | None = None
     errors: list[str] = Field(default_factory=list)
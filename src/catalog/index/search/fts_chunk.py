@@ -67,7 +67,7 @@ class FTSChunkRetriever(BaseRetriever):
             similarity_top_k: Maximum number of results to return. Defaults to 10.
             dataset_name: Optional dataset name filter. If provided, only chunks
                 from documents in this dataset will be returned. The filter is
-                applied via source_doc_id prefix matching (e.g., "obsidian:").
+                applied inside the FTS5 MATCH, before BM25 ranking.
             query_intent: Optional query intent for BM25 weight routing.
         """
         super().__init__()
@@ -117,11 +117,6 @@ class FTSChunkRetriever(BaseRetriever):
         """
         query_str = query_bundle.query_str
 
-        # Build source_doc_id prefix from dataset_name
-        source_doc_id_prefix: str | None = None
-        if self._dataset_name:
-            source_doc_id_prefix = f"{self._dataset_name}:"
-
         # Resolve BM25 weights from intent
         bm25_weights: str | None = None
         if self._query_intent is not None:
@@ -137,8 +132,8 @@ class FTSChunkRetriever(BaseRetriever):
         fts_results = self._fts_manager.search_with_scores(
             query=query_str,
             limit=self._similarity_top_k,
-            source_doc_id_prefix=source_doc_id_prefix,
             bm25_weights=bm25_weights,
+            dataset_name=self._dataset_name or None,
         )
 
         logger.debug(
@@ -4,6 +4,11 @@ Provides a custom RRF retriever with per-query weighting for combining
 FTS and vector retrieval results. Uses configurable weights to tune
 the contribution of each retriever in the final ranking.
 
+When a query expansion result is supplied, the hybrid pipeline becomes
+multi-query: lex expansions add FTS legs, vec expansions and the HyDE
+passage add vector legs (embedded together with the original query in one
+batched call), and every leg is fused with ``rrf_expansion_weight``.
+
 Example usage:
     from index.search.hybrid import HybridRetriever
     from catalog.store.database import get_session
@@ -16,8 +21,12 @@ Example usage:
             nodes = retriever.retrieve("machine learning concepts")
 """
 
+import concurrent.futures
+import contextvars
+import threading
+import time
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from agentlayer.logging import get_logger
 from llama_index.core.retrievers import BaseRetriever
@@ -26,11 +35,13 @@ from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from catalog.core.settings import get_settings
 from index.search.fts_chunk import FTSChunkRetriever
 from index.search.intent import QueryIntent
+from index.search.models import SearchResult
 from index.search.vector import VectorSearch
 from index.store.vector import VectorStoreManager
 
 if TYPE_CHECKING:
     from index.search.postprocessors import PerDocDedupePostprocessor
+    from index.search.query_expansion import QueryExpansionResult
     from sqlalchemy.orm import Session
 
 __all__ = [
@@ -83,6 +94,8 @@ class WeightedRRFRetriever(BaseRetriever):
         k: int = 60,
         top_n: int = 30,
         enable_dedupe: bool = False,
+        leg_names: list[str] | None = None,
+        timeouts_ms: list[float | None] | None = None,
     ) -> None:
         """Initialize the WeightedRRFRetriever.
 
@@ -92,10 +105,16 @@ class WeightedRRFRetriever(BaseRetriever):
             k: RRF constant k. Higher values give more weight to lower-ranked
                 results. Defaults to 60 (standard RRF).
             top_n: Maximum number of fused results to return. Defaults to 30.
+            enable_dedupe: Apply per-document deduplication after fusion.
+            leg_names: Name per retriever used in timings and logs.
+                Defaults to "leg0", "leg1", ...
+            timeouts_ms: Optional timeout per retriever in milliseconds
+                (None for no timeout). A leg that misses its timeout is
+                dropped from the fusion; the other legs' results are kept.
 
         Raises:
-            ValueError: If retrievers and weights have different lengths,
-                or if any weight is negative.
+            ValueError: If retrievers, weights, leg_names, or timeouts_ms have
+                different lengths, or if any weight is negative.
         """
         super().__init__()
         if len(retrievers) != len(weights):
@@ -105,12 +124,20 @@ class WeightedRRFRetriever(BaseRetriever):
             )
         if any(w < 0 for w in weights):
             raise ValueError("All weights must be non-negative")
+        if leg_names is not None and len(leg_names) != len(retrievers):
+            raise ValueError("leg_names must have one entry per retriever")
+        if timeouts_ms is not None and len(timeouts_ms) != len(retrievers):
+            raise ValueError("timeouts_ms must have one entry per retriever")
 
         self._retrievers = retrievers
         self._weights = weights
         self._k = k
         self._top_n = top_n
         self._enable_dedupe = enable_dedupe
+        self._leg_names = leg_names or [f"leg{i}" for i in range(len(retrievers))]
+        self._timeouts_ms = timeouts_ms or [None] * len(retrievers)
+        self._leg_timings_ms: dict[str, float] = {}
+        self._degraded_legs: list[str] = []
 
         logger.debug(
             f"WeightedRRFRetriever initialized: k={k}, top_n={top_n}, "
@@ -127,6 +154,21 @@ class WeightedRRFRetriever(BaseRetriever):
         """Get the weights for each retriever."""
         return self._weights
 
+    @property
+    def leg_names(self) -> list[str]:
+        """Get the name of each retriever leg."""
+        return self._leg_names
+
+    @property
+    def leg_timings_ms(self) -> dict[str, float]:
+        """Per-leg latency of the last retrieval, in milliseconds."""
+        return dict(self._leg_timings_ms)
+
+    @property
+    def degraded_legs(self) -> list[str]:
+        """Legs dropped from the last retrieval for missing their timeout."""
+        return list(self._degraded_legs)
+
     @property
     def k(self) -> int:
         """Get the RRF constant k."""
@@ -137,12 +179,91 @@ class WeightedRRFRetriever(BaseRetriever):
         """Get the number of results to return."""
         return self._top_n
 
+    def _run_retriever(
+        self, index: int, query_bundle: QueryBundle
+    ) -> tuple[list[NodeWithScore], float]:
+        """Run one sub-retriever, returning ([], elapsed) if it fails."""
+        name = self._leg_names[index]
+        started = time.perf_counter()
+        try:
+            results = self._retrievers[index].retrieve(query_bundle)
+        except Exception as e:
+            logger.warning(f"Retriever {name} failed: {e}")
+            results = []
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.debug(
+            f"Retriever {name} returned {len(results)} results in {elapsed_ms:.1f}ms "
+            f"(weight={self._weights[index]})"
+        )
+        return results, elapsed_ms
+
+    def _retrieve_all(self, query_bundle: QueryBundle) -> list[list[NodeWithScore]]:
+        """Run all sub-retrievers concurrently on a thread pool.
+
+        Each task runs in a copy of the caller's context so the ambient
+        session set via ``use_session()`` is visible to FTS retrievers.
+        Legs are awaited in order of their deadline; a leg still running
+        at its deadline is abandoned (its thread finishes in the
+        background) and contributes no results. Per-leg timings and
+        dropped legs are recorded for ``leg_timings_ms``/``degraded_legs``.
+
+        Returns:
+            Results per retriever, in retriever order.
+        """
+        count = len(self._retrievers)
+        self._leg_timings_ms = {}
+        self._degraded_legs = []
+        if count == 1 and self._timeouts_ms[0] is None:
+            results, elapsed_ms = self._run_retriever(0, query_bundle)
+            self._leg_timings_ms[self._leg_names[0]] = elapsed_ms
+            return [results]
+
+        all_results: list[list[NodeWithScore]] = [[] for _ in range(count)]
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(count, 1),
+            thread_name_prefix="rrf",
+        )
+        try:
+            started = time.perf_counter()
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._run_retriever, i, query_bundle
+                )
+                for i in range(count)
+            ]
+            deadlines = [
+                started + timeout / 1000 if timeout is not None else float("inf")
+                for timeout in self._timeouts_ms
+            ]
+            for i in sorted(range(count), key=lambda i: deadlines[i]):
+                name = self._leg_names[i]
+                remaining = deadlines[i] - time.perf_counter()
+                try:
+                    if remaining == float("inf"):
+                        results, elapsed_ms = futures[i].result()
+                    else:
+                        results, elapsed_ms = futures[i].result(timeout=max(remaining, 0))
+                except concurrent.futures.TimeoutError:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    logger.warning(
+                        f"Retriever {name} exceeded its {self._timeouts_ms[i]}ms "
+                        f"timeout; fusing without it"
+                    )
+                    self._degraded_legs.append(name)
+                    results = []
+                all_results[i] = results
+                self._leg_timings_ms[name] = elapsed_ms
+        finally:
+            # Don't block on abandoned legs.
+            executor.shutdown(wait=False)
+        return all_results
+
     def _retrieve(self, query_bundle: QueryBundle) -> list[NodeWithScore]:
         """Retrieve and fuse results from all sub-retrievers using weighted RRF.
 
-        Runs all sub-retrievers, collects their results, computes weighted RRF
-        scores for each unique document, and returns the top_n documents sorted
-        by descending RRF score.
+        Runs all sub-retrievers concurrently, collects their results, computes
+        weighted RRF scores for each unique document, and returns the top_n
+        documents sorted by descending RRF score.
 
         Args:
             query_bundle: LlamaIndex query bundle containing the search query.
@@ -151,19 +272,7 @@ class WeightedRRFRetriever(BaseRetriever):
             List of NodeWithScore objects sorted by weighted RRF score (highest first).
             Each NodeWithScore.score contains the weighted RRF score.
         """
-        # Collect results from all retrievers
-        all_results: list[list[NodeWithScore]] = []
-        for i, retriever in enumerate(self._retrievers):
-            try:
-                results = retriever.retrieve(query_bundle)
-                all_results.append(results)
-                logger.debug(
-                    f"Retriever {i} returned {len(results)} results "
-                    f"(weight={self._weights[i]})"
-                )
-            except Exception as e:
-                logger.warning(f"Retriever {i} failed: {e}")
-                all_results.append([])
+        all_results = self._retrieve_all(query_bundle)
 
         # Compute weighted RRF scores
         # node_id -> (accumulated_score, best_node)
@@ -220,12 +329,107 @@ class WeightedRRFRetriever(BaseRetriever):
         return fused_results
 
 
+def _search_results_to_nodes(search_results: list[SearchResult]) -> list[NodeWithScore]:
+    """Convert VectorSearch results to LlamaIndex NodeWithScore objects."""
+    nodes_with_scores: list[NodeWithScore] = []
+    for result in search_results:
+        metadata = dict(result.metadata or {})
+        source_doc_id = f"{result.dataset_name}:{result.path}"
+        metadata["source_doc_id"] = source_doc_id
+        if result.chunk_seq is not None:
+            metadata["chunk_seq"] = result.chunk_seq
+        if result.chunk_pos is not None:
+            metadata["chunk_pos"] = result.chunk_pos
+
+        node_id = metadata.get("node_id")
+        if not node_id:
+            node_id = source_doc_id
+
+        text = result.snippet.text if result.snippet is not None else ""
+        node = TextNode(
+            id_=str(node_id),
+            text=text,
+            metadata=metadata,
+        )
+        nodes_with_scores.append(
+            NodeWithScore(
+                node=node,
+                score=result.score,
+            )
+        )
+
+    return nodes_with_scores
+
+
+class _VectorQueryBatch:
+    """Vector results for a fixed set of queries, computed once on demand.
+
+    The first vector leg to ask triggers one ``VectorSearch.search_many``
+    call (one batched embedding call for all queries); other legs block
+    until it finishes and then read their own result list.
+    """
+
+    def __init__(
+        self,
+        vector_search: VectorSearch,
+        queries: list[str],
+        top_k: int,
+        dataset_name: str | None,
+    ) -> None:
+        self._vector_search = vector_search
+        self._queries = queries
+        self._top_k = top_k
+        self._dataset_name = dataset_name
+        self._lock = threading.Lock()
+        self._results: dict[str, list[SearchResult]] | None = None
+
+    def get(self, query: str) -> list[SearchResult]:
+        """Return the results for ``query`` (one of the batch queries)."""
+        with self._lock:
+            if self._results is None:
+                per_query = self._vector_search.search_many(
+                    queries=self._queries,
+                    top_k=self._top_k,
+                    dataset_name=self._dataset_name,
+                )
+                self._results = dict(zip(self._queries, per_query))
+        return self._results.get(query, [])
+
+
+class _ExpansionLegRetriever(BaseRetriever):
+    """Runs a sub-retriever for a fixed query string.
+
+    Used for expansion legs, which search for their own expansion text
+    instead of the query bundle handed to the RRF retriever. An optional
+    lock serializes legs that share a database session.
+    """
+
+    def __init__(
+        self,
+        retriever: BaseRetriever,
+        query_str: str | None = None,
+        lock: Any = None,
+    ) -> None:
+        super().__init__()
+        self._retriever = retriever
+        self._query_str = query_str
+        self._lock = lock
+
+    def _retrieve(self, query_bundle: QueryBundle) -> list[NodeWithScore]:
+        bundle = query_bundle if self._query_str is None else QueryBundle(self._query_str)
+        if self._lock is None:
+            return self._retriever.retrieve(bundle)
+        with self._lock:
+            return self._retriever.retrieve(bundle)
+
+
 class VectorSearchRetriever(BaseRetriever):
     """LlamaIndex retriever wrapper around index VectorSearch.
 
     This keeps hybrid retrieval model-aware by delegating vector retrieval to
     ``VectorSearch``, which resolves query embedding models from stored vector
-    payload metadata.
+    payload metadata. When built with a shared query batch, results come from
+    the batch instead of a per-retriever search.
     """
 
     def __init__(
@@ -233,49 +437,26 @@ class VectorSearchRetriever(BaseRetriever):
         vector_search: VectorSearch,
         similarity_top_k: int,
         dataset_name: str | None = None,
+        query_batch: _VectorQueryBatch | None = None,
     ) -> None:
         """Initialize the vector retriever wrapper."""
         super().__init__()
         self._vector_search = vector_search
         self._similarity_top_k = similarity_top_k
         self._dataset_name = dataset_name
+        self._query_batch = query_batch
 
     def _retrieve(self, query_bundle: QueryBundle) -> list[NodeWithScore]:
         """Retrieve vector matches as LlamaIndex NodeWithScore objects."""
-        search_results = self._vector_search.search(
-            query=query_bundle.query_str,
-            top_k=self._similarity_top_k,
-            dataset_name=self._dataset_name,
-        )
-
-        nodes_with_scores: list[NodeWithScore] = []
-        for result in search_results:
-            metadata = dict(result.metadata or {})
-            source_doc_id = f"{result.dataset_name}:{result.path}"
-            metadata["source_doc_id"] = source_doc_id
-            if result.chunk_seq is not None:
-                metadata["chunk_seq"] = result.chunk_seq
-            if result.chunk_pos is not None:
-                metadata["chunk_pos"] = result.chunk_pos
-
-            node_id = metadata.get("node_id")
-            if not node_id:
-                node_id = source_doc_id
-
-            text = result.snippet.text if result.snippet is not None else ""
-            node = TextNode(
-                id_=str(node_id),
-                text=text,
-                metadata=metadata,
-            )
-            nodes_with_scores.append(
-                NodeWithScore(
-                    node=node,
-                    score=result.score,
-                )
+        if self._query_batch is not None:
+            search_results = self._query_batch.get(query_bundle.query_str)
+        else:
+            search_results = self._vector_search.search(
+                query=query_bundle.query_str,
+                top_k=self._similarity_top_k,
+                dataset_name=self._dataset_name,
             )
-
-        return nodes_with_scores
+        return _search_results_to_nodes(search_results)
 
 
 class HybridRetriever:
@@ -323,12 +504,21 @@ class HybridRetriever:
         vector_top_k: int | None = None,
         fusion_top_k: int | None = None,
         query_intent: QueryIntent | None = None,
+        query: str | None = None,
+        expansion_result: "QueryExpansionResult | None" = None,
     ) -> WeightedRRFRetriever:
         """Build a WeightedRRFRetriever with FTS and vector retrievers.
 
         Creates FTS and vector retrievers configured for the specified dataset,
         then wraps them in a WeightedRRFRetriever with settings from rag.
 
+        With an expansion result, each lex expansion adds an FTS leg and each
+        vec expansion (plus the HyDE passage) adds a vector leg. Expansion legs
+        are weighted by ``rrf_expansion_weight`` relative to
+        ``rrf_original_weight``, applied to the intent weight of their kind.
+        All vector queries, including the original, are embedded in one
+        batched call; FTS legs share the session and run one at a time.
+
         Args:
             dataset_name: Optional dataset name filter. When provided, both
                 retrievers filter results to that dataset.
@@ -338,6 +528,11 @@ class HybridRetriever:
                 uses settings.rag.vector_top_k.
             fusion_top_k: Number of results after RRF fusion. If None, uses
                 settings.rag.fusion_top_k.
+            query_intent: Optional query intent for weight routing.
+            query: The original query. Required with ``expansion_result``
+                so it can be embedded in the same batch as the expansions.
+            expansion_result: Optional QueryExpansionResult for multi-query
+                retrieval.
 
         Returns:
             WeightedRRFRetriever configured with FTS and vector retrievers.
@@ -359,6 +554,11 @@ class HybridRetriever:
             fts_weight = self._settings.rrf_original_weight
             vector_weight = self._settings.rrf_original_weight
 
+        lex_queries: list[str] = []
+        vec_queries: list[str] = []
+        if expansion_result is not None and query is not None:
+            lex_queries, vec_queries = _expansion_queries(query, expansion_result)
+
         # Create FTS retriever
         fts_retriever = FTSChunkRetriever(
             similarity_top_k=fts_k,
@@ -366,19 +566,63 @@ class HybridRetriever:
             query_intent=query_intent,
         )
 
+        vector_search = VectorSearch(vector_manager=self._vector_manager)
+        query_batch = None
+        if vec_queries:
+            query_batch = _VectorQueryBatch(
+                vector_search=vector_search,
+                queries=[query, *vec_queries],
+                top_k=vector_k,
+                dataset_name=dataset_name,
+            )
         vector_retriever = VectorSearchRetriever(
-            vector_search=VectorSearch(vector_manager=self._vector_manager),
+            vector_search=vector_search,
             similarity_top_k=vector_k,
             dataset_name=dataset_name,
+            query_batch=query_batch,
         )
 
+        # FTS legs run on the request's session, so they are never
+        # abandoned mid-query; only vector legs get a timeout.
+        vector_timeout = self._settings.hybrid_vector_timeout_ms or None
+
+        retrievers: list[BaseRetriever] = [fts_retriever, vector_retriever]
+        weights = [fts_weight, vector_weight]
+        leg_names = ["fts", "vector"]
+        timeouts: list[float | None] = [None, vector_timeout]
+        if lex_queries or vec_queries:
+            fts_lock = threading.Lock()
+            retrievers[0] = _ExpansionLegRetriever(fts_retriever, lock=fts_lock)
+            expansion_ratio = self._expansion_ratio()
+            for i, lex in enumerate(lex_queries, start=1):
+                leg = FTSChunkRetriever(
+                    similarity_top_k=fts_k,
+                    dataset_name=dataset_name,
+                    query_intent=query_intent,
+                )
+                retrievers.append(_ExpansionLegRetriever(leg, query_str=lex, lock=fts_lock))
+                weights.append(fts_weight * expansion_ratio)
+                leg_names.append(f"fts:lex{i}")
+                timeouts.append(None)
+            for i, vec in enumerate(vec_queries, start=1):
+                retrievers.append(_ExpansionLegRetriever(vector_retriever, query_str=vec))
+                weights.append(vector_weight * expansion_ratio)
+                leg_names.append(f"vector:vec{i}")
+                timeouts.append(vector_timeout)
+            logger.debug(
+                f"Multi-query hybrid: {len(lex_queries)} lex and "
+                f"{len(vec_queries)} vec/hyde expansion legs"
+            )
+
         # Create weighted RRF retriever with settings
         hybrid_retriever = WeightedRRFRetriever(
-            retrievers=[fts_retriever, vector_retriever],
-            weights=[fts_weight, vector_weight],
+            retrievers=retrievers,
+            weights=weights,
             k=self._settings.rrf_k,
             top_n=fusion_k,
             enable_dedupe=self._settings.hybrid_dedupe_enabled,
+            leg_names=leg_names,
+            timeouts_ms=timeouts,
         )
 
         logger.debug(
@@ -387,3 +631,36 @@ class HybridRetriever:
         )
 
         return hybrid_retriever
+
+    def _expansion_ratio(self) -> float:
+        """Weight of an expansion leg relative to the original-query leg."""
+        original = self._settings.rrf_original_weight
+        if original <= 0:
+            return self._settings.rrf_expansion_weight
+        return self._settings.rrf_expansion_weight / original
+
+
+def _expansion_queries(
+    query: str,
+    expansion_result: "QueryExpansionResult",
+) -> tuple[list[str], list[str]]:
+    """Return de-duplicated (lex, vec + HyDE) expansion queries.
+
+    Expansions identical to the original query (case-insensitive) or to an
+    earlier expansion of the same kind are dropped.
+    """
+
+    def _unique(candidates: list[str]) -> list[str]:
+        seen = {query.strip().lower()}
+        unique: list[str] = []
+        for candidate in candidates:
+            key = candidate.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(candidate.strip())
+        return unique
+
+    vec_candidates = list(expansion_result.vec_expansions)
+    if expansion_result.hyde_passage:
+        vec_candidates.append(expansion_result.hyde_passage)
+    return _unique(list(expansion_result.lex_expansions)), _unique(vec_candidates)
@@ -143,6 +143,9 @@ class SearchResults(BaseModel):
             and limit application.
         timing_ms: Time taken for the search operation in milliseconds.
             None if timing was not recorded.
+        leg_timings_ms: Per-retriever latency for hybrid search, keyed by
+            leg name ("fts", "vector", "fts:lex1", ...).
+        degraded_legs: Hybrid legs dropped for exceeding their timeout.
     """
 
     results: list[SearchResult] = Field(
@@ -161,6 +164,14 @@ class SearchResults(BaseModel):
         ge=0.0,
         description="Search operation timing in milliseconds",
     )
+    leg_timings_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-retriever-leg latency in milliseconds (hybrid only)",
+    )
+    degraded_legs: list[str] = Field(
+        default_factory=list,
+        description="Retriever legs dropped after exceeding their timeout",
+    )
 
 
 __all__ = [
@@ -100,7 +100,11 @@ class QueryExpansionTransform:
         """
         self._session = session
         self._model_name = model_name or "mlx-local"
-        self._cache = LLMCache(session)
+        self._cache = LLMCache(
+            session,
+            ttl_hours=self._settings.cache_ttl_hours,
+            memory_entries=self._settings.cache_memory_entries,
+        )
 
     @property
     def _settings(self):
@@ -120,25 +124,48 @@ class QueryExpansionTransform:
         Returns:
             QueryExpansionResult with original and expanded queries.
         """
+        return (await self.expand_many([query]))[0]
+
+    async def expand_many(self, queries: list[str]) -> list[QueryExpansionResult]:
+        """Expand several queries, sharing one cache lookup and one cache write.
+
+        Cached expansions are fetched with a single ``LLMCache.get_many`` and
+        newly generated ones stored with a single ``LLMCache.set_many``.
+        Queries whose expansion fails fall back to the original only.
+
+        Args:
+            queries: Original search queries (duplicates are expanded once).
+
+        Returns:
+            One QueryExpansionResult per query, in input order.
+        """
         if not self._settings.expansion_enabled:
-            logger.debug("Query expansion disabled", query=query[:50])
-            return QueryExpansionResult(original=query)
-
-        # Check cache first
-        cached = self._cache.get_expansion(query, self._model_name)
-        if cached is not None:
-            logger.debug("Query expansion cache hit", query=query[:50])
-            return self._dict_to_result(query, cached)
-
-        # Generate expansions via LLM
-        try:
-            result = await self._generate_expansions(query)
-            # Cache the result
-            self._cache.set_expansion(query, self._model_name, self._result_to_dict(result))
-            return result
-        except Exception as e:
-            logger.warning("Query expansion failed, using original only", error=str(e))
-            return QueryExpansionResult(original=query)
+            logger.debug("Query expansion disabled", count=len(queries))
+            return [QueryExpansionResult(original=query) for query in queries]
+
+        results: dict[str, QueryExpansionResult] = {}
+        cached = self._cache.get_many(
+            "expansion", [(query, self._model_name) for query in queries]
+        )
+        for query, data in zip(queries, cached):
+            if data is not None:
+                logger.debug("Query expansion cache hit", query=query[:50])
+                results[query] = self._dict_to_result(query, data)
+
+        # Generate expansions via LLM for the misses
+        generated: list[tuple[tuple[str, str], dict]] = []
+        for query in dict.fromkeys(q for q in queries if q not in results):
+            try:
+                result = await self._generate_expansions(query)
+            except Exception as e:
+                logger.warning("Query expansion failed, using original only", error=str(e))
+                results[query] = QueryExpansionResult(original=query)
+                continue
+            results[query] = result
+            generated.append(((query, self._model_name), self._result_to_dict(result)))
+
+        self._cache.set_many("expansion", generated)
+        return [results[query] for query in queries]
 
     async def _generate_expansions(self, query: str) -> QueryExpansionResult:
         """Generate expansions using the LLM.
@@ -149,9 +176,9 @@ class QueryExpansionTransform:
         Returns:
             QueryExpansionResult with parsed expansions.
         """
-        from agentlayer.llm.provider import MLXProvider
+        from agentlayer.llm.registry import get_model_registry
 
-        provider = MLXProvider()
+        provider = get_model_registry().get_llm()
 
         prompt = QUERY_EXPANSION_PROMPT.format(
             query=query,
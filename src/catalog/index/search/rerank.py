@@ -19,6 +19,7 @@ Example usage:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 from typing import TYPE_CHECKING
 
 from agentlayer.logging import get_logger
@@ -32,6 +33,9 @@ __all__ = ["Reranker"]
 
 logger = get_logger(__name__)
 
+# Output tokens allowed per document in a listwise response ("[12] 7\n").
+_LISTWISE_TOKENS_PER_DOC = 6
+
 
 class Reranker:
     """LLM-as-judge reranker with pluggable provider (MLX or OpenAI).
@@ -39,6 +43,11 @@ class Reranker:
     Provider is selected from settings.rag.rerank_provider at init time.
     Both paths produce the same interface: rerank(nodes, query, top_n).
 
+    The MLX path scores candidates in listwise batches (or one Yes/No
+    prompt per candidate for the pointwise strategy) with bounded
+    concurrency and an optional per-query latency budget. Candidates left
+    unscored are returned unchanged, keeping their retrieval score.
+
     Attributes:
         _provider: The configured provider name ("mlx" or "openai").
         _default_top_n: Default number of top results to return.
@@ -48,6 +57,11 @@ class Reranker:
         self,
         default_top_n: int = 10,
         choice_batch_size: int = 5,
+        strategy: str | None = None,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+        budget_ms: int | None = None,
+        mlx_provider=None,
     ) -> None:
         """Initialize the Reranker.
 
@@ -55,13 +69,28 @@ class Reranker:
             default_top_n: Default number of top results to return when
                 top_n is not specified in rerank(). Defaults to 10.
             choice_batch_size: Nodes per LLM call (OpenAI path only).
+            strategy: "listwise" or "pointwise" (MLX path). Defaults to
+                settings.rag.rerank_strategy.
+            batch_size: Candidates per listwise prompt. Defaults to
+                settings.rag.rerank_batch_size.
+            max_concurrency: Maximum concurrent LLM calls. Defaults to
+                settings.rag.rerank_max_concurrency.
+            budget_ms: Per-query latency budget, 0 for none. Defaults to
+                settings.rag.rerank_budget_ms.
+            mlx_provider: Provider to use instead of the shared MLXProvider
+                from the model registry (anything with an async generate()).
         """
+        rag = get_settings().rag
         self._default_top_n = default_top_n
         self._choice_batch_size = choice_batch_size
-        self._provider = get_settings().rag.rerank_provider
+        self._provider = rag.rerank_provider
+        self._strategy = strategy or rag.rerank_strategy
+        self._batch_size = batch_size or rag.rerank_batch_size
+        self._max_concurrency = max_concurrency or rag.rerank_max_concurrency
+        self._budget_ms = rag.rerank_budget_ms if budget_ms is None else budget_ms
 
         # Lazy-loaded internals
-        self._mlx_provider = None
+        self._mlx_provider = mlx_provider
         self._openai_llm = None
         self._openai_reranker = None
 
@@ -103,12 +132,12 @@ class Reranker:
     # -- MLX path ----------------------------------------------------------
 
     def _ensure_mlx(self):
-        """Lazy-load MLXProvider."""
-        if self._mlx_provider is None:
-            from agentlayer.llm.provider import MLXProvider
+        """Return the injected provider or the shared registry MLXProvider."""
+        if self._mlx_provider is not None:
+            return self._mlx_provider
+        from agentlayer.llm.registry import get_model_registry
 
-            self._mlx_provider = MLXProvider()
-        return self._mlx_provider
+        return get_model_registry().get_llm()
 
     def _rerank_mlx(
         self,
@@ -116,53 +145,138 @@ class Reranker:
         query: str,
         top_n: int,
     ) -> list[NodeWithScore]:
-        """Score each node with MLXProvider and return top_n by relevance."""
+        """Score nodes with MLXProvider and return top_n by relevance.
+
+        Candidates are split into work items (one listwise batch, or one
+        node for pointwise) scored on a bounded thread pool. When the
+        latency budget runs out, outstanding items are abandoned. Nodes left
+        unscored (abandoned, failed, or not rated by a listwise response)
+        keep the original NodeWithScore (retrieval score) and their relative
+        order, ranked after all LLM-scored nodes.
+        """
         from llama_index.core.schema import NodeWithScore as NWS
 
-        from agentlayer.llm.prompts import RERANK_SYSTEM, format_rerank_prompt
+        scores = self._score_all(nodes, query)
+
+        scored = [(node, score) for node, score in zip(nodes, scores) if score is not None]
+        unscored = [node for node, score in zip(nodes, scores) if score is None]
+        scored.sort(key=lambda x: x[1], reverse=True)
+
+        result = [NWS(node=node.node, score=score) for node, score in scored]
+        result.extend(unscored)
+        if unscored:
+            logger.debug(f"{len(unscored)} rerank candidates kept their retrieval score")
+        return result[:top_n]
+
+    def _score_all(
+        self,
+        nodes: list[NodeWithScore],
+        query: str,
+    ) -> list[float | None]:
+        """Score nodes concurrently within the latency budget.
 
+        Returns:
+            One entry per node: the LLM relevance score in [0, 1], or None
+            if the node was not scored (budget exhausted, LLM failure, or
+            missing from a listwise response).
+        """
         provider = self._ensure_mlx()
+        texts = [node.node.get_content() for node in nodes]
 
-        async def _score_all():
-            scores = []
-            for node in nodes:
-                text = node.node.get_content()
-                prompt = format_rerank_prompt(query, text)
-                try:
-                    response = await provider.generate(
-                        prompt,
-                        system=RERANK_SYSTEM,
-                        max_tokens=5,
-                        temperature=0.0,
-                    )
-                    # "Yes" -> 1.0, anything else -> 0.0
-                    is_relevant = response.strip().lower().startswith("yes")
-                    scores.append(1.0 if is_relevant else 0.0)
-                except Exception as e:
-                    logger.warning(f"MLX rerank scoring failed for node: {e}")
-                    scores.append(0.0)
-            return scores
-
-        # Run async scoring in sync context
+        step = self._batch_size if self._strategy == "listwise" else 1
+        spans = [(i, min(i + step, len(nodes))) for i in range(0, len(nodes), step)]
+
+        scores: list[float | None] = [None] * len(nodes)
+        timeout = self._budget_ms / 1000.0 if self._budget_ms else None
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(spans)),
+            thread_name_prefix="rerank",
+        )
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                scores = pool.submit(lambda: asyncio.run(_score_all())).result()
-        else:
-            scores = asyncio.run(_score_all())
+            futures = {
+                executor.submit(self._score_span, provider, query, texts[lo:hi]): lo
+                for lo, hi in spans
+            }
+            done, pending = concurrent.futures.wait(futures, timeout=timeout)
+            for future in done:
+                lo = futures[future]
+                for offset, score in enumerate(future.result()):
+                    scores[lo + offset] = score
+            if pending:
+                logger.warning(
+                    f"Rerank budget of {self._budget_ms}ms exhausted: "
+                    f"{len(pending)}/{len(spans)} batches unscored"
+                )
+        finally:
+            # Don't wait for abandoned batches; queued ones are dropped.
+            executor.shutdown(wait=False, cancel_futures=True)
+        return scores
+
+    def _score_span(
+        self,
+        provider,
+        query: str,
+        texts: list[str],
+    ) -> list[float | None]:
+        """Score one work item on a worker thread.
+
+        Listwise spans (including a trailing single document) always use
+        the listwise 0-10 rating, so scores stay on one scale. Documents
+        the response did not rate are left unscored rather than judged
+        pointwise, which would mix 0/1 verdicts with ratings and spend
+        extra calls inside the latency budget.
+        """
+        if self._strategy == "listwise":
+            return self._score_listwise(provider, query, texts)
+        return [self._score_pointwise(provider, query, text) for text in texts]
 
-        # Pair nodes with scores, sort descending, take top_n
-        scored = sorted(zip(nodes, scores), key=lambda x: x[1], reverse=True)
-        result = []
-        for node, score in scored[:top_n]:
-            result.append(NWS(node=node.node, score=score))
+    def _score_listwise(
+        self,
+        provider,
+        query: str,
+        texts: list[str],
+    ) -> list[float | None]:
+        """Rate several documents with a single listwise prompt."""
+        from agentlayer.llm.prompts import (
+            RERANK_LISTWISE_SYSTEM,
+            format_listwise_rerank_prompt,
+            parse_listwise_scores,
+        )
 
-        return result
+        prompt = format_listwise_rerank_prompt(query, texts)
+        try:
+            response = asyncio.run(
+                provider.generate(
+                    prompt,
+                    system=RERANK_LISTWISE_SYSTEM,
+                    max_tokens=_LISTWISE_TOKENS_PER_DOC * len(texts),
+                    temperature=0.0,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"MLX listwise rerank failed for batch of {len(texts)}: {e}")
+            return [None] * len(texts)
+        return parse_listwise_scores(response, len(texts))
+
+    def _score_pointwise(self, provider, query: str, text: str) -> float | None:
+        """Judge one document with a Yes/No prompt."""
+        from agentlayer.llm.prompts import RERANK_SYSTEM, format_rerank_prompt
+
+        prompt = format_rerank_prompt(query, text)
+        try:
+            response = asyncio.run(
+                provider.generate(
+                    prompt,
+                    system=RERANK_SYSTEM,
+                    max_tokens=5,
+                    temperature=0.0,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"MLX rerank scoring failed for node: {e}")
+            return None
+        # "Yes" -> 1.0, anything else -> 0.0
+        return 1.0 if response.strip().lower().startswith("yes") else 0.0
 
     # -- OpenAI path -------------------------------------------------------
 
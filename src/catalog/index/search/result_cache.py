@@ -0,0 +1,239 @@
+"""index.search.result_cache - Query-result cache for SearchService.
+
+Agents repeat near-identical searches; a hit skips expansion, retrieval,
+fusion and rerank entirely. Entries are keyed on:
+
+- the normalized query (NFKC, case-folded, whitespace collapsed)
+- a fingerprint of every other ``SearchCriteria`` field
+- the index generation token of the searched dataset(s)
+  (``IndexGenerationRepository.token``), which every index write bumps,
+  so stale results are never served, even across processes
+
+Optionally, a query whose embedding has cosine similarity of at least
+``min_similarity`` with a cached query (same criteria and generation) is
+served that query's results, so paraphrases hit too.
+
+The cache is a bounded, thread-safe LRU held in memory; it stores result
+copies and hands out copies, so callers may modify what they get.
+
+Example usage:
+    from index.search.result_cache import SearchResultCache
+
+    cache = SearchResultCache(max_entries=1_000)
+    results = cache.get(criteria, generation, embedding=vec, min_similarity=0.95)
+    if results is None:
+        results = service.search(criteria)
+        cache.put(criteria, generation, results, embedding=vec)
+    print(cache.stats.hits, cache.stats.semantic_hits, cache.stats.misses)
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from agentlayer.logging import get_logger
+
+from index.search.models import SearchCriteria, SearchResults
+
+__all__ = [
+    "SearchResultCache",
+    "SearchResultCacheStats",
+    "criteria_fingerprint",
+    "normalize_query",
+]
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# (criteria fingerprint, generation token)
+_Group = tuple[str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for exact-match caching.
+
+    Applies NFKC, case folding and whitespace collapsing, so queries that
+    differ only in case, spacing or Unicode form share an entry.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query).casefold()).strip()
+
+
+def criteria_fingerprint(criteria: SearchCriteria) -> str:
+    """Hash every SearchCriteria field except the query."""
+    fields = criteria.model_dump(exclude={"query"})
+    canonical = "|".join(f"{name}={fields[name]!r}" for name in sorted(fields))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+@dataclass
+class SearchResultCacheStats:
+    """Result cache counters.
+
+    Attributes:
+        hits: Lookups answered by an exact (normalized) query match.
+        semantic_hits: Lookups answered by embedding similarity.
+        misses: Lookups that found nothing.
+        evictions: Entries dropped to stay within capacity.
+    """
+
+    hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    results: SearchResults
+    embedding: np.ndarray | None
+
+
+class SearchResultCache:
+    """Bounded LRU of search results keyed by query, criteria and generation.
+
+    Args:
+        max_entries: Capacity; 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int = 1_000) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Capacity; 0 disables the cache.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[_Group, str], _Entry] = OrderedDict()
+        # Queries with embeddings per (fingerprint, generation), for similarity scans
+        self._embedded: dict[_Group, set[str]] = {}
+        self._lock = threading.Lock()
+        self.stats = SearchResultCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        criteria: SearchCriteria,
+        generation: str,
+        embedding: Sequence[float] | None = None,
+        min_similarity: float = 0.0,
+        embed: Callable[[], Sequence[float] | None] | None = None,
+    ) -> SearchResults | None:
+        """Look up cached results for a search.
+
+        The exact (normalized) query is tried first; similarity matching
+        only runs on an exact miss.
+
+        Args:
+            criteria: The search's criteria.
+            generation: Index generation token of the searched dataset(s).
+            embedding: Query embedding, for similarity matching.
+            min_similarity: Cosine similarity a cached query needs to be
+                reused for a different query; 0 disables similarity matching.
+            embed: Computes the query embedding when ``embedding`` is not
+                given; only called on an exact miss with similarity matching
+                enabled, outside the cache lock.
+
+        Returns:
+            A copy of the cached results, or None on a miss.
+        """
+        group = (criteria_fingerprint(criteria), generation)
+        key = (group, normalize_query(criteria.query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.results.model_copy(deep=True)
+        if embedding is None and embed is not None and min_similarity > 0:
+            embedding = embed()
+        with self._lock:
+            if embedding is not None and min_similarity > 0:
+                match = self._most_similar(group, _unit(embedding), min_similarity)
+                if match is not None:
+                    self._entries.move_to_end((group, match))
+                    self.stats.semantic_hits += 1
+                    logger.debug(f"Result cache: '{criteria.query[:50]}' matched '{match[:50]}'")
+                    return self._entries[(group, match)].results.model_copy(deep=True)
+            self.stats.misses += 1
+            return None
+
+    def put(
+        self,
+        criteria: SearchCriteria,
+        generation: str,
+        results: SearchResults,
+        embedding: Sequence[float] | None = None,
+    ) -> None:
+        """Cache a search's results, evicting least-recently-used entries.
+
+        Args:
+            criteria: The search's criteria.
+            generation: Index generation token the results were computed at.
+            results: Results to cache (a copy is stored).
+            embedding: Query embedding, to make the entry reachable by
+                similar queries.
+        """
+        if self._max_entries <= 0:
+            return
+        group = (criteria_fingerprint(criteria), generation)
+        query = normalize_query(criteria.query)
+        entry = _Entry(
+            results=results.model_copy(deep=True),
+            embedding=_unit(embedding) if embedding is not None else None,
+        )
+        with self._lock:
+            self._entries[(group, query)] = entry
+            self._entries.move_to_end((group, query))
+            if entry.embedding is not None:
+                self._embedded.setdefault(group, set()).add(query)
+            else:
+                self._unindex(group, query)
+            while len(self._entries) > self._max_entries:
+                (old_group, old_query), _ = self._entries.popitem(last=False)
+                self._unindex(old_group, old_query)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._embedded.clear()
+
+    def _most_similar(
+        self, group: _Group, embedding: np.ndarray, min_similarity: float
+    ) -> str | None:
+        """Cached query in ``group`` most similar to ``embedding``, if close enough."""
+        candidates: list[tuple[str, np.ndarray]] = []
+        for query in self._embedded.get(group, ()):
+            vec = self._entries[(group, query)].embedding
+            if vec is not None and vec.shape == embedding.shape:
+                candidates.append((query, vec))
+        if not candidates:
+            return None
+        similarities = np.stack([vec for _, vec in candidates]) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < min_similarity:
+            return None
+        return candidates[best][0]
+
+    def _unindex(self, group: _Group, query: str) -> None:
+        queries = self._embedded.get(group)
+        if queries is not None:
+            queries.discard(query)
+            if not queries:
+                del self._embedded[group]
+
+
+def _unit(embedding: Sequence[float]) -> np.ndarray:
+    """Embedding as a unit-length float32 vector (zero vectors stay zero)."""
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
@@ -5,6 +5,7 @@ Provides the unified search orchestrator integrating:
 - Weighted RRF hybrid retrieval
 - Cached LLM reranking
 - Top-rank bonuses
+- A query-result cache, invalidated by index generation bumps
 
 Example usage:
     from index.search.service import SearchService, search
@@ -19,10 +20,10 @@ Example usage:
         rerank=True,
     ))
 
-    # Using service directly
+    # Using service directly; retrieval runs on pooled read-only sessions
     with get_session() as session:
         with use_session(session):
-            service = SearchService(session)
+            service = SearchService(session, read_only=True)
             results = service.search(SearchCriteria(
                 query="machine learning",
                 rerank=True,
@@ -30,6 +31,8 @@ Example usage:
 """
 
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 from agentlayer.logging import get_logger
@@ -48,7 +51,10 @@ if TYPE_CHECKING:
         PerDocDedupePostprocessor,
         TopRankBonusPostprocessor,
     )
+    from llama_index.core.base.embeddings.base import BaseEmbedding
+
     from index.search.query_expansion import QueryExpansionTransform
+    from index.search.result_cache import SearchResultCache
     from index.search.vector import VectorSearch
     from index.store.vector import VectorStoreManager
 
@@ -68,6 +74,16 @@ class SearchService:
 
     All components are lazy-loaded on first use to minimize startup time.
 
+    With ``read_only``, FTS and hybrid retrieval check out a session from
+    the read-only pool (``get_read_session``) per search instead of using
+    ``session``, so searches run concurrently with each other and with
+    ingest writers. ``session`` is still used for the LLM cache.
+
+    Results are cached per service (``rag.result_cache_entries``), keyed on
+    the normalized query, the other criteria and the searched datasets'
+    index generation; with ``rag.result_cache_similarity`` set, queries
+    whose embedding is that similar to a cached query reuse its results.
+
     Attributes:
         session: SQLAlchemy session for database access.
         _settings: RAGSettings instance.
@@ -77,13 +93,16 @@ class SearchService:
         _cached_reranker: Lazy-loaded CachedReranker.
     """
 
-    def __init__(self, session: "Session") -> None:
+    def __init__(self, session: "Session", *, read_only: bool = False) -> None:
         """Initialize the SearchService.
 
         Args:
             session: SQLAlchemy session for database access.
+            read_only: Retrieve on read-only pooled sessions instead of
+                ``session``.
         """
         self.session = session
+        self._read_only = read_only
         self._settings = get_settings().rag
         self._cache: LLMCache | None = None
         self._query_expander: "QueryExpansionTransform | None" = None
@@ -92,6 +111,21 @@ class SearchService:
         self._fts_search: "FTSChunkRetriever | None" = None
         self._vector_search: "VectorSearch | None" = None
         self._vector_manager: "VectorStoreManager | None" = None
+        self._result_cache: "SearchResultCache | None" = None
+        self._cache_embed_model: "BaseEmbedding | None" = None
+
+    @contextmanager
+    def _retrieval_session(self) -> Iterator["Session"]:
+        """Session (also made ambient) that FTS retrieval runs on."""
+        if not self._read_only:
+            yield self.session
+            return
+
+        from agentlayer.session import use_session
+        from catalog.store.database import get_read_session
+
+        with get_read_session() as session, use_session(session):
+            yield session
 
     def _ensure_vector_manager(self) -> "VectorStoreManager":
         """Lazy-load shared VectorStoreManager.
@@ -112,9 +146,52 @@ class SearchService:
             self._cache = LLMCache(
                 session=self.session,
                 ttl_hours=self._settings.cache_ttl_hours,
+                memory_entries=self._settings.cache_memory_entries,
             )
         return self._cache
 
+    @property
+    def result_cache(self) -> "SearchResultCache":
+        """Get or create the query-result cache."""
+        if self._result_cache is None:
+            from index.search.result_cache import SearchResultCache
+
+            self._result_cache = SearchResultCache(self._settings.result_cache_entries)
+        return self._result_cache
+
+    def _ensure_cache_embed_model(self) -> "BaseEmbedding":
+        """Lazy-load the embedding model for similarity cache lookups."""
+        if self._cache_embed_model is None:
+            from agentlayer.embedding import get_embed_model
+
+            self._cache_embed_model = get_embed_model(resilient=True)
+        return self._cache_embed_model
+
+    def _result_cache_generation(self, criteria: SearchCriteria) -> str | None:
+        """Index generation token to cache a search under.
+
+        Returns:
+            The generation token, or None if the search cannot be cached.
+        """
+        if self._settings.result_cache_entries <= 0:
+            return None
+        from catalog.store.repositories import IndexGenerationRepository
+
+        try:
+            with self._retrieval_session() as session:
+                return IndexGenerationRepository(session).token(criteria.dataset_name)
+        except Exception as e:
+            logger.warning(f"Result cache skipped, index generation unavailable: {e}")
+            return None
+
+    def _cache_query_embedding(self, criteria: SearchCriteria) -> list[float] | None:
+        """Embed the query for similarity cache matching, or None on failure."""
+        try:
+            return self._ensure_cache_embed_model().get_query_embedding(criteria.query)
+        except Exception as e:
+            logger.warning(f"Result cache similarity matching skipped: {e}")
+            return None
+
     def _ensure_query_expander(self) -> "QueryExpansionTransform":
         """Lazy-load QueryExpansionTransform."""
         if self._query_expander is None:
@@ -174,13 +251,15 @@ class SearchService:
         """Execute search with query expansion, weighted RRF, and caching.
 
         Pipeline:
+        0. Return cached results for the query (or a similar one) if the
+           searched datasets have not been re-indexed since
         1. Query expansion (if enabled)
         2. Dispatch to appropriate search mode. For vector/hybrid retrieval,
            query-time embeddings are resolved by vector-store provenance so
            the matching embedding model identity is used per stored profile.
         3. Apply top-rank bonus
         4. Rerank (if enabled)
-        5. Return results
+        5. Cache and return results
 
         Args:
             criteria: Search criteria specifying query, mode, filters,
@@ -194,6 +273,39 @@ class SearchService:
         start = time.perf_counter()
         debug_info: dict[str, Any] = {}
 
+        # 0. Result cache
+        generation = self._result_cache_generation(criteria)
+        # Computed only on an exact-match miss, and reused to cache the results
+        embedding: list[float] | None = None
+
+        def embed_query() -> list[float] | None:
+            nonlocal embedding
+            embedding = self._cache_query_embedding(criteria)
+            return embedding
+
+        if generation is not None:
+            cached = self.result_cache.get(
+                criteria,
+                generation,
+                min_similarity=self._settings.result_cache_similarity,
+                embed=embed_query,
+            )
+            if cached is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logger.debug(
+                    f"SearchService.search({criteria.mode}) for '{criteria.query[:50]}...' "
+                    f"served {len(cached.results)} cached results in {elapsed_ms:.1f}ms"
+                )
+                return SearchResults(
+                    results=cached.results,
+                    query=criteria.query,
+                    mode=criteria.mode,
+                    total_candidates=cached.total_candidates,
+                    timing_ms=elapsed_ms,
+                    leg_timings_ms=cached.leg_timings_ms,
+                    degraded_legs=cached.degraded_legs,
+                )
+
         # 1. Query expansion (if enabled and not pure FTS)
         expansion_result = None
         if self._settings.expansion_enabled and criteria.mode != "fts":
@@ -263,6 +375,8 @@ class SearchService:
                 mode=results.mode,
                 total_candidates=results.total_candidates,
                 timing_ms=results.timing_ms,
+                leg_timings_ms=results.leg_timings_ms,
+                degraded_legs=results.degraded_legs,
             )
 
         total_elapsed_ms = (time.perf_counter() - start) * 1000
@@ -272,13 +386,19 @@ class SearchService:
             f"returned {len(results.results)} results in {total_elapsed_ms:.1f}ms"
         )
 
-        return SearchResults(
+        final = SearchResults(
             results=results.results,
             query=criteria.query,
             mode=criteria.mode,
             total_candidates=len(results.results),
             timing_ms=total_elapsed_ms,
+            leg_timings_ms=results.leg_timings_ms,
+            degraded_legs=results.degraded_legs,
         )
+        # Degraded results (a leg timed out) are not worth repeating
+        if generation is not None and not final.degraded_legs:
+            self.result_cache.put(criteria, generation, final, embedding=embedding)
+        return final
 
     def search_fts(
         self,
@@ -311,7 +431,8 @@ class SearchService:
 
         # Use the retriever interface
         query_bundle = QueryBundle(query_str=query)
-        nodes = fts.retrieve(query_bundle)
+        with self._retrieval_session():
+            nodes = fts.retrieve(query_bundle)
 
         # Convert to SearchResults
         results = self._nodes_to_search_results(nodes[:limit])
@@ -371,7 +492,9 @@ class SearchService:
             query: Search query string.
             dataset_name: Optional dataset filter.
             limit: Maximum results to return.
-            expansion_result: Optional QueryExpansionResult for multi-query search.
+            expansion_result: Optional QueryExpansionResult. Its lex
+                expansions become extra FTS legs and its vec/HyDE expansions
+                extra vector legs in the RRF fusion.
 
         Returns:
             SearchResults from hybrid search.
@@ -386,11 +509,14 @@ class SearchService:
             dataset_name=dataset_name,
             fusion_top_k=limit,
             query_intent=query_intent,
+            query=query,
+            expansion_result=expansion_result,
         )
 
         # Execute search
         query_bundle = QueryBundle(query_str=query)
-        nodes = retriever.retrieve(query_bundle)
+        with self._retrieval_session():
+            nodes = retriever.retrieve(query_bundle)
 
         # Convert to SearchResults
         results = self._nodes_to_search_results(nodes)
@@ -401,6 +527,8 @@ class SearchService:
             mode="hybrid",
             total_candidates=len(results),
             timing_ms=0,
+            leg_timings_ms=retriever.leg_timings_ms,
+            degraded_legs=retriever.degraded_legs,
         )
 
     def _build_snippet(self, chunk_text: str | None, doc_path: str) -> "SnippetResult | None":
@@ -507,6 +635,8 @@ class SearchService:
             mode=results.mode,
             total_candidates=results.total_candidates,
             timing_ms=results.timing_ms,
+            leg_timings_ms=results.leg_timings_ms,
+            degraded_legs=results.degraded_legs,
         )
 
     def _apply_rerank(
@@ -523,7 +653,8 @@ class SearchService:
             limit: Maximum results after reranking.
 
         Returns:
-            Reranked SearchResults.
+            Reranked SearchResults. Results the LLM did not score follow the
+            scored ones and keep their original score.
         """
         from llama_index.core.schema import NodeWithScore, TextNode
 
@@ -555,11 +686,16 @@ class SearchService:
         # Apply reranking
         reranked = reranker.rerank(query=query, nodes=nodes, top_n=limit)
 
-        # Convert back
+        # Convert back. Nodes returned as the input objects were not scored
+        # by the LLM (e.g. latency budget exhausted): they keep their original
+        # score and get no rerank entry.
+        input_ids = {id(node) for node in nodes}
         reranked_results = []
         for node in reranked:
             original = result_map.get(node.node.id_)
-            if original:
+            if original and id(node) in input_ids:
+                reranked_results.append(original)
+            elif original:
                 reranked_results.append(
                     SearchResult(
                         path=original.path,
@@ -579,6 +715,8 @@ class SearchService:
             mode=results.mode,
             total_candidates=len(reranked_results),
             timing_ms=results.timing_ms,
+            leg_timings_ms=results.leg_timings_ms,
+            degraded_legs=results.degraded_legs,
         )
 
 
@@ -586,7 +724,7 @@ def search(criteria: SearchCriteria) -> SearchResults:
     """Search with query expansion, weighted RRF, and caching.
 
     Convenience function that creates a session and SearchService
-    for one-off searches.
+    for one-off searches. Retrieval runs on a read-only session.
 
     Args:
         criteria: Search criteria.
@@ -599,5 +737,5 @@ def search(criteria: SearchCriteria) -> SearchResults:
 
     with get_session() as session:
         with use_session(session):
-            service = SearchService(session)
+            service = SearchService(session, read_only=True)
             return service.search(criteria)
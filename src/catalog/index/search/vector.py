@@ -24,7 +24,7 @@ from agentlayer.logging import get_logger
 
 from index.search.formatting import build_snippet
 from index.search.models import SearchResult, SnippetResult
-from index.store.vector import VectorStoreManager
+from index.store.vector import VectorQueryHit, VectorStoreManager
 
 if TYPE_CHECKING:
     from llama_index.vector_stores.qdrant import QdrantVectorStore
@@ -92,7 +92,10 @@ class VectorSearch:
         return self._vector_store
 
     def _lookup_chunk_text(self, chunk_ids: list[str]) -> dict[str, str]:
-        """Look up chunk text from SQLite FTS table.
+        """Look up chunk body text from the SQLite chunks table.
+
+        Runs on a pooled read-only session, so concurrent searches do not
+        open a connection each or wait on ingest writers.
 
         Args:
             chunk_ids: List of chunk IDs to look up.
@@ -103,20 +106,11 @@ class VectorSearch:
         if not chunk_ids:
             return {}
 
-        from sqlalchemy import text
-
-        from catalog.store.database import get_engine
-
-        engine = get_engine()
-        # c0 = chunk_id, c1 = text
-        # Use named parameters for SQLAlchemy
-        placeholders = ",".join([f":id{i}" for i in range(len(chunk_ids))])
-        params = {f"id{i}": cid for i, cid in enumerate(chunk_ids)}
-        query = text(f"SELECT c0, c1 FROM chunks_fts_content WHERE c0 IN ({placeholders})")
+        from catalog.store.database import get_read_session
+        from index.store.fts_chunk import FTSChunkManager
 
-        with engine.connect() as conn:
-            result = conn.execute(query, params)
-            return {row[0]: row[1] for row in result}
+        with get_read_session() as session:
+            return FTSChunkManager(session).get_texts(chunk_ids)
 
     def search(
         self,
@@ -165,9 +159,62 @@ class VectorSearch:
             logger.debug(f"Vector search '{query[:50]}...' returned 0 results")
             return []
 
-        chunk_ids = [hit.node_id for hit in hits]
+        chunk_texts = self._lookup_chunk_text([hit.node_id for hit in hits])
+        results = self._hits_to_results(hits, chunk_texts)
+
+        logger.debug(
+            f"Vector search '{query[:50]}...' returned {len(results)} results"
+        )
+        return results
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        dataset_name: str | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with one batched embedding call.
+
+        Used for multi-query hybrid retrieval, where the original query and
+        its vec/HyDE expansions are embedded together. Chunk text for all
+        hits is looked up in a single query.
+
+        Args:
+            queries: Query strings to search for.
+            top_k: Maximum number of results per query. Defaults to 10.
+            dataset_name: Optional dataset name to filter results.
+
+        Returns:
+            One result list per query, in input order, each shaped like
+            ``search()`` results.
+        """
+        if not queries:
+            return []
+        if self._vector_manager.vector_backend == "qdrant":
+            self._ensure_vector_store()
+        hits_per_query = self._vector_manager.semantic_query_many(
+            queries=queries,
+            top_k=top_k,
+            dataset_name=dataset_name,
+        )
+
+        chunk_ids = list(
+            dict.fromkeys(hit.node_id for hits in hits_per_query for hit in hits)
+        )
         chunk_texts = self._lookup_chunk_text(chunk_ids)
 
+        logger.debug(
+            f"Vector multi-search over {len(queries)} queries returned "
+            f"{sum(len(hits) for hits in hits_per_query)} hits"
+        )
+        return [self._hits_to_results(hits, chunk_texts) for hits in hits_per_query]
+
+    def _hits_to_results(
+        self,
+        hits: list[VectorQueryHit],
+        chunk_texts: dict[str, str],
+    ) -> list[SearchResult]:
+        """Convert vector hits to SearchResults using looked-up chunk text."""
         results = []
         for hit in hits:
             node_id = hit.node_id
@@ -215,7 +262,4 @@ class VectorSearch:
                 )
             )
 
-        logger.debug(
-            f"Vector search '{query[:50]}...' returned {len(results)} results"
-        )
         return results
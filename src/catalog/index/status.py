@@ -1,7 +1,7 @@
 """index.status - Health/status checks for index subsystem.
 
-Reports on vector store path, FTS table existence, and overall
-index health.
+Reports on vector store path, FTS table existence and segment layout, and
+overall index health.
 
 Example usage:
     from index.status import check_health, HealthStatus
@@ -145,17 +145,20 @@ def check_vector_store() -> ComponentStatus:
 
 
 def check_fts_table() -> ComponentStatus:
-    """Check FTS5 table existence.
+    """Check FTS5 table existence and segment layout.
 
-    Verifies that the FTS5 virtual table exists in the database.
+    Verifies that the FTS5 virtual table exists in the database and reports
+    segment counts and sizes for each index FTS table in ``details``.
 
     Returns:
         ComponentStatus indicating FTS table health.
     """
     try:
         from sqlalchemy import text
+        from sqlalchemy.orm import Session
 
         from catalog.store.database import get_engine
+        from index.store.fts_maintenance import FTS_TABLES, FTSMaintenance
 
         engine = get_engine()
         with engine.connect() as conn:
@@ -165,10 +168,23 @@ def check_fts_table() -> ComponentStatus:
             table_name = result.scalar()
 
         if table_name:
+            details: dict[str, Any] = {}
+            with Session(engine) as session:
+                maintenance = FTSMaintenance(session)
+                for table in FTS_TABLES:
+                    stats = maintenance.segment_stats(table)
+                    if stats is not None:
+                        details[table] = {
+                            "segments": stats.segments,
+                            "levels": stats.levels,
+                            "pages": stats.pages,
+                            "size_bytes": stats.size_bytes,
+                        }
             return ComponentStatus(
                 name="fts_table",
                 healthy=True,
                 message="FTS5 table exists",
+                details=details,
             )
         else:
             return ComponentStatus(
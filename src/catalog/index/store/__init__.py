@@ -8,6 +8,7 @@ from index.store.fts_chunk import (
     drop_chunks_fts_table,
     extract_heading_body,
 )
+from index.store.fts_maintenance import FTSMaintenance, FTSSegmentStats
 from index.store.vector import VectorStoreManager
 from index.store.cleanup import (
     IndexCleanup,
@@ -26,6 +27,8 @@ __all__ = [
     "create_chunks_fts_table",
     "drop_chunks_fts_table",
     "extract_heading_body",
+    "FTSMaintenance",
+    "FTSSegmentStats",
     "VectorStoreManager",
     "IndexCleanup",
     "cleanup_fts_for_document",
@@ -25,6 +25,7 @@ from sqlalchemy import Engine, text
 from sqlalchemy.orm import Session
 
 from agentlayer.session import current_session
+from catalog.store.models.content import load_bodies
 
 __all__ = [
     "FTSManager",
@@ -46,28 +47,75 @@ class FTSResult:
     snippet: str | None = None
 
 
+# dataset_id holds the document's parent dataset ID as a single token, so a
+# column filter can restrict a MATCH to one dataset before ranking.
+_DOCUMENTS_FTS_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+        path,
+        body,
+        dataset_id,
+        content='',
+        contentless_delete=1,
+        tokenize='porter unicode61'
+    )
+"""
+
+# Text columns a user query may match; excludes the dataset_id partition key.
+_TEXT_COLUMNS = "{path body}"
+
+# BM25 weights for (path, body, dataset_id).
+_BM25_WEIGHTS = "1.0, 1.0, 0.0"
+
+
 def create_fts_table(engine: Engine) -> None:
     """Create the FTS5 virtual table if it doesn't exist.
 
     Creates documents_fts with porter stemming and unicode61 tokenizer.
     Uses content='' for external content (we manage content ourselves).
 
+    A documents_fts created before the ``dataset_id`` column existed cannot
+    be altered (contentless tables keep no content to rebuild from), so it
+    is recreated and repopulated from the active rows of ``documents`` and
+    their bodies in the content database.
+
     Args:
         engine: SQLAlchemy engine.
     """
     with engine.connect() as conn:
-        conn.execute(
-            text("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
-                    path,
-                    body,
-                    content='',
-                    contentless_delete=1,
-                    tokenize='porter unicode61'
+        existing = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'documents_fts'")
+        ).scalar()
+        migrate = existing is not None and "dataset_id" not in existing
+        if migrate:
+            conn.execute(text("DROP TABLE documents_fts"))
+        conn.execute(text(_DOCUMENTS_FTS_DDL))
+        has_documents = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'documents'")
+        ).scalar()
+        if migrate and has_documents:
+            rows = conn.execute(
+                text("SELECT id, path, body_hash, parent_id FROM documents WHERE active = 1")
+            ).all()
+            bodies = load_bodies(conn, [row.body_hash for row in rows if row.body_hash])
+            if rows:
+                conn.execute(
+                    text("""
+                        INSERT INTO documents_fts(rowid, path, body, dataset_id)
+                        VALUES (:id, :path, :body, :dataset_id)
+                    """),
+                    [
+                        {
+                            "id": row.id,
+                            "path": row.path,
+                            "body": bodies.get(row.body_hash, ""),
+                            "dataset_id": row.parent_id,
+                        }
+                        for row in rows
+                    ],
                 )
-            """)
-        )
         conn.commit()
+    if migrate:
+        logger.info("Recreated documents_fts with dataset_id partition column")
     logger.debug("FTS5 table created or already exists")
 
 
@@ -121,7 +169,9 @@ class FTSManager:
         if engine is not None:
             create_fts_table(engine)  # type: ignore
 
-    def upsert(self, doc_id: int, path: str, body: str) -> None:
+    def upsert(
+        self, doc_id: int, path: str, body: str, dataset_id: int | None = None
+    ) -> None:
         """Insert or update a document in the FTS index.
 
         Uses INSERT OR REPLACE semantics with explicit rowid.
@@ -130,6 +180,8 @@ class FTSManager:
             doc_id: Document ID (used as rowid).
             path: Document path for searching.
             body: Document body text for searching.
+            dataset_id: Parent dataset ID. Defaults to the document's
+                ``parent_id`` in the documents table.
         """
         # Delete existing entry if any
         self._session.execute(
@@ -139,10 +191,13 @@ class FTSManager:
         # Insert new entry
         self._session.execute(
             text("""
-                INSERT INTO documents_fts(rowid, path, body)
-                VALUES (:rowid, :path, :body)
+                INSERT INTO documents_fts(rowid, path, body, dataset_id)
+                VALUES (
+                    :rowid, :path, :body,
+                    coalesce(:dataset_id, (SELECT parent_id FROM documents WHERE id = :rowid))
+                )
             """),
-            {"rowid": doc_id, "path": path, "body": body},
+            {"rowid": doc_id, "path": path, "body": body, "dataset_id": dataset_id},
         )
         #logger.debug(f"FTS indexed document {doc_id}: {path}")
 
@@ -198,51 +253,39 @@ class FTSManager:
     ) -> list[FTSResult]:
         """Search documents using FTS5.
 
+        The query only matches the path and body columns. A
+        ``parent_filter`` is applied as an FTS5 column filter on
+        ``dataset_id`` inside the MATCH, so other datasets' documents are
+        pruned before BM25 ranking.
+
         Args:
             query: FTS5 search query (supports FTS5 syntax).
             limit: Maximum number of results.
-            parent_filter: Optional parent ID to filter by (requires join).
+            parent_filter: Optional parent (dataset) ID to filter by.
 
         Returns:
             List of FTSResult objects sorted by relevance.
         """
+        match = f"{_TEXT_COLUMNS} : ({query})"
         if parent_filter is not None:
-            # Join with documents table to filter by dataset
-            results = self._session.execute(
-                text("""
-                    SELECT
-                        d.id as doc_id,
-                        d.path,
-                        bm25(documents_fts) as rank,
-                        snippet(documents_fts, 1, '<b>', '</b>', '...', 32) as snippet
-                    FROM documents_fts f
-                    JOIN documents d ON d.id = f.rowid
-                    WHERE documents_fts MATCH :query
-                    AND d.parent_id = :parent_id
-                    AND d.active = 1
-                    ORDER BY rank
-                    LIMIT :limit
-                """),
-                {"query": query, "parent_id": parent_filter, "limit": limit},
-            )
-        else:
-            # Search without dataset filter
-            results = self._session.execute(
-                text("""
-                    SELECT
-                        d.id as doc_id,
-                        d.path,
-                        bm25(documents_fts) as rank,
-                        snippet(documents_fts, 1, '<b>', '</b>', '...', 32) as snippet
-                    FROM documents_fts f
-                    JOIN documents d ON d.id = f.rowid
-                    WHERE documents_fts MATCH :query
-                    AND d.active = 1
-                    ORDER BY rank
-                    LIMIT :limit
-                """),
-                {"query": query, "limit": limit},
-            )
+            match = f'dataset_id : "{int(parent_filter)}" AND {match}'
+
+        results = self._session.execute(
+            text(f"""
+                SELECT
+                    d.id as doc_id,
+                    d.path,
+                    bm25(documents_fts, {_BM25_WEIGHTS}) as rank,
+                    snippet(documents_fts, 1, '<b>', '</b>', '...', 32) as snippet
+                FROM documents_fts f
+                JOIN documents d ON d.id = f.rowid
+                WHERE documents_fts MATCH :query
+                AND d.active = 1
+                ORDER BY rank
+                LIMIT :limit
+            """),
+            {"query": match, "limit": limit},
+        )
 
         return [
             FTSResult(
@@ -1,7 +1,9 @@
 """index.store.fts_chunk - FTS5 full-text search support for chunks.
 
 Provides FTS5 virtual table management and search operations for document chunks.
-The FTS5 table uses porter stemming and unicode61 tokenizer for robust search.
+Chunks are stored in the ``chunks`` table (indexed by node_id, source_doc_id,
+dataset_name and doc_id); ``chunks_fts`` is an external-content FTS5 index over
+it, kept in sync by triggers, using porter stemming and unicode61 tokenizer.
 Supports both explicit session injection and ambient session via contextvars.
 
 Unlike the document-level FTS table, this uses string node_ids as identifiers
@@ -23,13 +25,25 @@ Example usage:
     # Or with explicit session
     manager = FTSChunkManager(session)
     manager.upsert(...)
+
+    # Searches from the query path run on pooled read-only sessions
+    with get_read_session() as session:
+        results = FTSChunkManager(session).search_with_scores("hello")
+
+    # Bulk: replace all of a document's chunks (one DELETE + executemany)
+    manager.replace_document(
+        "obsidian:notes/test.md",
+        [("abc123:0", "Hello world"), ("abc123:1", "More text")],
+    )
 """
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
 
 from agentlayer.logging import get_logger
-from sqlalchemy import Engine
+from sqlalchemy import Connection, Engine
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session
 
@@ -55,6 +69,136 @@ _HEADING_RE = re.compile(r"^#{1,6}\s+.+$", re.MULTILINE)
 # Hyphens are column-filter operators, quotes/parens are grouping, etc.
 _FTS5_SPECIAL_RE = re.compile(r'["\-*^(){}:+]')
 
+# Any character the unicode61 tokenizer keeps as part of a token.
+_TOKEN_CHAR_RE = re.compile(r"\w")
+
+# Chunk rows live in the ``chunks`` table; ``chunks_fts`` is an
+# external-content FTS5 index over it kept in sync by triggers. ``id`` is an
+# explicit INTEGER PRIMARY KEY because FTS5 addresses content rows by rowid,
+# and VACUUM may renumber implicit rowids.
+_CHUNKS_TABLE_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS chunks (
+        id INTEGER PRIMARY KEY,
+        node_id TEXT NOT NULL UNIQUE,
+        source_doc_id TEXT NOT NULL,
+        dataset_name TEXT NOT NULL,
+        doc_id INTEGER,
+        seq INTEGER NOT NULL DEFAULT 0,
+        heading TEXT NOT NULL DEFAULT '',
+        body TEXT NOT NULL DEFAULT ''
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_chunks_source_doc_id ON chunks(source_doc_id, seq)",
+    "CREATE INDEX IF NOT EXISTS ix_chunks_dataset_name ON chunks(dataset_name)",
+    "CREATE INDEX IF NOT EXISTS ix_chunks_doc_id ON chunks(doc_id)",
+)
+
+# Column order (node_id, heading, body, source_doc_id) is what bm25 weight
+# strings refer to; node_id and source_doc_id are stored but not tokenized.
+# dataset_name is tokenized so a column filter can restrict a MATCH to one
+# dataset before ranking; it always gets bm25 weight 0.
+_CHUNKS_FTS_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+        node_id UNINDEXED,
+        heading,
+        body,
+        source_doc_id UNINDEXED,
+        dataset_name,
+        content='chunks',
+        content_rowid='id',
+        tokenize='porter unicode61'
+    )
+"""
+
+_CHUNKS_TRIGGERS_DDL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+        INSERT INTO chunks_fts(rowid, node_id, heading, body, source_doc_id, dataset_name)
+        VALUES (
+            new.id, new.node_id, new.heading, new.body, new.source_doc_id, new.dataset_name
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+        INSERT INTO chunks_fts(
+            chunks_fts, rowid, node_id, heading, body, source_doc_id, dataset_name
+        )
+        VALUES (
+            'delete', old.id, old.node_id, old.heading, old.body, old.source_doc_id,
+            old.dataset_name
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chunks_au AFTER UPDATE ON chunks BEGIN
+        INSERT INTO chunks_fts(
+            chunks_fts, rowid, node_id, heading, body, source_doc_id, dataset_name
+        )
+        VALUES (
+            'delete', old.id, old.node_id, old.heading, old.body, old.source_doc_id,
+            old.dataset_name
+        );
+        INSERT INTO chunks_fts(rowid, node_id, heading, body, source_doc_id, dataset_name)
+        VALUES (
+            new.id, new.node_id, new.heading, new.body, new.source_doc_id, new.dataset_name
+        );
+    END
+    """,
+)
+
+# Copies a pre-``chunks`` database (content stored in chunks_fts itself)
+# into the chunks table. Later rows win for duplicated node_ids.
+_MIGRATE_LEGACY_SQL = """
+    INSERT OR REPLACE INTO chunks(
+        node_id, source_doc_id, dataset_name, seq, heading, body
+    )
+    SELECT
+        node_id,
+        source_doc_id,
+        substr(source_doc_id, 1, max(instr(source_doc_id, ':') - 1, 0)),
+        row_number() OVER (PARTITION BY source_doc_id ORDER BY rowid) - 1,
+        coalesce(heading_text, ''),
+        coalesce(body_text, '')
+    FROM chunks_fts
+    ORDER BY rowid
+"""
+
+# Duplicate content yields the same node_id in several documents; the
+# latest write owns the row, matching the single vector point per node_id.
+_UPSERT_CHUNK_SQL = sql_text("""
+    INSERT INTO chunks(node_id, source_doc_id, dataset_name, doc_id, seq, heading, body)
+    VALUES (:node_id, :source_doc_id, :dataset_name, :doc_id, :seq, :heading, :body)
+    ON CONFLICT(node_id) DO UPDATE SET
+        source_doc_id = excluded.source_doc_id,
+        dataset_name = excluded.dataset_name,
+        doc_id = excluded.doc_id,
+        seq = excluded.seq,
+        heading = excluded.heading,
+        body = excluded.body
+""")
+
+
+def _chunk_row(
+    node_id: str,
+    text: str,
+    source_doc_id: str,
+    seq: int,
+    doc_id: int | None = None,
+) -> dict[str, Any]:
+    """Build insert parameters for one chunk, splitting heading from body."""
+    heading, body = extract_heading_body(text)
+    return {
+        "node_id": node_id,
+        "source_doc_id": source_doc_id,
+        "dataset_name": source_doc_id.partition(":")[0],
+        "doc_id": doc_id,
+        "seq": seq,
+        "heading": heading,
+        "body": body,
+    }
+
 
 def _split_frontmatter_title(text: str) -> tuple[str, str]:
     """Extract title from YAML frontmatter and return (title, body).
@@ -172,40 +316,127 @@ class FTSChunkResult:
     score: float
 
 
+_CHUNKS_TRIGGERS = ("chunks_ai", "chunks_ad", "chunks_au")
+
+# Text columns a user query may match; excludes the dataset_name partition key.
+_TEXT_COLUMNS = "{heading body}"
+
+
+def _chunks_fts_ddl(conn: Connection) -> str | None:
+    """Return the CREATE statement of the existing chunks_fts table, if any."""
+    return conn.execute(
+        sql_text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'chunks_fts'")
+    ).scalar()
+
+
+def _dataset_match(dataset_name: str) -> str | None:
+    """Build an FTS5 column filter selecting one dataset's rows.
+
+    The filter is a phrase over the tokenized dataset name, so it can also
+    match longer names that contain the phrase (``my-vault`` vs
+    ``my-vault-2``); callers must also check the name for equality.
+
+    Args:
+        dataset_name: Dataset name.
+
+    Returns:
+        FTS5 expression, or None if the name has no indexable tokens.
+    """
+    if not _TOKEN_CHAR_RE.search(dataset_name):
+        return None
+    phrase = dataset_name.replace('"', '""')
+    return f'dataset_name : "{phrase}"'
+
+
+# Default BM25 column weights for (node_id, heading, body, source_doc_id).
+_DEFAULT_BM25_WEIGHTS = "0.0, 0.25, 1.0, 0.0"
+
+
+@lru_cache(maxsize=32)
+def _parse_bm25_weights(weights: str) -> tuple[float, float, float, float]:
+    """Parse a weights preset string into the four bound bm25() weights.
+
+    Raises:
+        ValueError: If the string does not hold exactly four numbers.
+    """
+    values = tuple(float(part) for part in weights.split(","))
+    if len(values) != 4:
+        raise ValueError(
+            f"bm25_weights needs 4 values (node_id, heading, body, source_doc_id), got {weights!r}"
+        )
+    return values  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=4)
+def _search_sql(dataset_filter: bool, prefix_filter: bool) -> str:
+    """Return the chunk search statement for a filter mode.
+
+    Column weights, MATCH expression, filters and limit are all ``?``
+    parameters (in that order), so the statement text is fixed per mode and
+    sqlite3 reuses its prepared statement across queries and weight presets.
+    The dataset_name partition column always gets weight 0.
+    """
+    conditions = ["chunks_fts MATCH ?"]
+    if dataset_filter:
+        conditions.append("dataset_name = ?")
+    if prefix_filter:
+        conditions.append("source_doc_id LIKE ?")
+    return (
+        "SELECT node_id, body, source_doc_id, bm25(chunks_fts, ?, ?, ?, ?, 0.0) AS rank "
+        f"FROM chunks_fts WHERE {' AND '.join(conditions)} ORDER BY rank LIMIT ?"
+    )
+
+
 def create_chunks_fts_table(engine: Engine) -> None:
-    """Create the chunks FTS5 virtual table if it doesn't exist.
+    """Create the chunks table and its FTS5 index if they don't exist.
 
-    Creates chunks_fts with porter stemming and unicode61 tokenizer.
-    Unlike document-level FTS which uses contentless mode with external joins,
-    chunk FTS stores content directly to enable text retrieval without joins.
+    Creates the ``chunks`` table (B-tree indexed on node_id, source_doc_id,
+    dataset_name and doc_id) and ``chunks_fts``, an external-content FTS5
+    index over it with porter stemming and unicode61 tokenizer. Triggers on
+    ``chunks`` keep the FTS index in sync, so writers only touch ``chunks``.
+
+    Databases created before the ``chunks`` table existed, where chunks_fts
+    stored the content itself, are migrated in place: rows are copied into
+    ``chunks``, the old table is dropped and the FTS index is rebuilt. An
+    index without the ``dataset_name`` column is rebuilt the same way.
 
     Args:
         engine: SQLAlchemy engine.
     """
     with engine.connect() as conn:
-        conn.execute(
-            sql_text("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
-                    node_id,
-                    heading_text,
-                    body_text,
-                    source_doc_id,
-                    tokenize='porter unicode61'
-                )
-            """)
-        )
+        for ddl in _CHUNKS_TABLE_DDL:
+            conn.execute(sql_text(ddl))
+        existing = _chunks_fts_ddl(conn)
+        migrate = existing is not None and "content='chunks'" not in existing
+        rebuild = existing is not None and "dataset_name" not in existing
+        if migrate:
+            conn.execute(sql_text(_MIGRATE_LEGACY_SQL))
+        if rebuild:
+            for trigger in _CHUNKS_TRIGGERS:
+                conn.execute(sql_text(f"DROP TRIGGER IF EXISTS {trigger}"))
+            conn.execute(sql_text("DROP TABLE chunks_fts"))
+        conn.execute(sql_text(_CHUNKS_FTS_DDL))
+        for ddl in _CHUNKS_TRIGGERS_DDL:
+            conn.execute(sql_text(ddl))
+        if rebuild:
+            conn.execute(sql_text("INSERT INTO chunks_fts(chunks_fts) VALUES('rebuild')"))
         conn.commit()
-    logger.debug("chunks_fts FTS5 table created or already exists")
+    if rebuild:
+        logger.info("Rebuilt chunks_fts as external-content index over chunks table")
+    logger.debug("chunks table and chunks_fts FTS5 index created or already exist")
 
 
 def drop_chunks_fts_table(engine: Engine) -> None:
-    """Drop the chunks FTS5 virtual table.
+    """Drop the chunks FTS5 index, its sync triggers and the chunks table.
 
     Args:
         engine: SQLAlchemy engine.
     """
     with engine.connect() as conn:
+        for trigger in _CHUNKS_TRIGGERS:
+            conn.execute(sql_text(f"DROP TRIGGER IF EXISTS {trigger}"))
         conn.execute(sql_text("DROP TABLE IF EXISTS chunks_fts"))
+        conn.execute(sql_text("DROP TABLE IF EXISTS chunks"))
         conn.commit()
     logger.debug("chunks_fts FTS5 table dropped")
 
@@ -213,8 +444,9 @@ def drop_chunks_fts_table(engine: Engine) -> None:
 class FTSChunkManager:
     """Manages FTS5 full-text search operations for document chunks.
 
-    Handles indexing, updating, deleting, and searching chunks
-    using SQLite's FTS5 virtual table.
+    Handles indexing, updating, deleting, and searching chunks. Writes and
+    lookups go to the ``chunks`` table; full-text queries go to its
+    ``chunks_fts`` FTS5 index.
 
     Unlike document-level FTS which uses integer rowids, this uses
     string node_ids as identifiers (format: `{hash}:{seq}`).
@@ -248,38 +480,91 @@ class FTSChunkManager:
         if engine is not None:
             create_chunks_fts_table(engine)  # type: ignore
 
-    def upsert(self, node_id: str, text: str, source_doc_id: str) -> None:
+    def upsert(
+        self,
+        node_id: str,
+        text: str,
+        source_doc_id: str,
+        seq: int = 0,
+        doc_id: int | None = None,
+    ) -> None:
         """Insert or update a chunk in the FTS index.
 
-        Uses DELETE then INSERT semantics since FTS5 with contentless tables
-        doesn't support UPDATE.
+        Writes the ``chunks`` row keyed by node_id; triggers update
+        ``chunks_fts``.
 
         Args:
             node_id: Canonical chunk ID (format: `{hash}:{seq}`).
             text: Chunk text content for searching.
             source_doc_id: Composite document key `{dataset_name}:{path}`.
+            seq: 0-indexed chunk sequence within the document.
+            doc_id: Catalog document ID, if known.
         """
-        heading_text, body_text = extract_heading_body(text)
-
-        # Delete existing entry if any
         self._session.execute(
-            sql_text("DELETE FROM chunks_fts WHERE node_id = :node_id"),
-            {"node_id": node_id},
+            _UPSERT_CHUNK_SQL, _chunk_row(node_id, text, source_doc_id, seq, doc_id)
         )
-        # Insert with separate heading and body columns
+
+    def upsert_many(self, chunks: Sequence[tuple[str, str, str]]) -> int:
+        """Insert or update chunks from any documents.
+
+        Writes all chunks with a single executemany upsert keyed by node_id.
+        Each chunk's ``seq`` is its position among the chunks of the same
+        source_doc_id in ``chunks``.
+
+        Args:
+            chunks: (node_id, text, source_doc_id) per chunk.
+
+        Returns:
+            Number of chunks written.
+        """
+        if not chunks:
+            return 0
+        seqs: dict[str, int] = {}
+        rows = []
+        for node_id, text, source_doc_id in chunks:
+            seq = seqs.get(source_doc_id, 0)
+            seqs[source_doc_id] = seq + 1
+            rows.append(_chunk_row(node_id, text, source_doc_id, seq))
+        self._session.execute(_UPSERT_CHUNK_SQL, rows)
+        return len(chunks)
+
+    def replace_document(
+        self,
+        source_doc_id: str,
+        chunks: Sequence[tuple[str, str]],
+        doc_id: int | None = None,
+    ) -> int:
+        """Replace every indexed chunk of a document.
+
+        Deletes the document's chunks with one indexed ``DELETE`` by
+        source_doc_id and writes the new ones with a single executemany,
+        instead of a delete and insert per chunk. Chunks previously indexed
+        for the document but absent from ``chunks`` are removed.
+
+        Only use this for documents with a unique ``source_doc_id``;
+        path-less documents share one and should use ``upsert_many``.
+
+        Args:
+            source_doc_id: Composite document key `{dataset_name}:{path}`.
+            chunks: (node_id, text) per chunk, in sequence order.
+            doc_id: Catalog document ID, if known.
+
+        Returns:
+            Number of chunks written.
+        """
         self._session.execute(
-            sql_text("""
-                INSERT INTO chunks_fts(node_id, heading_text, body_text, source_doc_id)
-                VALUES (:node_id, :heading_text, :body_text, :source_doc_id)
-            """),
-            {
-                "node_id": node_id,
-                "heading_text": heading_text,
-                "body_text": body_text,
-                "source_doc_id": source_doc_id,
-            },
+            sql_text("DELETE FROM chunks WHERE source_doc_id = :source_doc_id"),
+            {"source_doc_id": source_doc_id},
         )
-        #logger.debug(f"FTS indexed chunk {node_id} from {source_doc_id}")
+        if chunks:
+            self._session.execute(
+                _UPSERT_CHUNK_SQL,
+                [
+                    _chunk_row(node_id, text, source_doc_id, seq, doc_id)
+                    for seq, (node_id, text) in enumerate(chunks)
+                ],
+            )
+        return len(chunks)
 
     def delete(self, node_id: str) -> None:
         """Delete a chunk from the FTS index.
@@ -288,7 +573,7 @@ class FTSChunkManager:
             node_id: Chunk ID to delete.
         """
         self._session.execute(
-            sql_text("DELETE FROM chunks_fts WHERE node_id = :node_id"),
+            sql_text("DELETE FROM chunks WHERE node_id = :node_id"),
             {"node_id": node_id},
         )
         logger.debug(f"FTS deleted chunk {node_id}")
@@ -303,13 +588,50 @@ class FTSChunkManager:
             Number of chunks deleted.
         """
         result = self._session.execute(
-            sql_text("DELETE FROM chunks_fts WHERE source_doc_id = :source_doc_id"),
+            sql_text("DELETE FROM chunks WHERE source_doc_id = :source_doc_id"),
             {"source_doc_id": source_doc_id},
         )
         deleted = result.rowcount
         logger.debug(f"FTS deleted {deleted} chunks for {source_doc_id}")
         return deleted
 
+    def list_node_ids(self, source_doc_id: str) -> set[str]:
+        """List the chunk IDs currently indexed for a document.
+
+        Args:
+            source_doc_id: Composite document key `{dataset_name}:{path}`.
+
+        Returns:
+            Set of chunk node IDs.
+        """
+        result = self._session.execute(
+            sql_text("SELECT node_id FROM chunks WHERE source_doc_id = :source_doc_id"),
+            {"source_doc_id": source_doc_id},
+        )
+        return {row[0] for row in result}
+
+    def get_texts(self, node_ids: Sequence[str]) -> dict[str, str]:
+        """Look up the body text of chunks by node_id.
+
+        Args:
+            node_ids: Chunk IDs to look up.
+
+        Returns:
+            Dict mapping node_id to body text, for the IDs that exist.
+        """
+        texts: dict[str, str] = {}
+        batch_size = 500
+        for i in range(0, len(node_ids), batch_size):
+            batch = node_ids[i : i + batch_size]
+            placeholders = ", ".join(f":id{j}" for j in range(len(batch)))
+            params = {f"id{j}": id_ for j, id_ in enumerate(batch)}
+            result = self._session.execute(
+                sql_text(f"SELECT node_id, body FROM chunks WHERE node_id IN ({placeholders})"),
+                params,
+            )
+            texts.update({row[0]: row[1] for row in result})
+        return texts
+
     def delete_many(self, node_ids: list[str]) -> int:
         """Delete multiple chunks from the FTS index.
 
@@ -330,7 +652,7 @@ class FTSChunkManager:
             placeholders = ", ".join(f":id{j}" for j in range(len(batch)))
             params = {f"id{j}": id_ for j, id_ in enumerate(batch)}
             result = self._session.execute(
-                sql_text(f"DELETE FROM chunks_fts WHERE node_id IN ({placeholders})"),
+                sql_text(f"DELETE FROM chunks WHERE node_id IN ({placeholders})"),
                 params,
             )
             deleted += result.rowcount
@@ -342,85 +664,77 @@ class FTSChunkManager:
         limit: int = 100,
         source_doc_id_prefix: str | None = None,
         bm25_weights: str | None = None,
+        dataset_name: str | None = None,
     ) -> list[FTSChunkResult]:
         """Search chunks and return results with normalized scores.
 
         Normalizes BM25 scores to 0-1 range using max normalization.
 
+        Prefer ``dataset_name`` over ``source_doc_id_prefix`` for dataset
+        scoping: it is applied as an FTS5 column filter inside the MATCH, so
+        other datasets' chunks are pruned before BM25 ranking, whereas the
+        prefix is a ``LIKE`` applied to every match.
+
         Args:
             query: FTS5 search query (supports FTS5 syntax like AND, OR, NEAR).
             limit: Maximum number of results.
             source_doc_id_prefix: Optional prefix filter for source_doc_id
-                (e.g., "obsidian:" to search only obsidian documents).
+                (e.g., "obsidian:notes/" to search one folder).
             bm25_weights: Optional BM25 column weights string for
-                (node_id, heading_text, body_text, source_doc_id).
-                Defaults to "0.0, 0.25, 1.0, 0.0".
+                (node_id, heading, body, source_doc_id).
+                Defaults to "0.0, 0.25, 1.0, 0.0". Weights are bound as
+                statement parameters, so every preset shares one prepared
+                statement per filter mode.
+            dataset_name: Optional dataset to restrict the search to.
 
         Returns:
             List of FTSChunkResult objects sorted by relevance (highest score first).
         """
-        safe_query = _sanitize_fts5_query(query)
-
-        # BM25 column weights: (node_id, heading_text, body_text, source_doc_id)
-        weights = bm25_weights or "0.0, 0.25, 1.0, 0.0"
-
+        match = f"{_TEXT_COLUMNS} : ({_sanitize_fts5_query(query)})"
+        params: list[Any] = list(_parse_bm25_weights(bm25_weights or _DEFAULT_BM25_WEIGHTS))
+
+        filter_params: list[Any] = []
+        if dataset_name is not None:
+            dataset_filter = _dataset_match(dataset_name)
+            if dataset_filter is not None:
+                match = f"{dataset_filter} AND {match}"
+            filter_params.append(dataset_name)
         if source_doc_id_prefix is not None:
-            # Filter by source_doc_id prefix
-            results = self._session.execute(
-                sql_text(f"""
-                    SELECT
-                        node_id,
-                        body_text,
-                        source_doc_id,
-                        bm25(chunks_fts, {weights}) as rank
-                    FROM chunks_fts
-                    WHERE chunks_fts MATCH :query
-                    AND source_doc_id LIKE :prefix
-                    ORDER BY rank
-                    LIMIT :limit
-                """),
-                {
-                    "query": safe_query,
-                    "prefix": f"{source_doc_id_prefix}%",
-                    "limit": limit,
-                },
-            )
-        else:
-            # Search without filter
-            results = self._session.execute(
-                sql_text(f"""
-                    SELECT
-                        node_id,
-                        body_text,
-                        source_doc_id,
-                        bm25(chunks_fts, {weights}) as rank
-                    FROM chunks_fts
-                    WHERE chunks_fts MATCH :query
-                    ORDER BY rank
-                    LIMIT :limit
-                """),
-                {"query": safe_query, "limit": limit},
-            )
+            filter_params.append(f"{source_doc_id_prefix}%")
+        params.append(match)
+        params.extend(filter_params)
+        params.append(limit)
+
+        # Fixed statement text per filter mode, executed on the raw DBAPI
+        # cursor of the session's connection (same transaction) so the
+        # sqlite3 statement cache reuses the prepared statement. On the
+        # read-only pool the connections (and their caches) outlive sessions.
+        sql = _search_sql(dataset_name is not None, source_doc_id_prefix is not None)
+        cursor = self._session.connection().connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
 
-        rows = list(results)
         if not rows:
             return []
 
         # BM25 returns negative values (lower/more negative is better)
         # Convert to positive and normalize to 0-1
-        raw_scores = [-row.rank for row in rows]
+        raw_scores = [-rank for _, _, _, rank in rows]
         max_score = max(raw_scores) if raw_scores else 1.0
         if max_score == 0:
             max_score = 1.0
 
         return [
             FTSChunkResult(
-                node_id=row.node_id,
-                text=row.body_text,
-                source_doc_id=row.source_doc_id,
-                score=(-row.rank) / max_score,
+                node_id=node_id,
+                text=body,
+                source_doc_id=source_doc_id,
+                score=(-rank) / max_score,
             )
-            for row in rows
+            for node_id, body, source_doc_id, rank in rows
         ]
 
     def count(self) -> int:
@@ -429,7 +743,7 @@ class FTSChunkManager:
         Returns:
             Number of indexed chunks.
         """
-        result = self._session.execute(sql_text("SELECT COUNT(*) FROM chunks_fts"))
+        result = self._session.execute(sql_text("SELECT COUNT(*) FROM chunks"))
         count = result.scalar()
         return count or 0
 
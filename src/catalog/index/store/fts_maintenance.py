@@ -0,0 +1,321 @@
+"""index.store.fts_maintenance - FTS5 segment maintenance.
+
+Each FTS5 write transaction adds b-tree segments to an index; FTS5 merges
+them incrementally (``automerge``) and forcibly when a level grows past
+``crisismerge``. Large re-indexes leave many segments behind, and query
+latency grows with the segment count. This module:
+
+- tunes automerge/crisismerge for the duration of a bulk load, restoring
+  the FTS5 defaults afterwards
+- reports segment counts and on-disk size per FTS table
+- runs ``optimize`` (merge into one segment) when a table crosses a segment
+  threshold
+- runs ``integrity-check`` on demand
+
+Example usage:
+    from index.store.fts_maintenance import FTSMaintenance
+
+    with use_session(session):
+        maintenance = FTSMaintenance()
+        with maintenance.bulk_merge(automerge=8, crisismerge=64):
+            pipeline.run(nodes=nodes)
+        maintenance.optimize_if_needed(threshold=32)
+        print(maintenance.segment_stats("chunks_fts"))
+        print(maintenance.integrity_check("chunks_fts"))
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from agentlayer.logging import get_logger
+from sqlalchemy import text
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.orm import Session
+
+from agentlayer.session import current_session
+
+__all__ = [
+    "DEFAULT_AUTOMERGE",
+    "DEFAULT_CRISISMERGE",
+    "FTS_TABLES",
+    "FTSMaintenance",
+    "FTSSegmentStats",
+]
+
+logger = get_logger(__name__)
+
+# FTS tables managed by the index subsystem.
+FTS_TABLES: tuple[str, ...] = ("documents_fts", "chunks_fts")
+
+# FTS5 built-in defaults, restored after a bulk load.
+DEFAULT_AUTOMERGE = 4
+DEFAULT_CRISISMERGE = 16
+
+# Rowid of the structure record in the %_data shadow table.
+_STRUCTURE_ROWID = 10
+# Marker following the cookie in structure records that carry tombstone
+# and origin fields per segment (contentless_delete tables).
+_STRUCTURE_V2 = b"\xff\x00\x00\x01"
+
+
+@dataclass
+class FTSSegmentStats:
+    """Segment layout and size of one FTS5 table.
+
+    Attributes:
+        table: FTS5 table name.
+        segments: Total b-tree segments across all levels.
+        levels: Segment count per level, lowest level first.
+        pages: Rows in the ``%_data`` shadow table (leaf pages and records).
+        size_bytes: Total size of the ``%_data`` blocks.
+    """
+
+    table: str
+    segments: int
+    levels: list[int] = field(default_factory=list)
+    pages: int = 0
+    size_bytes: int = 0
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode an SQLite varint at ``pos``; returns (value, next position)."""
+    value = 0
+    for n in range(8):
+        byte = data[pos + n]
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, pos + n + 1
+    return (value << 8) | data[pos + 8], pos + 9
+
+
+def _parse_structure(record: bytes) -> tuple[int, list[int]]:
+    """Parse an FTS5 structure record into (total segments, per-level counts).
+
+    Layout: 4-byte cookie, optional V2 marker, then varints nLevel, nSegment,
+    nWriteCounter, and per level nMerge, nSeg followed by each segment's
+    fields (3 varints, or 8 in V2 records).
+    """
+    pos = 4
+    fields_per_segment = 3
+    if record[pos : pos + 4] == _STRUCTURE_V2:
+        pos += 4
+        fields_per_segment = 8
+    n_level, pos = _read_varint(record, pos)
+    n_segment, pos = _read_varint(record, pos)
+    _, pos = _read_varint(record, pos)  # write counter
+    levels: list[int] = []
+    for _ in range(n_level):
+        _, pos = _read_varint(record, pos)  # segments being merged
+        n_seg, pos = _read_varint(record, pos)
+        levels.append(n_seg)
+        for _ in range(n_seg * fields_per_segment):
+            _, pos = _read_varint(record, pos)
+    return n_segment, levels
+
+
+class FTSMaintenance:
+    """Tunes, inspects, optimizes and checks the index FTS5 tables.
+
+    Can be initialized with an explicit session or use the ambient session
+    from the current context (set via `use_session()`). Tables that do not
+    exist are skipped.
+    """
+
+    def __init__(self, session: Session | None = None) -> None:
+        """Initialize FTS maintenance.
+
+        Args:
+            session: SQLAlchemy session for database operations. If None,
+                uses the ambient session from current_session().
+        """
+        self._explicit_session = session
+
+    @property
+    def _session(self) -> Session:
+        """Get the session to use for database operations."""
+        if self._explicit_session is not None:
+            return self._explicit_session
+        return current_session()
+
+    def existing_tables(self, tables: tuple[str, ...] = FTS_TABLES) -> list[str]:
+        """Return the subset of ``tables`` present in the database."""
+        names = self._session.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table'")
+        ).scalars()
+        present = set(names)
+        return [table for table in tables if table in present]
+
+    def configure_merge(
+        self,
+        automerge: int,
+        crisismerge: int,
+        tables: tuple[str, ...] = FTS_TABLES,
+    ) -> None:
+        """Set automerge/crisismerge on each table.
+
+        The values persist in the table's ``%_config`` shadow table.
+
+        Args:
+            automerge: Segments per level merged incrementally (0 disables).
+            crisismerge: Segments per level that force a merge.
+            tables: FTS5 tables to configure.
+        """
+        for table in self.existing_tables(tables):
+            self._session.execute(
+                text(f"INSERT INTO {table}({table}, rank) VALUES ('automerge', :value)"),
+                {"value": automerge},
+            )
+            self._session.execute(
+                text(f"INSERT INTO {table}({table}, rank) VALUES ('crisismerge', :value)"),
+                {"value": crisismerge},
+            )
+
+    def merge_settings(
+        self, tables: tuple[str, ...] = FTS_TABLES
+    ) -> dict[str, tuple[int, int]]:
+        """Read the current automerge/crisismerge of each table.
+
+        Tables that never had a value set report the FTS5 defaults.
+
+        Args:
+            tables: FTS5 tables to read.
+
+        Returns:
+            Mapping of table name -> (automerge, crisismerge).
+        """
+        settings: dict[str, tuple[int, int]] = {}
+        for table in self.existing_tables(tables):
+            values = dict(
+                self._session.execute(
+                    text(
+                        f"SELECT k, v FROM {table}_config "
+                        "WHERE k IN ('automerge', 'crisismerge')"
+                    )
+                ).all()
+            )
+            settings[table] = (
+                int(values.get("automerge", DEFAULT_AUTOMERGE)),
+                int(values.get("crisismerge", DEFAULT_CRISISMERGE)),
+            )
+        return settings
+
+    @contextmanager
+    def bulk_merge(
+        self,
+        automerge: int,
+        crisismerge: int,
+        tables: tuple[str, ...] = FTS_TABLES,
+    ) -> Iterator[None]:
+        """Apply bulk-load merge settings, restoring the previous ones on exit.
+
+        Raising crisismerge keeps FTS5 from stalling a write to merge a large
+        level mid-load; the accumulated segments are merged afterwards by
+        ``optimize_if_needed``.
+
+        Args:
+            automerge: automerge during the load.
+            crisismerge: crisismerge during the load.
+            tables: FTS5 tables to configure.
+        """
+        previous = self.merge_settings(tables)
+        self.configure_merge(automerge, crisismerge, tables)
+        logger.debug(f"FTS bulk merge settings: automerge={automerge}, crisismerge={crisismerge}")
+        try:
+            yield
+        except BaseException:
+            # The session may be unusable; never mask the original error
+            try:
+                self._restore_merge(previous)
+            except Exception as e:
+                logger.warning(f"Could not restore FTS merge settings: {e}")
+            raise
+        self._restore_merge(previous)
+
+    def _restore_merge(self, settings: dict[str, tuple[int, int]]) -> None:
+        """Re-apply per-table settings read by ``merge_settings``."""
+        for table, (automerge, crisismerge) in settings.items():
+            self.configure_merge(automerge, crisismerge, (table,))
+
+    def segment_stats(self, table: str) -> FTSSegmentStats | None:
+        """Read the segment layout and size of an FTS5 table.
+
+        Args:
+            table: FTS5 table name.
+
+        Returns:
+            FTSSegmentStats, or None if the table does not exist.
+        """
+        if not self.existing_tables((table,)):
+            return None
+        record = self._session.execute(
+            text(f"SELECT block FROM {table}_data WHERE id = :id"),
+            {"id": _STRUCTURE_ROWID},
+        ).scalar()
+        segments, levels = _parse_structure(record) if record else (0, [])
+        pages, size_bytes = self._session.execute(
+            text(f"SELECT COUNT(*), COALESCE(SUM(LENGTH(block)), 0) FROM {table}_data")
+        ).one()
+        return FTSSegmentStats(
+            table=table,
+            segments=segments,
+            levels=levels,
+            pages=pages,
+            size_bytes=size_bytes,
+        )
+
+    def optimize(self, table: str) -> None:
+        """Merge all of a table's segments into one.
+
+        Args:
+            table: FTS5 table name.
+        """
+        self._session.execute(text(f"INSERT INTO {table}({table}) VALUES ('optimize')"))
+        logger.info(f"{table} optimized")
+
+    def optimize_if_needed(
+        self,
+        threshold: int,
+        tables: tuple[str, ...] = FTS_TABLES,
+    ) -> list[str]:
+        """Optimize tables whose segment count exceeds ``threshold``.
+
+        Args:
+            threshold: Segment count above which a table is optimized;
+                0 disables.
+            tables: FTS5 tables to consider.
+
+        Returns:
+            Names of the tables that were optimized.
+        """
+        if threshold <= 0:
+            return []
+        optimized: list[str] = []
+        for table in self.existing_tables(tables):
+            stats = self.segment_stats(table)
+            if stats is not None and stats.segments > threshold:
+                logger.info(f"{table} has {stats.segments} segments (> {threshold}), optimizing")
+                self.optimize(table)
+                optimized.append(table)
+        return optimized
+
+    def integrity_check(self, table: str) -> str | None:
+        """Run FTS5 ``integrity-check`` on a table.
+
+        For external-content tables the index is also checked against the
+        content table.
+
+        Args:
+            table: FTS5 table name.
+
+        Returns:
+            None if the index is consistent, otherwise the error message.
+        """
+        try:
+            with self._session.begin_nested():
+                self._session.execute(
+                    text(f"INSERT INTO {table}({table}, rank) VALUES ('integrity-check', 1)")
+                )
+        except DatabaseError as e:
+            return str(e.orig) if e.orig is not None else str(e)
+        return None
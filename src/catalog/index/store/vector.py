@@ -12,13 +12,13 @@ Example usage:
     retriever = manager.get_retriever(similarity_top_k=10)
 """
 
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
-import json
-import math
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
+import numpy as np
 import qdrant_client
 from qdrant_client.models import Distance, FieldCondition, Filter, MatchValue, VectorParams
 from agentlayer.logging import get_logger
@@ -26,6 +26,8 @@ from llama_index.core.vector_stores import SimpleVectorStore
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 
 from catalog.core.settings import get_settings
+from index.store.zvec import ZvecIndexLoader, export_simple_vector_store, matches_dataset
+from index.store.zvec_ivf import IVFIndex, IVFParams
 from agentlayer.embedding.identity import (
     EMBEDDING_BACKEND_METADATA_KEY,
     EMBEDDING_MODEL_METADATA_KEY,
@@ -49,10 +51,33 @@ logger = get_logger(__name__)
 
 
 class _ZvecClient:
-    """Local-file client for experimental Zvec semantic queries."""
+    """Local-file client for experimental Zvec semantic queries.
 
-    def __init__(self, index_path: Path) -> None:
+    Queries run against the binary, memory-mapped index maintained by
+    ``index.store.zvec``. The index is loaded once and reloaded only when
+    the JSON index file's mtime changes. Scoring is one matrix-vector
+    product per segment over pre-normalized rows, filtered by cached
+    dataset/profile masks, followed by ``argpartition`` top-k selection.
+    """
+
+    def __init__(
+        self,
+        index_path: Path,
+        collection_name: str,
+        ivf_params: IVFParams | None = None,
+        nprobe: int = 8,
+    ) -> None:
         self._index_path = index_path.expanduser()
+        self._loader = ZvecIndexLoader(
+            self._index_path,
+            collection_name=collection_name,
+            ivf_params=ivf_params,
+        )
+        self._nprobe = nprobe
+
+    def invalidate(self) -> None:
+        """Drop the cached index so the next query re-checks the disk."""
+        self._loader.invalidate()
 
     def query(
         self,
@@ -61,33 +86,102 @@ class _ZvecClient:
         top_k: int,
         dataset_name: str | None,
         embedding_identity: EmbeddingIdentity | None = None,
+        exact: bool = False,
     ) -> list["VectorQueryHit"]:
-        entries = self._load_collection_entries(collection_name=collection_name)
-        hits: list[VectorQueryHit] = []
-        for entry in entries:
-            metadata = entry["metadata"]
-            if dataset_name and not self._matches_dataset(metadata, dataset_name):
-                continue
-            if not self._matches_embedding_identity(
-                metadata=metadata,
-                embedding_identity=embedding_identity,
-            ):
+        query = np.asarray(query_vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query)) if query.size else 0.0
+        if top_k <= 0 or query_norm == 0.0:
+            return []
+        query = query / query_norm
+
+        index = self._loader.load()
+        segment_ids: list[int] = []
+        segment_rows: list[np.ndarray] = []
+        segment_scores: list[np.ndarray] = []
+        for segment_id, segment in enumerate(index.segments):
+            if segment.dim != query.shape[0] or not segment.node_ids:
                 continue
 
-            score = self._cosine_similarity(query_vector, entry["vector"])
-            if score is None:
+            mask: np.ndarray | None = None
+            if dataset_name:
+                mask = segment.dataset_mask(dataset_name)
+            if embedding_identity is not None:
+                profile_mask = segment.profile_mask(embedding_identity.profile)
+                mask = profile_mask if mask is None else mask & profile_mask
+
+            if segment.ivf is not None and not exact:
+                rows = self._ivf_candidates(segment.ivf, query, mask, top_k)
+                scores = segment.vectors[rows] @ query
+            else:
+                scores = segment.vectors @ query
+                rows = np.arange(len(segment.node_ids))
+                if mask is not None:
+                    rows = rows[mask]
+                    scores = scores[mask]
+            if rows.size == 0:
                 continue
 
+            rows, scores = self._top_k(rows, scores, top_k)
+            segment_ids.extend([segment_id] * rows.size)
+            segment_rows.append(rows)
+            segment_scores.append(scores)
+
+        if not segment_rows:
+            return []
+
+        rows = np.concatenate(segment_rows)
+        scores = np.concatenate(segment_scores)
+        owners = np.asarray(segment_ids)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+
+        hits: list[VectorQueryHit] = []
+        for position in order:
+            segment = index.segments[owners[position]]
+            row = int(rows[position])
             hits.append(
                 VectorQueryHit(
-                    node_id=entry["id"],
-                    score=score,
-                    metadata=metadata,
+                    node_id=segment.node_ids[row],
+                    score=float(scores[position]),
+                    metadata=segment.metadata[row],
                 )
             )
+        return hits
+
+    def _ivf_candidates(
+        self,
+        ivf: IVFIndex,
+        query: np.ndarray,
+        mask: np.ndarray | None,
+        top_k: int,
+    ) -> np.ndarray:
+        """Collect candidate rows from the closest IVF clusters.
 
-        hits.sort(key=lambda hit: hit.score, reverse=True)
-        return hits[:top_k]
+        Starts at ``nprobe`` clusters and doubles the probe count until the
+        filtered candidates cover ``top_k`` or every cluster was scanned, so
+        narrow dataset/profile filters do not starve the result list.
+        """
+        clusters = ivf.probe(query)
+        nprobe = self._nprobe
+        while True:
+            rows = ivf.candidate_rows(query, nprobe=nprobe, clusters=clusters)
+            if mask is not None:
+                rows = rows[mask[rows]]
+            if rows.size >= top_k or nprobe >= ivf.nlist:
+                # Sorted rows keep memory-mapped reads sequential.
+                return np.sort(rows)
+            nprobe *= 2
+
+    @staticmethod
+    def _top_k(
+        rows: np.ndarray,
+        scores: np.ndarray,
+        top_k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Select the ``top_k`` highest-scoring rows without a full sort."""
+        if scores.size <= top_k:
+            return rows, scores
+        selected = np.argpartition(scores, -top_k)[-top_k:]
+        return rows[selected], scores[selected]
 
     def get_embedding_identities(
         self,
@@ -95,10 +189,9 @@ class _ZvecClient:
         dataset_name: str | None = None,
     ) -> list[EmbeddingIdentity]:
         """Discover embedding identities from local index entry metadata."""
-        entries = self._load_collection_entries(collection_name=collection_name)
+        index = self._loader.load()
         seen: dict[str, EmbeddingIdentity] = {}
-        for entry in entries:
-            metadata = entry["metadata"]
+        for metadata in index.iter_metadata():
             if dataset_name and not self._matches_dataset(metadata, dataset_name):
                 continue
             identity = EmbeddingIdentity.from_metadata(metadata)
@@ -108,143 +201,10 @@ class _ZvecClient:
                 seen[identity.profile] = identity
         return list(seen.values())
 
-    def _load_collection_entries(self, collection_name: str) -> list[dict[str, Any]]:
-        """Load and normalize vector entries from the configured local file."""
-        if not self._index_path.exists():
-            raise FileNotFoundError(
-                f"Zvec index file does not exist: {self._index_path}"
-            )
-
-        with self._index_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-
-        raw_entries: Any = []
-        if isinstance(payload, dict):
-            embedding_dict = payload.get("embedding_dict")
-            metadata_dict = payload.get("metadata_dict")
-            if isinstance(embedding_dict, dict):
-                simple_entries: list[dict[str, Any]] = []
-                for node_id, vector in embedding_dict.items():
-                    metadata: Any = {}
-                    if isinstance(metadata_dict, dict):
-                        metadata = metadata_dict.get(node_id, {})
-                    simple_entries.append(
-                        {
-                            "id": node_id,
-                            "vector": vector,
-                            "metadata": metadata,
-                        }
-                    )
-                raw_entries = simple_entries
-            else:
-                collections = payload.get("collections")
-                if isinstance(collections, dict):
-                    raw_entries = collections.get(collection_name, [])
-                elif isinstance(payload.get("entries"), list):
-                    raw_entries = payload["entries"]
-                elif isinstance(payload.get("vectors"), list):
-                    raw_entries = payload["vectors"]
-        elif isinstance(payload, list):
-            raw_entries = payload
-
-        if not isinstance(raw_entries, list):
-            raise ValueError(
-                "Zvec index file format is invalid. Expected a list of entries or "
-                "a dict containing 'collections', 'entries', or 'vectors'."
-            )
-
-        entries: list[dict[str, Any]] = []
-        for raw_entry in raw_entries:
-            if not isinstance(raw_entry, dict):
-                continue
-
-            entry_collection = raw_entry.get("collection_name")
-            if (
-                isinstance(entry_collection, str)
-                and entry_collection
-                and entry_collection != collection_name
-            ):
-                continue
-
-            node_id = raw_entry.get("id")
-            raw_vector = raw_entry.get("vector")
-            if node_id is None or not isinstance(raw_vector, list):
-                continue
-
-            try:
-                vector = [float(value) for value in raw_vector]
-            except (TypeError, ValueError):
-                continue
-
-            metadata = raw_entry.get("metadata")
-            if not isinstance(metadata, dict):
-                metadata = {}
-
-            dataset_name = raw_entry.get("dataset_name")
-            if (
-                isinstance(dataset_name, str)
-                and dataset_name
-                and "dataset_name" not in metadata
-            ):
-                metadata = {
-                    **metadata,
-                    "dataset_name": dataset_name,
-                }
-
-            entries.append(
-                {
-                    "id": str(node_id),
-                    "vector": vector,
-                    "metadata": metadata,
-                }
-            )
-
-        return entries
-
     @staticmethod
     def _matches_dataset(metadata: dict[str, Any], dataset_name: str) -> bool:
         """Return True when metadata belongs to the requested dataset."""
-        meta_dataset = metadata.get("dataset_name")
-        if isinstance(meta_dataset, str) and meta_dataset == dataset_name:
-            return True
-
-        source_doc_id = metadata.get("source_doc_id")
-        if isinstance(source_doc_id, str):
-            return source_doc_id.startswith(f"{dataset_name}:")
-
-        return False
-
-    @staticmethod
-    def _matches_embedding_identity(
-        metadata: dict[str, Any],
-        embedding_identity: EmbeddingIdentity | None,
-    ) -> bool:
-        """Return True when metadata matches requested embedding identity filter."""
-        if embedding_identity is None:
-            return True
-
-        stored_identity = EmbeddingIdentity.from_metadata(metadata)
-        if stored_identity is None:
-            return False
-        return stored_identity.profile == embedding_identity.profile
-
-    @staticmethod
-    def _cosine_similarity(
-        left: list[float],
-        right: list[float],
-    ) -> float | None:
-        """Compute cosine similarity, returning None for invalid vectors."""
-        if not left or not right:
-            return None
-        if len(left) != len(right):
-            return None
-
-        dot = sum(a * b for a, b in zip(left, right, strict=False))
-        left_norm = math.sqrt(sum(a * a for a in left))
-        right_norm = math.sqrt(sum(b * b for b in right))
-        if left_norm == 0.0 or right_norm == 0.0:
-            return None
-        return dot / (left_norm * right_norm)
+        return matches_dataset(metadata, dataset_name)
 
 
 @dataclass(frozen=True, slots=True)
@@ -282,6 +242,15 @@ class _EmbeddingIdentityStrategy(Protocol):
     ) -> list["VectorQueryHit"]:
         """Execute vector query with backend-specific identity behavior."""
 
+    def query_many(
+        self,
+        manager: "VectorStoreManager",
+        queries: list[str],
+        top_k: int,
+        dataset_name: str | None = None,
+    ) -> list[list["VectorQueryHit"]]:
+        """Execute several vector queries, embedding them in one batch."""
+
 
 class _NativeEmbeddingIdentityStrategy:
     """No-op identity strategy for backends with native identity support."""
@@ -322,6 +291,42 @@ class _NativeEmbeddingIdentityStrategy:
         result = vector_store.query(vs_query)
         return manager._normalize_query_hits(result)
 
+    def query_many(
+        self,
+        manager: "VectorStoreManager",
+        queries: list[str],
+        top_k: int,
+        dataset_name: str | None = None,
+    ) -> list[list["VectorQueryHit"]]:
+        from agentlayer.embedding import get_query_embeddings
+        from llama_index.core.vector_stores import VectorStoreQuery
+
+        query_embeddings = get_query_embeddings(manager._get_embed_model(), queries)
+        if manager.vector_backend == "zvec":
+            return [
+                manager._query_zvec(
+                    top_k=top_k,
+                    dataset_name=dataset_name,
+                    query_embedding=query_embedding,
+                )
+                for query_embedding in query_embeddings
+            ]
+
+        vector_store = manager.get_vector_store()
+        filters = manager._build_filters(dataset_name=dataset_name)
+        return [
+            manager._normalize_query_hits(
+                vector_store.query(
+                    VectorStoreQuery(
+                        query_embedding=query_embedding,
+                        similarity_top_k=top_k,
+                        filters=filters,
+                    )
+                )
+            )
+            for query_embedding in query_embeddings
+        ]
+
 
 class _PayloadEmbeddingIdentityStrategy:
     """Payload-based strategy for backends lacking native identity support."""
@@ -352,6 +357,16 @@ class _PayloadEmbeddingIdentityStrategy:
         top_k: int,
         dataset_name: str | None = None,
     ) -> list["VectorQueryHit"]:
+        return self.query_many(manager, [query], top_k, dataset_name)[0]
+
+    def query_many(
+        self,
+        manager: "VectorStoreManager",
+        queries: list[str],
+        top_k: int,
+        dataset_name: str | None = None,
+    ) -> list[list["VectorQueryHit"]]:
+        from agentlayer.embedding import get_query_embeddings
         from llama_index.core.vector_stores import VectorStoreQuery
 
         stored_identities = manager.get_embedding_identities(dataset_name=dataset_name)
@@ -363,45 +378,49 @@ class _PayloadEmbeddingIdentityStrategy:
         )
 
         vector_store = manager.get_vector_store() if manager.vector_backend == "qdrant" else None
-        best_hits: dict[str, VectorQueryHit] = {}
+        best_hits: list[dict[str, VectorQueryHit]] = [{} for _ in queries]
         for identity in identities:
             embed_model = manager.get_embed_model_for_identity(identity)
-            query_embedding = embed_model.get_query_embedding(query)
-            if manager.vector_backend == "zvec":
-                hits = manager._query_zvec(
-                    top_k=top_k,
-                    dataset_name=dataset_name,
-                    query_embedding=query_embedding,
-                    embedding_identity=identity if use_identity_filter else None,
-                    fallback_identity=identity,
-                )
-            else:
-                if vector_store is None:
-                    raise RuntimeError("Vector store is unavailable for qdrant backend query")
-                filters = manager._build_filters(
-                    dataset_name=dataset_name,
-                    embedding_identity=identity if use_identity_filter else None,
-                )
-                vs_query = VectorStoreQuery(
-                    query_embedding=query_embedding,
-                    similarity_top_k=top_k,
-                    filters=filters,
-                )
-                result = vector_store.query(vs_query)
-                hits = manager._normalize_query_hits(
-                    result=result,
-                    fallback_identity=identity,
-                )
-            for hit in hits:
-                existing = best_hits.get(hit.node_id)
-                if existing is None or hit.score > existing.score:
-                    best_hits[hit.node_id] = hit
+            query_embeddings = get_query_embeddings(embed_model, queries)
+            for per_query, query_embedding in zip(best_hits, query_embeddings):
+                if manager.vector_backend == "zvec":
+                    hits = manager._query_zvec(
+                        top_k=top_k,
+                        dataset_name=dataset_name,
+                        query_embedding=query_embedding,
+                        embedding_identity=identity if use_identity_filter else None,
+                        fallback_identity=identity,
+                    )
+                else:
+                    if vector_store is None:
+                        raise RuntimeError("Vector store is unavailable for qdrant backend query")
+                    filters = manager._build_filters(
+                        dataset_name=dataset_name,
+                        embedding_identity=identity if use_identity_filter else None,
+                    )
+                    vs_query = VectorStoreQuery(
+                        query_embedding=query_embedding,
+                        similarity_top_k=top_k,
+                        filters=filters,
+                    )
+                    result = vector_store.query(vs_query)
+                    hits = manager._normalize_query_hits(
+                        result=result,
+                        fallback_identity=identity,
+                    )
+                for hit in hits:
+                    existing = per_query.get(hit.node_id)
+                    if existing is None or hit.score > existing.score:
+                        per_query[hit.node_id] = hit
 
-        return sorted(
-            best_hits.values(),
-            key=lambda hit: hit.score,
-            reverse=True,
-        )[:top_k]
+        return [
+            sorted(
+                per_query.values(),
+                key=lambda hit: hit.score,
+                reverse=True,
+            )[:top_k]
+            for per_query in best_hits
+        ]
 
 
 @lru_cache(maxsize=8)
@@ -437,6 +456,10 @@ class VectorStoreManager:
 
     Zvec (SimpleVectorStore-backed) is the primary backend. Qdrant remains
     available as an alternative backend selectable via settings.
+
+    One manager may be shared by pipelines running on several threads:
+    loading, changes and persists of the vector store are serialized on
+    ``lock``, which callers adding to the store directly must also hold.
     """
 
     def __init__(
@@ -480,6 +503,8 @@ class VectorStoreManager:
         self._vector_store: QdrantVectorStore | None = None
         self._zvec_vector_store: SimpleVectorStore | None = None
         self._zvec_client: _ZvecClient | None = None
+        # Reentrant: persist_vector_store() and deletes call get_vector_store()
+        self._lock = threading.RLock()
 
         logger.debug(
             f"VectorStoreManager initialized with persist_dir={self._persist_dir}"
@@ -490,6 +515,11 @@ class VectorStoreManager:
         """Get the persistence directory path."""
         return self._persist_dir
 
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock serializing changes to, and persists of, the vector store."""
+        return self._lock
+
     @property
     def capabilities(self) -> VectorBackendCapabilities:
         """Get declared capabilities for the active vector backend."""
@@ -505,9 +535,22 @@ class VectorStoreManager:
         if self._zvec_client is None:
             self._zvec_client = _ZvecClient(
                 index_path=self._zvec_settings.index_path,
+                collection_name=self._zvec_settings.collection_name,
+                ivf_params=self._get_ivf_params(),
+                nprobe=self._zvec_settings.ivf_nprobe,
             )
         return self._zvec_client
 
+    def _get_ivf_params(self) -> IVFParams | None:
+        """Return IVF build parameters when approximate Zvec search is enabled."""
+        if self._zvec_settings.index_type != "ivf":
+            return None
+        return IVFParams(
+            nlist=self._zvec_settings.ivf_nlist,
+            min_rows=self._zvec_settings.ivf_min_vectors,
+            retrain_growth=self._zvec_settings.ivf_retrain_growth,
+        )
+
     def _get_client(self) -> qdrant_client.QdrantClient:
         """Get or create the Qdrant client (lazy initialization).
 
@@ -600,6 +643,28 @@ class VectorStoreManager:
             dataset_name=dataset_name,
         )
 
+    def semantic_query_many(
+        self,
+        queries: list[str],
+        top_k: int,
+        dataset_name: str | None = None,
+    ) -> list[list["VectorQueryHit"]]:
+        """Execute several semantic queries with one batched embedding call.
+
+        Used for multi-query retrieval (original query plus expansions).
+
+        Returns:
+            One hit list per query, in input order.
+        """
+        if not queries:
+            return []
+        return self._identity_strategy.query_many(
+            self,
+            queries=queries,
+            top_k=top_k,
+            dataset_name=dataset_name,
+        )
+
     def _query_zvec(
         self,
         top_k: int,
@@ -608,8 +673,12 @@ class VectorStoreManager:
         query_embedding: list[float] | None = None,
         embedding_identity: EmbeddingIdentity | None = None,
         fallback_identity: EmbeddingIdentity | None = None,
+        exact: bool = False,
     ) -> list[VectorQueryHit]:
-        """Execute semantic query using the experimental Zvec backend."""
+        """Execute semantic query using the experimental Zvec backend.
+
+        ``exact=True`` bypasses the IVF index (used for recall comparisons).
+        """
         if query_embedding is None:
             if query is None:
                 raise ValueError("query or query_embedding is required for zvec query")
@@ -623,6 +692,7 @@ class VectorStoreManager:
             top_k=top_k,
             dataset_name=dataset_name,
             embedding_identity=embedding_identity,
+            exact=exact,
         )
         if fallback_identity is None:
             return hits
@@ -824,22 +894,23 @@ class VectorStoreManager:
         Returns:
             VectorStoreIndex ready for use.
         """
-        if self._index is not None:
-            return self._index
+        with self._lock:
+            if self._index is not None:
+                return self._index
 
-        from llama_index.core import StorageContext, VectorStoreIndex
+            from llama_index.core import StorageContext, VectorStoreIndex
 
-        vector_store = self.get_vector_store()
-        storage_context = StorageContext.from_defaults(vector_store=vector_store)
+            vector_store = self.get_vector_store()
+            storage_context = StorageContext.from_defaults(vector_store=vector_store)
 
-        self._index = VectorStoreIndex.from_vector_store(
-            vector_store=vector_store,
-            storage_context=storage_context,
-            embed_model=self._get_embed_model(),
-        )
+            self._index = VectorStoreIndex.from_vector_store(
+                vector_store=vector_store,
+                storage_context=storage_context,
+                embed_model=self._get_embed_model(),
+            )
 
-        logger.info("VectorStoreIndex created from %s", self._vector_backend)
-        return self._index
+            logger.info("VectorStoreIndex created from %s", self._vector_backend)
+            return self._index
 
     def get_vector_store(self):
         """Get or create the active backend vector store for pipeline integration.
@@ -852,23 +923,24 @@ class VectorStoreManager:
             Backend vector store instance for pipeline use.
         """
         if self._vector_backend == "zvec":
-            if self._zvec_vector_store is not None:
+            with self._lock:
+                if self._zvec_vector_store is not None:
+                    return self._zvec_vector_store
+
+                index_path = self._zvec_settings.index_path.expanduser()
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                if index_path.exists():
+                    self._zvec_vector_store = SimpleVectorStore.from_persist_path(
+                        str(index_path)
+                    )
+                    logger.info(f"SimpleVectorStore initialized for Zvec from {index_path}")
+                else:
+                    self._zvec_vector_store = SimpleVectorStore()
+                    logger.info(
+                        f"SimpleVectorStore initialized for Zvec (new index at {index_path})"
+                    )
                 return self._zvec_vector_store
 
-            index_path = self._zvec_settings.index_path.expanduser()
-            index_path.parent.mkdir(parents=True, exist_ok=True)
-            if index_path.exists():
-                self._zvec_vector_store = SimpleVectorStore.from_persist_path(
-                    str(index_path)
-                )
-                logger.info(f"SimpleVectorStore initialized for Zvec from {index_path}")
-            else:
-                self._zvec_vector_store = SimpleVectorStore()
-                logger.info(
-                    f"SimpleVectorStore initialized for Zvec (new index at {index_path})"
-                )
-            return self._zvec_vector_store
-
         if self._vector_store is not None:
             return self._vector_store
 
@@ -896,14 +968,23 @@ class VectorStoreManager:
             persist_dir: Optional override for persist target.
         """
         if self._vector_backend == "zvec":
-            vector_store = self.get_vector_store()
             persist_path = (
                 (persist_dir / "vector_store.json")
                 if persist_dir is not None
                 else self._zvec_settings.index_path.expanduser()
             )
             persist_path.parent.mkdir(parents=True, exist_ok=True)
-            vector_store.persist(str(persist_path))
+            with self._lock:
+                vector_store = self.get_vector_store()
+                vector_store.persist(str(persist_path))
+                export_simple_vector_store(
+                    vector_store.data,
+                    index_path=persist_path,
+                    collection_name=self._zvec_settings.collection_name,
+                    ivf_params=self._get_ivf_params(),
+                )
+                if self._zvec_client is not None:
+                    self._zvec_client.invalidate()
             logger.debug(f"Persisted Zvec vector store to {persist_path}")
             return
         logger.debug("Qdrant auto-persists; explicit persist_vector_store() is no-op")
@@ -930,7 +1011,8 @@ class VectorStoreManager:
             )
 
         logger.debug(f"Inserting {len(nodes)} nodes into vector store")
-        self._index.insert_nodes(nodes)
+        with self._lock:
+            self._index.insert_nodes(nodes)
         logger.info(f"Inserted {len(nodes)} nodes into vector store")
 
     def delete_nodes(self, node_ids: list[str]) -> None:
@@ -952,9 +1034,43 @@ class VectorStoreManager:
             )
 
         logger.debug(f"Deleting {len(node_ids)} nodes from vector store")
-        self._index.delete_nodes(node_ids)
+        with self._lock:
+            self._index.delete_nodes(node_ids)
         logger.info(f"Deleted {len(node_ids)} nodes from vector store")
 
+    def existing_node_ids(self, node_ids: list[str]) -> set[str]:
+        """Return the subset of node IDs that already have stored vectors.
+
+        Used by incremental indexing to skip re-embedding unchanged chunks.
+
+        Args:
+            node_ids: Candidate node IDs.
+
+        Returns:
+            Set of node IDs present in the active backend.
+        """
+        if not node_ids:
+            return set()
+
+        if self._vector_backend == "zvec":
+            embedding_dict = self.get_vector_store().data.embedding_dict
+            return {node_id for node_id in node_ids if node_id in embedding_dict}
+
+        if not self._collection_exists():
+            return set()
+        client = self._get_client()
+        found: set[str] = set()
+        batch_size = 500
+        for i in range(0, len(node_ids), batch_size):
+            points = client.retrieve(
+                collection_name=self._qdrant_settings.collection_name,
+                ids=node_ids[i : i + batch_size],
+                with_payload=False,
+                with_vectors=False,
+            )
+            found.update(str(point.id) for point in points)
+        return found
+
     def delete_ref_doc(self, ref_doc_id: str) -> None:
         """Delete all nodes associated with a reference document.
 
@@ -973,7 +1089,8 @@ class VectorStoreManager:
             )
 
         logger.debug(f"Deleting nodes for ref_doc_id: {ref_doc_id}")
-        self._index.delete_ref_doc(ref_doc_id)
+        with self._lock:
+            self._index.delete_ref_doc(ref_doc_id)
         logger.info(f"Deleted nodes for ref_doc_id: {ref_doc_id}")
 
     def delete_source_doc(self, source_doc_id: str) -> int | None:
@@ -993,7 +1110,8 @@ class VectorStoreManager:
             raise RuntimeError(
                 "No index loaded. Call load_or_create() first."
             )
-        self._index.delete_ref_doc(source_doc_id)
+        with self._lock:
+            self._index.delete_ref_doc(source_doc_id)
         return None
 
     def delete_by_dataset(self, dataset_name: str) -> int:
@@ -1012,27 +1130,27 @@ class VectorStoreManager:
 
     def _delete_by_dataset_zvec(self, dataset_name: str) -> int:
         """Delete dataset vectors from the SimpleVectorStore backing Zvec."""
-        vector_store = self.get_vector_store()
-        data = vector_store.data
+        with self._lock:
+            data = self.get_vector_store().data
 
-        node_ids_to_remove = [
-            node_id
-            for node_id, metadata in (data.metadata_dict or {}).items()
-            if _ZvecClient._matches_dataset(metadata, dataset_name)
-        ]
+            node_ids_to_remove = [
+                node_id
+                for node_id, metadata in (data.metadata_dict or {}).items()
+                if _ZvecClient._matches_dataset(metadata, dataset_name)
+            ]
 
-        if not node_ids_to_remove:
-            logger.debug(f"No vectors found for dataset '{dataset_name}'")
-            return 0
+            if not node_ids_to_remove:
+                logger.debug(f"No vectors found for dataset '{dataset_name}'")
+                return 0
 
-        for node_id in node_ids_to_remove:
-            data.embedding_dict.pop(node_id, None)
-            if data.metadata_dict:
-                data.metadata_dict.pop(node_id, None)
-            if data.text_id_to_ref_doc_id:
-                data.text_id_to_ref_doc_id.pop(node_id, None)
+            for node_id in node_ids_to_remove:
+                data.embedding_dict.pop(node_id, None)
+                if data.metadata_dict:
+                    data.metadata_dict.pop(node_id, None)
+                if data.text_id_to_ref_doc_id:
+                    data.text_id_to_ref_doc_id.pop(node_id, None)
 
-        self.persist()
+            self.persist()
         logger.info(f"Deleted {len(node_ids_to_remove)} vectors for dataset '{dataset_name}'")
         return len(node_ids_to_remove)
 
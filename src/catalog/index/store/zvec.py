@@ -0,0 +1,639 @@
+"""index.store.zvec - Binary, memory-mappable on-disk format for Zvec.
+
+The Zvec backend persists vectors through LlamaIndex's SimpleVectorStore,
+whose JSON file is expensive to parse on every query. This module keeps a
+binary companion index next to that JSON file:
+
+    <index>.zvec/<collection_name>/
+        header.json          format version, source mtime/size, segment table
+        vectors-<dim>.npy    contiguous float32 matrix of L2-normalized rows
+        ids-<dim>.txt        newline-separated node ids aligned with rows
+        metadata-<dim>.json  JSON list of metadata dicts aligned with rows
+        ivf-<dim>.npz        optional IVF centroids/assignments (ANN search)
+
+Vectors are grouped into one segment per embedding dimension so that
+collections mixing embedding profiles still yield contiguous matrices.
+Rows are normalized at write time, so cosine similarity against a
+normalized query is a single matrix-vector product. Matrices are opened
+with ``numpy.load(mmap_mode="r")`` so only the pages touched by scoring
+are read from disk.
+
+Example usage:
+    from index.store.zvec import ZvecIndexLoader
+
+    loader = ZvecIndexLoader(index_path, collection_name="catalog_vectors")
+    index = loader.load()  # cached until the JSON file's mtime changes
+    for segment in index.segments:
+        print(segment.dim, len(segment.node_ids))
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from agentlayer.embedding.identity import EmbeddingIdentity
+from agentlayer.logging import get_logger
+
+from index.store.zvec_ivf import IVFIndex, IVFParams, load_ivf, save_ivf, update_ivf
+
+if TYPE_CHECKING:
+    from llama_index.core.vector_stores.simple import SimpleVectorStoreData
+
+__all__ = [
+    "ZVEC_FORMAT_VERSION",
+    "ZvecIndex",
+    "ZvecIndexLoader",
+    "ZvecSegment",
+    "binary_index_dir",
+    "export_simple_vector_store",
+    "import_json_index",
+    "load_binary_index",
+    "matches_dataset",
+    "parse_json_entries",
+    "write_binary_index",
+]
+
+logger = get_logger(__name__)
+
+ZVEC_FORMAT_VERSION = 2
+
+_HEADER_FILE = "header.json"
+
+
+def matches_dataset(metadata: dict[str, Any], dataset_name: str) -> bool:
+    """Return True when vector metadata belongs to the requested dataset."""
+    meta_dataset = metadata.get("dataset_name")
+    if isinstance(meta_dataset, str) and meta_dataset == dataset_name:
+        return True
+
+    source_doc_id = metadata.get("source_doc_id")
+    if isinstance(source_doc_id, str):
+        return source_doc_id.startswith(f"{dataset_name}:")
+
+    return False
+
+
+@dataclass(slots=True)
+class ZvecSegment:
+    """Vectors sharing one embedding dimension.
+
+    Attributes:
+        dim: Embedding dimension of every row.
+        node_ids: Node ids aligned with matrix rows.
+        vectors: float32 matrix of shape ``(len(node_ids), dim)`` holding
+            L2-normalized rows; usually a read-only memory map.
+        metadata: Metadata dicts aligned with matrix rows.
+        ivf: Optional IVF index over the rows for approximate search.
+    """
+
+    dim: int
+    node_ids: list[str]
+    vectors: np.ndarray
+    metadata: list[dict[str, Any]]
+    ivf: IVFIndex | None = None
+    _masks: dict[tuple[str, str], np.ndarray] = field(default_factory=dict, repr=False)
+
+    def _mask(
+        self,
+        key: tuple[str, str],
+        predicate: Callable[[dict[str, Any]], bool],
+    ) -> np.ndarray:
+        """Build (once) and return a boolean row mask for ``predicate``."""
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.fromiter(
+                (predicate(metadata) for metadata in self.metadata),
+                dtype=bool,
+                count=len(self.metadata),
+            )
+            self._masks[key] = mask
+        return mask
+
+    def dataset_mask(self, dataset_name: str) -> np.ndarray:
+        """Boolean mask of rows belonging to ``dataset_name``."""
+        return self._mask(
+            ("dataset", dataset_name),
+            lambda metadata: matches_dataset(metadata, dataset_name),
+        )
+
+    def profile_mask(self, profile: str) -> np.ndarray:
+        """Boolean mask of rows embedded with the given embedding profile."""
+
+        def _matches(metadata: dict[str, Any]) -> bool:
+            identity = EmbeddingIdentity.from_metadata(metadata)
+            return identity is not None and identity.profile == profile
+
+        return self._mask(("profile", profile), _matches)
+
+
+@dataclass(slots=True)
+class ZvecIndex:
+    """In-memory view of one Zvec collection.
+
+    Attributes:
+        collection_name: Collection the index was built for.
+        segments: Per-dimension vector segments.
+        source_mtime_ns: mtime of the JSON file the index was built from.
+        source_size: Size in bytes of the JSON file the index was built from.
+    """
+
+    collection_name: str
+    segments: list[ZvecSegment] = field(default_factory=list)
+    source_mtime_ns: int | None = None
+    source_size: int | None = None
+
+    def __len__(self) -> int:
+        return sum(len(segment.node_ids) for segment in self.segments)
+
+    def iter_metadata(self):
+        """Yield metadata dicts across all segments."""
+        for segment in self.segments:
+            yield from segment.metadata
+
+
+def binary_index_dir(index_path: Path, collection_name: str) -> Path:
+    """Return the binary index directory for a JSON index file.
+
+    Args:
+        index_path: Path to the SimpleVectorStore JSON file.
+        collection_name: Zvec collection name.
+
+    Returns:
+        Directory holding the binary files for the collection.
+    """
+    index_path = index_path.expanduser()
+    return index_path.with_name(f"{index_path.stem}.zvec") / collection_name
+
+
+def parse_json_entries(payload: Any, collection_name: str) -> list[dict[str, Any]]:
+    """Normalize a Zvec JSON payload into ``{id, vector, metadata}`` entries.
+
+    Accepts the SimpleVectorStore format (``embedding_dict``/``metadata_dict``)
+    as well as the legacy ``collections``/``entries``/``vectors`` layouts and
+    a bare list of entries.
+
+    Args:
+        payload: Decoded JSON payload.
+        collection_name: Collection to select from multi-collection payloads.
+
+    Returns:
+        Normalized entries with float vectors and dict metadata.
+
+    Raises:
+        ValueError: If the payload does not contain a list of entries.
+    """
+    raw_entries: Any = []
+    if isinstance(payload, dict):
+        embedding_dict = payload.get("embedding_dict")
+        metadata_dict = payload.get("metadata_dict")
+        if isinstance(embedding_dict, dict):
+            simple_entries: list[dict[str, Any]] = []
+            for node_id, vector in embedding_dict.items():
+                metadata: Any = {}
+                if isinstance(metadata_dict, dict):
+                    metadata = metadata_dict.get(node_id, {})
+                simple_entries.append(
+                    {
+                        "id": node_id,
+                        "vector": vector,
+                        "metadata": metadata,
+                    }
+                )
+            raw_entries = simple_entries
+        else:
+            collections = payload.get("collections")
+            if isinstance(collections, dict):
+                raw_entries = collections.get(collection_name, [])
+            elif isinstance(payload.get("entries"), list):
+                raw_entries = payload["entries"]
+            elif isinstance(payload.get("vectors"), list):
+                raw_entries = payload["vectors"]
+    elif isinstance(payload, list):
+        raw_entries = payload
+
+    if not isinstance(raw_entries, list):
+        raise ValueError(
+            "Zvec index file format is invalid. Expected a list of entries or "
+            "a dict containing 'collections', 'entries', or 'vectors'."
+        )
+
+    entries: list[dict[str, Any]] = []
+    for raw_entry in raw_entries:
+        if not isinstance(raw_entry, dict):
+            continue
+
+        entry_collection = raw_entry.get("collection_name")
+        if (
+            isinstance(entry_collection, str)
+            and entry_collection
+            and entry_collection != collection_name
+        ):
+            continue
+
+        node_id = raw_entry.get("id")
+        raw_vector = raw_entry.get("vector")
+        if node_id is None or not isinstance(raw_vector, list):
+            continue
+
+        try:
+            vector = [float(value) for value in raw_vector]
+        except (TypeError, ValueError):
+            continue
+
+        metadata = raw_entry.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+
+        dataset_name = raw_entry.get("dataset_name")
+        if (
+            isinstance(dataset_name, str)
+            and dataset_name
+            and "dataset_name" not in metadata
+        ):
+            metadata = {
+                **metadata,
+                "dataset_name": dataset_name,
+            }
+
+        entries.append(
+            {
+                "id": str(node_id),
+                "vector": vector,
+                "metadata": metadata,
+            }
+        )
+
+    return entries
+
+
+def _build_segments(entries: list[dict[str, Any]]) -> list[ZvecSegment]:
+    """Group entries into per-dimension segments of L2-normalized rows.
+
+    Zero-norm vectors have no defined cosine similarity and are dropped.
+    """
+    grouped: dict[int, tuple[list[str], list[list[float]], list[dict[str, Any]]]] = {}
+    for entry in entries:
+        vector = entry["vector"]
+        if not vector:
+            continue
+        ids, rows, metadata = grouped.setdefault(len(vector), ([], [], []))
+        ids.append(entry["id"])
+        rows.append(vector)
+        metadata.append(entry["metadata"])
+
+    segments: list[ZvecSegment] = []
+    for dim, (ids, rows, metadata) in sorted(grouped.items()):
+        matrix = np.asarray(rows, dtype=np.float32).reshape(len(ids), dim)
+        norms = np.linalg.norm(matrix, axis=1)
+        keep = norms > 0.0
+        if not keep.all():
+            ids = [node_id for node_id, kept in zip(ids, keep) if kept]
+            metadata = [meta for meta, kept in zip(metadata, keep) if kept]
+            matrix = matrix[keep]
+            norms = norms[keep]
+        if not ids:
+            continue
+        segments.append(
+            ZvecSegment(
+                dim=dim,
+                node_ids=ids,
+                vectors=matrix / norms[:, np.newaxis],
+                metadata=metadata,
+            )
+        )
+    return segments
+
+
+def _replace_file(path: Path, write) -> None:
+    """Write a file through a temporary sibling and atomically replace it."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def write_binary_index(
+    directory: Path,
+    index: ZvecIndex,
+) -> None:
+    """Write a Zvec index to its binary on-disk layout.
+
+    The header is written last, so a reader never observes a header that
+    references partially written segment files.
+
+    Args:
+        directory: Target collection directory (see ``binary_index_dir``).
+        index: Index to persist.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    segment_table: list[dict[str, Any]] = []
+    for segment in index.segments:
+        vectors_name = f"vectors-{segment.dim}.npy"
+        ids_name = f"ids-{segment.dim}.txt"
+        metadata_name = f"metadata-{segment.dim}.json"
+        matrix = np.ascontiguousarray(segment.vectors, dtype=np.float32)
+
+        def _write_vectors(tmp: Path, matrix=matrix) -> None:
+            with tmp.open("wb") as handle:
+                np.save(handle, matrix, allow_pickle=False)
+
+        def _write_ids(tmp: Path, ids=segment.node_ids) -> None:
+            tmp.write_text("\n".join(ids), encoding="utf-8")
+
+        def _write_metadata(tmp: Path, metadata=segment.metadata) -> None:
+            with tmp.open("w", encoding="utf-8") as handle:
+                json.dump(metadata, handle, separators=(",", ":"))
+
+        _replace_file(directory / vectors_name, _write_vectors)
+        _replace_file(directory / ids_name, _write_ids)
+        _replace_file(directory / metadata_name, _write_metadata)
+        segment_entry: dict[str, Any] = {
+            "dim": segment.dim,
+            "count": len(segment.node_ids),
+            "vectors": vectors_name,
+            "ids": ids_name,
+            "metadata": metadata_name,
+        }
+        if segment.ivf is not None:
+            ivf_name = f"ivf-{segment.dim}.npz"
+            _replace_file(
+                directory / ivf_name,
+                lambda tmp, ivf=segment.ivf: save_ivf(tmp, ivf),
+            )
+            segment_entry["ivf"] = ivf_name
+        segment_table.append(segment_entry)
+
+    header = {
+        "format": "zvec",
+        "version": ZVEC_FORMAT_VERSION,
+        "collection_name": index.collection_name,
+        "source_mtime_ns": index.source_mtime_ns,
+        "source_size": index.source_size,
+        "segments": segment_table,
+    }
+    _replace_file(
+        directory / _HEADER_FILE,
+        lambda tmp: tmp.write_text(json.dumps(header, indent=2), encoding="utf-8"),
+    )
+    logger.debug(
+        f"Wrote Zvec binary index ({len(index)} vectors, "
+        f"{len(segment_table)} segments) to {directory}"
+    )
+
+
+def _read_header(directory: Path) -> dict[str, Any] | None:
+    """Read a binary index header, returning None when absent or unreadable."""
+    header_path = directory / _HEADER_FILE
+    if not header_path.exists():
+        return None
+    try:
+        header = json.loads(header_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(header, dict)
+        or header.get("format") != "zvec"
+        or header.get("version") != ZVEC_FORMAT_VERSION
+    ):
+        return None
+    return header
+
+
+def load_binary_index(directory: Path, mmap: bool = True) -> ZvecIndex | None:
+    """Load a binary Zvec index.
+
+    Args:
+        directory: Collection directory (see ``binary_index_dir``).
+        mmap: Memory-map vector matrices instead of reading them eagerly.
+
+    Returns:
+        Loaded index, or None if no valid binary index exists.
+    """
+    header = _read_header(directory)
+    if header is None:
+        return None
+
+    segments: list[ZvecSegment] = []
+    try:
+        for entry in header["segments"]:
+            vectors = np.load(
+                directory / entry["vectors"],
+                mmap_mode="r" if mmap else None,
+                allow_pickle=False,
+            )
+            ids_text = (directory / entry["ids"]).read_text(encoding="utf-8")
+            node_ids = ids_text.split("\n") if ids_text else []
+            with (directory / entry["metadata"]).open("r", encoding="utf-8") as handle:
+                metadata = json.load(handle)
+            count = int(entry["count"])
+            if vectors.shape != (count, int(entry["dim"])) or len(node_ids) != count:
+                logger.warning(f"Zvec binary index at {directory} is inconsistent; ignoring")
+                return None
+            ivf = None
+            if entry.get("ivf"):
+                ivf = load_ivf(directory / entry["ivf"])
+                if ivf.assignments.shape[0] != count:
+                    logger.warning(f"Zvec IVF index at {directory} is stale; using exact search")
+                    ivf = None
+            segments.append(
+                ZvecSegment(
+                    dim=int(entry["dim"]),
+                    node_ids=node_ids,
+                    vectors=vectors,
+                    metadata=metadata,
+                    ivf=ivf,
+                )
+            )
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning(f"Failed to load Zvec binary index at {directory}: {exc}")
+        return None
+
+    return ZvecIndex(
+        collection_name=header.get("collection_name", ""),
+        segments=segments,
+        source_mtime_ns=header.get("source_mtime_ns"),
+        source_size=header.get("source_size"),
+    )
+
+
+def _attach_ivf(
+    index: ZvecIndex,
+    previous: ZvecIndex | None,
+    params: IVFParams | None,
+) -> None:
+    """Build or carry forward IVF indexes for segments large enough to need one.
+
+    Segments smaller than ``params.min_rows`` keep exact search only.
+    """
+    if params is None:
+        return
+    previous_segments = {
+        segment.dim: segment for segment in (previous.segments if previous else [])
+    }
+    for segment in index.segments:
+        if len(segment.node_ids) < params.min_rows:
+            continue
+        prior = previous_segments.get(segment.dim)
+        segment.ivf = update_ivf(
+            previous=prior.ivf if prior is not None else None,
+            previous_ids=prior.node_ids if prior is not None else [],
+            vectors=segment.vectors,
+            node_ids=segment.node_ids,
+            params=params,
+        )
+
+
+def import_json_index(
+    index_path: Path,
+    collection_name: str,
+    directory: Path | None = None,
+    ivf_params: IVFParams | None = None,
+) -> ZvecIndex:
+    """Convert a Zvec JSON index file into the binary layout.
+
+    Args:
+        index_path: SimpleVectorStore (or legacy) JSON file.
+        collection_name: Collection to import.
+        directory: Target directory; defaults to ``binary_index_dir``.
+        ivf_params: Build IVF indexes with these parameters when set.
+
+    Returns:
+        The imported index, backed by the freshly written memory maps.
+    """
+    index_path = index_path.expanduser()
+    stat = index_path.stat()
+    with index_path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+
+    directory = directory or binary_index_dir(index_path, collection_name)
+    index = ZvecIndex(
+        collection_name=collection_name,
+        segments=_build_segments(parse_json_entries(payload, collection_name)),
+        source_mtime_ns=stat.st_mtime_ns,
+        source_size=stat.st_size,
+    )
+    _attach_ivf(index, load_binary_index(directory), ivf_params)
+    write_binary_index(directory, index)
+    logger.info(f"Imported {len(index)} Zvec vectors from {index_path} into {directory}")
+    return load_binary_index(directory) or index
+
+
+def export_simple_vector_store(
+    data: "SimpleVectorStoreData",
+    index_path: Path,
+    collection_name: str,
+    ivf_params: IVFParams | None = None,
+) -> None:
+    """Write the binary index directly from in-memory SimpleVectorStore data.
+
+    Called right after the JSON file is persisted so the binary index is
+    stamped with that file's mtime and the next query skips the JSON import.
+    When ``ivf_params`` is set, IVF indexes from the previous binary index
+    are carried forward so only newly added rows are assigned to clusters.
+
+    Args:
+        data: SimpleVectorStore data that was just persisted.
+        index_path: Path the JSON file was persisted to.
+        collection_name: Zvec collection name.
+        ivf_params: Build IVF indexes with these parameters when set.
+    """
+    index_path = index_path.expanduser()
+    stat = index_path.stat()
+    metadata_dict = data.metadata_dict or {}
+    entries = [
+        {
+            "id": str(node_id),
+            "vector": vector,
+            "metadata": metadata_dict.get(node_id) or {},
+        }
+        for node_id, vector in data.embedding_dict.items()
+        if vector
+    ]
+    directory = binary_index_dir(index_path, collection_name)
+    index = ZvecIndex(
+        collection_name=collection_name,
+        segments=_build_segments(entries),
+        source_mtime_ns=stat.st_mtime_ns,
+        source_size=stat.st_size,
+    )
+    _attach_ivf(index, load_binary_index(directory), ivf_params)
+    write_binary_index(directory, index)
+
+
+class ZvecIndexLoader:
+    """Loads a Zvec collection once and reloads it when the JSON file changes.
+
+    The JSON file written by ``VectorStoreManager.persist_vector_store`` is
+    the source of truth. Its mtime and size are compared against the values
+    stamped into the binary header; a mismatch triggers a re-import.
+    """
+
+    def __init__(
+        self,
+        index_path: Path,
+        collection_name: str,
+        ivf_params: IVFParams | None = None,
+    ) -> None:
+        self._index_path = index_path.expanduser()
+        self._collection_name = collection_name
+        self._ivf_params = ivf_params
+        self._directory = binary_index_dir(self._index_path, collection_name)
+        self._index: ZvecIndex | None = None
+        self._loaded_stamp: tuple[int, int] | None = None
+
+    @property
+    def directory(self) -> Path:
+        """Binary index directory for this collection."""
+        return self._directory
+
+    def invalidate(self) -> None:
+        """Drop the cached index so the next ``load`` re-checks the disk."""
+        self._index = None
+        self._loaded_stamp = None
+
+    def load(self) -> ZvecIndex:
+        """Return the cached index, reloading if the JSON file changed.
+
+        Raises:
+            FileNotFoundError: If neither the JSON file nor a binary index exist.
+        """
+        if not self._index_path.exists():
+            if self._index is not None and self._loaded_stamp is None:
+                return self._index
+            index = load_binary_index(self._directory)
+            if index is None:
+                raise FileNotFoundError(
+                    f"Zvec index file does not exist: {self._index_path}"
+                )
+            self._index = index
+            self._loaded_stamp = None
+            return index
+
+        stat = self._index_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._index is not None and self._loaded_stamp == stamp:
+            return self._index
+
+        index = load_binary_index(self._directory)
+        if (
+            index is None
+            or index.collection_name != self._collection_name
+            or (index.source_mtime_ns, index.source_size) != stamp
+        ):
+            index = import_json_index(
+                self._index_path,
+                collection_name=self._collection_name,
+                directory=self._directory,
+                ivf_params=self._ivf_params,
+            )
+        else:
+            logger.debug(f"Loaded Zvec binary index from {self._directory}")
+
+        self._index = index
+        self._loaded_stamp = stamp
+        return index
@@ -0,0 +1,249 @@
+"""index.store.zvec_ivf - Inverted-file (IVF) ANN index for Zvec segments.
+
+Partitions a segment's normalized rows into ``nlist`` clusters with
+spherical k-means. A query scores only the rows in the ``nprobe`` clusters
+whose centroids are closest to it, trading a little recall for latency
+that grows with ``n / nlist * nprobe`` instead of ``n``.
+
+The index is maintained incrementally: when a segment is re-exported,
+rows whose node ids were already assigned keep their cluster, and only new
+rows are assigned to the existing centroids. Centroids are retrained once
+the segment has grown past ``retrain_growth`` times its size at training.
+
+Example usage:
+    from index.store.zvec_ivf import IVFParams, build_ivf
+
+    ivf = build_ivf(segment.vectors, IVFParams(nlist=256))
+    rows = ivf.candidate_rows(query, nprobe=16)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from agentlayer.logging import get_logger
+
+__all__ = [
+    "IVFIndex",
+    "IVFParams",
+    "build_ivf",
+    "load_ivf",
+    "save_ivf",
+    "update_ivf",
+]
+
+logger = get_logger(__name__)
+
+# Rows scored per block when assigning rows to centroids; bounds temporary
+# memory to ``_ASSIGN_BLOCK * nlist`` floats.
+_ASSIGN_BLOCK = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class IVFParams:
+    """Build-time IVF parameters.
+
+    Attributes:
+        nlist: Number of clusters; 0 picks ``sqrt(n)`` automatically.
+        min_rows: Segments with fewer rows skip IVF and use exact search.
+        train_iterations: k-means iterations at (re)training.
+        train_sample: Maximum rows sampled for training.
+        retrain_growth: Retrain centroids when the segment grows past this
+            multiple of its size at the last training.
+        seed: RNG seed so builds are reproducible.
+    """
+
+    nlist: int = 0
+    min_rows: int = 4096
+    train_iterations: int = 10
+    train_sample: int = 65536
+    retrain_growth: float = 2.0
+    seed: int = 0
+
+    def resolve_nlist(self, count: int) -> int:
+        """Return the effective cluster count for ``count`` rows."""
+        nlist = self.nlist or int(math.sqrt(count))
+        return max(1, min(nlist, count))
+
+
+@dataclass(slots=True)
+class IVFIndex:
+    """Cluster centroids plus inverted lists over segment rows.
+
+    Attributes:
+        centroids: float32 matrix ``(nlist, dim)`` of unit-length centroids.
+        assignments: int32 cluster id per segment row.
+        trained_count: Segment size when centroids were last trained.
+    """
+
+    centroids: np.ndarray
+    assignments: np.ndarray
+    trained_count: int
+    _order: np.ndarray | None = None
+    _offsets: np.ndarray | None = None
+
+    @property
+    def nlist(self) -> int:
+        """Number of clusters."""
+        return int(self.centroids.shape[0])
+
+    def _inverted_lists(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return rows sorted by cluster and per-cluster offsets (built once)."""
+        if self._order is None or self._offsets is None:
+            self._order = np.argsort(self.assignments, kind="stable").astype(np.int64)
+            counts = np.bincount(self.assignments, minlength=self.nlist)
+            self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        return self._order, self._offsets
+
+    def probe(self, query: np.ndarray) -> np.ndarray:
+        """Return cluster ids ordered from closest to farthest from ``query``."""
+        return np.argsort(-(self.centroids @ query), kind="stable")
+
+    def candidate_rows(
+        self,
+        query: np.ndarray,
+        nprobe: int,
+        clusters: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return row indices in the ``nprobe`` closest clusters.
+
+        Args:
+            query: Normalized query vector.
+            nprobe: Number of clusters to scan.
+            clusters: Optional precomputed ``probe(query)`` ordering.
+        """
+        order, offsets = self._inverted_lists()
+        if clusters is None:
+            clusters = self.probe(query)
+        selected = clusters[: max(1, nprobe)]
+        parts = [order[offsets[c] : offsets[c + 1]] for c in selected]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign each row to its most similar centroid, in bounded blocks."""
+    assignments = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], _ASSIGN_BLOCK):
+        block = np.asarray(vectors[start : start + _ASSIGN_BLOCK], dtype=np.float32)
+        assignments[start : start + block.shape[0]] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+def _train_centroids(vectors: np.ndarray, params: IVFParams) -> np.ndarray:
+    """Train unit-length centroids with spherical k-means on a row sample."""
+    count = vectors.shape[0]
+    nlist = params.resolve_nlist(count)
+    rng = np.random.default_rng(params.seed)
+    sample_size = min(count, max(params.train_sample, nlist))
+    sample_rows = np.sort(rng.choice(count, size=sample_size, replace=False))
+    sample = np.asarray(vectors[sample_rows], dtype=np.float32)
+
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+    for _ in range(params.train_iterations):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        empty = np.bincount(labels, minlength=nlist) == 0
+        if empty.any():
+            # Re-seed empty clusters from random sample rows.
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+        centroids = _normalize_rows(sums).astype(np.float32)
+    return centroids
+
+
+def build_ivf(vectors: np.ndarray, params: IVFParams) -> IVFIndex:
+    """Train centroids and assign every row of ``vectors``.
+
+    Args:
+        vectors: Normalized float32 matrix (may be a memory map).
+        params: Build parameters.
+    """
+    centroids = _train_centroids(vectors, params)
+    assignments = _assign(vectors, centroids)
+    logger.debug(f"Built IVF index: rows={vectors.shape[0]}, nlist={centroids.shape[0]}")
+    return IVFIndex(
+        centroids=centroids,
+        assignments=assignments,
+        trained_count=int(vectors.shape[0]),
+    )
+
+
+def update_ivf(
+    previous: IVFIndex | None,
+    previous_ids: list[str],
+    vectors: np.ndarray,
+    node_ids: list[str],
+    params: IVFParams,
+) -> IVFIndex:
+    """Carry an IVF index forward to a new version of its segment.
+
+    Rows whose node id existed before keep their cluster; new rows are
+    assigned to the existing centroids. Falls back to a full build when
+    there is no previous index, its dimension differs, or the segment has
+    outgrown ``params.retrain_growth``.
+
+    Args:
+        previous: IVF index of the previous segment version, if any.
+        previous_ids: Node ids aligned with ``previous.assignments``.
+        vectors: New normalized segment matrix.
+        node_ids: Node ids aligned with ``vectors`` rows.
+        params: Build parameters.
+    """
+    if (
+        previous is None
+        or previous.centroids.shape[1] != vectors.shape[1]
+        or previous.nlist != params.resolve_nlist(previous.trained_count)
+        or len(node_ids) > previous.trained_count * params.retrain_growth
+    ):
+        return build_ivf(vectors, params)
+
+    known = dict(zip(previous_ids, previous.assignments.tolist()))
+    assignments = np.fromiter(
+        (known.get(node_id, -1) for node_id in node_ids),
+        dtype=np.int32,
+        count=len(node_ids),
+    )
+    new_rows = np.flatnonzero(assignments < 0)
+    if new_rows.size:
+        assignments[new_rows] = _assign(vectors[new_rows], previous.centroids)
+    logger.debug(
+        f"Updated IVF index incrementally: rows={len(node_ids)}, assigned={new_rows.size}"
+    )
+    return IVFIndex(
+        centroids=previous.centroids,
+        assignments=assignments,
+        trained_count=previous.trained_count,
+    )
+
+
+def save_ivf(path: Path, ivf: IVFIndex) -> None:
+    """Write an IVF index to an ``.npz`` file."""
+    with path.open("wb") as handle:
+        np.savez(
+            handle,
+            centroids=ivf.centroids,
+            assignments=ivf.assignments,
+            trained_count=np.asarray(ivf.trained_count, dtype=np.int64),
+        )
+
+
+def load_ivf(path: Path) -> IVFIndex:
+    """Read an IVF index written by ``save_ivf``."""
+    with np.load(path, allow_pickle=False) as data:
+        return IVFIndex(
+            centroids=data["centroids"].astype(np.float32, copy=False),
+            assignments=data["assignments"].astype(np.int32, copy=False),
+            trained_count=int(data["trained_count"]),
+        )
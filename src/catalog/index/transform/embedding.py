@@ -37,6 +37,11 @@ class EmbeddingPrefixTransform(TransformComponent):
     The prefix template supports {title} substitution from node metadata.
     If no title is found in metadata, an empty string is used.
 
+    Node metadata is excluded from the embedding input, so the model embeds
+    exactly the prefixed text. This keeps the Nomic-style format intact and
+    makes the text (and hence the embedding cache key) independent of
+    path-dependent metadata such as ``source_doc_id``.
+
     Attributes:
         prefix_template: Template string with optional {title} placeholder.
             Defaults to the value from settings.rag.embed_prefix_doc.
@@ -74,6 +79,7 @@ class EmbeddingPrefixTransform(TransformComponent):
         2. Formats the prefix template with the title
         3. Stores original text in metadata["original_text"]
         4. Prepends the formatted prefix to node text
+        5. Excludes all metadata keys from the embedding input
 
         Args:
             nodes: List of nodes to transform.
@@ -98,6 +104,9 @@ class EmbeddingPrefixTransform(TransformComponent):
             # Apply prefix to text
             node.set_content(prefix + original_text)
 
+            # Embed the prefixed text only, not the metadata header
+            node.excluded_embed_metadata_keys = list(node.metadata)
+
         return nodes
 
 
@@ -142,9 +151,14 @@ class EmbeddingIdentityTransform(TransformComponent):
             model_name=self.model_name,
         )
 
+        identity_metadata = identity.to_metadata()
         for node in nodes:
             if node.metadata is None:
                 node.metadata = {}
-            node.metadata.update(identity.to_metadata())
+            node.metadata.update(identity_metadata)
+            # Identity is payload for filtering, not embedding input
+            for key in identity_metadata:
+                if key not in node.excluded_embed_metadata_keys:
+                    node.excluded_embed_metadata_keys.append(key)
 
         return nodes
@@ -2,7 +2,9 @@
 
 Provides LlamaIndex-compatible transform components for the index pipeline:
 - DocumentFTSTransform: indexes nodes in FTS5
-- ChunkPersistenceTransform: persists chunks to FTS with metadata assignment
+- ChunkPersistenceTransform: persists chunks to FTS with metadata assignment,
+  diffing chunk IDs per document so only stale chunks are deleted and only
+  new chunks are passed on for embedding
 
 Example usage:
     from index.transform.llama import DocumentFTSTransform, ChunkPersistenceTransform
@@ -11,14 +13,17 @@ Example usage:
 import hashlib
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 from agentlayer.logging import get_logger
 from llama_index.core.schema import BaseNode, TransformComponent
 
 from index.store.fts import FTSManager
 from index.store.fts_chunk import FTSChunkManager, extract_heading_body
-from agentlayer.session import session_or_new
+from agentlayer.session import current_session, session_or_new
+
+if TYPE_CHECKING:
+    from index.store.vector import VectorStoreManager
 
 __all__ = [
     "DocumentFTSTransform",
@@ -184,7 +189,8 @@ class ChunkPersistenceStats:
     Attributes:
         created: Number of new chunks created in FTS index.
         updated: Number of existing chunks updated.
-        skipped: Number of unchanged chunks skipped (currently unused).
+        skipped: Number of unchanged chunks reused without re-embedding.
+        deleted: Number of stale chunks removed for re-chunked documents.
         failed: Number of chunks that failed to process.
         errors: List of error messages for failed chunks.
     """
@@ -192,6 +198,7 @@ class ChunkPersistenceStats:
     created: int = 0
     updated: int = 0
     skipped: int = 0
+    deleted: int = 0
     failed: int = 0
     errors: list[str] = field(default_factory=list)
 
@@ -205,6 +212,7 @@ class ChunkPersistenceStats:
         self.created = 0
         self.updated = 0
         self.skipped = 0
+        self.deleted = 0
         self.failed = 0
         self.errors = []
 
@@ -215,14 +223,25 @@ class ChunkPersistenceTransform(TransformComponent):
     This transform handles chunk persistence after MarkdownNodeParser:
     1. Assigns stable node IDs in format `{content_hash}:{chunk_seq}`
     2. Sets metadata fields (source_doc_id, doc_id, chunk_seq, chunk_pos)
-    3. Upserts chunks to FTSChunkManager (chunks_fts table)
-    4. Tracks statistics (created, updated, skipped, failed)
+    3. Diffs the new chunk IDs against those already indexed for the
+       document and deletes stale chunks (FTS and, if a vector manager is
+       given, vectors)
+    4. Writes each document's chunks to FTSChunkManager (chunks table,
+       indexed by chunks_fts) in bulk: one delete by source_doc_id, then one
+       executemany insert
+    5. Tracks statistics (created, skipped, deleted, failed)
+
+    For documents listed in ``reuse_paths``, chunks whose ID is already
+    indexed (and present in the vector store, when a vector manager is
+    given) are dropped from the output so they are not re-embedded. The
+    index pipeline only lists documents whose previous index used the same
+    chunking/embedding configuration.
 
     The transform uses the ambient session from the current context (set via
     `use_session()`). Statistics are available via the `stats` property.
 
     Attributes:
-        stats: ChunkPersistenceStats with counts of created/updated/skipped/failed.
+        stats: ChunkPersistenceStats with counts of created/skipped/deleted/failed.
     """
 
     # Private attributes (not Pydantic fields)
@@ -231,6 +250,8 @@ class ChunkPersistenceTransform(TransformComponent):
     _doc_id_key: str = "doc_id"
     _content_hash_key: str = "content_hash"
     _stats: ChunkPersistenceStats | None = None
+    _vector_manager: "VectorStoreManager | None" = None
+    _reuse_paths: frozenset[str] = frozenset()
 
     def __init__(
         self,
@@ -239,6 +260,8 @@ class ChunkPersistenceTransform(TransformComponent):
         path_key: str = "relative_path",
         doc_id_key: str = "doc_id",
         content_hash_key: str = "content_hash",
+        vector_manager: "VectorStoreManager | None" = None,
+        reuse_paths: Iterable[str] | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the chunk persistence transform.
@@ -248,6 +271,10 @@ class ChunkPersistenceTransform(TransformComponent):
             path_key: Metadata key for the document path (default: "relative_path").
             doc_id_key: Metadata key for the document ID (default: "doc_id").
             content_hash_key: Metadata key for content hash (default: "content_hash").
+            vector_manager: Optional vector manager used to delete stale
+                chunk vectors and to confirm reused chunks still have vectors.
+            reuse_paths: Document paths whose already-indexed chunks may be
+                reused without re-embedding.
             **kwargs: Additional arguments passed to TransformComponent.
         """
         super().__init__(**kwargs)
@@ -256,6 +283,8 @@ class ChunkPersistenceTransform(TransformComponent):
         self._doc_id_key = doc_id_key
         self._content_hash_key = content_hash_key
         self._stats = ChunkPersistenceStats()
+        self._vector_manager = vector_manager
+        self._reuse_paths = frozenset(reuse_paths or ())
 
     @property
     def stats(self) -> ChunkPersistenceStats:
@@ -271,10 +300,12 @@ class ChunkPersistenceTransform(TransformComponent):
     ) -> list[BaseNode]:
         """Persist each chunk to the FTS index.
 
-        For each node:
-        - Assigns stable node ID as `{content_hash}:{chunk_seq}`
+        For each document's chunks:
+        - Assigns stable node IDs as `{content_hash}:{chunk_seq}`
         - Sets metadata fields (source_doc_id, doc_id, chunk_seq, chunk_pos)
-        - Upserts to FTSChunkManager
+        - Deletes previously indexed chunks whose IDs are no longer produced
+        - Rewrites the document's chunks in FTS with one bulk write;
+          reusable chunks are not returned for embedding
         - Tracks statistics
 
         Uses `session_or_new()`: the ambient session if set, otherwise a
@@ -285,7 +316,8 @@ class ChunkPersistenceTransform(TransformComponent):
             **kwargs: Additional arguments (unused).
 
         Returns:
-            The same nodes with assigned IDs and metadata (pass-through).
+            The chunks that need embedding, with assigned IDs and metadata.
+            Reused and failed chunks are omitted.
 
         Raises:
             SessionNotSetError: If no ambient session is set and
@@ -310,26 +342,109 @@ class ChunkPersistenceTransform(TransformComponent):
                 doc_chunks[source_key].append(node)
 
             # Process nodes grouped by document
-            for source_key, chunk_nodes in doc_chunks.items():
-                for chunk_seq, node in enumerate(chunk_nodes):
-                    try:
-                        self._process_chunk(
-                            fts_chunk=fts_chunk,
-                            node=node,
-                            chunk_seq=chunk_seq,
-                        )
-                    except Exception as e:
-                        node_id = getattr(node, "node_id", "unknown")
-                        logger.error(f"Failed to persist chunk {node_id}: {e}")
-                        self.stats.failed += 1
-                        self.stats.errors.append(f"{node_id}: {e}")
+            output: list[BaseNode] = []
+            stale_node_ids: list[str] = []
+            for chunk_nodes in doc_chunks.values():
+                output.extend(
+                    self._persist_document(
+                        fts_chunk=fts_chunk,
+                        chunk_nodes=chunk_nodes,
+                        stale_node_ids=stale_node_ids,
+                    )
+                )
+
+            if stale_node_ids and self._vector_manager is not None:
+                try:
+                    self._vector_manager.delete_nodes(stale_node_ids)
+                except Exception as e:
+                    logger.warning(f"Failed to delete {len(stale_node_ids)} stale chunk vectors: {e}")
 
             logger.info(
                 f"ChunkPersistenceTransform complete: "
-                f"created={self.stats.created}, failed={self.stats.failed}"
+                f"created={self.stats.created}, skipped={self.stats.skipped}, "
+                f"deleted={self.stats.deleted}, failed={self.stats.failed}"
             )
 
-            return nodes
+            return output
+
+    def _persist_document(
+        self,
+        fts_chunk: FTSChunkManager,
+        chunk_nodes: list[BaseNode],
+        stale_node_ids: list[str],
+    ) -> list[BaseNode]:
+        """Persist one document's chunks, diffing against indexed chunk IDs.
+
+        Args:
+            fts_chunk: FTSChunkManager instance.
+            chunk_nodes: The document's chunks in sequence order.
+            stale_node_ids: Accumulator for deleted chunk IDs (for vector cleanup).
+
+        Returns:
+            Chunks that were written to FTS and still need embedding.
+        """
+        prepared: list[tuple[BaseNode, str, str]] = []
+        for chunk_seq, node in enumerate(chunk_nodes):
+            try:
+                text, source_doc_id = self._prepare_chunk(node=node, chunk_seq=chunk_seq)
+                prepared.append((node, text, source_doc_id))
+            except Exception as e:
+                self._record_failure(node, e)
+        if not prepared:
+            return []
+
+        # Chunk IDs are only diffable for documents with a real path; without
+        # one, every path-less document would share the same source_doc_id.
+        path = self._get_path(chunk_nodes[0])
+        new_ids = {node.node_id for node, _, _ in prepared}
+        stale: list[str] = []
+        reusable: set[str] = set()
+        if path:
+            existing = fts_chunk.list_node_ids(prepared[0][2])
+            stale = sorted(existing - new_ids)
+            if path in self._reuse_paths:
+                reusable = existing & new_ids
+                if reusable and self._vector_manager is not None:
+                    reusable = self._vector_manager.existing_node_ids(sorted(reusable))
+
+        # One DELETE + executemany per document, in a savepoint so a failed
+        # write leaves the document's previously indexed chunks untouched.
+        try:
+            with current_session().begin_nested():
+                if path:
+                    fts_chunk.replace_document(
+                        prepared[0][2],
+                        [(node.node_id, text) for node, text, _ in prepared],
+                        doc_id=self._get_doc_id(prepared[0][0]),
+                    )
+                else:
+                    fts_chunk.upsert_many(
+                        [(node.node_id, text, doc_key) for node, text, doc_key in prepared]
+                    )
+        except Exception as e:
+            for node, _, _ in prepared:
+                self._record_failure(node, e)
+            return []
+
+        if stale:
+            self.stats.deleted += len(stale)
+            stale_node_ids.extend(stale)
+
+        output: list[BaseNode] = []
+        for node, _, _ in prepared:
+            if node.node_id in reusable:
+                self.stats.skipped += 1
+                continue
+            self.stats.created += 1
+            output.append(node)
+        return output
+
+    def _record_failure(self, node: BaseNode, error: Exception) -> None:
+        """Log and count a chunk that failed to persist."""
+        node_id = getattr(node, "node_id", "unknown")
+        logger.error(f"Failed to persist chunk {node_id}: {error}")
+        self.stats.failed += 1
+        self.stats.errors.append(f"{node_id}: {error}")
 
     def _get_source_key(self, node: BaseNode, ref_doc_id: str) -> str:
         """Get a key to group chunks by source document.
@@ -412,18 +527,19 @@ class ChunkPersistenceTransform(TransformComponent):
                 pass
         return None
 
-    def _process_chunk(
+    def _prepare_chunk(
         self,
-        fts_chunk: FTSChunkManager,
         node: BaseNode,
         chunk_seq: int,
-    ) -> None:
-        """Process a single chunk for persistence.
+    ) -> tuple[str, str]:
+        """Assign a chunk's stable ID and metadata.
 
         Args:
-            fts_chunk: FTSChunkManager instance.
             node: The chunk node.
             chunk_seq: 0-indexed chunk sequence within the document.
+
+        Returns:
+            Tuple of (full chunk text for FTS, source_doc_id).
         """
         # Get content hash for stable ID
         content_hash = self._get_content_hash(node)
@@ -466,18 +582,4 @@ class ChunkPersistenceTransform(TransformComponent):
         # If body is empty (heading-only chunk), fall back to heading.
         node.set_content(body_text if body_text.strip() else heading_text)
 
-        # Check if chunk already exists by searching for existing node_id
-        # For FTS5, we use upsert which handles both insert and update
-        # Since upsert does DELETE then INSERT, we count all as "updated"
-        # unless we can detect it's truly new
-
-        # Upsert to FTS
-        fts_chunk.upsert(node_id=node_id, text=text, source_doc_id=source_doc_id)
-
-        # Count as created (we can't easily distinguish update vs create with FTS5)
-        # A more sophisticated implementation could query first to check existence
-        self.stats.created += 1
-
-        #logger.debug(
-        #    f"Persisted chunk {node_id} (seq={chunk_seq}) from {source_doc_id}"
-        #)
+        return text, source_doc_id
@@ -4,24 +4,31 @@ Tests the ingestion pipeline's hybrid indexing capabilities including:
 - Idempotent ingestion (same node_ids on re-ingest)
 - No duplicates in FTS and vector stores
 - Delete propagation removes from both stores
+- Parallel dataset syncs keep each other's vectors
 """
 
+import asyncio
 import hashlib
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from typing import Generator
 from unittest.mock import patch
 
 import pytest
+from llama_index.core.vector_stores import SimpleVectorStore
 from sqlalchemy import Engine
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session, sessionmaker
 
+from catalog.core.settings import get_settings
 from catalog.ingest.pipelines import DatasetIngestPipeline
 from catalog.integrations.obsidian import SourceObsidianConfig
 from catalog.store.database import Base, create_engine_for_path
+from catalog.store.writer import SQLiteWriter
 from index.store.fts import create_fts_table
 from index.store.fts_chunk import create_chunks_fts_table
+from index.store.zvec import matches_dataset
 from catalog.sync import DatasetSync
 
 
@@ -534,7 +541,7 @@ class TestChunkMetadata:
         # Check that all chunks have body_text content
         with create_session(session_factory) as session:
             result = session.execute(
-                sql_text("SELECT body_text FROM chunks_fts WHERE body_text = '' OR body_text IS NULL")
+                sql_text("SELECT body FROM chunks WHERE body = '' OR body IS NULL")
             )
             empty_chunks = list(result)
 
@@ -630,3 +637,50 @@ class TestSyncStats:
         # Chunk count should be consistent (no duplicates)
         assert result2.index.chunks_created == initial_chunks, \
             f"Force re-sync should produce same chunk count: {result2.index.chunks_created} vs {initial_chunks}"
+
+
+class TestParallelSync:
+    """Tests for syncing several datasets at once."""
+
+    def test_parallel_datasets_keep_each_others_vectors(
+        self,
+        patched_get_session,
+        mock_embed_model,
+        session_factory,
+        tmp_path: Path,
+        monkeypatch,
+    ) -> None:
+        """Datasets synced in parallel all end up in the persisted vector store."""
+        index_path = tmp_path / "zvec" / "vector_store.json"
+        monkeypatch.setenv("SUBSTRATE_VECTOR_DB__BACKEND", "zvec")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_PATH", str(index_path))
+        get_settings.cache_clear()
+
+        configs = []
+        for name in ("alpha", "beta"):
+            vault = tmp_path / name
+            (vault / ".obsidian").mkdir(parents=True)
+            for i in range(3):
+                (vault / f"{name}-{i}.md").write_text(f"# {name} {i}\n\nNote {i} of {name}.")
+            configs.append(SourceObsidianConfig(source_path=vault, dataset_name=name))
+
+        sync = DatasetSync(max_parallel_datasets=2)
+        sync._configs = configs
+        try:
+            with (
+                patch("agentlayer.pipeline.get_embed_model", return_value=mock_embed_model),
+                patch("index.store.vector._build_embed_model", return_value=mock_embed_model),
+                patch("catalog.sync.SQLiteWriter", partial(SQLiteWriter, session_factory)),
+                # Only the vector store is under test; VectorStoreIndex refuses
+                # to wrap a store that does not keep node text.
+                patch("llama_index.core.VectorStoreIndex.from_vector_store"),
+            ):
+                results = asyncio.run(sync.arun())
+        finally:
+            get_settings.cache_clear()
+
+        assert len(results) == 2
+        stored = SimpleVectorStore.from_persist_path(str(index_path)).data.metadata_dict
+        for name in ("alpha", "beta"):
+            vectors = [meta for meta in stored.values() if matches_dataset(meta, name)]
+            assert len(vectors) == 3, f"vectors of '{name}' missing from the store"
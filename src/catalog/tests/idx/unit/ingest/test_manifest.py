@@ -0,0 +1,190 @@
+"""Tests for catalog.ingest.manifest and the SourceFile repository."""
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from catalog.ingest.manifest import FileState, SourceManifest
+from catalog.store.database import Base, create_engine_for_path
+from catalog.store.models import Dataset, Document
+from catalog.store.repositories import IngestCheckpointRepository, SourceFileRepository
+
+
+def _write(path: Path, text: str, mtime: int | None = None) -> Path:
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _previous(root: Path, *names: str) -> dict[str, FileState]:
+    """Manifest entries as a completed run would have recorded them."""
+    manifest = SourceManifest(root)
+    for path in manifest.select([root / name for name in names]):
+        manifest.content_unchanged(path)
+    return dict(manifest.current)
+
+
+class TestSourceManifest:
+    """SourceManifest.select and content_unchanged."""
+
+    def test_unchanged_files_not_selected(self, tmp_path: Path) -> None:
+        """Files with matching stat are not returned for reading."""
+        a = _write(tmp_path / "a.md", "A")
+        b = _write(tmp_path / "b.md", "B")
+        previous = _previous(tmp_path, "a.md", "b.md")
+        _write(b, "B edited")
+
+        manifest = SourceManifest(tmp_path, previous)
+
+        assert manifest.select([a, b]) == [b]
+        assert manifest.unchanged == {"a.md"}
+
+    def test_touched_file_skipped_by_content_hash(self, tmp_path: Path) -> None:
+        """A file whose mtime changed but bytes did not is read once, then skipped."""
+        a = _write(tmp_path / "a.md", "A", mtime=1_000_000)
+        previous = _previous(tmp_path, "a.md")
+        _write(a, "A", mtime=2_000_000)
+
+        manifest = SourceManifest(tmp_path, previous)
+
+        assert manifest.select([a]) == [a]
+        assert manifest.content_unchanged(a) is True
+        assert manifest.unchanged == {"a.md"}
+        assert manifest.current["a.md"].mtime_ns == 2_000_000 * 10**9
+
+    def test_deleted_paths(self, tmp_path: Path) -> None:
+        """Paths in the previous manifest but not listed are deleted."""
+        a = _write(tmp_path / "a.md", "A")
+        _write(tmp_path / "gone.md", "G")
+        previous = _previous(tmp_path, "a.md", "gone.md")
+        (tmp_path / "gone.md").unlink()
+
+        manifest = SourceManifest(tmp_path, previous)
+        manifest.select([a])
+
+        assert manifest.deleted == {"gone.md"}
+
+    def test_renamed_file_is_read_despite_old_mtime(self, tmp_path: Path) -> None:
+        """A file with no previous entry is read even if its mtime is old."""
+        a = _write(tmp_path / "a.md", "A", mtime=1_000_000)
+        previous = _previous(tmp_path, "a.md")
+        b = a.rename(tmp_path / "b.md")
+
+        manifest = SourceManifest(tmp_path, previous)
+
+        assert manifest.select([b]) == [b]
+        assert manifest.unchanged == set()
+        assert manifest.deleted == {"a.md"}
+
+
+class TestSourceFileRepository:
+    """Manifest persistence."""
+
+    @pytest.fixture
+    def session(self, tmp_path: Path):
+        engine = create_engine_for_path(tmp_path / "catalog.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    @pytest.fixture
+    def dataset(self, session) -> Dataset:
+        ds = Dataset(name="ds", uri="dataset:ds", source_type="directory", source_path="/ds")
+        session.add(ds)
+        session.flush()
+        for path, active in (("a.md", True), ("b.md", True), ("off.md", False)):
+            session.add(
+                Document(
+                    parent_id=ds.id,
+                    uri=f"document:ds:{path}",
+                    path=path,
+                    content_hash=path,
+                    body=path,
+                    active=active,
+                )
+            )
+        session.flush()
+        return ds
+
+    @staticmethod
+    def _entry(size: int) -> dict:
+        return {"size": size, "mtime_ns": 1, "inode": 2, "content_hash": None}
+
+    def test_sync_writes_only_changes(self, session, dataset) -> None:
+        """sync inserts, updates and deletes to match the given entries."""
+        repo = SourceFileRepository(session)
+
+        assert repo.sync(dataset.id, {"a.md": self._entry(1), "b.md": self._entry(1)}) == 2
+        assert repo.sync(dataset.id, {"a.md": self._entry(1), "b.md": self._entry(1)}) == 0
+        assert repo.sync(dataset.id, {"a.md": self._entry(5)}) == 2
+
+        manifest = repo.map_by_dataset(dataset.id)
+        assert set(manifest) == {"a.md"}
+        assert manifest["a.md"].size == 5
+
+    def test_map_excludes_inactive_documents(self, session, dataset) -> None:
+        """Entries for inactive (or missing) documents are not returned."""
+        repo = SourceFileRepository(session)
+        repo.sync(
+            dataset.id,
+            {p: self._entry(1) for p in ("a.md", "off.md", "never-persisted.md")},
+        )
+
+        assert set(repo.map_by_dataset(dataset.id)) == {"a.md"}
+
+
+class TestIngestCheckpointRepository:
+    """Checkpoint and pending-link persistence."""
+
+    @pytest.fixture
+    def session(self, tmp_path: Path):
+        engine = create_engine_for_path(tmp_path / "catalog.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    @pytest.fixture
+    def docs(self, session) -> tuple[Dataset, list[Document]]:
+        ds = Dataset(name="ds", uri="dataset:ds", source_type="directory", source_path="/ds")
+        session.add(ds)
+        session.flush()
+        docs = [
+            Document(parent_id=ds.id, uri=f"document:ds:{p}", path=p, content_hash=p, body=p)
+            for p in ("a.md", "b.md")
+        ]
+        session.add_all(docs)
+        session.flush()
+        return ds, docs
+
+    def test_save_overwrites_checkpoint(self, session, docs) -> None:
+        """save keeps one checkpoint per dataset; clear removes it."""
+        ds, _ = docs
+        repo = IngestCheckpointRepository(session)
+
+        repo.save(ds.id, "a.md", {"documents_read": 1})
+        repo.save(ds.id, "b.md", {"documents_read": 2})
+
+        checkpoint = repo.get(ds.id)
+        assert checkpoint.last_path == "b.md"
+        assert checkpoint.stats == {"documents_read": 2}
+        repo.clear(ds.id)
+        assert repo.get(ds.id) is None
+
+    def test_pending_links_replaced_per_source(self, session, docs) -> None:
+        """Later batches replace a source's staged links, including with none."""
+        ds, (a, b) = docs
+        repo = IngestCheckpointRepository(session)
+
+        repo.add_pending_links(ds.id, {a.id: ["b", "c"], b.id: ["a"]})
+        repo.add_pending_links(ds.id, {a.id: ["c"], b.id: []})
+
+        assert repo.pending_links(ds.id) == {a.id: ["c"], b.id: []}
+        repo.clear(ds.id)
+        assert repo.pending_links(ds.id) == {}
@@ -0,0 +1,82 @@
+"""Tests for catalog.ingest.streaming."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from catalog.ingest.directory import DirectorySource
+from catalog.ingest.streaming import ReadOptions, batched, read_ahead
+
+
+class TestReadAhead:
+    """read_ahead reads on a thread pool within a byte budget."""
+
+    def test_yields_in_input_order(self) -> None:
+        """Results come back in input order regardless of completion order."""
+        results = list(read_ahead(range(20), lambda i: i * 2, size_of=lambda i: 1, max_workers=4))
+
+        assert results == [i * 2 for i in range(20)]
+
+    def test_in_flight_bytes_bounded(self) -> None:
+        """Reads not yet consumed never exceed the budget."""
+        lock = threading.Lock()
+        started: list[int] = []
+        consumed = 0
+        peak = 0
+
+        def read(i: int) -> int:
+            nonlocal peak
+            with lock:
+                started.append(i)
+                peak = max(peak, len(started) - consumed)
+            return i
+
+        for _ in read_ahead(
+            range(50), read, size_of=lambda i: 10, max_workers=4, max_in_flight_bytes=30
+        ):
+            with lock:
+                consumed += 1
+
+        assert len(started) == 50
+        assert peak <= 3
+
+    def test_oversized_item_still_read(self) -> None:
+        """An item larger than the whole budget is read on its own."""
+        results = list(
+            read_ahead([1, 2], lambda i: i, size_of=lambda i: 100, max_in_flight_bytes=10)
+        )
+
+        assert results == [1, 2]
+
+    def test_read_errors_propagate(self) -> None:
+        """An exception in a read surfaces to the consumer."""
+
+        def read(i: int) -> int:
+            if i == 3:
+                raise OSError("boom")
+            return i
+
+        with pytest.raises(OSError, match="boom"):
+            list(read_ahead(range(5), read, size_of=lambda i: 1))
+
+
+def test_batched_groups_items() -> None:
+    """batched yields full batches then the remainder."""
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(batched([1], 0))
+
+
+def test_directory_source_streams_same_documents(tmp_path: Path) -> None:
+    """iter_documents yields what documents returns, in batches."""
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / name).write_text(f"# {name}")
+    (tmp_path / "skip.txt").write_text("not markdown")
+    source = DirectorySource(tmp_path)
+
+    batches = list(source.iter_documents(ReadOptions(batch_size=2, max_workers=2)))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    streamed = [(doc.id_, doc.text) for batch in batches for doc in batch]
+    assert streamed == [(doc.id_, doc.text) for doc in source.documents]
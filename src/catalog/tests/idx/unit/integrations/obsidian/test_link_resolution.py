@@ -236,3 +236,22 @@ class TestLinkResolution:
         assert len(incoming) == 2
         source_ids = {l.source_id for l in incoming}
         assert source_ids == {nodes[0].metadata["doc_id"], nodes[1].metadata["doc_id"]}
+
+    def test_removed_links_cleared(self, db_session, dataset_id: int) -> None:
+        """A document whose wikilinks were all removed loses its old links."""
+        nodes = [
+            _make_node("A.md", wikilinks=["B"]),
+            _make_node("B.md"),
+        ]
+        nodes = _persist_nodes(db_session, dataset_id, nodes)
+
+        with use_session(db_session):
+            LinkResolutionTransform(dataset_id=dataset_id, resolver=ObsidianWikilinkResolver())(nodes)
+            db_session.commit()
+
+            nodes[0].metadata["wikilinks"] = []
+            LinkResolutionTransform(dataset_id=dataset_id, resolver=ObsidianWikilinkResolver())(nodes)
+            db_session.commit()
+
+            outgoing = DocumentLinkRepository().list_outgoing(nodes[0].metadata["doc_id"])
+        assert outgoing == []
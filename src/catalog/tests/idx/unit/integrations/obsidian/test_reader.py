@@ -4,7 +4,9 @@ from pathlib import Path
 
 import pytest
 
-from catalog.integrations.obsidian.reader import ObsidianMarkdownReader
+from catalog.ingest.manifest import SourceManifest
+from catalog.ingest.streaming import ReadOptions
+from catalog.integrations.obsidian.reader import ObsidianMarkdownReader, ObsidianVaultReader
 
 
 class TestGetEffectiveTitle:
@@ -127,3 +129,54 @@ class TestLoadDataDuplicateTitleNormalization:
         docs = reader.load_data(md_file, extra_info=extra_info)
         assert len(docs) == 1
         assert docs[0].text.strip().startswith("# Actual Heading")
+
+
+class TestStreamData:
+    """stream_data yields the same documents as load_data, in batches."""
+
+    @pytest.fixture
+    def vault(self, tmp_path: Path) -> Path:
+        vault = tmp_path / "vault"
+        (vault / ".obsidian").mkdir(parents=True)
+        (vault / "a.md").write_text("---\ntags: [x]\n---\nSee [[b]] and [[missing]].")
+        (vault / "b.md").write_text("Back to [[a]].")
+        (vault / "sub").mkdir()
+        (vault / "sub" / "c.md").write_text("Links [[b#Section]].")
+        return vault
+
+    @staticmethod
+    def _snapshot(docs) -> list[tuple]:
+        return sorted((doc.id_, doc.text, sorted(doc.metadata.items(), key=str)) for doc in docs)
+
+    @pytest.mark.parametrize("remove_dead", [False, True])
+    def test_matches_load_data(self, vault: Path, remove_dead: bool) -> None:
+        """Texts, wikilinks and backlinks match the in-memory reader."""
+        loaded = ObsidianVaultReader(input_dir=vault, remove_dead_wikilinks=remove_dead).load_data()
+
+        batches = list(
+            ObsidianVaultReader(input_dir=vault, remove_dead_wikilinks=remove_dead).stream_data(
+                ReadOptions(batch_size=2, max_workers=2)
+            )
+        )
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        streamed = [doc for batch in batches for doc in batch]
+        assert self._snapshot(streamed) == self._snapshot(loaded)
+        by_name = {doc.metadata["note_name"]: doc for doc in streamed}
+        assert by_name["b"].metadata["backlinks"] == ["a"]
+
+    def test_manifest_skips_unchanged_notes(self, vault: Path) -> None:
+        """Only edited notes are read; links to skipped notes stay valid."""
+        first = SourceManifest(vault)
+        reader = ObsidianVaultReader(input_dir=vault, remove_dead_wikilinks=True)
+        list(reader.stream_data(ReadOptions(batch_size=10), first))
+        (vault / "a.md").write_text("Only [[b]] now.")
+
+        manifest = SourceManifest(vault, first.current)
+        reader = ObsidianVaultReader(input_dir=vault, remove_dead_wikilinks=True)
+        batches = reader.stream_data(ReadOptions(batch_size=10), manifest)
+        docs = [doc for batch in batches for doc in batch]
+
+        assert [doc.metadata["relative_path"] for doc in docs] == ["a.md"]
+        assert docs[0].metadata["wikilinks"] == ["b"]
+        assert manifest.unchanged == {"b.md", "sub/c.md"}
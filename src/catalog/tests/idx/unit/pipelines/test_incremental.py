@@ -4,6 +4,7 @@ Tests the incremental flag resolution, docstore strategy (DUPLICATES_ONLY),
 deletion sync skip, and last_ingested_at stamping.
 """
 
+import os
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -266,3 +267,62 @@ class TestIncrementalIngestion:
             doc_repo = DocumentRepository(session)
             active = doc_repo.list_by_parent(result1.dataset_id, active_only=True)
             assert len(active) == 2
+
+    def test_incremental_deletion_sync_uses_manifest(
+        self, test_db, sample_directory: Path
+    ):
+        """With the file manifest, incremental runs still deactivate deleted files."""
+        config1 = SourceDirectoryConfig(
+            source_path=sample_directory,
+            dataset_name="incr-test-manifest",
+        )
+        result1 = DatasetIngestPipeline(ingest_config=config1).ingest()
+        (sample_directory / "b.md").unlink()
+        (sample_directory / "c.md").write_text("# C\n\nContent C.")
+
+        config2 = SourceDirectoryConfig(
+            source_path=sample_directory,
+            dataset_name="incr-test-manifest",
+            incremental=True,
+        )
+        result2 = DatasetIngestPipeline(ingest_config=config2).ingest()
+
+        assert result2.documents_read == 1
+        assert result2.documents_created == 1
+        assert result2.files_unchanged == 1
+        assert result2.documents_deactivated == 1
+        with test_db() as session:
+            active = DocumentRepository(session).list_paths_by_parent(
+                result1.dataset_id, active_only=True
+            )
+            assert active == {"a.md", "c.md"}
+
+    def test_incremental_rename_ingests_new_path(
+        self, test_db, sample_directory: Path
+    ):
+        """A file renamed before an incremental run is read under its new path."""
+        config1 = SourceDirectoryConfig(
+            source_path=sample_directory,
+            dataset_name="incr-test-rename",
+        )
+        result1 = DatasetIngestPipeline(ingest_config=config1).ingest()
+        renamed = sample_directory / "renamed.md"
+        (sample_directory / "b.md").rename(renamed)
+        old = datetime(2000, 1, 1, tzinfo=timezone.utc).timestamp()
+        os.utime(renamed, (old, old))
+
+        config2 = SourceDirectoryConfig(
+            source_path=sample_directory,
+            dataset_name="incr-test-rename",
+            incremental=True,
+        )
+        result2 = DatasetIngestPipeline(ingest_config=config2).ingest()
+
+        assert result2.documents_read == 1
+        assert result2.documents_created == 1
+        assert result2.documents_deactivated == 1
+        with test_db() as session:
+            active = DocumentRepository(session).list_paths_by_parent(
+                result1.dataset_id, active_only=True
+            )
+            assert active == {"a.md", "renamed.md"}
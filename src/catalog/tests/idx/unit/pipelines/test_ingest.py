@@ -1,6 +1,7 @@
 """Tests for catalog.ingest.pipelines module."""
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,11 +11,21 @@ from sqlalchemy.orm import sessionmaker
 
 from catalog.core.settings import get_settings
 from catalog.ingest.pipelines import DatasetIngestPipeline
-from catalog.ingest.directory import SourceDirectoryConfig
+from catalog.ingest.directory import DirectorySource, SourceDirectoryConfig
+from catalog.ingest.streaming import ReadOptions
+from catalog.integrations.obsidian import SourceObsidianConfig
+from catalog.integrations.obsidian.source import ObsidianVaultSource
 from catalog.store.database import Base, create_engine_for_path
+from catalog.store.writer import SQLiteWriter
 from index.store.fts import FTSManager, create_fts_table
 from index.store.fts_chunk import create_chunks_fts_table
-from catalog.store.repositories import DatasetRepository, DocumentRepository
+from catalog.store.repositories import (
+    DatasetRepository,
+    DocumentLinkRepository,
+    DocumentRepository,
+    IndexGenerationRepository,
+    IngestCheckpointRepository,
+)
 from catalog.transform.llama import PersistenceTransform
 from catalog.transform.ontology import OntologyMapper
 
@@ -180,6 +191,216 @@ class TestDatasetIngestPipeline:
         assert result.documents_created == 3
         assert result.dataset_name == "test-docs"
 
+    def test_ingest_streams_in_batches(
+        self, test_db, db_session, sample_directory: Path
+    ) -> None:
+        """Documents are run in batches; counts and deletion sync span all batches."""
+        batch_sizes: list[int] = []
+        source_iter = DirectorySource.iter_documents
+
+        def iter_documents(source, options=None):
+            for batch in source_iter(source, ReadOptions(batch_size=1, max_workers=2)):
+                batch_sizes.append(len(batch))
+                yield batch
+
+        config = SourceDirectoryConfig(source_path=sample_directory, dataset_name="test-docs")
+        with patch.object(DirectorySource, "iter_documents", iter_documents):
+            DatasetIngestPipeline(ingest_config=config).ingest()
+            (sample_directory / "notes.md").unlink()
+            result = DatasetIngestPipeline(ingest_config=config).ingest()
+
+        # The second run reads nothing: the manifest shows both files unchanged
+        assert batch_sizes == [1, 1, 1]
+        assert result.documents_read == 0
+        assert result.files_unchanged == 2
+        assert result.documents_deactivated == 1
+        active = DocumentRepository(db_session).list_paths_by_parent(
+            result.dataset_id, active_only=True
+        )
+        assert active == {"readme.md", "subdir/deep.md"}
+
+    def test_failed_update_is_retried(
+        self, test_db, db_session, sample_directory: Path
+    ) -> None:
+        """A file whose update fails stays out of the manifest and is read again."""
+        config = SourceDirectoryConfig(source_path=sample_directory, dataset_name="test-docs")
+        DatasetIngestPipeline(ingest_config=config).ingest()
+        (sample_directory / "notes.md").write_text("# Notes\n\nEdited.")
+
+        process_node = PersistenceTransform._process_node
+
+        def failing_process_node(self, *, node, **kwargs):
+            if node.metadata.get("relative_path") == "notes.md":
+                raise RuntimeError("disk full")
+            return process_node(self, node=node, **kwargs)
+
+        with (
+            patch.object(PersistenceTransform, "_batch_size", 0),
+            patch.object(PersistenceTransform, "_process_node", failing_process_node),
+        ):
+            failed = DatasetIngestPipeline(ingest_config=config).ingest()
+        retried = DatasetIngestPipeline(ingest_config=config).ingest()
+
+        assert failed.documents_failed == 1
+        assert retried.documents_read == 1
+        assert retried.documents_updated == 1
+        doc = DocumentRepository(db_session).get_by_path(retried.dataset_id, "notes.md")
+        assert "Edited." in doc.body
+
+    def test_links_resolved_across_batches(self, test_db, db_session, tmp_path: Path) -> None:
+        """A link to a note in a later batch still resolves."""
+        vault = tmp_path / "test-vault"
+        (vault / ".obsidian").mkdir(parents=True)
+        (vault / "a.md").write_text("Links to [[z]].")
+        (vault / "z.md").write_text("Last note.")
+
+        config = SourceObsidianConfig(source_path=vault)
+        with patch(
+            "catalog.ingest.pipelines.ReadOptions.from_settings",
+            return_value=ReadOptions(batch_size=1),
+        ):
+            result = DatasetIngestPipeline(ingest_config=config).ingest()
+
+        doc_repo = DocumentRepository(db_session)
+        source = doc_repo.get_by_path(result.dataset_id, "a.md")
+        target = doc_repo.get_by_path(result.dataset_id, "z.md")
+        links = DocumentLinkRepository(db_session).list_outgoing(source.id)
+        assert [link.target_id for link in links] == [target.id]
+
+    def test_ingest_bumps_index_generation_on_change(
+        self, test_db, db_session, sample_directory: Path
+    ) -> None:
+        """Ingests that change documents bump the dataset's index generation."""
+        config = SourceDirectoryConfig(source_path=sample_directory, dataset_name="test-docs")
+
+        result = DatasetIngestPipeline(ingest_config=config).ingest()
+        DatasetIngestPipeline(ingest_config=config).ingest()
+        generations = IndexGenerationRepository(db_session)
+        assert generations.get(result.dataset_id) == 1
+
+        (sample_directory / "notes.md").write_text("# Notes\n\nEdited.")
+        DatasetIngestPipeline(ingest_config=config).ingest()
+        assert generations.get(result.dataset_id) == 2
+
+    @pytest.fixture
+    def crashing_vault(self, tmp_path: Path):
+        """A vault whose first ingest dies after committing two batches."""
+        vault = tmp_path / "test-vault"
+        (vault / ".obsidian").mkdir(parents=True)
+        (vault / "a.md").write_text("Links to [[z]].")
+        (vault / "m.md").write_text("Middle.")
+        (vault / "z.md").write_text("Last note.")
+
+        stream = ObsidianVaultSource.iter_documents
+        read: list[str] = []
+
+        def iter_documents(source, options=None):
+            for i, batch in enumerate(stream(source, ReadOptions(batch_size=1))):
+                if crash and i == 2:
+                    raise RuntimeError("interrupted")
+                read.extend(doc.metadata["relative_path"] for doc in batch)
+                yield batch
+
+        crash = True
+        with patch.object(ObsidianVaultSource, "iter_documents", iter_documents):
+            with pytest.raises(RuntimeError, match="interrupted"):
+                DatasetIngestPipeline(
+                    ingest_config=SourceObsidianConfig(source_path=vault)
+                ).ingest()
+            crash = False
+            read.clear()
+            yield vault, read
+
+    def test_interrupted_ingest_resumes_from_checkpoint(
+        self, test_db, db_session, crashing_vault
+    ) -> None:
+        """Committed batches survive a crash and are not read again on resume."""
+        vault, read = crashing_vault
+        dataset = DatasetRepository(db_session).get_by_name("test-vault")
+        checkpoint = IngestCheckpointRepository(db_session).get(dataset.id)
+        assert checkpoint.last_path == "m.md"
+        assert checkpoint.stats["documents_read"] == 2
+
+        config = SourceObsidianConfig(source_path=vault, resume=True)
+        result = DatasetIngestPipeline(ingest_config=config).ingest()
+
+        assert read == ["z.md"]
+        assert result.documents_read == 3
+        assert result.documents_created == 3
+        assert result.files_unchanged == 0
+        db_session.expire_all()
+        assert IngestCheckpointRepository(db_session).get(dataset.id) is None
+        # a.md was committed before the crash; its link to z.md still resolves
+        doc_repo = DocumentRepository(db_session)
+        source = doc_repo.get_by_path(dataset.id, "a.md")
+        target = doc_repo.get_by_path(dataset.id, "z.md")
+        links = DocumentLinkRepository(db_session).list_outgoing(source.id)
+        assert [link.target_id for link in links] == [target.id]
+
+    def test_interrupted_ingest_starts_over_without_resume(
+        self, test_db, db_session, crashing_vault
+    ) -> None:
+        """Without resume, an interrupted run's checkpoint is discarded."""
+        vault, read = crashing_vault
+
+        result = DatasetIngestPipeline(
+            ingest_config=SourceObsidianConfig(source_path=vault)
+        ).ingest()
+
+        assert read == ["a.md", "m.md", "z.md"]
+        assert result.documents_created == 1
+        db_session.expire_all()
+        assert IngestCheckpointRepository(db_session).get(result.dataset_id) is None
+
+    def test_resume_without_manifest_reads_and_counts_once(
+        self, test_db, db_session, crashing_vault
+    ) -> None:
+        """A source without a manifest re-reads everything on resume, counted once."""
+        vault, read = crashing_vault
+
+        config = SourceObsidianConfig(source_path=vault, resume=True)
+        with patch.object(ObsidianVaultSource, "supports_manifest", False):
+            result = DatasetIngestPipeline(ingest_config=config).ingest()
+
+        assert read == ["a.md", "m.md", "z.md"]
+        assert result.documents_read == 3
+        assert result.documents_created == 1
+        db_session.expire_all()
+        assert IngestCheckpointRepository(db_session).get(result.dataset_id) is None
+
+    def test_parallel_ingest_through_writer(
+        self, test_db, db_session, sample_directory: Path, tmp_path: Path
+    ) -> None:
+        """Datasets ingested concurrently share one writer thread."""
+        vault = tmp_path / "test-vault"
+        (vault / ".obsidian").mkdir(parents=True)
+        (vault / "a.md").write_text("Links to [[b]].")
+        (vault / "b.md").write_text("Target.")
+        configs = [
+            SourceDirectoryConfig(source_path=sample_directory, dataset_name="test-docs"),
+            SourceObsidianConfig(source_path=vault),
+        ]
+        factory = sessionmaker(bind=db_session.get_bind(), expire_on_commit=False)
+
+        with SQLiteWriter(factory) as writer:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(
+                    pool.map(
+                        lambda config: DatasetIngestPipeline(
+                            ingest_config=config, writer=writer
+                        ).ingest(),
+                        configs,
+                    )
+                )
+
+        assert [r.documents_created for r in results] == [3, 2]
+        assert writer.metrics.completed > 0
+        doc_repo = DocumentRepository(db_session)
+        source = doc_repo.get_by_path(results[1].dataset_id, "a.md")
+        target = doc_repo.get_by_path(results[1].dataset_id, "b.md")
+        links = DocumentLinkRepository(db_session).list_outgoing(source.id)
+        assert [link.target_id for link in links] == [target.id]
+
     def test_respects_custom_embed_model(
         self, test_db, sample_directory: Path
     ) -> None:
@@ -0,0 +1,162 @@
+"""Tests for the DatasetSync scheduler (catalog.sync)."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from typer.testing import CliRunner
+
+from catalog.cli import app
+from catalog.ingest.directory import SourceDirectoryConfig
+from catalog.store.database import Base, create_engine_for_path
+from catalog.store.writer import SQLiteWriter
+from catalog.sync import DatasetSync
+from index.pipelines import DatasetIndexPipeline
+from index.pipelines.schemas import IndexResult
+from index.store.fts import create_fts_table
+from index.store.vector import VectorStoreManager
+
+
+@pytest.fixture
+def writer_cls(tmp_path: Path):
+    """SQLiteWriter bound to a throwaway database."""
+    engine = create_engine_for_path(tmp_path / "sync.db")
+    yield partial(SQLiteWriter, sessionmaker(bind=engine))
+    engine.dispose()
+
+
+def _sync_with_configs(count: int, **kwargs) -> DatasetSync:
+    sync = DatasetSync(**kwargs)
+    sync._configs = [MagicMock(name=f"config-{i}") for i in range(count)]
+    return sync
+
+
+def test_arun_limits_parallel_datasets(writer_cls) -> None:
+    """No more than max_parallel_datasets jobs run at once, all on one writer."""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    writers = set()
+    vector_managers = set()
+
+    def fake_sync(config, writer, vector_manager):
+        nonlocal running, peak
+        writers.add(writer)
+        vector_managers.add(vector_manager)
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        writer.run(lambda: None)
+        with lock:
+            running -= 1
+        return config
+
+    sync = _sync_with_configs(5, max_parallel_datasets=2)
+    with (
+        patch("catalog.sync.SQLiteWriter", writer_cls),
+        patch.object(sync, "sync", fake_sync),
+    ):
+        results = asyncio.run(sync.arun())
+
+    assert len(results) == 5
+    assert peak == 2
+    assert len(writers) == 1
+    assert len(vector_managers) == 1
+    # Two start right away; the other three wait for a slot
+    assert sync.metrics["datasets"].snapshot()["peak_queued"] == 3
+    assert sync.metrics["datasets"].completed == 5
+    assert sync.metrics["write"].completed == 5
+
+
+def test_arun_drops_failed_jobs(writer_cls) -> None:
+    """A failing job does not stop the others."""
+
+    def fake_sync(config, writer, vector_manager):
+        if config is sync._configs[0]:
+            raise RuntimeError("boom")
+        return config
+
+    sync = _sync_with_configs(3)
+    with (
+        patch("catalog.sync.SQLiteWriter", writer_cls),
+        patch.object(sync, "sync", fake_sync),
+    ):
+        results = asyncio.run(sync.arun(max_parallel_datasets=3))
+
+    assert results == sync._configs[1:]
+
+
+def test_arun_forced_datasets_clear_vectors_through_shared_manager(
+    tmp_path: Path,
+) -> None:
+    """Forced datasets in a parallel sync delete vectors via the shared manager."""
+    engine = create_engine_for_path(tmp_path / "catalog.db")
+    Base.metadata.create_all(engine)
+    create_fts_table(engine)
+    configs = []
+    for name in ("one", "two"):
+        source = tmp_path / name
+        source.mkdir()
+        (source / "a.md").write_text(f"# {name}")
+        configs.append(
+            SourceDirectoryConfig(source_path=source, dataset_name=name, force=True)
+        )
+
+    shared = MagicMock(spec=VectorStoreManager)
+    shared.delete_by_dataset.return_value = 0
+
+    def fake_index(self, nodes=None, vector_manager=None):
+        assert vector_manager is shared
+        return IndexResult(
+            dataset_id=self.dataset_id,
+            dataset_name=self.dataset_name,
+            started_at=datetime.now(tz=timezone.utc),
+        )
+
+    sync = DatasetSync(max_parallel_datasets=2)
+    sync._configs = configs
+    with (
+        patch(
+            "catalog.sync.SQLiteWriter",
+            partial(SQLiteWriter, sessionmaker(bind=engine, expire_on_commit=False)),
+        ),
+        patch("catalog.sync.VectorStoreManager", return_value=shared),
+        patch("catalog.ingest.pipelines.VectorStoreManager") as own_manager,
+        patch.object(DatasetIndexPipeline, "index", fake_index),
+    ):
+        results = asyncio.run(sync.arun())
+    engine.dispose()
+
+    assert len(results) == 2
+    own_manager.assert_not_called()
+    assert sorted(c.args[0] for c in shared.delete_by_dataset.call_args_list) == [
+        "one",
+        "two",
+    ]
+
+
+def test_sync_cli_passes_options(tmp_path: Path) -> None:
+    """catalog sync forwards --max-parallel-datasets and --resume."""
+    instance = MagicMock(configs=[], metrics={})
+
+    async def arun():
+        return []
+
+    instance.arun = arun
+    with patch("catalog.sync.DatasetSync", return_value=instance) as cls:
+        result = CliRunner().invoke(
+            app, ["sync", str(tmp_path), "--max-parallel-datasets", "3"]
+        )
+        resumed = CliRunner().invoke(app, ["sync", str(tmp_path), "--resume"])
+
+    assert result.exit_code == 0, result.output
+    assert cls.call_args_list[0] == call(base_dir=tmp_path, max_parallel_datasets=3, resume=False)
+    assert resumed.exit_code == 0, resumed.output
+    assert cls.call_args_list[1].kwargs["resume"] is True
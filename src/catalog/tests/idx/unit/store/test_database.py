@@ -179,3 +179,49 @@ class TestSettingsIntegration:
         get_registry.cache_clear()
         get_session_factory.cache_clear()
         get_settings.cache_clear()
+
+
+class TestReadSession:
+    """Tests for the read-only search engine."""
+
+    @pytest.fixture
+    def registry(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        from catalog.core.settings import get_settings
+        from catalog.store.database import get_registry, get_session_factory
+
+        monkeypatch.setenv("SUBSTRATE_DATABASES__CATALOG_PATH", str(tmp_path / "catalog.db"))
+        monkeypatch.setenv("SUBSTRATE_DATABASES__CONTENT_PATH", str(tmp_path / "content.db"))
+        monkeypatch.setenv("SUBSTRATE_PERFORMANCE__READ_POOL_SIZE", "2")
+        get_settings.cache_clear()
+        get_registry.cache_clear()
+        get_session_factory.cache_clear()
+        yield get_registry()
+        get_registry().get_read_engine().dispose()
+        get_registry.cache_clear()
+        get_session_factory.cache_clear()
+        get_settings.cache_clear()
+
+    def test_read_session_sees_committed_data_and_rejects_writes(self, registry) -> None:
+        """Read sessions see committed rows and cannot write."""
+        from sqlalchemy.exc import OperationalError
+
+        from catalog.store.database import get_read_session
+        from catalog.store.models import Dataset
+
+        with get_session() as session:
+            session.add(Dataset(name="ds", uri="dataset:ds", source_type="directory", source_path="/ds"))
+
+        with get_read_session() as session:
+            assert session.query(Dataset.name).scalar() == "ds"
+            assert session.execute(text("PRAGMA query_only")).scalar() == 1
+            # Content database is attached (read-only) as well
+            session.execute(text("SELECT COUNT(*) FROM content.document_content")).scalar()
+            with pytest.raises(OperationalError):
+                session.execute(text("DELETE FROM datasets"))
+
+    def test_read_pool_is_warmed(self, registry) -> None:
+        """The read engine opens its pool up front."""
+        engine = registry.get_read_engine()
+
+        assert engine.pool.checkedin() == 2
+        assert registry.get_read_engine() is engine
@@ -0,0 +1,216 @@
+"""Tests for document bodies in the content database."""
+
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from catalog.store.database import Base, create_engine_for_path, migrate_document_bodies
+from catalog.store.models import Dataset, Document
+from catalog.store.models import content as content_module
+from catalog.store.models.content import (
+    DocumentContent,
+    decode_body,
+    encode_body,
+    hash_body,
+)
+from catalog.store.repositories import DocumentRepository
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    """Catalog engine; creating the tables attaches a sibling content db."""
+    engine = create_engine_for_path(tmp_path / "catalog.db")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Session on the catalog engine."""
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def dataset(session) -> Dataset:
+    """A dataset to hold documents."""
+    ds = Dataset(name="ds", uri="dataset:ds", source_type="directory", source_path="/ds")
+    session.add(ds)
+    session.flush()
+    return ds
+
+
+def _doc(dataset: Dataset, path: str, body: str) -> Document:
+    return Document(
+        parent_id=dataset.id,
+        uri=f"document:ds:{path}",
+        path=path,
+        content_hash=hash_body(path + body),
+        body=body,
+    )
+
+
+def _content_rows(session) -> int:
+    return session.execute(select(func.count()).select_from(DocumentContent)).scalar()
+
+
+class TestDocumentBody:
+    """Document.body is stored by hash and loaded lazily."""
+
+    def test_identical_bodies_stored_once(self, session, dataset) -> None:
+        """Documents with the same body share one content row."""
+        session.add_all([_doc(dataset, "a.md", "same"), _doc(dataset, "b.md", "same")])
+        session.commit()
+
+        assert _content_rows(session) == 1
+
+    def test_body_loaded_on_access(self, engine, session, dataset) -> None:
+        """Loading documents does not read bodies until one is accessed."""
+        session.add(_doc(dataset, "a.md", "# Body"))
+        session.commit()
+        session.expunge_all()
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            doc = DocumentRepository(session).get_by_path(dataset.id, "a.md")
+            loaded = list(statements)
+            body = doc.body
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert not any("document_content" in s for s in loaded)
+        assert any("document_content" in s for s in statements[len(loaded) :])
+        assert body == "# Body"
+
+    def test_changed_body_reloads(self, session, dataset) -> None:
+        """Setting a new body updates the hash and what is read back."""
+        doc = _doc(dataset, "a.md", "old")
+        session.add(doc)
+        session.commit()
+
+        doc.body = "new"
+        session.commit()
+        session.expire_all()
+
+        assert doc.body == "new"
+        assert doc.body_hash == hash_body("new")
+
+    def test_load_bodies_prefetches(self, session, dataset) -> None:
+        """load_bodies fills every document's body in one pass."""
+        session.add_all([_doc(dataset, f"{i}.md", f"body {i}") for i in range(3)])
+        session.commit()
+        session.expunge_all()
+        repo = DocumentRepository(session)
+        docs = repo.list_by_parent(dataset.id)
+
+        repo.load_bodies(docs)
+        session.close()  # bodies must not need the session any more
+
+        assert [doc.body for doc in docs] == ["body 0", "body 1", "body 2"]
+
+    def test_purge_unreferenced_content(self, session, dataset) -> None:
+        """Bodies replaced by updates are purged; shared ones are kept."""
+        doc = _doc(dataset, "a.md", "v1")
+        session.add_all([doc, _doc(dataset, "b.md", "shared")])
+        session.commit()
+        doc.body = "v2"
+        session.commit()
+
+        purged = DocumentRepository(session).purge_unreferenced_content()
+
+        assert purged == 1
+        assert _content_rows(session) == 2
+
+
+class TestCompression:
+    """Optional zstd compression of stored bodies."""
+
+    @pytest.fixture
+    def fake_zstd(self, monkeypatch):
+        """Stand-in zstandard module (zlib underneath)."""
+        module = SimpleNamespace(
+            ZstdCompressor=lambda level: SimpleNamespace(compress=zlib.compress),
+            ZstdDecompressor=lambda: SimpleNamespace(decompress=zlib.decompress),
+        )
+        monkeypatch.setattr(content_module, "_zstd", lambda: module)
+        return module
+
+    def test_zstd_round_trip(self, fake_zstd) -> None:
+        """Compressed bodies decode to the original text."""
+        body = "repeated text " * 100
+        data, compression = encode_body(body, "zstd")
+
+        assert compression == "zstd"
+        assert len(data) < len(body)
+        assert decode_body(data, compression) == body
+
+    def test_falls_back_to_raw_without_zstandard(self, monkeypatch) -> None:
+        """Without zstandard, bodies are stored uncompressed."""
+        monkeypatch.setattr(content_module, "_zstd", lambda: None)
+
+        data, compression = encode_body("text", "zstd")
+
+        assert compression is None
+        assert decode_body(data, compression) == "text"
+
+    def test_compressed_rows_readable_through_document(
+        self, session, dataset, fake_zstd, monkeypatch
+    ) -> None:
+        """Documents written with compression enabled read back transparently."""
+        monkeypatch.setattr(content_module, "_compression_settings", lambda: ("zstd", 3))
+        session.add(_doc(dataset, "a.md", "compressed body"))
+        session.commit()
+        session.expire_all()
+
+        doc = DocumentRepository(session).get_by_path(dataset.id, "a.md")
+        stored = session.execute(select(DocumentContent.compression)).scalar()
+
+        assert stored == "zstd"
+        assert doc.body == "compressed body"
+
+
+def test_migrates_legacy_body_column(engine, session, dataset) -> None:
+    """Bodies in documents.body move to the content table and the column is dropped."""
+    session.commit()
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX ix_documents_body_hash"))
+        conn.execute(text("ALTER TABLE documents DROP COLUMN body_hash"))
+        conn.execute(text("ALTER TABLE documents ADD COLUMN body TEXT NOT NULL DEFAULT ''"))
+        for doc_id, path in ((100, "a.md"), (101, "b.md")):
+            conn.execute(
+                text(
+                    "INSERT INTO resources (id, kind, uri, created_at, updated_at) "
+                    "VALUES (:id, 'DOCUMENT', :uri, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ),
+                {"id": doc_id, "uri": f"document:ds:{path}"},
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO documents (id, parent_id, doc_type, path, active, "
+                    "content_hash, body) VALUES (:id, :parent, 'OTHER', :path, 1, 'h', 'legacy')"
+                ),
+                {"id": doc_id, "parent": dataset.id, "path": path},
+            )
+        conn.commit()
+
+    assert migrate_document_bodies(engine) == 2
+    assert migrate_document_bodies(engine) == 0
+
+    with engine.connect() as conn:
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(documents)")}
+    session.expire_all()
+    doc = DocumentRepository(session).get_by_path(dataset.id, "b.md")
+    assert "body" not in columns
+    assert doc.body == "legacy"
+    assert _content_rows(session) == 1
@@ -310,3 +310,46 @@ class TestDocumentLinkRepository:
         assert deleted == 2
         remaining = db_session.execute(select(DocumentLink)).scalars().all()
         assert len(remaining) == 0
+
+    def test_replace_outgoing_bulk(self, db_session, docs: list[Document]) -> None:
+        """replace_outgoing_bulk() resolves names set-wise and replaces old links."""
+        a, b, c = (doc.id for doc in docs)
+        with use_session(db_session):
+            repo = DocumentLinkRepository()
+            repo.create(a, c, DocumentLinkKind.WIKILINK)
+            repo.create(c, a, DocumentLinkKind.WIKILINK)
+            db_session.flush()
+
+            counts = repo.replace_outgoing_bulk(
+                {a: ["B", "Missing", "A", "B"], b: ["C"], c: []},
+                {"A": a, "B": b, "C": c},
+                DocumentLinkKind.WIKILINK,
+            )
+
+        assert counts == {"resolved": 2, "unresolved": 1, "self_links": 1}
+        pairs = {
+            (link.source_id, link.target_id)
+            for link in db_session.execute(select(DocumentLink)).scalars()
+        }
+        assert pairs == {(a, b), (b, c)}
+
+    def test_replace_outgoing_bulk_leaves_other_sources(
+        self, db_session, docs: list[Document]
+    ) -> None:
+        """Only the given sources' outgoing links are replaced."""
+        a, b, c = (doc.id for doc in docs)
+        with use_session(db_session):
+            repo = DocumentLinkRepository()
+            repo.create(b, c, DocumentLinkKind.MARKDOWN_LINK)
+            db_session.flush()
+
+            repo.replace_outgoing_bulk({a: ["C"]}, {"C": c}, DocumentLinkKind.WIKILINK)
+            outgoing_b = repo.list_outgoing(b)
+            outgoing_a = repo.list_outgoing(a)
+
+        assert [(l.target_id, l.relation) for l in outgoing_b] == [
+            (c, DocumentLinkKind.MARKDOWN_LINK)
+        ]
+        assert [(l.target_id, l.relation) for l in outgoing_a] == [
+            (c, DocumentLinkKind.WIKILINK)
+        ]
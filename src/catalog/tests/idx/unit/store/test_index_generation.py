@@ -0,0 +1,75 @@
+"""Tests for IndexGeneration and IndexGenerationRepository."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from catalog.store.database import Base, create_engine_for_path
+from catalog.store.models import Dataset
+from catalog.store.repositories import IndexGenerationRepository
+
+
+@pytest.fixture
+def db_session(tmp_path: Path):
+    """Create a test database session with all tables."""
+    engine = create_engine_for_path(tmp_path / "test.db")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def datasets(db_session) -> list[Dataset]:
+    """Create two datasets."""
+    rows = [
+        Dataset(name=name, uri=f"dataset:{name}", source_type="directory", source_path=f"/{name}")
+        for name in ("alpha", "beta")
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def test_bump_increments_from_zero(db_session, datasets) -> None:
+    """A dataset starts at generation 0; each bump adds one."""
+    alpha, _ = datasets
+    repo = IndexGenerationRepository(db_session)
+
+    assert repo.get(alpha.id) == 0
+    repo.bump(alpha.id)
+    repo.bump(alpha.id)
+
+    assert repo.get(alpha.id) == 2
+
+
+def test_token_changes_only_for_bumped_scope(db_session, datasets) -> None:
+    """Bumping one dataset changes its token and the global one, not the other's."""
+    alpha, _ = datasets
+    repo = IndexGenerationRepository(db_session)
+    before = {name: repo.token(name) for name in ("alpha", "beta", None)}
+
+    repo.bump(alpha.id)
+
+    assert repo.token("alpha") != before["alpha"]
+    assert repo.token(None) != before[None]
+    assert repo.token("beta") == before["beta"]
+    assert repo.token("missing") == ""
+
+
+def test_recreated_dataset_gets_new_token(db_session, datasets) -> None:
+    """Deleting and re-creating a dataset does not reuse its old token."""
+    alpha, _ = datasets
+    repo = IndexGenerationRepository(db_session)
+    before = repo.token("alpha")
+
+    db_session.delete(alpha)
+    db_session.flush()
+    db_session.add(
+        Dataset(name="alpha", uri="dataset:alpha2", source_type="directory", source_path="/a")
+    )
+    db_session.flush()
+
+    assert repo.token("alpha") != before
@@ -0,0 +1,124 @@
+"""Tests for catalog.store.writer."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from agentlayer.session import current_session
+from catalog.store.database import create_engine_for_path
+from catalog.store.writer import SQLiteWriter, StageMetrics
+
+
+@pytest.fixture
+def factory(tmp_path: Path):
+    engine = create_engine_for_path(tmp_path / "writer.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER PRIMARY KEY)"))
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+def _insert(x: int):
+    return lambda: current_session().execute(text("INSERT INTO t VALUES (:x)"), {"x": x})
+
+
+def _rows(factory) -> list[int]:
+    with factory() as session:
+        return list(session.execute(text("SELECT x FROM t ORDER BY x")).scalars())
+
+
+class TestSQLiteWriter:
+    """SQLiteWriter runs jobs on one thread with batched commits."""
+
+    def test_jobs_run_on_writer_thread_with_ambient_session(self, factory) -> None:
+        """Jobs see the writer's session and return their result after commit."""
+        with SQLiteWriter(factory, commit_every=4) as writer:
+            thread = writer.run(lambda: threading.current_thread().name)
+            writer.run(_insert(1))
+
+        assert thread == "sqlite-writer"
+        assert _rows(factory) == [1]
+
+    def test_failed_job_rolls_back_only_itself(self, factory) -> None:
+        """A failing job's writes are undone; the rest of its batch commits."""
+        gate = threading.Event()
+        with SQLiteWriter(factory, commit_every=10) as writer:
+            # Hold the writer so the next jobs are committed together
+            blocker = writer.submit(gate.wait)
+            ok = writer.submit(_insert(1))
+
+            def failing() -> None:
+                _insert(2)()
+                _insert(1)()  # duplicate key
+
+            bad = writer.submit(failing)
+            later = writer.submit(_insert(3))
+            gate.set()
+
+            blocker.result()
+            ok.result()
+            later.result()
+            with pytest.raises(IntegrityError):
+                bad.result()
+            assert writer.commits == 1
+
+        assert _rows(factory) == [1, 3]
+
+    def test_commit_every_bounds_batch(self, factory) -> None:
+        """No more than commit_every jobs share a commit."""
+        gate = threading.Event()
+        with SQLiteWriter(factory, commit_every=2) as writer:
+            writer.submit(gate.wait)
+            futures = [writer.submit(_insert(i)) for i in range(5)]
+            gate.set()
+            for future in futures:
+                future.result()
+
+            assert writer.commits == 3
+            assert writer.metrics.peak_queued >= 5
+            assert writer.metrics.completed == 6
+
+    def test_nested_run_executes_inline(self, factory) -> None:
+        """run() called from a job does not deadlock."""
+        with SQLiteWriter(factory) as writer:
+            assert writer.run(lambda: writer.run(lambda: 42)) == 42
+
+    def test_writer_thread_failure_fails_submitters(self) -> None:
+        """If the writer thread dies, waiting jobs get the error and submit raises."""
+        gate = threading.Event()
+
+        def broken_factory():
+            gate.wait()
+            raise RuntimeError("no database")
+
+        writer = SQLiteWriter(broken_factory, commit_every=1).start()
+        queued = [writer.submit(lambda: None) for _ in range(3)]
+        gate.set()
+
+        for future in queued:
+            with pytest.raises(RuntimeError, match="no database"):
+                future.result(timeout=5)
+        with pytest.raises(RuntimeError, match="not running"):
+            writer.submit(lambda: None)
+        assert writer.metrics.snapshot()["queued"] == 0
+        writer.close()
+
+    def test_submit_requires_start(self, factory) -> None:
+        """Submitting to a writer that is not running raises."""
+        with pytest.raises(RuntimeError):
+            SQLiteWriter(factory).submit(lambda: None)
+
+
+def test_stage_metrics_tracks_peak() -> None:
+    """StageMetrics counts waiting, active and completed items."""
+    stage = StageMetrics("read")
+    stage.enqueue()
+    stage.enqueue()
+    with stage.track():
+        assert stage.snapshot() == {"queued": 1, "active": 1, "peak_queued": 2, "completed": 0}
+
+    assert stage.snapshot() == {"queued": 1, "active": 0, "peak_queued": 2, "completed": 1}
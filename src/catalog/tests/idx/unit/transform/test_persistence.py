@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 from llama_index.core.schema import Document as LlamaDocument
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 
 from catalog.store.database import Base, create_engine_for_path
@@ -183,6 +184,119 @@ class TestPersistenceTransform:
             assert len(result) == 2
 
 
+class TestBulkPersistence:
+    """Batched writes, prefetch and per-node fallback."""
+
+    def test_query_count_independent_of_dataset_size(self, db_session, dataset):
+        """Re-ingest prefetches once and writes in batches, not per document."""
+        paths = {f"{i}.md": f"body {i}" for i in range(50)}
+        with use_session(db_session):
+            PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)(
+                _make_docs(paths)
+            )
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            transform = PersistenceTransform(
+                dataset_id=dataset.id, dataset_name=dataset.name, batch_size=20
+            )
+            with use_session(db_session):
+                result = transform(_make_docs({p: b + " v2" for p, b in paths.items()}))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(result) == 50
+        assert transform.stats.updated == 50
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        content_lookups = [s for s in selects if "content.document_content" in s]
+        assert len(selects) - len(content_lookups) == 1
+        assert len(content_lookups) <= 3  # one existing-body lookup per batch
+        assert len(statements) < 20
+
+    def test_prefetch_defers_body(self, db_session, dataset):
+        """Existing documents are loaded without their body."""
+        with use_session(db_session):
+            PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)(
+                _make_docs({"a.md": "AAA"})
+            )
+            db_session.expire_all()
+            docs = DocumentRepository().map_by_path(dataset.id)
+
+        assert "body" not in docs["a.md"].__dict__
+        assert docs["a.md"].body == "AAA"
+
+    def test_updated_documents_are_refreshed(self, db_session, dataset):
+        """Instances in the session see the bulk-updated values."""
+        with use_session(db_session):
+            PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)(
+                _make_docs({"a.md": "AAA"})
+            )
+            doc = DocumentRepository().get_by_path(dataset.id, "a.md")
+            PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)(
+                _make_docs({"a.md": "NEW"}, metadata={"a.md": {"title": "A"}})
+            )
+
+        assert doc.body == "NEW"
+        assert doc.title == "A"
+
+    def test_failed_batch_retried_per_node(self, db_session, dataset):
+        """A URI collision drops only the colliding node."""
+        db_session.add(
+            Dataset(
+                name="squatter",
+                uri="document:test-ds:b.md",
+                source_type="directory",
+                source_path="/other",
+            )
+        )
+        db_session.flush()
+        transform = PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)
+
+        with use_session(db_session):
+            result = transform(_make_docs({"a.md": "AAA", "b.md": "BBB", "c.md": "CCC"}))
+            paths = DocumentRepository().list_paths_by_parent(dataset.id)
+
+        assert [n.metadata["relative_path"] for n in result] == ["a.md", "c.md"]
+        assert transform.stats.created == 2
+        assert transform.stats.failed == 1
+        assert paths == {"a.md", "c.md"}
+
+    def test_repeated_path_updates_created_row(self, db_session, dataset):
+        """A path seen twice in one run is created once, then updated."""
+        docs = _make_docs({"a.md": "first"}) + _make_docs({"a.md": "second"})
+        transform = PersistenceTransform(dataset_id=dataset.id, dataset_name=dataset.name)
+
+        with use_session(db_session):
+            transform(docs)
+            doc = DocumentRepository().get_by_path(dataset.id, "a.md")
+
+        assert transform.stats.created == 1
+        assert transform.stats.updated == 1
+        assert docs[0].metadata["doc_id"] == docs[1].metadata["doc_id"] == doc.id
+        assert doc.body == "second"
+
+    @pytest.mark.parametrize("batch_size", [0, 1, 500])
+    def test_batch_size_does_not_change_result(self, db_session, dataset, batch_size):
+        """Per-node and batched modes persist the same documents."""
+        transform = PersistenceTransform(
+            dataset_id=dataset.id, dataset_name=dataset.name, batch_size=batch_size
+        )
+        docs = _make_docs({"a.md": "AAA", "b.md": "BBB"})
+
+        with use_session(db_session):
+            transform(docs)
+            stored = DocumentRepository().map_by_path(dataset.id)
+
+        assert transform.stats.created == 2
+        assert {d.metadata["doc_id"] for d in docs} == {doc.id for doc in stored.values()}
+
+
 class TestContentHash:
     """Tests for the _compute_content_hash function."""
 
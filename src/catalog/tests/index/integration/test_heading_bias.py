@@ -49,15 +49,15 @@ class TestHeadingBodySplitInFTS:
 
         result = db_session.execute(
             sql_text(
-                "SELECT heading_text, body_text FROM chunks_fts"
+                "SELECT heading, body FROM chunks"
                 " WHERE node_id = 'chunk:0'"
             )
         )
         row = result.fetchone()
         assert row is not None
-        assert "Machine Learning Basics" in row.heading_text
-        assert "Neural networks" in row.body_text
-        assert "# Machine Learning" not in row.body_text
+        assert "Machine Learning Basics" in row.heading
+        assert "Neural networks" in row.body
+        assert "# Machine Learning" not in row.body
 
     def test_frontmatter_title_in_heading(
         self, fts_manager: FTSChunkManager, db_session
@@ -72,14 +72,14 @@ class TestHeadingBodySplitInFTS:
 
         result = db_session.execute(
             sql_text(
-                "SELECT heading_text, body_text FROM chunks_fts"
+                "SELECT heading, body FROM chunks"
                 " WHERE node_id = 'chunk:1'"
             )
         )
         row = result.fetchone()
-        assert "Python Guide" in row.heading_text
-        assert "Getting Started" in row.heading_text
-        assert "Install Python first." in row.body_text
+        assert "Python Guide" in row.heading
+        assert "Getting Started" in row.heading
+        assert "Install Python first." in row.body
 
     def test_body_search_returns_body_content(
         self, fts_manager: FTSChunkManager, db_session
@@ -327,6 +327,7 @@ class TestCatalogMultiGetTool:
             mock_ds = MagicMock()
             mock_ds.get_dataset_by_name.return_value = mock_dataset
             mock_ds.list_documents.return_value = mock_docs
+            mock_ds.get_document_bodies.return_value = {"notes/a.md": "A", "notes/b.md": "B"}
             mock_ds_cls.return_value = mock_ds
 
             tools = create_mcp_tools(mock_service)
@@ -341,6 +342,9 @@ class TestCatalogMultiGetTool:
             assert "notes/a.md" in paths
             assert "notes/b.md" in paths
             assert "archive/c.md" not in paths
+            assert {d["body"] for d in result["documents"]} == {"A", "B"}
+            # Bodies are fetched for the matching paths only
+            mock_ds.get_document_bodies.assert_called_once_with(1, {"notes/a.md", "notes/b.md"})
 
 
 class TestCatalogStatusTool:
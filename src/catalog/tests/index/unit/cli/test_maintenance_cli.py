@@ -0,0 +1,76 @@
+"""Tests for index.cli.maintenance module."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from typer.testing import CliRunner
+
+from catalog.cli import app
+from catalog.store.database import Base, create_engine_for_path
+from index.store.fts import create_fts_table
+from index.store.fts_chunk import FTSChunkManager, create_chunks_fts_table
+
+
+def _session_factory(tmp_path: Path):
+    engine = create_engine_for_path(tmp_path / "test.db")
+    Base.metadata.create_all(engine)
+    create_fts_table(engine)
+    create_chunks_fts_table(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_session():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return get_session
+
+
+def test_index_app_registered_on_main_app() -> None:
+    """index subcommand is registered on main app."""
+    result = CliRunner().invoke(app, ["index", "--help"])
+    assert result.exit_code == 0
+    assert "check" in result.stdout
+    assert "optimize" in result.stdout
+
+
+def test_check_reports_each_table(tmp_path: Path) -> None:
+    """check runs integrity-check on every FTS table."""
+    get_session = _session_factory(tmp_path)
+    with get_session() as session:
+        FTSChunkManager(session).replace_document("ds:a.md", [("a:0", "alpha")])
+
+    with patch("catalog.store.database.get_session", get_session):
+        result = CliRunner().invoke(app, ["index", "check"])
+
+    assert result.exit_code == 0
+    assert "documents_fts: ok" in result.stdout
+    assert "chunks_fts: ok" in result.stdout
+
+
+def test_check_fails_on_inconsistent_index(tmp_path: Path) -> None:
+    """check exits 1 when an index does not match its content."""
+    get_session = _session_factory(tmp_path)
+    with get_session() as session:
+        FTSChunkManager(session).replace_document("ds:a.md", [("a:0", "alpha")])
+        session.execute(text("DROP TRIGGER chunks_ad"))
+        session.execute(text("DELETE FROM chunks"))
+
+    with patch("catalog.store.database.get_session", get_session):
+        result = CliRunner().invoke(app, ["index", "check", "--table", "chunks_fts"])
+
+    assert result.exit_code == 1
+    assert "chunks_fts: FAILED" in result.output
+
+
+def test_unknown_table_rejected() -> None:
+    """Unknown table names are rejected."""
+    result = CliRunner().invoke(app, ["index", "optimize", "--table", "documents"])
+    assert result.exit_code == 1
@@ -156,3 +156,30 @@ class TestPrintMethodsTable:
         assert "Search Method Comparison" in captured.out
         assert "Top results by method" in captured.out
         assert "FTS" in captured.out
+
+
+class TestModelWarmUp:
+    """llm.warm_up loads models only for commands that use them."""
+
+    def _invoke(self, monkeypatch, args: list[str]) -> MagicMock:
+        from catalog.core.settings import get_settings
+
+        monkeypatch.setenv("SUBSTRATE_LLM__WARM_UP", "true")
+        get_settings.cache_clear()
+        try:
+            with patch("agentlayer.llm.registry.warm_up_models") as warm_up:
+                result = CliRunner().invoke(app, args)
+        finally:
+            get_settings.cache_clear()
+        assert result.exit_code == 0, result.output
+        return warm_up
+
+    def test_search_warms_up_models(self, monkeypatch) -> None:
+        """search commands load the models before running."""
+        warm_up = self._invoke(monkeypatch, ["search", "methods", "--help"])
+        warm_up.assert_called_once()
+
+    def test_maintenance_commands_skip_warm_up(self, monkeypatch) -> None:
+        """index maintenance commands do not load models."""
+        warm_up = self._invoke(monkeypatch, ["index", "stats", "--help"])
+        warm_up.assert_not_called()
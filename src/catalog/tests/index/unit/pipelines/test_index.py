@@ -83,8 +83,9 @@ class TestDatasetIndexPipeline:
 
     def test_index_returns_index_result(self, db_session) -> None:
         """index() returns an IndexResult with correct stats."""
+        dataset_id = _seed_dataset(db_session, {})
         pipeline = DatasetIndexPipeline(
-            dataset_id=1,
+            dataset_id=dataset_id,
             dataset_name="test-ds",
         )
         nodes = _make_nodes({
@@ -96,7 +97,7 @@ class TestDatasetIndexPipeline:
             result = pipeline.index(nodes=nodes)
 
         assert isinstance(result, IndexResult)
-        assert result.dataset_id == 1
+        assert result.dataset_id == dataset_id
         assert result.dataset_name == "test-ds"
         assert result.fts_documents_indexed == 2
         assert result.completed_at is not None
@@ -121,7 +122,7 @@ class TestDatasetIndexPipeline:
         from index.store.cleanup import ReconciliationStats
 
         pipeline = DatasetIndexPipeline(
-            dataset_id=1,
+            dataset_id=_seed_dataset(db_session, {}),
             dataset_name="test-ds",
         )
         nodes = _make_nodes({"a.md": "Content"})
@@ -181,3 +182,214 @@ class TestDocumentFTSTransform:
 
         # Should still return the node (passthrough)
         assert len(result) == 1
+
+
+def _seed_dataset(session, contents: dict[str, str]) -> int:
+    """Create a dataset with active documents and return its ID."""
+    from catalog.store.repositories import DatasetRepository, DocumentRepository
+
+    dataset = DatasetRepository(session).create(
+        name="test-ds",
+        uri="dataset:test-ds",
+        source_type="directory",
+        source_path="/tmp/test-ds",
+    )
+    session.flush()
+    doc_repo = DocumentRepository(session)
+    for path, body in contents.items():
+        doc_repo.create(dataset.id, path, content_hash=f"hash-{body}", body=body)
+    session.flush()
+    return dataset.id
+
+
+class TestIncrementalIndexing:
+    """Tests for hash-aware incremental indexing."""
+
+    @pytest.fixture(autouse=True)
+    def use_mock_embedding(self, patched_embedding) -> None:
+        """Use mock embedding model; report every chunk as having a vector."""
+        patched_embedding["vector_manager"].existing_node_ids.side_effect = set
+        self.embed_model = patched_embedding["embed_model"]
+        yield
+
+    def test_second_run_skips_unchanged_documents(self, db_session) -> None:
+        """Documents indexed at their current content_hash are not reloaded."""
+        dataset_id = _seed_dataset(db_session, {"a.md": "Alpha", "b.md": "Beta"})
+        pipeline = DatasetIndexPipeline(
+            dataset_id=dataset_id, dataset_name="test-ds", embed_model=self.embed_model
+        )
+
+        with use_session(db_session):
+            first = pipeline.index()
+            second = pipeline.index()
+
+        assert first.fts_documents_indexed == 2
+        assert second.fts_documents_indexed == 0
+        assert second.documents_skipped == 2
+        assert second.vectors_inserted == 0
+
+    def test_bulk_runs_tune_merge_and_optimize(self, db_session) -> None:
+        """Runs over the bulk threshold tune FTS merging; optimize runs after."""
+        from catalog.core.settings import get_settings
+
+        dataset_id = _seed_dataset(db_session, {"a.md": "Alpha", "b.md": "Beta"})
+        pipeline = DatasetIndexPipeline(
+            dataset_id=dataset_id, dataset_name="test-ds", embed_model=self.embed_model
+        )
+        rag = get_settings().rag.model_copy(
+            update={
+                "fts_bulk_min_documents": 2,
+                "fts_bulk_automerge": 8,
+                "fts_bulk_crisismerge": 64,
+                "fts_optimize_segment_threshold": 1,
+            }
+        )
+        maintenance = MagicMock()
+        maintenance.optimize_if_needed.return_value = ["chunks_fts"]
+
+        with (
+            patch.object(DatasetIndexPipeline, "_settings", rag),
+            patch("index.pipelines.pipelines.FTSMaintenance", return_value=maintenance),
+            use_session(db_session),
+        ):
+            result = pipeline.index()
+            maintenance.bulk_merge.assert_called_once_with(8, 64)
+            maintenance.optimize_if_needed.assert_called_once_with(1)
+
+            maintenance.reset_mock()
+            pipeline.index(nodes=_make_nodes({"c.md": "Gamma"}, doc_id_start=50))
+            maintenance.bulk_merge.assert_not_called()
+
+        assert result.fts_tables_optimized == ["chunks_fts"]
+
+    def test_changed_document_reindexed_and_stale_chunks_removed(self, db_session) -> None:
+        """A changed document is reloaded; only its new chunks are embedded."""
+        from catalog.store.repositories import DocumentRepository
+        from index.store.fts_chunk import FTSChunkManager
+
+        dataset_id = _seed_dataset(db_session, {"a.md": "Alpha", "b.md": "Beta"})
+        pipeline = DatasetIndexPipeline(
+            dataset_id=dataset_id, dataset_name="test-ds", embed_model=self.embed_model
+        )
+
+        with use_session(db_session):
+            pipeline.index()
+            old_ids = FTSChunkManager().list_node_ids("test-ds:a.md")
+            doc = DocumentRepository().get_by_path(dataset_id, "a.md")
+            DocumentRepository().update(doc, body="Gamma", content_hash="hash-Gamma")
+            result = pipeline.index()
+            new_ids = FTSChunkManager().list_node_ids("test-ds:a.md")
+
+        assert result.fts_documents_indexed == 1
+        assert result.documents_skipped == 1
+        assert result.chunks_deleted == len(old_ids)
+        assert result.vectors_inserted == 1
+        assert new_ids and not (new_ids & old_ids)
+
+    def test_reactivated_document_is_reindexed(self, db_session) -> None:
+        """Markers of inactive documents are dropped during reconciliation."""
+        from catalog.store.repositories import DocumentRepository
+
+        dataset_id = _seed_dataset(db_session, {"a.md": "Alpha"})
+        pipeline = DatasetIndexPipeline(
+            dataset_id=dataset_id, dataset_name="test-ds", embed_model=self.embed_model
+        )
+
+        with use_session(db_session):
+            pipeline.index()
+            doc = DocumentRepository().get_by_path(dataset_id, "a.md")
+            doc.active = False
+            db_session.flush()
+            pipeline.index()
+            doc.active = True
+            db_session.flush()
+            result = pipeline.index()
+
+        assert result.fts_documents_indexed == 1
+
+
+class TestChunkPersistenceTransform:
+    """Tests for chunk ID diffing in ChunkPersistenceTransform."""
+
+    def _chunks(self, path: str, texts: list[str]) -> list[TextNode]:
+        return [
+            TextNode(text=text, metadata={"relative_path": path, "doc_id": 1})
+            for text in texts
+        ]
+
+    def test_reused_chunks_are_not_returned(self, db_session) -> None:
+        """Unchanged chunks of reusable documents skip embedding."""
+        with use_session(db_session):
+            ChunkPersistenceTransform("ds")(self._chunks("a.md", ["one", "two"]))
+            transform = ChunkPersistenceTransform("ds", reuse_paths={"a.md"})
+            result = transform(self._chunks("a.md", ["one", "three"]))
+
+        assert [node.get_content() for node in result] == ["three"]
+        assert transform.stats.skipped == 1
+        assert transform.stats.created == 1
+        assert transform.stats.deleted == 1
+
+    def test_without_reuse_all_chunks_returned(self, db_session) -> None:
+        """Documents not marked reusable are fully re-embedded."""
+        with use_session(db_session):
+            ChunkPersistenceTransform("ds")(self._chunks("a.md", ["one"]))
+            transform = ChunkPersistenceTransform("ds")
+            result = transform(self._chunks("a.md", ["one"]))
+
+        assert len(result) == 1
+        assert transform.stats.skipped == 0
+        assert transform.stats.deleted == 0
+
+    def test_stale_vectors_deleted(self, db_session) -> None:
+        """Stale chunk IDs are removed from the vector store."""
+        vector_manager = MagicMock()
+        vector_manager.existing_node_ids.side_effect = set
+        with use_session(db_session):
+            first = ChunkPersistenceTransform("ds")(self._chunks("a.md", ["one", "two"]))
+            stale_id = first[1].node_id
+            transform = ChunkPersistenceTransform(
+                "ds", vector_manager=vector_manager, reuse_paths={"a.md"}
+            )
+            transform(self._chunks("a.md", ["one"]))
+
+        vector_manager.delete_nodes.assert_called_once_with([stale_id])
+
+    def test_document_written_with_one_bulk_insert(self, db_session) -> None:
+        """A document's chunks are written with one executemany insert."""
+        from sqlalchemy import event
+
+        inserts: list[bool] = []
+
+        def record(conn, cursor, statement, params, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("INSERT INTO CHUNKS("):
+                inserts.append(executemany)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with use_session(db_session):
+                ChunkPersistenceTransform("ds")(self._chunks("a.md", ["one", "two", "three"]))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert inserts == [True]
+
+    def test_failed_write_keeps_previous_chunks(self, db_session) -> None:
+        """A failed bulk write is rolled back to the document's savepoint."""
+        from index.store.fts_chunk import FTSChunkManager
+
+        with use_session(db_session):
+            ChunkPersistenceTransform("ds")(self._chunks("a.md", ["one", "two"]))
+            before = FTSChunkManager().list_node_ids("ds:a.md")
+
+            transform = ChunkPersistenceTransform("ds")
+            with patch.object(
+                FTSChunkManager, "replace_document", side_effect=RuntimeError("disk full")
+            ):
+                result = transform(self._chunks("a.md", ["three"]))
+
+            assert FTSChunkManager().list_node_ids("ds:a.md") == before
+
+        assert result == []
+        assert transform.stats.failed == 1
+        assert transform.stats.deleted == 0
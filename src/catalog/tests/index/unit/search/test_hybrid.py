@@ -3,12 +3,16 @@
 Tests for WeightedRRFRetriever and HybridRetriever classes.
 """
 
+import contextvars
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 
 from index.search.hybrid import HybridRetriever, WeightedRRFRetriever
+from index.search.models import SearchResult
+from index.search.query_expansion import QueryExpansionResult
 
 
 class TestWeightedRRFRetriever:
@@ -313,6 +317,97 @@ class TestWeightedRRFRetriever:
         assert len(results) == 1
         assert results[0].node.node_id == "node1"
 
+    def test_retrievers_run_concurrently(
+        self, mock_retriever_a: MagicMock, mock_retriever_b: MagicMock
+    ) -> None:
+        """Sub-retrievers overlap instead of running one after the other."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _wait_then(node_id: str) -> list[NodeWithScore]:
+            barrier.wait()  # Deadlocks (times out) if run sequentially
+            return [self._make_node_with_score(node_id, node_id, 0.5)]
+
+        mock_retriever_a.retrieve.side_effect = lambda _: _wait_then("a")
+        mock_retriever_b.retrieve.side_effect = lambda _: _wait_then("b")
+
+        retriever = WeightedRRFRetriever(
+            retrievers=[mock_retriever_a, mock_retriever_b],
+            weights=[1.0, 1.0],
+        )
+        results = retriever._retrieve(QueryBundle(query_str="test query"))
+
+        assert {r.node.node_id for r in results} == {"a", "b"}
+
+    def test_slow_leg_is_dropped_after_timeout(
+        self, mock_retriever_a: MagicMock, mock_retriever_b: MagicMock
+    ) -> None:
+        """A leg that misses its timeout is dropped; other legs still fuse."""
+        release = threading.Event()
+        mock_retriever_a.retrieve.return_value = [
+            self._make_node_with_score("fts-hit", "text", 0.9),
+        ]
+
+        def _slow(_: QueryBundle) -> list[NodeWithScore]:
+            release.wait(5)
+            return [self._make_node_with_score("vec-hit", "text", 0.9)]
+
+        mock_retriever_b.retrieve.side_effect = _slow
+
+        retriever = WeightedRRFRetriever(
+            retrievers=[mock_retriever_a, mock_retriever_b],
+            weights=[1.0, 1.0],
+            leg_names=["fts", "vector"],
+            timeouts_ms=[None, 50],
+        )
+        try:
+            results = retriever._retrieve(QueryBundle(query_str="test query"))
+        finally:
+            release.set()
+
+        assert [r.node.node_id for r in results] == ["fts-hit"]
+        assert retriever.degraded_legs == ["vector"]
+        assert set(retriever.leg_timings_ms) == {"fts", "vector"}
+        assert retriever.leg_timings_ms["vector"] >= 50
+
+    def test_leg_options_must_match_retrievers(
+        self, mock_retriever_a: MagicMock
+    ) -> None:
+        """leg_names and timeouts_ms need one entry per retriever."""
+        with pytest.raises(ValueError, match="leg_names"):
+            WeightedRRFRetriever(
+                retrievers=[mock_retriever_a], weights=[1.0], leg_names=["a", "b"]
+            )
+        with pytest.raises(ValueError, match="timeouts_ms"):
+            WeightedRRFRetriever(
+                retrievers=[mock_retriever_a], weights=[1.0], timeouts_ms=[]
+            )
+
+    def test_retrievers_see_callers_context(
+        self, mock_retriever_a: MagicMock, mock_retriever_b: MagicMock
+    ) -> None:
+        """Context variables (e.g. the ambient session) reach worker threads."""
+        ambient: contextvars.ContextVar[str] = contextvars.ContextVar("ambient")
+        seen: list[str] = []
+
+        def _record(_: QueryBundle) -> list[NodeWithScore]:
+            seen.append(ambient.get("missing"))
+            return []
+
+        mock_retriever_a.retrieve.side_effect = _record
+        mock_retriever_b.retrieve.side_effect = _record
+
+        retriever = WeightedRRFRetriever(
+            retrievers=[mock_retriever_a, mock_retriever_b],
+            weights=[1.0, 1.0],
+        )
+        token = ambient.set("session")
+        try:
+            retriever._retrieve(QueryBundle(query_str="test query"))
+        finally:
+            ambient.reset(token)
+
+        assert seen == ["session", "session"]
+
     def test_different_k_values(
         self, mock_retriever_a: MagicMock
     ) -> None:
@@ -375,6 +470,7 @@ class TestHybridRetriever:
         settings.fts_top_k = 20
         settings.vector_top_k = 20
         settings.fusion_top_k = 30
+        settings.hybrid_vector_timeout_ms = 0
         return settings
 
     def test_init_default_vector_manager(self, mock_session: MagicMock) -> None:
@@ -532,3 +628,82 @@ class TestHybridRetriever:
             assert len(retriever.retrievers) == 2
             # Should have exactly 2 weights
             assert len(retriever.weights) == 2
+
+    def test_build_with_expansions_adds_weighted_legs(
+        self,
+        mock_session: MagicMock,
+        mock_vector_manager: MagicMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Lex expansions add FTS legs; vec and HyDE add vector legs."""
+        mock_settings.rrf_expansion_weight = 1.0
+        expansion = QueryExpansionResult(
+            original="rust async",
+            lex_expansions=["tokio runtime", "Rust Async"],  # second duplicates query
+            vec_expansions=["asynchronous rust programming"],
+            hyde_passage="Tokio is an async runtime for Rust.",
+        )
+        with patch("index.search.hybrid.get_settings") as mock_get_settings, \
+             patch("index.search.hybrid.FTSChunkRetriever") as mock_fts_cls:
+            mock_get_settings.return_value.rag = mock_settings
+
+            factory = HybridRetriever(mock_session, mock_vector_manager)
+            retriever = factory.build(query="rust async", expansion_result=expansion)
+
+        # original FTS + vector, one lex leg, vec + hyde legs
+        assert len(retriever.retrievers) == 5
+        assert mock_fts_cls.call_count == 2
+        # Expansion legs get rrf_expansion_weight relative to the original weight
+        assert retriever.weights == [2.0, 2.0, 1.0, 1.0, 1.0]
+
+    def test_multi_query_vector_legs_share_one_batch(
+        self,
+        mock_session: MagicMock,
+        mock_vector_manager: MagicMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        """All vector legs are served by a single search_many call."""
+        mock_settings.rrf_expansion_weight = 1.0
+        mock_settings.hybrid_dedupe_enabled = False
+        expansion = QueryExpansionResult(
+            original="rust async",
+            lex_expansions=["tokio runtime"],
+            vec_expansions=["asynchronous rust programming"],
+            hyde_passage="Tokio is an async runtime for Rust.",
+        )
+
+        def _search_many(queries, top_k, dataset_name):
+            return [
+                [SearchResult(path=f"{i}.md", dataset_name="obsidian", score=0.5,
+                              metadata={"node_id": f"v{i}"})]
+                for i in range(len(queries))
+            ]
+
+        fts_queries: list[str] = []
+
+        def _fts_retrieve(bundle: QueryBundle) -> list[NodeWithScore]:
+            fts_queries.append(bundle.query_str)
+            return [NodeWithScore(node=TextNode(id_=f"f-{bundle.query_str}", text="t"),
+                                  score=1.0)]
+
+        with patch("index.search.hybrid.get_settings") as mock_get_settings, \
+             patch("index.search.hybrid.FTSChunkRetriever") as mock_fts_cls, \
+             patch("index.search.hybrid.VectorSearch.search_many",
+                   side_effect=_search_many) as mock_search_many:
+            mock_get_settings.return_value.rag = mock_settings
+            mock_fts_cls.return_value.retrieve.side_effect = _fts_retrieve
+
+            factory = HybridRetriever(mock_session, mock_vector_manager)
+            retriever = factory.build(query="rust async", expansion_result=expansion)
+            results = retriever.retrieve(QueryBundle(query_str="rust async"))
+
+        mock_search_many.assert_called_once()
+        assert mock_search_many.call_args.kwargs["queries"] == [
+            "rust async",
+            "asynchronous rust programming",
+            "Tokio is an async runtime for Rust.",
+        ]
+        assert sorted(fts_queries) == ["rust async", "tokio runtime"]
+        assert {r.node.node_id for r in results} == {
+            "v0", "v1", "v2", "f-rust async", "f-tokio runtime",
+        }
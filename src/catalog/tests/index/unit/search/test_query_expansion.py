@@ -269,10 +269,10 @@ class TestFallbackBehavior:
         transform = QueryExpansionTransform(db_session, model_name="test-model")
 
         # Mock the provider to raise an error
-        with patch("agentlayer.llm.provider.MLXProvider") as mock_provider_cls:
+        with patch("agentlayer.llm.registry.get_model_registry") as mock_registry:
             mock_provider = MagicMock()
             mock_provider.generate = AsyncMock(side_effect=Exception("LLM unavailable"))
-            mock_provider_cls.return_value = mock_provider
+            mock_registry.return_value.get_llm.return_value = mock_provider
 
             result = await transform.expand("test query")
 
@@ -318,12 +318,12 @@ class TestCacheIntegration:
         """Expansion results are cached after generation."""
         transform = QueryExpansionTransform(db_session, model_name="test-model")
 
-        with patch("agentlayer.llm.provider.MLXProvider") as mock_provider_cls:
+        with patch("agentlayer.llm.registry.get_model_registry") as mock_registry:
             mock_provider = MagicMock()
             mock_provider.generate = AsyncMock(
                 return_value="lex: python programming test\nvec: semantic python test"
             )
-            mock_provider_cls.return_value = mock_provider
+            mock_registry.return_value.get_llm.return_value = mock_provider
 
             # First call generates and caches
             result1 = await transform.expand("python test")
@@ -352,15 +352,42 @@ class TestCacheIntegration:
         db_session.flush()
 
         # Should use cache, not call LLM
-        with patch("agentlayer.llm.provider.MLXProvider") as mock_provider_cls:
+        with patch("agentlayer.llm.registry.get_model_registry") as mock_registry:
             result = await transform.expand("python test")
 
-            # Provider should not be instantiated
-            mock_provider_cls.assert_not_called()
+            # Provider should not be requested
+            mock_registry.assert_not_called()
 
         assert "cached lex python" in result.lex_expansions
         assert "cached vec test" in result.vec_expansions
 
+    @pytest.mark.asyncio
+    async def test_expand_many_batches_cache_access(self, db_session) -> None:
+        """expand_many serves hits from one lookup and only generates misses."""
+        transform = QueryExpansionTransform(db_session, model_name="test-model")
+        transform._cache.set_expansion(
+            "cached query",
+            "test-model",
+            {"lex_expansions": ["cached lex"], "vec_expansions": [], "hyde_passage": None},
+        )
+        db_session.flush()
+
+        with patch("agentlayer.llm.registry.get_model_registry") as mock_registry:
+            mock_provider = MagicMock()
+            mock_provider.generate = AsyncMock(
+                return_value="lex: python programming test\nvec: semantic python test"
+            )
+            mock_registry.return_value.get_llm.return_value = mock_provider
+
+            results = await transform.expand_many(
+                ["cached query", "python test", "python test"]
+            )
+
+        assert mock_provider.generate.await_count == 1
+        assert [r.original for r in results] == ["cached query", "python test", "python test"]
+        assert results[0].lex_expansions == ["cached lex"]
+        assert transform._cache.get_expansion("python test", "test-model") is not None
+
 
 class TestSettingsIntegration:
     """Tests for settings integration."""
@@ -0,0 +1,166 @@
+"""Tests for index.search.rerank MLX scoring path."""
+
+import asyncio
+import re
+import threading
+import time
+
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from index.eval.rerank import benchmark_rerank
+from index.search.rerank import Reranker
+
+
+def _nodes(count: int) -> list[NodeWithScore]:
+    """Build candidates doc-0..doc-N with decreasing retrieval scores."""
+    return [
+        NodeWithScore(node=TextNode(id_=f"n{i}", text=f"doc-{i}"), score=0.05 - i * 0.001)
+        for i in range(count)
+    ]
+
+
+class FakeProvider:
+    """Async provider that rates doc-N as N (mod 11), with optional latency.
+
+    Listwise prompts get one "[k] score" line per document; pointwise
+    prompts get "Yes" for odd-numbered docs.
+    """
+
+    def __init__(self, delay: float = 0.0, fail_listwise: bool = False) -> None:
+        self.delay = delay
+        self.fail_listwise = fail_listwise
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    async def generate(self, prompt: str, **kwargs) -> str:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            docs = [int(n) for n in re.findall(r"doc-(\d+)", prompt)]
+            if "Document [" in prompt:
+                if self.fail_listwise:
+                    return "I cannot rate these."
+                return "\n".join(f"[{k}] {n % 11}" for k, n in enumerate(docs, start=1))
+            return "Yes" if docs[0] % 2 else "No"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestRerankerMLX:
+    """Tests for batched, concurrent, budgeted MLX reranking."""
+
+    def test_listwise_batches_candidates(self) -> None:
+        """Listwise scoring issues one LLM call per batch and sorts by score."""
+        provider = FakeProvider()
+        reranker = Reranker(strategy="listwise", batch_size=4, budget_ms=0, mlx_provider=provider)
+
+        result = reranker.rerank(_nodes(10), "query", top_n=3)
+
+        assert provider.calls == 3  # 4 + 4 + 2
+        assert [n.node.node_id for n in result] == ["n9", "n8", "n7"]
+        assert result[0].score == 0.9
+
+    def test_pointwise_scores_each_node(self) -> None:
+        """Pointwise strategy keeps the per-candidate Yes/No scoring."""
+        provider = FakeProvider()
+        reranker = Reranker(strategy="pointwise", budget_ms=0, mlx_provider=provider)
+
+        result = reranker.rerank(_nodes(4), "query", top_n=4)
+
+        assert provider.calls == 4
+        assert {n.node.node_id for n in result[:2]} == {"n1", "n3"}
+        assert all(n.score == 1.0 for n in result[:2])
+
+    def test_unparseable_listwise_keeps_retrieval_order(self) -> None:
+        """Documents the listwise response did not rate keep their prior rank."""
+        provider = FakeProvider(fail_listwise=True)
+        reranker = Reranker(strategy="listwise", batch_size=3, budget_ms=0, mlx_provider=provider)
+        nodes = _nodes(3)
+
+        result = reranker.rerank(nodes, "query", top_n=3)
+
+        assert provider.calls == 1  # no pointwise fallback calls
+        assert result == nodes
+
+    def test_listwise_single_document_span_uses_listwise_scale(self) -> None:
+        """A trailing one-document batch is rated 0-10, not Yes/No."""
+        provider = FakeProvider()
+        reranker = Reranker(strategy="listwise", batch_size=2, budget_ms=0, mlx_provider=provider)
+
+        result = reranker.rerank(_nodes(3), "query", top_n=3)
+
+        assert provider.calls == 2
+        assert [(n.node.node_id, n.score) for n in result] == [
+            ("n2", 0.2),
+            ("n1", 0.1),
+            ("n0", 0.0),
+        ]
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency LLM calls run at once."""
+        provider = FakeProvider(delay=0.02)
+        reranker = Reranker(
+            strategy="pointwise", max_concurrency=3, budget_ms=0, mlx_provider=provider
+        )
+
+        reranker.rerank(_nodes(9), "query", top_n=9)
+
+        assert provider.calls == 9
+        assert 1 < provider.max_active <= 3
+
+    def test_budget_keeps_retrieval_scores_for_unscored(self) -> None:
+        """Candidates not scored within the budget keep their retrieval score."""
+        provider = FakeProvider(delay=0.2)
+        reranker = Reranker(
+            strategy="listwise", batch_size=2, max_concurrency=1, budget_ms=300,
+            mlx_provider=provider,
+        )
+        nodes = _nodes(6)
+
+        started = time.perf_counter()
+        result = reranker.rerank(nodes, "query", top_n=6)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.5
+        assert len(result) == 6
+        # First batch scored by the LLM, the rest returned unchanged after it.
+        assert {n.node.node_id for n in result[:2]} == {"n0", "n1"}
+        assert result[2:] == nodes[2:]
+
+    def test_runs_inside_event_loop(self) -> None:
+        """rerank() works when called from a running event loop."""
+        reranker = Reranker(
+            strategy="listwise", batch_size=5, budget_ms=0, mlx_provider=FakeProvider()
+        )
+
+        async def call() -> list[NodeWithScore]:
+            return reranker.rerank(_nodes(5), "query", top_n=2)
+
+        result = asyncio.run(call())
+
+        assert [n.node.node_id for n in result] == ["n4", "n3"]
+
+
+class TestBenchmarkRerank:
+    """Tests for the serial vs batched rerank benchmark."""
+
+    def test_reports_latency_and_call_counts(self) -> None:
+        """Benchmark reports both paths and the batched path makes fewer calls."""
+        report = benchmark_rerank(
+            _nodes(8), "query", FakeProvider(delay=0.005), top_n=4, runs=2,
+            batch_size=4, max_concurrency=2,
+        )
+
+        assert report["candidates"] == 8.0
+        assert report["serial_llm_calls"] == 8.0
+        assert report["batched_llm_calls"] == 2.0
+        assert report["serial_latency_ms_p50"] > report["batched_latency_ms_p50"]
+        assert report["speedup"] > 1.0
+        assert 0.0 <= report["top_n_overlap"] <= 1.0
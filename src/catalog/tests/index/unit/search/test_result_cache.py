@@ -0,0 +1,104 @@
+"""Tests for index.search.result_cache."""
+
+from index.search.models import SearchCriteria, SearchResult, SearchResults
+from index.search.result_cache import SearchResultCache, normalize_query
+
+
+def _results(path: str = "a.md") -> SearchResults:
+    return SearchResults(
+        results=[SearchResult(path=path, dataset_name="ds", score=0.9)],
+        query="q",
+        mode="hybrid",
+        total_candidates=1,
+        timing_ms=12.0,
+    )
+
+
+def test_normalize_query() -> None:
+    """Case, spacing and Unicode form do not matter."""
+    assert normalize_query("  Python\tＡsync   Patterns ") == "python async patterns"
+
+
+def test_exact_hit_ignores_case_and_spacing() -> None:
+    """A normalized-equal query with the same criteria and generation hits."""
+    cache = SearchResultCache()
+    cache.put(SearchCriteria(query="Python async"), "1:0", _results())
+
+    hit = cache.get(SearchCriteria(query="python   ASYNC"), "1:0")
+
+    assert hit is not None
+    assert hit.results[0].path == "a.md"
+    assert cache.stats.hits == 1
+
+
+def test_criteria_and_generation_are_part_of_the_key() -> None:
+    """Other criteria or a bumped generation miss."""
+    cache = SearchResultCache()
+    cache.put(SearchCriteria(query="q"), "1:0", _results())
+
+    assert cache.get(SearchCriteria(query="q", limit=5), "1:0") is None
+    assert cache.get(SearchCriteria(query="q", mode="fts"), "1:0") is None
+    assert cache.get(SearchCriteria(query="q"), "1:1") is None
+    assert cache.stats.misses == 3
+
+
+def test_semantic_hit_above_threshold() -> None:
+    """A similar enough query embedding reuses a cached result."""
+    cache = SearchResultCache()
+    cache.put(SearchCriteria(query="async in python"), "g", _results("async.md"), embedding=[1.0, 0.0])
+    cache.put(SearchCriteria(query="garden notes"), "g", _results("garden.md"), embedding=[0.0, 1.0])
+
+    close = cache.get(
+        SearchCriteria(query="python async"), "g", embedding=[0.99, 0.1], min_similarity=0.95
+    )
+    far = cache.get(
+        SearchCriteria(query="rust traits"), "g", embedding=[0.7, 0.7], min_similarity=0.95
+    )
+    other_generation = cache.get(
+        SearchCriteria(query="python async"), "g2", embedding=[1.0, 0.0], min_similarity=0.95
+    )
+
+    assert close is not None and close.results[0].path == "async.md"
+    assert far is None
+    assert other_generation is None
+    assert cache.stats.semantic_hits == 1
+
+
+def test_embed_called_only_on_exact_miss() -> None:
+    """The lazy embedding callback runs only when the exact lookup misses."""
+    cache = SearchResultCache()
+    cache.put(SearchCriteria(query="python async"), "g", _results(), embedding=[1.0, 0.0])
+    calls: list[str] = []
+
+    def embed() -> list[float]:
+        calls.append("embed")
+        return [0.99, 0.1]
+
+    exact = cache.get(SearchCriteria(query="Python Async"), "g", min_similarity=0.95, embed=embed)
+    similar = cache.get(SearchCriteria(query="async python"), "g", min_similarity=0.95, embed=embed)
+
+    assert exact is not None and similar is not None
+    assert calls == ["embed"]
+    assert (cache.stats.hits, cache.stats.semantic_hits, cache.stats.misses) == (1, 1, 0)
+
+
+def test_lru_eviction_and_copies() -> None:
+    """Capacity is enforced LRU-first and callers get independent copies."""
+    cache = SearchResultCache(max_entries=2)
+    cache.put(SearchCriteria(query="a"), "g", _results("a.md"), embedding=[1.0, 0.0])
+    cache.put(SearchCriteria(query="b"), "g", _results("b.md"))
+    cache.get(SearchCriteria(query="a"), "g").results.clear()
+    cache.put(SearchCriteria(query="c"), "g", _results("c.md"))
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.get(SearchCriteria(query="b"), "g") is None
+    assert cache.get(SearchCriteria(query="a"), "g").results[0].path == "a.md"
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    """max_entries=0 disables caching."""
+    cache = SearchResultCache(max_entries=0)
+    cache.put(SearchCriteria(query="q"), "g", _results())
+
+    assert cache.get(SearchCriteria(query="q"), "g") is None
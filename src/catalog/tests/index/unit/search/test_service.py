@@ -194,6 +194,30 @@ class TestSearchServiceSearch:
             mock_hybrid.assert_called_once()
             assert results.mode == "hybrid"
 
+    def test_search_reports_hybrid_leg_timings(self, mock_service: SearchService) -> None:
+        """Per-leg timings and dropped legs survive bonus and limit steps."""
+        mock_results = [
+            SearchResult(path="test.md", dataset_name="test", score=1.0,
+                         scores={"retrieval": 1.0})
+        ]
+
+        with patch.object(mock_service, "search_hybrid") as mock_hybrid:
+            mock_hybrid.return_value = SearchResults(
+                results=mock_results,
+                query="test",
+                mode="hybrid",
+                total_candidates=1,
+                timing_ms=0,
+                leg_timings_ms={"fts": 3.0, "vector": 250.0},
+                degraded_legs=["vector"],
+            )
+
+            criteria = SearchCriteria(query="test", mode="hybrid", limit=10)
+            results = mock_service.search(criteria)
+
+        assert results.leg_timings_ms == {"fts": 3.0, "vector": 250.0}
+        assert results.degraded_legs == ["vector"]
+
 
 class TestSearchServiceTopRankBonus:
     """Tests for top-rank bonus application."""
@@ -264,6 +288,44 @@ class TestSearchServiceTopRankBonus:
         assert modified.results[3].scores.get("bonus") == 0.0
 
 
+class TestSearchServiceRerank:
+    """Tests for applying the cached reranker."""
+
+    def test_unscored_results_keep_original_score(self) -> None:
+        """Results the reranker left unscored get no rerank score."""
+        service = SearchService(MagicMock())
+        results = SearchResults(
+            results=[
+                SearchResult(
+                    path=path,
+                    dataset_name="test",
+                    score=score,
+                    snippet=SnippetResult(text=path, start_line=1, end_line=1, header="@@ -1,1 +1,1 @@ test"),
+                    scores={"retrieval": score},
+                )
+                for path, score in (("a.md", 0.9), ("b.md", 0.8))
+            ],
+            query="test",
+            mode="hybrid",
+            total_candidates=2,
+            timing_ms=0,
+        )
+
+        def rerank(query, nodes, top_n):
+            # b.md is scored; a.md is handed back unchanged (budget exhausted)
+            return [nodes[1].model_copy(update={"score": 0.4}), nodes[0]]
+
+        service._cached_reranker = MagicMock()
+        service._cached_reranker.rerank.side_effect = rerank
+
+        reranked = service._apply_rerank(results, "test", limit=10)
+
+        assert [r.path for r in reranked.results] == ["b.md", "a.md"]
+        assert reranked.results[0].scores["rerank"] == 0.4
+        assert "rerank" not in reranked.results[1].scores
+        assert reranked.results[1].score == 0.9
+
+
 class TestSearchServiceNodeConversion:
     """Tests for node-to-SearchResult conversion."""
 
@@ -314,6 +376,117 @@ class TestSearchServiceNodeConversion:
         assert results[0].path == "notes.md"
 
 
+class TestSearchServiceReadOnly:
+    """Tests for retrieval on read-only sessions."""
+
+    def test_read_only_fts_runs_on_read_session(self) -> None:
+        """With read_only, FTS retrieval sees a pooled read session as ambient."""
+        from contextlib import contextmanager
+
+        from agentlayer.session import current_session
+
+        read_session = MagicMock()
+        seen = []
+
+        @contextmanager
+        def fake_read_session():
+            yield read_session
+
+        service = SearchService(MagicMock(), read_only=True)
+        fts = MagicMock()
+        fts.retrieve.side_effect = lambda bundle: seen.append(current_session()) or []
+        service._fts_search = fts
+
+        with patch("catalog.store.database.get_read_session", fake_read_session):
+            service.search_fts("query", limit=5)
+
+        assert seen == [read_session]
+
+    def test_default_fts_runs_on_service_session(self) -> None:
+        """Without read_only, retrieval keeps using the caller's session."""
+        service = SearchService(MagicMock())
+        service._fts_search = MagicMock(**{"retrieve.return_value": []})
+
+        with patch("catalog.store.database.get_read_session") as get_read_session:
+            service.search_fts("query", limit=5)
+
+        get_read_session.assert_not_called()
+
+
+class TestSearchServiceResultCache:
+    """Tests for the query-result cache in search()."""
+
+    @staticmethod
+    def _fts_results() -> SearchResults:
+        return SearchResults(
+            results=[SearchResult(path="a.md", dataset_name="ds", score=0.9)],
+            query="q",
+            mode="fts",
+            total_candidates=1,
+            timing_ms=0,
+        )
+
+    def test_repeat_search_served_until_generation_changes(self) -> None:
+        """A repeated query skips retrieval until the index generation moves."""
+        service = SearchService(MagicMock())
+        tokens = iter(["1:0", "1:0", "1:1"])
+
+        with patch(
+            "catalog.store.repositories.IndexGenerationRepository.token",
+            side_effect=lambda dataset_name: next(tokens),
+        ), patch.object(service, "search_fts", return_value=self._fts_results()) as fts:
+            first = service.search(SearchCriteria(query="Tokio executor", mode="fts"))
+            second = service.search(SearchCriteria(query="tokio  executor", mode="fts"))
+            assert fts.call_count == 1
+            service.search(SearchCriteria(query="tokio executor", mode="fts"))
+
+        assert fts.call_count == 2
+        assert second.results == first.results
+        assert second.query == "tokio  executor"
+        assert service.result_cache.stats.hits == 1
+
+    def test_similar_query_served_when_enabled(self) -> None:
+        """With result_cache_similarity set, a paraphrase reuses cached results."""
+        service = SearchService(MagicMock())
+        service._settings = service._settings.model_copy(
+            update={"result_cache_similarity": 0.9}
+        )
+        embeddings = {"tokio executor": [1.0, 0.0], "executor in tokio": [0.98, 0.05]}
+        service._cache_embed_model = MagicMock(
+            **{"get_query_embedding.side_effect": lambda q: embeddings[q]}
+        )
+
+        with patch(
+            "catalog.store.repositories.IndexGenerationRepository.token",
+            return_value="1:0",
+        ), patch.object(service, "search_fts", return_value=self._fts_results()) as fts:
+            service.search(SearchCriteria(query="tokio executor", mode="fts"))
+            service.search(SearchCriteria(query="executor in tokio", mode="fts"))
+
+        assert fts.call_count == 1
+        assert service.result_cache.stats.semantic_hits == 1
+
+    def test_exact_hit_does_not_embed_query(self) -> None:
+        """The query is only embedded when the exact lookup misses."""
+        service = SearchService(MagicMock())
+        service._settings = service._settings.model_copy(
+            update={"result_cache_similarity": 0.9}
+        )
+        service._cache_embed_model = MagicMock(
+            **{"get_query_embedding.return_value": [1.0, 0.0]}
+        )
+
+        with patch(
+            "catalog.store.repositories.IndexGenerationRepository.token",
+            return_value="1:0",
+        ), patch.object(service, "search_fts", return_value=self._fts_results()):
+            service.search(SearchCriteria(query="tokio executor", mode="fts"))
+            service.search(SearchCriteria(query="Tokio Executor", mode="fts"))
+
+        service._cache_embed_model.get_query_embedding.assert_called_once_with("tokio executor")
+        assert service.result_cache.stats.hits == 1
+
+
 class TestSearchConvenienceFunction:
     """Tests for search convenience function."""
 
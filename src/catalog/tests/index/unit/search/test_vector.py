@@ -54,3 +54,34 @@ class TestVectorSearch:
         results = search.search(query="none", top_k=3)
 
         assert results == []
+
+    def test_search_many_looks_up_chunk_text_once(self) -> None:
+        """search_many issues one semantic batch and one chunk text lookup."""
+        manager = MagicMock()
+        manager.vector_backend = "zvec"
+        manager.semantic_query_many.return_value = [
+            [VectorQueryHit(node_id="chunk-a", score=0.9,
+                            metadata={"source_doc_id": "obsidian:a.md"})],
+            [
+                VectorQueryHit(node_id="chunk-b", score=0.8,
+                               metadata={"source_doc_id": "obsidian:b.md"}),
+                VectorQueryHit(node_id="chunk-a", score=0.7,
+                               metadata={"source_doc_id": "obsidian:a.md"}),
+            ],
+        ]
+
+        search = VectorSearch(vector_manager=manager)
+        search._lookup_chunk_text = MagicMock(
+            return_value={"chunk-a": "alpha", "chunk-b": "beta"}
+        )
+
+        results = search.search_many(["first", "second"], top_k=5, dataset_name="obsidian")
+
+        manager.semantic_query_many.assert_called_once_with(
+            queries=["first", "second"], top_k=5, dataset_name="obsidian"
+        )
+        search._lookup_chunk_text.assert_called_once_with(["chunk-a", "chunk-b"])
+        assert [[r.path for r in per_query] for per_query in results] == [
+            ["a.md"],
+            ["b.md", "a.md"],
+        ]
@@ -60,6 +60,38 @@ class TestFTSTable:
             assert result.scalar() is None
 
 
+def test_create_fts_table_migrates_missing_dataset_column(tmp_path: Path) -> None:
+    """An index without dataset_id is recreated from active documents."""
+    engine = create_engine_for_path(tmp_path / "legacy.db")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(
+            text(
+                "CREATE VIRTUAL TABLE documents_fts USING fts5("
+                "path, body, content='', contentless_delete=1, tokenize='porter unicode61')"
+            )
+        )
+        conn.commit()
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    ds = Dataset(name="ds", uri="dataset:ds", source_type="dir", source_path="/p")
+    session.add(ds)
+    session.flush()
+    session.add_all([
+        Document(parent_id=ds.id, uri="document:ds/a.md", path="a.md",
+                 content_hash="h1", body="Apple pie"),
+        Document(parent_id=ds.id, uri="document:ds/b.md", path="b.md",
+                 content_hash="h2", body="Apple tart", active=False),
+    ])
+    session.commit()
+
+    create_fts_table(engine)
+
+    results = FTSManager(session).search("apple", parent_filter=ds.id)
+    assert [r.path for r in results] == ["a.md"]
+    assert FTSManager(session).count() == 1
+    session.close()
+
+
 class TestFTSManager:
     """Tests for FTSManager class."""
 
@@ -245,6 +277,26 @@ class TestFTSManager:
         assert len(results) == 1
         assert results[0].path == "doc1.md"
 
+    def test_parent_filter_is_part_of_match(
+        self, fts_manager: FTSManager, db_session
+    ) -> None:
+        """The dataset filter is an FTS5 column filter, and dataset IDs in the
+        query do not match the partition column."""
+        ds = Dataset(name="ds", uri="dataset:ds", source_type="dir", source_path="/p")
+        db_session.add(ds)
+        db_session.flush()
+
+        fts_manager.upsert(101, "a.md", "Apple pie", dataset_id=ds.id)
+        fts_manager.upsert(102, "b.md", "Apple cider", dataset_id=ds.id + 1)
+        db_session.flush()
+
+        rowids = db_session.execute(
+            text("SELECT rowid FROM documents_fts WHERE documents_fts MATCH :q"),
+            {"q": f'dataset_id : "{ds.id}" AND apple'},
+        ).scalars().all()
+        assert rowids == [101]
+        assert fts_manager.search(str(ds.id)) == []
+
     def test_search_excludes_inactive(
         self, fts_manager: FTSManager, db_session, sample_dataset: Dataset
     ) -> None:
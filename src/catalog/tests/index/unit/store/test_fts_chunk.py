@@ -0,0 +1,276 @@
+"""Tests for the chunks table and its FTS index in index.store.fts_chunk."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import sessionmaker
+
+from agentlayer.database import create_engine_for_path
+from index.eval.fts_query import benchmark_fts_query_overhead
+from index.eval.fts_write import benchmark_chunk_writes
+from index.eval.read_pool import benchmark_concurrent_search
+from index.store.fts_chunk import (
+    FTSChunkManager,
+    _search_sql,
+    create_chunks_fts_table,
+)
+
+
+@pytest.fixture
+def fts(tmp_path: Path) -> FTSChunkManager:
+    """FTSChunkManager over a fresh chunks_fts table."""
+    engine = create_engine_for_path(tmp_path / "test.db")
+    create_chunks_fts_table(engine)
+    session = sessionmaker(bind=engine)()
+    yield FTSChunkManager(session)
+    session.close()
+
+
+class TestReplaceDocument:
+    """Tests for FTSChunkManager.replace_document."""
+
+    def test_replaces_all_chunks_of_document(self, fts: FTSChunkManager) -> None:
+        """Old chunks of the document are removed, other documents untouched."""
+        fts.replace_document("ds:a.md", [("a:0", "alpha"), ("a:1", "beta")])
+        fts.replace_document("ds:b.md", [("b:0", "gamma")])
+
+        written = fts.replace_document("ds:a.md", [("a2:0", "delta")])
+
+        assert written == 1
+        assert fts.list_node_ids("ds:a.md") == {"a2:0"}
+        assert fts.list_node_ids("ds:b.md") == {"b:0"}
+        assert [r.node_id for r in fts.search_with_scores("delta")] == ["a2:0"]
+
+    def test_similar_ids_are_not_confused(self, fts: FTSChunkManager) -> None:
+        """IDs sharing tokens with another document only match exactly."""
+        fts.replace_document("ds:notes/a.md", [("x:0", "one")])
+        fts.replace_document("ds:notes/a.md.bak", [("y:0", "two")])
+        fts.replace_document("ds:archive/notes/a.md", [("z:0", "three")])
+
+        fts.replace_document("ds:notes/a.md", [])
+
+        assert fts.list_node_ids("ds:notes/a.md") == set()
+        assert fts.list_node_ids("ds:notes/a.md.bak") == {"y:0"}
+        assert fts.list_node_ids("ds:archive/notes/a.md") == {"z:0"}
+
+    def test_ids_with_quotes_and_no_tokens(self, fts: FTSChunkManager) -> None:
+        """IDs that need escaping or have no word characters still work."""
+        fts.replace_document('ds:say "hi".md', [("q:0", "quoted")])
+        fts.replace_document("::", [("p:0", "punctuation")])
+
+        assert fts.list_node_ids('ds:say "hi".md') == {"q:0"}
+        assert fts.delete_by_source_doc_id("::") == 1
+
+
+class TestUpsertMany:
+    """Tests for FTSChunkManager.upsert_many."""
+
+    def test_upserts_by_node_id(self, fts: FTSChunkManager) -> None:
+        """Existing node IDs are overwritten, new ones inserted."""
+        fts.upsert("n:0", "old text", "ds:a.md")
+
+        fts.upsert_many([("n:0", "new text", "ds:a.md"), ("n:1", "more", "ds:b.md")])
+
+        assert fts.count() == 2
+        assert fts.search_with_scores("old") == []
+        assert [r.node_id for r in fts.search_with_scores("new")] == ["n:0"]
+
+
+class TestChunksTable:
+    """Tests for the chunks table and its external-content FTS index."""
+
+    def test_row_columns(self, fts: FTSChunkManager) -> None:
+        """Chunk rows carry dataset, document, sequence, heading and body."""
+        fts.replace_document("ds:a.md", [("a:0", "# Title\nfirst"), ("a:1", "second")], doc_id=7)
+
+        rows = fts._session.execute(
+            sql_text(
+                "SELECT node_id, dataset_name, doc_id, seq, heading, body "
+                "FROM chunks ORDER BY seq"
+            )
+        ).all()
+
+        assert [tuple(row) for row in rows] == [
+            ("a:0", "ds", 7, 0, "Title", "first"),
+            ("a:1", "ds", 7, 1, "", "second"),
+        ]
+
+    def test_fts_follows_table_writes(self, fts: FTSChunkManager) -> None:
+        """Triggers keep chunks_fts in sync with updates and deletes."""
+        fts.upsert("n:0", "original words", "ds:a.md")
+        fts.upsert("n:0", "replacement words", "ds:a.md")
+        assert fts.search_with_scores("original") == []
+        assert [r.text for r in fts.search_with_scores("replacement")] == ["replacement words"]
+
+        fts.delete("n:0")
+
+        assert fts.search_with_scores("words") == []
+        integrity = "INSERT INTO chunks_fts(chunks_fts) VALUES('integrity-check')"
+        fts._session.execute(sql_text(integrity))
+
+    def test_get_texts(self, fts: FTSChunkManager) -> None:
+        """get_texts returns body text for known node IDs only."""
+        fts.replace_document("ds:a.md", [("a:0", "# Heading\nbody text")])
+
+        assert fts.get_texts(["a:0", "missing"]) == {"a:0": "body text"}
+
+
+class TestDatasetFilter:
+    """Tests for dataset-scoped chunk search."""
+
+    def test_dataset_filter_is_exact(self, fts: FTSChunkManager) -> None:
+        """Datasets whose names contain the filter's tokens are excluded."""
+        fts.replace_document("my-vault:a.md", [("a:0", "rust ownership")])
+        fts.replace_document("my-vault-2:a.md", [("b:0", "rust borrowing")])
+        fts.replace_document("other:a.md", [("c:0", "rust lifetimes")])
+
+        results = fts.search_with_scores("rust", dataset_name="my-vault")
+
+        assert [r.node_id for r in results] == ["a:0"]
+        assert fts.search_with_scores("rust", dataset_name="missing") == []
+
+    def test_dataset_name_not_matched_by_query(self, fts: FTSChunkManager) -> None:
+        """The dataset column is a filter only, never a query match."""
+        fts.replace_document("obsidian:a.md", [("a:0", "unrelated words")])
+
+        assert fts.search_with_scores("obsidian") == []
+
+    def test_rebuilds_index_without_dataset_column(self, tmp_path: Path) -> None:
+        """A chunks_fts without the dataset_name column is rebuilt from chunks."""
+        engine = create_engine_for_path(tmp_path / "old.db")
+        create_chunks_fts_table(engine)
+        with engine.connect() as conn:
+            for trigger in ("chunks_ai", "chunks_ad", "chunks_au"):
+                conn.execute(sql_text(f"DROP TRIGGER {trigger}"))
+            conn.execute(sql_text("DROP TABLE chunks_fts"))
+            conn.execute(
+                sql_text(
+                    "CREATE VIRTUAL TABLE chunks_fts USING fts5(node_id UNINDEXED, heading, "
+                    "body, source_doc_id UNINDEXED, content='chunks', content_rowid='id')"
+                )
+            )
+            conn.execute(
+                sql_text(
+                    "INSERT INTO chunks(node_id, source_doc_id, dataset_name, body) "
+                    "VALUES ('a:0', 'ds:a.md', 'ds', 'kept text')"
+                )
+            )
+            conn.commit()
+
+        create_chunks_fts_table(engine)
+
+        session = sessionmaker(bind=engine)()
+        results = FTSChunkManager(session).search_with_scores("kept", dataset_name="ds")
+        assert [r.node_id for r in results] == ["a:0"]
+        session.close()
+
+
+class TestPreparedSearch:
+    """Tests for the fixed-statement search path."""
+
+    def test_statement_text_fixed_per_filter_mode(self) -> None:
+        """Weight presets share the statement; only filters change its text."""
+        assert _search_sql(False, False) is _search_sql(False, False)
+        assert len({_search_sql(d, p) for d in (False, True) for p in (False, True)}) == 4
+
+    def test_bound_weights_change_ranking(self, fts: FTSChunkManager) -> None:
+        """Heading weights are bound parameters and still affect BM25 ranking."""
+        fts.replace_document("ds:a.md", [("a:0", "## Tokio\n\nruntime notes")])
+        fts.replace_document("ds:b.md", [("b:0", "## Runtime\n\ntokio tokio tokio notes")])
+
+        body_heavy = fts.search_with_scores("tokio", bm25_weights="0.0, 0.0, 1.0, 0.0")
+        heading_heavy = fts.search_with_scores("tokio", bm25_weights="0.0, 50.0, 1.0, 0.0")
+
+        assert body_heavy[0].node_id == "b:0"
+        assert heading_heavy[0].node_id == "a:0"
+
+    def test_filters_combine(self, fts: FTSChunkManager) -> None:
+        """Dataset and prefix filters bind alongside the weights."""
+        fts.replace_document("ds:notes/a.md", [("a:0", "rust")])
+        fts.replace_document("ds:other/b.md", [("b:0", "rust")])
+        fts.replace_document("xx:notes/c.md", [("c:0", "rust")])
+
+        results = fts.search_with_scores(
+            "rust", source_doc_id_prefix="ds:notes/", dataset_name="ds"
+        )
+
+        assert [r.node_id for r in results] == ["a:0"]
+
+    def test_invalid_weights_rejected(self, fts: FTSChunkManager) -> None:
+        """A weights string must hold all four column weights."""
+        with pytest.raises(ValueError, match="4 values"):
+            fts.search_with_scores("rust", bm25_weights="1.0, 2.0")
+
+
+def test_migrates_legacy_chunks_fts(tmp_path: Path) -> None:
+    """A chunks_fts table that stored content itself is migrated to chunks."""
+    engine = create_engine_for_path(tmp_path / "legacy.db")
+    with engine.connect() as conn:
+        conn.execute(
+            sql_text(
+                "CREATE VIRTUAL TABLE chunks_fts USING fts5("
+                "node_id, heading_text, body_text, source_doc_id, "
+                "tokenize='porter unicode61')"
+            )
+        )
+        conn.execute(
+            sql_text(
+                "INSERT INTO chunks_fts(node_id, heading_text, body_text, source_doc_id) "
+                "VALUES ('a:0', 'Intro', 'legacy alpha', 'ds:a.md'), "
+                "('a:1', '', 'legacy beta', 'ds:a.md'), "
+                "('b:0', '', 'legacy gamma', 'other:b.md')"
+            )
+        )
+        conn.commit()
+
+    create_chunks_fts_table(engine)
+    create_chunks_fts_table(engine)  # idempotent once migrated
+
+    session = sessionmaker(bind=engine)()
+    fts = FTSChunkManager(session)
+    rows = session.execute(
+        sql_text("SELECT node_id, dataset_name, seq, heading FROM chunks ORDER BY node_id")
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        ("a:0", "ds", 0, "Intro"),
+        ("a:1", "ds", 1, ""),
+        ("b:0", "other", 0, ""),
+    ]
+    assert {r.node_id for r in fts.search_with_scores("legacy")} == {"a:0", "a:1", "b:0"}
+    assert fts.delete_by_source_doc_id("ds:a.md") == 2
+    assert [r.node_id for r in fts.search_with_scores("legacy")] == ["b:0"]
+    session.close()
+
+
+def test_benchmark_reports_both_paths(tmp_path: Path) -> None:
+    """The write benchmark times both paths on a small vault."""
+    report = benchmark_chunk_writes(
+        note_count=50, chunks_per_note=2, per_chunk_sample=10, workdir=tmp_path
+    )
+
+    assert report["chunks"] == 100.0
+    assert report["per_chunk_sampled_notes"] == 10.0
+    assert report["bulk_seconds"] > 0.0
+    assert report["per_chunk_seconds"] > 0.0
+
+
+def test_query_benchmark_reports_both_paths(tmp_path: Path) -> None:
+    """The query benchmark times both search paths per query."""
+    report = benchmark_fts_query_overhead(queries=20, note_count=10, workdir=tmp_path)
+
+    assert report["queries"] == 20.0
+    assert report["adhoc_us_per_query"] > 0.0
+    assert report["prepared_us_per_query"] > 0.0
+
+
+def test_concurrent_search_benchmark_reports_both_paths(tmp_path: Path) -> None:
+    """The concurrent search benchmark measures both paths under ingest."""
+    report = benchmark_concurrent_search(
+        readers=2, seconds=0.2, note_count=10, chunks_per_note=2, workdir=tmp_path
+    )
+
+    assert report["readers"] == 2.0
+    assert report["shared_qps"] > 0.0
+    assert report["read_pool_qps"] > 0.0
+    assert report["read_pool_ingest_commits"] > 0.0
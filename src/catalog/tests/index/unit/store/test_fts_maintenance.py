@@ -0,0 +1,148 @@
+"""Tests for index.store.fts_maintenance."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from catalog.store.database import Base, create_engine_for_path
+from index.store.fts import FTSManager, create_fts_table
+from index.store.fts_chunk import FTSChunkManager, create_chunks_fts_table
+from index.store.fts_maintenance import FTSMaintenance
+
+
+@pytest.fixture
+def db_session(tmp_path: Path):
+    """Session on a database with both index FTS tables."""
+    engine = create_engine_for_path(tmp_path / "test.db")
+    Base.metadata.create_all(engine)
+    create_fts_table(engine)
+    create_chunks_fts_table(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _write_chunks(session, count: int) -> None:
+    """Write one chunk per transaction so each adds a segment."""
+    fts = FTSChunkManager(session)
+    for i in range(count):
+        fts.replace_document(f"ds:{i}.md", [(f"{i}:0", f"note {i} text")])
+        session.commit()
+
+
+def _raise_runtime_error(*args, **kwargs) -> None:
+    raise RuntimeError("session unusable")
+
+
+def _config(session, table: str) -> dict[str, int]:
+    rows = session.execute(text(f"SELECT k, v FROM {table}_config")).all()
+    return {k: v for k, v in rows}
+
+
+class TestSegmentStats:
+    """Tests for FTSMaintenance.segment_stats."""
+
+    def test_counts_segments_per_write(self, db_session) -> None:
+        """Each write transaction adds a level-0 segment while automerge is off."""
+        maintenance = FTSMaintenance(db_session)
+        maintenance.configure_merge(automerge=0, crisismerge=64)
+        db_session.commit()
+
+        _write_chunks(db_session, 6)
+
+        stats = maintenance.segment_stats("chunks_fts")
+        assert stats is not None
+        assert stats.segments == 6
+        assert stats.levels[0] == 6
+        assert stats.size_bytes > 0
+
+    def test_contentless_table(self, db_session) -> None:
+        """Contentless-delete tables (V2 structure records) are parsed too."""
+        fts = FTSManager(db_session)
+        for i in range(3):
+            fts.upsert(i + 1, f"{i}.md", f"body {i}", dataset_id=1)
+            db_session.commit()
+
+        stats = FTSMaintenance(db_session).segment_stats("documents_fts")
+
+        assert stats is not None
+        assert stats.segments == 3
+
+    def test_missing_table(self, db_session) -> None:
+        """Missing tables report None."""
+        assert FTSMaintenance(db_session).segment_stats("nope_fts") is None
+
+
+class TestMergeAndOptimize:
+    """Tests for bulk merge settings and optimize."""
+
+    def test_bulk_merge_restores_defaults(self, db_session) -> None:
+        """Bulk settings apply inside the block and defaults are restored after."""
+        maintenance = FTSMaintenance(db_session)
+
+        with maintenance.bulk_merge(automerge=8, crisismerge=64):
+            assert _config(db_session, "chunks_fts")["crisismerge"] == 64
+            assert _config(db_session, "documents_fts")["automerge"] == 8
+
+        assert _config(db_session, "chunks_fts")["automerge"] == 4
+        assert _config(db_session, "chunks_fts")["crisismerge"] == 16
+
+    def test_bulk_merge_restores_custom_settings(self, db_session) -> None:
+        """Values configured before the block are restored, per table."""
+        maintenance = FTSMaintenance(db_session)
+        maintenance.configure_merge(automerge=2, crisismerge=32, tables=("chunks_fts",))
+
+        with maintenance.bulk_merge(automerge=8, crisismerge=64):
+            pass
+
+        assert maintenance.merge_settings() == {
+            "documents_fts": (4, 16),
+            "chunks_fts": (2, 32),
+        }
+
+    def test_bulk_merge_keeps_original_error(self, db_session) -> None:
+        """A failing restore does not replace the block's exception."""
+        maintenance = FTSMaintenance(db_session)
+
+        with pytest.raises(ValueError, match="load failed"):
+            with maintenance.bulk_merge(automerge=8, crisismerge=64):
+                maintenance.configure_merge = _raise_runtime_error
+                raise ValueError("load failed")
+
+    def test_optimize_only_above_threshold(self, db_session) -> None:
+        """Tables are optimized only when their segment count exceeds the threshold."""
+        maintenance = FTSMaintenance(db_session)
+        maintenance.configure_merge(automerge=0, crisismerge=64)
+        _write_chunks(db_session, 5)
+
+        assert maintenance.optimize_if_needed(threshold=5) == []
+        assert maintenance.optimize_if_needed(threshold=0) == []
+        assert maintenance.optimize_if_needed(threshold=4) == ["chunks_fts"]
+        assert maintenance.segment_stats("chunks_fts").segments == 1
+        assert [r.node_id for r in FTSChunkManager(db_session).search_with_scores("note")]
+
+
+class TestIntegrityCheck:
+    """Tests for FTSMaintenance.integrity_check."""
+
+    def test_consistent_index(self, db_session) -> None:
+        """A consistent index passes."""
+        _write_chunks(db_session, 2)
+        maintenance = FTSMaintenance(db_session)
+
+        assert maintenance.integrity_check("chunks_fts") is None
+        assert maintenance.integrity_check("documents_fts") is None
+
+    def test_detects_index_out_of_sync(self, db_session) -> None:
+        """Content rows changed behind the index are reported without aborting
+        the session's transaction."""
+        _write_chunks(db_session, 2)
+        db_session.execute(text("DROP TRIGGER chunks_ad"))
+        db_session.execute(text("DELETE FROM chunks WHERE node_id = '0:0'"))
+
+        error = FTSMaintenance(db_session).integrity_check("chunks_fts")
+
+        assert error is not None
+        assert db_session.execute(text("SELECT COUNT(*) FROM chunks")).scalar() == 1
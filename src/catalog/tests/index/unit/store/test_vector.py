@@ -5,6 +5,7 @@ import sys
 from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from catalog.core.settings import get_settings
@@ -415,3 +416,146 @@ class TestZvecBackend:
         get_settings.cache_clear()
 
 
+
+    def test_semantic_query_many_embeds_queries_once_per_identity(
+        self,
+        tmp_path,
+        monkeypatch,
+    ) -> None:
+        """Multi-query search batches embeddings and returns hits per query."""
+        get_settings.cache_clear()
+        index_path = tmp_path / "zvec-index.json"
+        index_path.write_text(
+            json.dumps(
+                {
+                    "collections": {
+                        "catalog_vectors": [
+                            {
+                                "id": "chunk-x",
+                                "vector": [1.0, 0.0],
+                                "metadata": {"source_doc_id": "obsidian:x.md"},
+                            },
+                            {
+                                "id": "chunk-y",
+                                "vector": [0.0, 1.0],
+                                "metadata": {"source_doc_id": "obsidian:y.md"},
+                            },
+                        ]
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+        monkeypatch.setenv("SUBSTRATE_VECTOR_DB__BACKEND", "zvec")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_PATH", str(index_path))
+
+        embedded: list[list[str]] = []
+        fake_module = ModuleType("llama_index.embeddings.huggingface")
+
+        class _BatchHF:
+            def _embed(self, sentences: list[str], prompt_name: str) -> list[list[float]]:
+                embedded.append(list(sentences))
+                return [[1.0, 0.0] if s == "x" else [0.0, 1.0] for s in sentences]
+
+        fake_module.HuggingFaceEmbedding = _BatchHF
+        monkeypatch.setitem(sys.modules, "llama_index.embeddings.huggingface", fake_module)
+
+        manager = VectorStoreManager(persist_dir=tmp_path / "vectors")
+        manager.get_embed_model_for_identity = MagicMock(return_value=_BatchHF())
+
+        hits = manager.semantic_query_many(queries=["x", "y"], top_k=1, dataset_name=None)
+
+        assert embedded == [["x", "y"]]
+        assert [[hit.node_id for hit in per_query] for per_query in hits] == [
+            ["chunk-x"],
+            ["chunk-y"],
+        ]
+        get_settings.cache_clear()
+
+    def test_zvec_top_k_matches_exact_ranking(self, tmp_path, monkeypatch) -> None:
+        """Vectorized top-k returns the same ranking as exhaustive cosine scoring."""
+        get_settings.cache_clear()
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(200, 8))
+        query = rng.normal(size=8)
+        entries = [
+            {
+                "id": f"chunk-{i}",
+                "vector": vectors[i].tolist(),
+                "metadata": {"source_doc_id": f"{'obsidian' if i % 2 else 'archive'}:{i}.md"},
+            }
+            for i in range(len(vectors))
+        ]
+        index_path = tmp_path / "zvec-index.json"
+        index_path.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+
+        monkeypatch.setenv("SUBSTRATE_VECTOR_DB__BACKEND", "zvec")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_PATH", str(index_path))
+        manager = VectorStoreManager(persist_dir=tmp_path / "vectors")
+
+        hits = manager._query_zvec(
+            top_k=5,
+            dataset_name="obsidian",
+            query_embedding=query.tolist(),
+        )
+
+        cosine = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        expected = [
+            f"chunk-{i}"
+            for i in sorted(range(1, len(vectors), 2), key=lambda i: -cosine[i])[:5]
+        ]
+        assert [hit.node_id for hit in hits] == expected
+        assert hits[0].score == pytest.approx(cosine[int(expected[0].split("-")[1])], rel=1e-5)
+        get_settings.cache_clear()
+
+    def test_zvec_zero_query_vector_returns_no_hits(self, tmp_path, monkeypatch) -> None:
+        """A zero-norm query has no cosine similarity and yields no hits."""
+        get_settings.cache_clear()
+        index_path = tmp_path / "zvec-index.json"
+        index_path.write_text(
+            json.dumps([{"id": "chunk-a", "vector": [1.0, 0.0]}]),
+            encoding="utf-8",
+        )
+        monkeypatch.setenv("SUBSTRATE_VECTOR_DB__BACKEND", "zvec")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_PATH", str(index_path))
+        manager = VectorStoreManager(persist_dir=tmp_path / "vectors")
+
+        assert manager._query_zvec(top_k=3, query_embedding=[0.0, 0.0]) == []
+        get_settings.cache_clear()
+
+    def test_zvec_ivf_search_respects_filters_and_recall(self, tmp_path, monkeypatch) -> None:
+        """IVF search keeps dataset filtering and matches exact top hit."""
+        get_settings.cache_clear()
+        rng = np.random.default_rng(11)
+        vectors = rng.normal(size=(600, 8))
+        entries = [
+            {
+                "id": f"chunk-{i}",
+                "vector": vectors[i].tolist(),
+                "metadata": {"source_doc_id": f"{'obsidian' if i % 3 == 0 else 'archive'}:{i}.md"},
+            }
+            for i in range(len(vectors))
+        ]
+        index_path = tmp_path / "zvec-index.json"
+        index_path.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+
+        monkeypatch.setenv("SUBSTRATE_VECTOR_DB__BACKEND", "zvec")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_PATH", str(index_path))
+        monkeypatch.setenv("SUBSTRATE_ZVEC__INDEX_TYPE", "ivf")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__IVF_NLIST", "16")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__IVF_NPROBE", "1")
+        monkeypatch.setenv("SUBSTRATE_ZVEC__IVF_MIN_VECTORS", "100")
+        manager = VectorStoreManager(persist_dir=tmp_path / "vectors")
+
+        query = vectors[3].tolist()
+        ann_hits = manager._query_zvec(top_k=5, dataset_name="obsidian", query_embedding=query)
+        exact_hits = manager._query_zvec(
+            top_k=5, dataset_name="obsidian", query_embedding=query, exact=True
+        )
+
+        segment = manager._get_zvec_client()._loader.load().segments[0]
+        assert segment.ivf is not None
+        assert len(ann_hits) == 5
+        assert all(hit.metadata["source_doc_id"].startswith("obsidian:") for hit in ann_hits)
+        assert ann_hits[0].node_id == exact_hits[0].node_id == "chunk-3"
+        get_settings.cache_clear()
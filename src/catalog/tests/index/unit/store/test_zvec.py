@@ -0,0 +1,173 @@
+"""Tests for index.store.zvec binary index format."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores import SimpleVectorStore
+
+from index.store.zvec import (
+    ZvecIndexLoader,
+    binary_index_dir,
+    export_simple_vector_store,
+    import_json_index,
+    load_binary_index,
+)
+
+
+def _write_simple_store(path, embeddings: dict[str, list[float]]) -> None:
+    """Persist a SimpleVectorStore JSON file with the given embeddings."""
+    store = SimpleVectorStore()
+    store.add(
+        [
+            TextNode(id_=node_id, text=node_id, embedding=vector, metadata={"dataset_name": "obsidian"})
+            for node_id, vector in embeddings.items()
+        ]
+    )
+    store.persist(str(path))
+
+
+class TestImportJsonIndex:
+    """Tests for converting JSON indexes into the binary layout."""
+
+    def test_imports_simple_vector_store_json(self, tmp_path) -> None:
+        """SimpleVectorStore JSON is converted into a float32 mmap matrix."""
+        index_path = tmp_path / "index.json"
+        _write_simple_store(index_path, {"a": [1.0, 0.0], "b": [0.0, 2.0]})
+
+        index = import_json_index(index_path, collection_name="catalog_vectors")
+
+        assert len(index) == 2
+        segment = index.segments[0]
+        assert segment.dim == 2
+        assert segment.node_ids == ["a", "b"]
+        assert segment.vectors.dtype == np.float32
+        assert isinstance(segment.vectors, np.memmap)
+        assert segment.metadata[0]["dataset_name"] == "obsidian"
+        assert (binary_index_dir(index_path, "catalog_vectors") / "header.json").exists()
+
+    def test_groups_mixed_dimensions_into_segments(self, tmp_path) -> None:
+        """Vectors with different dimensions land in separate segments."""
+        index_path = tmp_path / "index.json"
+        index_path.write_text(
+            json.dumps(
+                [
+                    {"id": "small", "vector": [1.0, 0.0]},
+                    {"id": "large", "vector": [1.0, 0.0, 0.0]},
+                    {"id": "bad", "vector": ["x"]},
+                    {"id": "zero", "vector": [0.0, 0.0]},
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        index = import_json_index(index_path, collection_name="catalog_vectors")
+
+        assert [segment.dim for segment in index.segments] == [2, 3]
+        assert len(index) == 2
+
+    def test_round_trips_through_binary_files(self, tmp_path) -> None:
+        """A written binary index loads back with the same ids and vectors."""
+        index_path = tmp_path / "index.json"
+        _write_simple_store(index_path, {"a": [0.5, 0.5, 0.0]})
+        import_json_index(index_path, collection_name="catalog_vectors")
+
+        loaded = load_binary_index(binary_index_dir(index_path, "catalog_vectors"))
+
+        assert loaded is not None
+        assert loaded.segments[0].node_ids == ["a"]
+        np.testing.assert_allclose(
+            loaded.segments[0].vectors[0],
+            [2**-0.5, 2**-0.5, 0.0],
+            rtol=1e-6,
+        )
+        assert loaded.source_mtime_ns == index_path.stat().st_mtime_ns
+
+
+class TestSegmentMasks:
+    """Tests for precomputed dataset/profile row masks."""
+
+    def test_dataset_and_profile_masks(self, tmp_path) -> None:
+        """Masks select rows by dataset and embedding profile and are memoized."""
+        index_path = tmp_path / "index.json"
+        index_path.write_text(
+            json.dumps(
+                [
+                    {
+                        "id": "a",
+                        "vector": [1.0, 0.0],
+                        "metadata": {
+                            "source_doc_id": "obsidian:a.md",
+                            "embedding_profile": "mlx:model-a",
+                        },
+                    },
+                    {
+                        "id": "b",
+                        "vector": [0.0, 1.0],
+                        "metadata": {
+                            "dataset_name": "archive",
+                            "embedding_profile": "mlx:model-b",
+                        },
+                    },
+                ]
+            ),
+            encoding="utf-8",
+        )
+        segment = import_json_index(index_path, collection_name="catalog_vectors").segments[0]
+
+        assert segment.dataset_mask("obsidian").tolist() == [True, False]
+        assert segment.profile_mask("mlx:model-b").tolist() == [False, True]
+        assert segment.dataset_mask("obsidian") is segment.dataset_mask("obsidian")
+
+
+class TestZvecIndexLoader:
+    """Tests for mtime-based caching of the binary index."""
+
+    def test_reuses_cached_index_while_file_unchanged(self, tmp_path) -> None:
+        """Repeated loads return the same object without touching JSON."""
+        index_path = tmp_path / "index.json"
+        _write_simple_store(index_path, {"a": [1.0, 0.0]})
+        loader = ZvecIndexLoader(index_path, collection_name="catalog_vectors")
+
+        first = loader.load()
+        second = loader.load()
+
+        assert first is second
+
+    def test_reloads_when_mtime_changes(self, tmp_path) -> None:
+        """Rewriting the JSON file invalidates the cached index."""
+        index_path = tmp_path / "index.json"
+        _write_simple_store(index_path, {"a": [1.0, 0.0]})
+        loader = ZvecIndexLoader(index_path, collection_name="catalog_vectors")
+        assert loader.load().segments[0].node_ids == ["a"]
+
+        _write_simple_store(index_path, {"a": [1.0, 0.0], "b": [0.0, 1.0]})
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert loader.load().segments[0].node_ids == ["a", "b"]
+
+    def test_uses_exported_binary_without_reimport(self, tmp_path, monkeypatch) -> None:
+        """A binary index exported at persist time is loaded without parsing JSON."""
+        index_path = tmp_path / "index.json"
+        store = SimpleVectorStore()
+        store.add([TextNode(id_="a", text="a", embedding=[1.0, 0.0])])
+        store.persist(str(index_path))
+        export_simple_vector_store(store.data, index_path, collection_name="catalog_vectors")
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("JSON import should not run")
+
+        monkeypatch.setattr("index.store.zvec.import_json_index", _fail)
+        loader = ZvecIndexLoader(index_path, collection_name="catalog_vectors")
+
+        assert loader.load().segments[0].node_ids == ["a"]
+
+    def test_missing_index_raises(self, tmp_path) -> None:
+        """Missing JSON and binary files raise FileNotFoundError."""
+        loader = ZvecIndexLoader(tmp_path / "missing.json", collection_name="catalog_vectors")
+
+        with pytest.raises(FileNotFoundError):
+            loader.load()
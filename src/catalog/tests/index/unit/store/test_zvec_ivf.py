@@ -0,0 +1,79 @@
+"""Tests for index.store.zvec_ivf approximate search index."""
+
+import numpy as np
+
+from index.store.zvec_ivf import IVFParams, build_ivf, load_ivf, save_ivf, update_ivf
+
+
+def _normalized(rows: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Return a random matrix of unit-length float32 rows."""
+    matrix = np.random.default_rng(seed).normal(size=(rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+class TestBuildIvf:
+    """Tests for IVF training and probing."""
+
+    def test_assigns_every_row_to_a_cluster(self) -> None:
+        """Each row appears in exactly one inverted list."""
+        vectors = _normalized(500, 8)
+        ivf = build_ivf(vectors, IVFParams(nlist=10))
+
+        assert ivf.nlist == 10
+        assert ivf.assignments.shape == (500,)
+        all_rows = ivf.candidate_rows(vectors[0], nprobe=ivf.nlist)
+        assert sorted(all_rows.tolist()) == list(range(500))
+
+    def test_probing_one_cluster_contains_nearest_row(self) -> None:
+        """A row's own cluster is probed first when querying with that row."""
+        vectors = _normalized(300, 8)
+        ivf = build_ivf(vectors, IVFParams(nlist=12))
+
+        rows = ivf.candidate_rows(vectors[42], nprobe=1)
+
+        assert 42 in rows.tolist()
+
+    def test_auto_nlist_uses_square_root(self) -> None:
+        """nlist=0 picks sqrt(n) clusters."""
+        assert IVFParams().resolve_nlist(10_000) == 100
+        assert IVFParams().resolve_nlist(1) == 1
+
+
+class TestUpdateIvf:
+    """Tests for incremental IVF maintenance."""
+
+    def test_keeps_existing_assignments_and_assigns_new_rows(self) -> None:
+        """Known node ids keep their cluster; only new rows are assigned."""
+        vectors = _normalized(200, 8)
+        ids = [f"n{i}" for i in range(200)]
+        params = IVFParams(nlist=8)
+        previous = build_ivf(vectors, params)
+
+        grown = np.vstack([vectors[50:], _normalized(20, 8, seed=1)])
+        grown_ids = ids[50:] + [f"new{i}" for i in range(20)]
+        updated = update_ivf(previous, ids, grown, grown_ids, params)
+
+        assert updated.centroids is previous.centroids
+        assert updated.assignments[:150].tolist() == previous.assignments[50:].tolist()
+        assert (updated.assignments >= 0).all()
+
+    def test_retrains_after_growth_threshold(self) -> None:
+        """Growing past retrain_growth triggers a full rebuild."""
+        params = IVFParams(nlist=4, retrain_growth=2.0)
+        previous = build_ivf(_normalized(50, 8), params)
+
+        updated = update_ivf(previous, [f"n{i}" for i in range(50)], _normalized(150, 8), [f"m{i}" for i in range(150)], params)
+
+        assert updated.trained_count == 150
+
+    def test_round_trips_through_npz(self, tmp_path) -> None:
+        """save_ivf/load_ivf preserve centroids and assignments."""
+        ivf = build_ivf(_normalized(64, 4), IVFParams(nlist=4))
+        path = tmp_path / "ivf.npz"
+
+        save_ivf(path, ivf)
+        loaded = load_ivf(path)
+
+        np.testing.assert_array_equal(loaded.centroids, ivf.centroids)
+        np.testing.assert_array_equal(loaded.assignments, ivf.assignments)
+        assert loaded.trained_count == 64
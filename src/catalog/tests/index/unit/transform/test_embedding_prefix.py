@@ -1,6 +1,6 @@
 """Tests for catalog.transform.embedding module."""
 
-from llama_index.core.schema import TextNode
+from llama_index.core.schema import MetadataMode, TextNode
 
 from index.transform.embedding import (
     EmbeddingIdentityTransform,
@@ -131,6 +131,22 @@ class TestEmbeddingPrefixTransform:
 
         assert result == []
 
+    def test_embedding_input_is_prefixed_text_only(self) -> None:
+        """Metadata is excluded so the model embeds exactly the prefixed text."""
+        transform = EmbeddingPrefixTransform(prefix_template="title: {title} | text: ")
+        identity = EmbeddingIdentityTransform(backend="mlx", model_name="my-model")
+        node = TextNode(
+            text="Body",
+            metadata={"title": "Doc", "source_doc_id": "obsidian:a/b.md"},
+        )
+
+        result = identity(transform([node]))
+
+        assert (
+            result[0].get_content(metadata_mode=MetadataMode.EMBED)
+            == "title: Doc | text: Body"
+        )
+
 
 class TestEmbeddingIdentityTransform:
     """Tests for EmbeddingIdentityTransform class."""
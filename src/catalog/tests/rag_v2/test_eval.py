@@ -655,3 +655,43 @@ class TestEvalThresholds:
             vector_hit3 = EVAL_THRESHOLDS["vector"][difficulty]["hit_at_3"]
             # Hybrid should be at least as good as the max of others
             assert hybrid_hit3 >= max(bm25_hit3, vector_hit3) * 0.9  # Allow 10% tolerance
+
+
+class TestEvaluateAnnRecall:
+    """Tests for ANN vs exact recall/latency comparison."""
+
+    def test_reports_recall_and_latency(self) -> None:
+        """Recall@k compares ANN ids against exact ids per query."""
+        from index.eval.ann import evaluate_ann_recall
+        from index.store.vector import VectorQueryHit
+
+        manager = MagicMock()
+        manager.vector_backend = "zvec"
+        manager.get_embed_model_for_identity.return_value.get_query_embedding.return_value = [1.0]
+
+        def _query(top_k, dataset_name, query_embedding, exact):
+            ids = ["a", "b"] if exact else ["a", "c"]
+            return [VectorQueryHit(node_id=i, score=1.0, metadata={}) for i in ids]
+
+        manager._query_zvec.side_effect = _query
+        queries = [
+            GoldenQuery(query="q", expected_docs=[], difficulty="easy", retriever_types=["vector"])
+        ]
+
+        report = evaluate_ann_recall(manager, queries, k_values=[1, 2])
+
+        assert report["queries"] == 1.0
+        assert report["recall_at_1"] == 1.0
+        assert report["recall_at_2"] == 0.5
+        assert report["ann_latency_ms_p95"] >= 0.0
+        assert report["exact_latency_ms_p50"] >= 0.0
+
+    def test_requires_zvec_backend(self) -> None:
+        """Non-Zvec backends are rejected."""
+        from index.eval.ann import evaluate_ann_recall
+
+        manager = MagicMock()
+        manager.vector_backend = "qdrant"
+
+        with pytest.raises(ValueError, match="zvec"):
+            evaluate_ann_recall(manager, [])